@@ -9,20 +9,23 @@ specification using openapi-python-generator. The generated code includes:
 - API configuration with Bearer auth support
 
 Usage:
-    python scripts/generate_client.py [--spec PATH]
+    python scripts/generate_client.py [--spec PATH] [--post-process-only]
 
 Options:
-    --spec PATH    Path to OpenAPI spec (default: openapi/dataplane.yaml)
+    --spec PATH            Path to OpenAPI spec (default: openapi/dataplane.yaml)
+    --post-process-only    Re-apply post-processing to the existing output
 
 The generated client is written to:
     src/honeyhive/_generated/
 """
 
 import argparse
+import ast
 import shutil
 import subprocess
 import sys
 from pathlib import Path
+from typing import List
 
 # Get the repo root directory
 REPO_ROOT = Path(__file__).parent.parent
@@ -30,6 +33,67 @@ DEFAULT_SPEC = REPO_ROOT / "openapi" / "dataplane.yaml"
 OUTPUT_DIR = REPO_ROOT / "src" / "honeyhive" / "_generated"
 TEMP_DIR = REPO_ROOT / ".generated_temp"
 
+PACKAGE_INIT = '''"""Auto-generated HoneyHive API client.
+
+Models (``.models``) and services (``.services``) are imported per module on
+first use rather than from here, so importing the API configuration does not
+load every generated model.
+"""
+
+from .api_config import *
+'''
+
+LAZY_MODELS_INIT = '''"""Generated Pydantic models, each imported on first access.
+
+``from honeyhive._generated.models import X`` loads only ``X`` and the models
+it references, instead of all models of the API.
+"""
+
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any, List
+
+_MODEL_NAMES = frozenset(
+    [
+{names}
+    ]
+)
+
+if TYPE_CHECKING:
+    # Type checkers see the classes; at runtime they are loaded on access
+{type_imports}
+
+__all__ = sorted(_MODEL_NAMES)
+
+
+class _ModelsModule(types.ModuleType):
+    """Keeps model classes, not their modules, under the model names."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing submodule X makes the import system set package.X to the
+        # module; every model module defines a class of the same name
+        if name in _MODEL_NAMES and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a model on first access."""
+    if name not in _MODEL_NAMES:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    importlib.import_module(f".{{name}}", __name__)
+    return globals()[name]
+
+
+def __dir__() -> List[str]:
+    """List loaded attributes plus all model names."""
+    return sorted(set(globals()) | _MODEL_NAMES)
+
+
+sys.modules[__name__].__class__ = _ModelsModule
+'''
+
 
 def clean_output_dir(output_dir: Path) -> None:
     """Remove existing generated code."""
@@ -124,10 +188,93 @@ def post_process(output_dir: Path) -> bool:
     # Note: data.model_dump(exclude_none=True) and _serialize_query_params are
     # handled directly in scripts/templates/httpx.jinja2 and service.jinja2.
 
+    # Load models per module on first use instead of all at import time
+    init_file.write_text(PACKAGE_INIT)
+    model_names = write_lazy_models_init(output_dir)
+    print(f"  ✓ Made {len(model_names)} models lazily imported")
+    rewritten = import_models_explicitly(output_dir, model_names)
+    print(f"  ✓ Replaced model star imports in {rewritten} services")
+
     print("  ✓ Post-processing complete")
     return True
 
 
+def get_model_names(output_dir: Path) -> List[str]:
+    """
+    Collect the model class names from the generated model modules.
+
+    Each model module defines one class named after the module and lists it in
+    ``__all__``.
+    """
+    names = []
+    for path in sorted((output_dir / "models").glob("*.py")):
+        if path.name == "__init__.py":
+            continue
+        for node in ast.parse(path.read_text()).body:
+            if isinstance(node, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == "__all__"
+                for target in node.targets
+            ):
+                exported = [ast.literal_eval(item) for item in node.value.elts]
+                if exported != [path.stem]:
+                    raise ValueError(
+                        f"{path.name} exports {exported}, expected [{path.stem!r}]"
+                    )
+                names.append(path.stem)
+    return names
+
+
+def write_lazy_models_init(output_dir: Path) -> List[str]:
+    """Replace the star imports in models/__init__.py with lazy loading."""
+    names = get_model_names(output_dir)
+    listing = "\n".join(f'        "{name}",' for name in names)
+    # Case-insensitive, like the import sorting of ruff (isort)
+    type_imports = "\n".join(
+        _type_import(name) for name in sorted(names, key=str.lower)
+    )
+    (output_dir / "models" / "__init__.py").write_text(
+        LAZY_MODELS_INIT.format(names=listing, type_imports=type_imports)
+    )
+    return names
+
+
+def _type_import(name: str) -> str:
+    """Format one ``TYPE_CHECKING`` re-export, wrapped like ruff format does."""
+    line = f"    from .{name} import {name} as {name}"
+    if len(line) <= 88:
+        return line
+    return f"    from .{name} import (\n        {name} as {name},\n    )"
+
+
+def import_models_explicitly(output_dir: Path, model_names: List[str]) -> int:
+    """
+    Replace ``from ..models import *`` in services with the models they use.
+
+    A star import would load every model through the lazy models package.
+    """
+    known = set(model_names)
+    rewritten = 0
+    for path in sorted((output_dir / "services").glob("*.py")):
+        source = path.read_text()
+        if "from ..models import *\n" not in source:
+            continue
+        used = sorted(
+            {
+                node.id
+                for node in ast.walk(ast.parse(source))
+                if isinstance(node, ast.Name) and node.id in known
+            }
+        )
+        if used:
+            lines = "".join(f"    {name},\n" for name in used)
+            replacement = f"from ..models import (\n{lines})\n"
+        else:
+            replacement = ""
+        path.write_text(source.replace("from ..models import *\n", replacement))
+        rewritten += 1
+    return rewritten
+
+
 def main() -> int:
     """Generate client from OpenAPI specification."""
     parser = argparse.ArgumentParser(
@@ -138,8 +285,16 @@ def main() -> int:
         type=Path,
         help=f"Path to OpenAPI spec (default: {DEFAULT_SPEC.relative_to(REPO_ROOT)})",
     )
+    parser.add_argument(
+        "--post-process-only",
+        action="store_true",
+        help="Re-apply post-processing to the existing generated code",
+    )
     args = parser.parse_args()
 
+    if args.post_process_only:
+        return 0 if post_process(OUTPUT_DIR) else 1
+
     # Determine which spec to use
     spec_path = args.spec if args.spec else DEFAULT_SPEC
 
@@ -7,11 +7,53 @@ HoneyHive Python SDK - LLM Observability and Evaluation Platform
 # (release candidate) + a number
 __version__ = "1.5.1"
 
-# Main API client
-from .api import HoneyHive
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-# Tracer (if available - may have additional dependencies)
-try:
+# Public exports are imported on first access (PEP 562), so ``import honeyhive``
+# does not load the API client, generated models, OpenTelemetry SDK or
+# experiments until they are used. Maps export name -> (module, attribute).
+_LAZY_EXPORTS: Dict[str, Tuple[str, str]] = {
+    # Core client
+    "HoneyHive": (".api", "HoneyHive"),
+    # Tracer
+    "HoneyHiveTracer": (".tracer", "HoneyHiveTracer"),
+    "trace": (".tracer", "trace"),
+    "atrace": (".tracer", "atrace"),
+    "trace_class": (".tracer", "trace_class"),
+    "enrich_session": (".tracer", "enrich_session"),
+    "enrich_span": (".tracer", "enrich_span"),
+    "flush": (".tracer", "flush"),
+    "set_default_tracer": (".tracer", "set_default_tracer"),
+    # Evaluation/experiments
+    "evaluate": (".experiments", "evaluate"),
+    "evaluator": (".evaluation._compat", "evaluator"),
+    "aevaluator": (".evaluation._compat", "aevaluator"),
+    "BaseEvaluator": (".evaluation.evaluators", "BaseEvaluator"),
+    # Utilities (backwards compatibility)
+    "DotDict": (".utils.dotdict", "DotDict"),
+    "get_logger": (".utils.logger", "get_logger"),
+}
+
+# Subpackages that ``import honeyhive`` used to load eagerly and that callers
+# may reach as attributes (``honeyhive.tracer``)
+_SUBPACKAGES = (
+    "api",
+    "config",
+    "evaluation",
+    "experiments",
+    "models",
+    "tracer",
+    "utils",
+)
+
+__all__: List[str] = list(_LAZY_EXPORTS)
+
+if TYPE_CHECKING:
+    from .api import HoneyHive
+    from .evaluation._compat import aevaluator, evaluator
+    from .evaluation.evaluators import BaseEvaluator
+    from .experiments import evaluate
     from .tracer import (
         HoneyHiveTracer,
         atrace,
@@ -22,66 +64,22 @@ try:
         trace,
         trace_class,
     )
-
-    _TRACER_AVAILABLE = True
-except ImportError:
-    _TRACER_AVAILABLE = False
-
-# Evaluation/experiments module (if available)
-try:
-    from .evaluation._compat import aevaluator, evaluator
-    from .evaluation.evaluators import BaseEvaluator
-    from .experiments import evaluate
-
-    _EVALUATION_AVAILABLE = True
-except ImportError:
-    _EVALUATION_AVAILABLE = False
-
-# Utility imports (backwards compatibility)
-try:
     from .utils.dotdict import DotDict
     from .utils.logger import get_logger
 
-    _UTILS_AVAILABLE = True
-except ImportError:
-    _UTILS_AVAILABLE = False
 
-__all__ = [
-    # Core client
-    "HoneyHive",
-]
+def __getattr__(name: str) -> Any:
+    """Import a public export or subpackage on first access."""
+    if name in _LAZY_EXPORTS:
+        module_name, attribute = _LAZY_EXPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attribute)
+        globals()[name] = value
+        return value
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Add tracer exports if available
-if _TRACER_AVAILABLE:
-    __all__.extend(
-        [
-            "HoneyHiveTracer",
-            "trace",
-            "atrace",
-            "trace_class",
-            "enrich_session",
-            "enrich_span",
-            "flush",
-            "set_default_tracer",
-        ]
-    )
-
-# Add evaluation exports if available
-if _EVALUATION_AVAILABLE:
-    __all__.extend(
-        [
-            "evaluate",
-            "evaluator",
-            "aevaluator",
-            "BaseEvaluator",
-        ]
-    )
 
-# Add utility exports if available
-if _UTILS_AVAILABLE:
-    __all__.extend(
-        [
-            "DotDict",
-            "get_logger",
-        ]
-    )
+def __dir__() -> List[str]:
+    """List loaded attributes plus the lazily imported exports."""
+    return sorted(set(globals()) | set(__all__) | set(_SUBPACKAGES))
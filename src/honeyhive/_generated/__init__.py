@@ -1,3 +1,8 @@
+"""Auto-generated HoneyHive API client.
+
+Models (``.models``) and services (``.services``) are imported per module on
+first use rather than from here, so importing the API configuration does not
+load every generated model.
+"""
+
 from .api_config import *
-from .models import *
-from .services import *
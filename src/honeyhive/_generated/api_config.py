@@ -1,7 +1,11 @@
+import asyncio
 import os
-from typing import Any, Dict, Optional, Union
+import threading
+import weakref
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+import httpx
+from pydantic import BaseModel, Field, PrivateAttr
 
 from honeyhive._clock import _get_or_stamp_call_time_ns
 
@@ -9,6 +13,27 @@ from honeyhive._clock import _get_or_stamp_call_time_ns
 DEFAULT_BASE_URL = "https://api.dp1.us.honeyhive.ai"
 
 
+class _LoopClients:
+    """Async clients opened on one event loop, closed together on that loop."""
+
+    def __init__(self) -> None:
+        self.client: Optional[httpx.AsyncClient] = None
+        self.key: Optional[Tuple[Any, ...]] = None
+        # Every client opened on the loop, including ones replaced after a
+        # settings change, so requests still using them are not cut off
+        self.opened: List[httpx.AsyncClient] = []
+        self.closer: Optional[AsyncGenerator[None, None]] = None
+
+    async def aclose(self) -> None:
+        opened, self.opened = self.opened, []
+        self.client, self.key = None, None
+        for client in opened:
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+
+
 class APIConfig(BaseModel):
     model_config = {"validate_assignment": True}
 
@@ -19,6 +44,24 @@ class APIConfig(BaseModel):
     # to 5.0 to match httpx's own default (so behaviour is unchanged unless set).
     # Set to None to disable timeouts entirely.
     timeout: Optional[float] = 5.0
+    # Connection pool limits for the shared keep-alive clients returned by
+    # get_client()/get_async_client(). Defaults match httpx.Limits; the
+    # HoneyHive client fills them from HTTPClientConfig.
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+    # Seconds to wait for a free pooled connection; None applies `timeout`.
+    pool_timeout: Optional[float] = None
+
+    _client: Optional[httpx.Client] = PrivateAttr(default=None)
+    _client_key: Optional[Tuple[Any, ...]] = PrivateAttr(default=None)
+    # One set of async clients per event loop; entries go away with their loop
+    _async_clients: "weakref.WeakKeyDictionary[Any, _LoopClients]" = PrivateAttr(
+        default_factory=weakref.WeakKeyDictionary
+    )
+    # Async clients requested outside a running event loop
+    _unbound_async_clients: _LoopClients = PrivateAttr(default_factory=_LoopClients)
+    _client_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     @classmethod
     def from_env(
@@ -62,6 +105,168 @@ class APIConfig(BaseModel):
             "hh-client-timestamp": str(_get_or_stamp_call_time_ns()),
         }
 
+    def get_limits(self) -> httpx.Limits:
+        """Get the connection pool limits for the shared clients."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def get_timeout(self) -> Union[httpx.Timeout, float, None]:
+        """Get the timeout for the shared clients.
+
+        ``pool_timeout``, when set, bounds the wait for a pooled connection.
+        """
+        if self.pool_timeout is None:
+            return self.timeout
+        return httpx.Timeout(self.timeout, pool=self.pool_timeout)
+
+    def _transport_key(self) -> Tuple[Any, ...]:
+        # Any change to these settings (or a fork, which must not share
+        # sockets with the parent) invalidates the pooled client.
+        return (
+            os.getpid(),
+            self.base_path,
+            self.verify,
+            self.timeout,
+            self.max_connections,
+            self.max_keepalive_connections,
+            self.keepalive_expiry,
+            self.pool_timeout,
+        )
+
+    def get_client(self) -> httpx.Client:
+        """Get the shared keep-alive sync client, creating it on first use.
+
+        The client is rebuilt when the base URL, TLS, timeout or pool settings
+        change, or when the process has forked since it was created.
+        """
+        key = self._transport_key()
+        with self._client_lock:
+            if (
+                self._client is None
+                or self._client.is_closed
+                or self._client_key != key
+            ):
+                stale = self._client
+                self._client = httpx.Client(
+                    base_url=self.base_path,
+                    verify=self.verify,
+                    timeout=self.get_timeout(),
+                    limits=self.get_limits(),
+                )
+                self._client_key = key
+                if stale is not None and key[0] == os.getpid():
+                    stale.close()
+            return self._client
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        """Get the shared keep-alive async client for the running event loop.
+
+        An ``httpx.AsyncClient`` is bound to the loop that opened its
+        connections, so each event loop gets its own client. Clients are closed
+        on their own loop by ``close()``/``aclose()`` or when that loop shuts
+        down, never because another loop asked for a client.
+        """
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        key = self._transport_key()
+        with self._client_lock:
+            for stale in [known for known in self._async_clients if known.is_closed()]:
+                del self._async_clients[stale]
+            if loop is None:
+                clients = self._unbound_async_clients
+            elif loop in self._async_clients:
+                clients = self._async_clients[loop]
+            else:
+                clients = self._async_clients[loop] = _LoopClients()
+                clients.closer = _close_with_loop(clients)
+                loop.create_task(_register_closer(clients.closer))
+            if clients.client is None or clients.client.is_closed or clients.key != key:
+                if clients.key is not None and clients.key[0] != key[0]:
+                    # Forked: the parent's clients are not ours to close
+                    clients.opened.clear()
+                clients.client = httpx.AsyncClient(
+                    base_url=self.base_path,
+                    verify=self.verify,
+                    timeout=self.get_timeout(),
+                    limits=self.get_limits(),
+                )
+                clients.key = key
+                clients.opened.append(clients.client)
+            return clients.client
+
+    def close(self) -> None:
+        """Close all shared clients and release their pooled connections.
+
+        Each async client is closed on the event loop it was used on, the next
+        time that loop runs.
+        """
+        with self._client_lock:
+            client, self._client, self._client_key = self._client, None, None
+            loop_clients = list(self._async_clients.items())
+            self._async_clients.clear()
+            self._unbound_async_clients = _LoopClients()
+        if client is not None:
+            client.close()
+        for loop, clients in loop_clients:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(loop.create_task, clients.aclose())
+
+    async def aclose(self) -> None:
+        """Close all shared clients and release their pooled connections.
+
+        The running loop's clients are closed before this returns; clients of
+        other loops are closed on their own loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._client_lock:
+            own = self._async_clients.pop(loop, None)
+            unbound = self._unbound_async_clients
+            self._unbound_async_clients = _LoopClients()
+        for clients in (own, unbound):
+            if clients is not None:
+                await clients.aclose()
+        self.close()
+
+
+async def _close_with_loop(clients: _LoopClients) -> AsyncGenerator[None, None]:
+    """Hold ``clients`` open until this generator is finalized, then close them.
+
+    asyncio finalizes the async generators it has seen on their own loop while
+    it can still run (``asyncio.run()`` calls ``loop.shutdown_asyncgens()``), so
+    the clients are closed before the loop their connections belong to is.
+    """
+    try:
+        yield
+    finally:
+        await clients.aclose()
+
+
+async def _register_closer(closer: AsyncGenerator[None, None]) -> None:
+    """Start ``closer`` on the running loop so the loop finalizes it on shutdown."""
+    await closer.asend(None)
+
+
+_default_config: Optional[APIConfig] = None
+_default_config_lock = threading.Lock()
+
+
+def get_default_api_config() -> APIConfig:
+    """Get the shared APIConfig used by service calls without an override.
+
+    One instance keeps that path on a single pooled client instead of opening
+    a new client, never closed, on every call.
+    """
+    global _default_config
+    with _default_config_lock:
+        if _default_config is None:
+            _default_config = APIConfig()
+        return _default_config
+
 
 def _get_sdk_version() -> str:
     """Get the SDK version for use in request headers."""
@@ -1,198 +1,647 @@
-from .AbsoluteDateRange import *
-from .AddDatapointsResponse import *
-from .AddDatapointsToDatasetRequest import *
-from .AddSessionTracesRequest import *
-from .BatchCreateDatapointsRequest import *
-from .BatchCreateDatapointsResponse import *
-from .BatchDateRange import *
-from .CheckState import *
-from .ComparableEvent import *
-from .ConfigurationItem import *
-from .ConfigurationParameters import *
-from .CreateAnnotationQueueRequest import *
-from .CreateAnnotationQueueRequestFilters import *
-from .CreateAnnotationQueueResponse import *
-from .CreateAnnotationQueueResponseQueue import *
-from .CreateAnnotationQueueResponseQueueFilters import *
-from .CreateChartRequest import *
-from .CreateChartResponse import *
-from .CreateChartResponseData import *
-from .CreateConfigurationRequest import *
-from .CreateConfigurationResponse import *
-from .CreateDatapointRequest import *
-from .CreateDatapointResponse import *
-from .CreateDatapointResponseResult import *
-from .CreateDatasetRequest import *
-from .CreateDatasetResponse import *
-from .CreateMetricRequest import *
-from .CreateMetricRequestCategoriesItem import *
-from .CreateMetricRequestFilters import *
-from .CreateMetricResponse import *
-from .CreateMetricVersionRequest import *
-from .CreateMetricVersionResponse import *
-from .Datapoint import *
-from .DatapointMapping import *
-from .DatapointResult import *
-from .Dataset import *
-from .DeleteAnnotationQueueResponse import *
-from .DeleteChartResponse import *
-from .DeleteConfigurationResponse import *
-from .DeleteDatapointParams import *
-from .DeleteDatapointResponse import *
-from .DeleteDatasetParams import *
-from .DeleteDatasetResponse import *
-from .DeleteExperimentRunParams import *
-from .DeleteExperimentRunResponse import *
-from .DeleteMetricResponse import *
-from .DeleteResult import *
-from .DeployMetricVersionResponse import *
-from .Event import *
-from .EventComparisonDetail import *
-from .EventDetail import *
-from .EventFeedback import *
-from .EventMetricData import *
-from .EventMetricDataMetadata import *
-from .EventSearchFilter import *
-from .EventSearchFiltersArray import *
-from .ExperimentRunObject import *
-from .ExperimentSchemaField import *
-from .ExperimentSchemaMappingEntry import *
-from .ExportEventsResponse import *
-from .FiltersArray import *
-from .GetAnnotationQueueByIdResponse import *
-from .GetAnnotationQueueByIdResponseFilters import *
-from .GetAnnotationQueuesResponse import *
-from .GetAnnotationQueuesResponseQueuesItem import *
-from .GetAnnotationQueuesResponseQueuesItemFilters import *
-from .GetChartResponse import *
-from .GetChartResponseData import *
-from .GetChartsResponse import *
-from .GetChartsResponseDataItem import *
-from .GetConfigurationsQuery import *
-from .GetConfigurationsResponse import *
-from .GetDatapointParams import *
-from .GetDatapointResponse import *
-from .GetDatapointsQuery import *
-from .GetDatapointsResponse import *
-from .GetDatasetsResponse import *
-from .GetEventResponse import *
-from .GetEventResponseEvent import *
-from .GetEventsQuery import *
-from .GetEventsResponse import *
-from .GetEventsSchemaLegacyDateRangeOneOf1 import *
-from .GetEventsSchemaResponse import *
-from .GetExperimentCompareEventsResponse import *
-from .GetExperimentRunCompareResponse import *
-from .GetExperimentRunMetricsQuery import *
-from .GetExperimentRunMetricsResponse import *
-from .GetExperimentRunParams import *
-from .GetExperimentRunResponse import *
-from .GetExperimentRunResultResponse import *
-from .GetExperimentRunsQuery import *
-from .GetExperimentRunsResponse import *
-from .GetMetricsQuery import *
-from .GetMetricsResponse import *
-from .GetMetricVersionsResponse import *
-from .GetRunSchemaDateRangeOneOf1 import *
-from .GetRunsDateRangeOneOf1 import *
-from .GetRunsSchemaDateRangeOneOf1 import *
-from .InsertResult import *
-from .LegacyDeleteDatasetQuery import *
-from .LegacyEvent import *
-from .LegacyExportEventsRequest import *
-from .LegacyExportEventsRequestDateRange import *
-from .LegacyGetEventsSchemaQuery import *
-from .LegacyGetExperimentRunCompareEventsQuery import *
-from .LegacyGetExperimentRunCompareParams import *
-from .LegacyGetExperimentRunCompareQuery import *
-from .LegacyGetExperimentRunResultQuery import *
-from .LegacyPostEventBatchRequest import *
-from .LegacyPostEventRequest import *
-from .LegacyPostEventRequestEvent import *
-from .LegacyRemoveDatapointFromDatasetParams import *
-from .LegacyRunMetricRequest import *
-from .LegacyRunMetricRequestEvent import *
-from .LegacyRunMetricRequestEventFeedback import *
-from .LegacyRunMetricRequestMetric import *
-from .LegacyRunMetricRequestMetricCategoriesItem import *
-from .LegacyRunMetricRequestMetricFilters import *
-from .LegacyStartSessionRequest import *
-from .LegacyStartSessionRequestSession import *
-from .LegacyUpdateDatasetRequest import *
-from .LegacyUpdateEventRequest import *
-from .LegacyUpdateMetricRequest import *
-from .LegacyUpdateMetricRequestCategoriesItem import *
-from .LegacyUpdateMetricRequestFilters import *
-from .MetricComparison import *
-from .MetricDatapoints import *
-from .MetricDetail import *
-from .MetricItem import *
-from .MetricItemCategoriesItem import *
-from .MetricItemFilters import *
-from .MetricsAggregation import *
-from .MetricVersion import *
-from .MetricVersionContent import *
-from .MetricVersionContentCategoriesItem import *
-from .MetricVersionContentFilters import *
-from .MetricVersionContentRequest import *
-from .MetricVersionContentRequestCategoriesItem import *
-from .MetricVersionContentRequestFilters import *
-from .ModelEvent import *
-from .Pagination import *
-from .PassingRange import *
-from .PostEventBatchRequest import *
-from .PostEventBatchResponse import *
-from .PostEventRequest import *
-from .PostEventResponse import *
-from .PostExperimentRunRequest import *
-from .PostExperimentRunResponse import *
-from .PostModelEventBatchRequest import *
-from .PostModelEventRequest import *
-from .PostSessionRequest import *
-from .PostSessionRequestFeedback import *
-from .PostSessionStartResponse import *
-from .PutExperimentRunRequest import *
-from .PutExperimentRunResponse import *
-from .QueryFilter import *
-from .RelativeDateRange import *
-from .RemoveDatapointResponse import *
-from .ResponseFormat import *
-from .RunMetricRequest import *
-from .RunMetricRequestEvent import *
-from .RunMetricRequestEventFeedback import *
-from .RunMetricRequestMetric import *
-from .RunMetricRequestMetricCategoriesItem import *
-from .RunMetricRequestMetricFilters import *
-from .RunMetricResponse import *
-from .SearchEventsRequest import *
-from .SearchEventsRequestDateRange import *
-from .SelectedFunction import *
-from .SessionEventBatchRequest import *
-from .SessionProperties import *
-from .SessionTracesResponse import *
-from .SingleFilter import *
-from .StartSessionRequest import *
-from .TemplateItem import *
-from .TODOSchema import *
-from .UpdateAnnotationQueueRequest import *
-from .UpdateAnnotationQueueRequestFilters import *
-from .UpdateAnnotationQueueResponse import *
-from .UpdateAnnotationQueueResponseQueue import *
-from .UpdateAnnotationQueueResponseQueueFilters import *
-from .UpdateChartRequest import *
-from .UpdateChartResponse import *
-from .UpdateChartResponseData import *
-from .UpdateConfigurationRequest import *
-from .UpdateConfigurationResponse import *
-from .UpdateDatapointParams import *
-from .UpdateDatapointRequest import *
-from .UpdateDatapointResponse import *
-from .UpdateDatapointResponseResult import *
-from .UpdateDatasetRequest import *
-from .UpdateDatasetResponse import *
-from .UpdateEventRequest import *
-from .UpdateMetricRequest import *
-from .UpdateMetricRequestCategoriesItem import *
-from .UpdateMetricRequestFilters import *
-from .UpdateMetricRequestThreshold import *
-from .UpdateMetricResponse import *
+"""Generated Pydantic models, each imported on first access.
+
+``from honeyhive._generated.models import X`` loads only ``X`` and the models
+it references, instead of all models of the API.
+"""
+
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any, List
+
+_MODEL_NAMES = frozenset(
+    [
+        "AbsoluteDateRange",
+        "AddDatapointsResponse",
+        "AddDatapointsToDatasetRequest",
+        "AddSessionTracesRequest",
+        "BatchCreateDatapointsRequest",
+        "BatchCreateDatapointsResponse",
+        "BatchDateRange",
+        "CheckState",
+        "ComparableEvent",
+        "ConfigurationItem",
+        "ConfigurationParameters",
+        "CreateAnnotationQueueRequest",
+        "CreateAnnotationQueueRequestFilters",
+        "CreateAnnotationQueueResponse",
+        "CreateAnnotationQueueResponseQueue",
+        "CreateAnnotationQueueResponseQueueFilters",
+        "CreateChartRequest",
+        "CreateChartResponse",
+        "CreateChartResponseData",
+        "CreateConfigurationRequest",
+        "CreateConfigurationResponse",
+        "CreateDatapointRequest",
+        "CreateDatapointResponse",
+        "CreateDatapointResponseResult",
+        "CreateDatasetRequest",
+        "CreateDatasetResponse",
+        "CreateMetricRequest",
+        "CreateMetricRequestCategoriesItem",
+        "CreateMetricRequestFilters",
+        "CreateMetricResponse",
+        "CreateMetricVersionRequest",
+        "CreateMetricVersionResponse",
+        "Datapoint",
+        "DatapointMapping",
+        "DatapointResult",
+        "Dataset",
+        "DeleteAnnotationQueueResponse",
+        "DeleteChartResponse",
+        "DeleteConfigurationResponse",
+        "DeleteDatapointParams",
+        "DeleteDatapointResponse",
+        "DeleteDatasetParams",
+        "DeleteDatasetResponse",
+        "DeleteExperimentRunParams",
+        "DeleteExperimentRunResponse",
+        "DeleteMetricResponse",
+        "DeleteResult",
+        "DeployMetricVersionResponse",
+        "Event",
+        "EventComparisonDetail",
+        "EventDetail",
+        "EventFeedback",
+        "EventMetricData",
+        "EventMetricDataMetadata",
+        "EventSearchFilter",
+        "EventSearchFiltersArray",
+        "ExperimentRunObject",
+        "ExperimentSchemaField",
+        "ExperimentSchemaMappingEntry",
+        "ExportEventsResponse",
+        "FiltersArray",
+        "GetAnnotationQueueByIdResponse",
+        "GetAnnotationQueueByIdResponseFilters",
+        "GetAnnotationQueuesResponse",
+        "GetAnnotationQueuesResponseQueuesItem",
+        "GetAnnotationQueuesResponseQueuesItemFilters",
+        "GetChartResponse",
+        "GetChartResponseData",
+        "GetChartsResponse",
+        "GetChartsResponseDataItem",
+        "GetConfigurationsQuery",
+        "GetConfigurationsResponse",
+        "GetDatapointParams",
+        "GetDatapointResponse",
+        "GetDatapointsQuery",
+        "GetDatapointsResponse",
+        "GetDatasetsResponse",
+        "GetEventResponse",
+        "GetEventResponseEvent",
+        "GetEventsQuery",
+        "GetEventsResponse",
+        "GetEventsSchemaLegacyDateRangeOneOf1",
+        "GetEventsSchemaResponse",
+        "GetExperimentCompareEventsResponse",
+        "GetExperimentRunCompareResponse",
+        "GetExperimentRunMetricsQuery",
+        "GetExperimentRunMetricsResponse",
+        "GetExperimentRunParams",
+        "GetExperimentRunResponse",
+        "GetExperimentRunResultResponse",
+        "GetExperimentRunsQuery",
+        "GetExperimentRunsResponse",
+        "GetMetricVersionsResponse",
+        "GetMetricsQuery",
+        "GetMetricsResponse",
+        "GetRunSchemaDateRangeOneOf1",
+        "GetRunsDateRangeOneOf1",
+        "GetRunsSchemaDateRangeOneOf1",
+        "InsertResult",
+        "LegacyDeleteDatasetQuery",
+        "LegacyEvent",
+        "LegacyExportEventsRequest",
+        "LegacyExportEventsRequestDateRange",
+        "LegacyGetEventsSchemaQuery",
+        "LegacyGetExperimentRunCompareEventsQuery",
+        "LegacyGetExperimentRunCompareParams",
+        "LegacyGetExperimentRunCompareQuery",
+        "LegacyGetExperimentRunResultQuery",
+        "LegacyPostEventBatchRequest",
+        "LegacyPostEventRequest",
+        "LegacyPostEventRequestEvent",
+        "LegacyRemoveDatapointFromDatasetParams",
+        "LegacyRunMetricRequest",
+        "LegacyRunMetricRequestEvent",
+        "LegacyRunMetricRequestEventFeedback",
+        "LegacyRunMetricRequestMetric",
+        "LegacyRunMetricRequestMetricCategoriesItem",
+        "LegacyRunMetricRequestMetricFilters",
+        "LegacyStartSessionRequest",
+        "LegacyStartSessionRequestSession",
+        "LegacyUpdateDatasetRequest",
+        "LegacyUpdateEventRequest",
+        "LegacyUpdateMetricRequest",
+        "LegacyUpdateMetricRequestCategoriesItem",
+        "LegacyUpdateMetricRequestFilters",
+        "MetricComparison",
+        "MetricDatapoints",
+        "MetricDetail",
+        "MetricItem",
+        "MetricItemCategoriesItem",
+        "MetricItemFilters",
+        "MetricVersion",
+        "MetricVersionContent",
+        "MetricVersionContentCategoriesItem",
+        "MetricVersionContentFilters",
+        "MetricVersionContentRequest",
+        "MetricVersionContentRequestCategoriesItem",
+        "MetricVersionContentRequestFilters",
+        "MetricsAggregation",
+        "ModelEvent",
+        "Pagination",
+        "PassingRange",
+        "PostEventBatchRequest",
+        "PostEventBatchResponse",
+        "PostEventRequest",
+        "PostEventResponse",
+        "PostExperimentRunRequest",
+        "PostExperimentRunResponse",
+        "PostModelEventBatchRequest",
+        "PostModelEventRequest",
+        "PostSessionRequest",
+        "PostSessionRequestFeedback",
+        "PostSessionStartResponse",
+        "PutExperimentRunRequest",
+        "PutExperimentRunResponse",
+        "QueryFilter",
+        "RelativeDateRange",
+        "RemoveDatapointResponse",
+        "ResponseFormat",
+        "RunMetricRequest",
+        "RunMetricRequestEvent",
+        "RunMetricRequestEventFeedback",
+        "RunMetricRequestMetric",
+        "RunMetricRequestMetricCategoriesItem",
+        "RunMetricRequestMetricFilters",
+        "RunMetricResponse",
+        "SearchEventsRequest",
+        "SearchEventsRequestDateRange",
+        "SelectedFunction",
+        "SessionEventBatchRequest",
+        "SessionProperties",
+        "SessionTracesResponse",
+        "SingleFilter",
+        "StartSessionRequest",
+        "TODOSchema",
+        "TemplateItem",
+        "UpdateAnnotationQueueRequest",
+        "UpdateAnnotationQueueRequestFilters",
+        "UpdateAnnotationQueueResponse",
+        "UpdateAnnotationQueueResponseQueue",
+        "UpdateAnnotationQueueResponseQueueFilters",
+        "UpdateChartRequest",
+        "UpdateChartResponse",
+        "UpdateChartResponseData",
+        "UpdateConfigurationRequest",
+        "UpdateConfigurationResponse",
+        "UpdateDatapointParams",
+        "UpdateDatapointRequest",
+        "UpdateDatapointResponse",
+        "UpdateDatapointResponseResult",
+        "UpdateDatasetRequest",
+        "UpdateDatasetResponse",
+        "UpdateEventRequest",
+        "UpdateMetricRequest",
+        "UpdateMetricRequestCategoriesItem",
+        "UpdateMetricRequestFilters",
+        "UpdateMetricRequestThreshold",
+        "UpdateMetricResponse",
+    ]
+)
+
+if TYPE_CHECKING:
+    # Type checkers see the classes; at runtime they are loaded on access
+    from .AbsoluteDateRange import AbsoluteDateRange as AbsoluteDateRange
+    from .AddDatapointsResponse import AddDatapointsResponse as AddDatapointsResponse
+    from .AddDatapointsToDatasetRequest import (
+        AddDatapointsToDatasetRequest as AddDatapointsToDatasetRequest,
+    )
+    from .AddSessionTracesRequest import (
+        AddSessionTracesRequest as AddSessionTracesRequest,
+    )
+    from .BatchCreateDatapointsRequest import (
+        BatchCreateDatapointsRequest as BatchCreateDatapointsRequest,
+    )
+    from .BatchCreateDatapointsResponse import (
+        BatchCreateDatapointsResponse as BatchCreateDatapointsResponse,
+    )
+    from .BatchDateRange import BatchDateRange as BatchDateRange
+    from .CheckState import CheckState as CheckState
+    from .ComparableEvent import ComparableEvent as ComparableEvent
+    from .ConfigurationItem import ConfigurationItem as ConfigurationItem
+    from .ConfigurationParameters import (
+        ConfigurationParameters as ConfigurationParameters,
+    )
+    from .CreateAnnotationQueueRequest import (
+        CreateAnnotationQueueRequest as CreateAnnotationQueueRequest,
+    )
+    from .CreateAnnotationQueueRequestFilters import (
+        CreateAnnotationQueueRequestFilters as CreateAnnotationQueueRequestFilters,
+    )
+    from .CreateAnnotationQueueResponse import (
+        CreateAnnotationQueueResponse as CreateAnnotationQueueResponse,
+    )
+    from .CreateAnnotationQueueResponseQueue import (
+        CreateAnnotationQueueResponseQueue as CreateAnnotationQueueResponseQueue,
+    )
+    from .CreateAnnotationQueueResponseQueueFilters import (
+        CreateAnnotationQueueResponseQueueFilters as CreateAnnotationQueueResponseQueueFilters,
+    )
+    from .CreateChartRequest import CreateChartRequest as CreateChartRequest
+    from .CreateChartResponse import CreateChartResponse as CreateChartResponse
+    from .CreateChartResponseData import (
+        CreateChartResponseData as CreateChartResponseData,
+    )
+    from .CreateConfigurationRequest import (
+        CreateConfigurationRequest as CreateConfigurationRequest,
+    )
+    from .CreateConfigurationResponse import (
+        CreateConfigurationResponse as CreateConfigurationResponse,
+    )
+    from .CreateDatapointRequest import CreateDatapointRequest as CreateDatapointRequest
+    from .CreateDatapointResponse import (
+        CreateDatapointResponse as CreateDatapointResponse,
+    )
+    from .CreateDatapointResponseResult import (
+        CreateDatapointResponseResult as CreateDatapointResponseResult,
+    )
+    from .CreateDatasetRequest import CreateDatasetRequest as CreateDatasetRequest
+    from .CreateDatasetResponse import CreateDatasetResponse as CreateDatasetResponse
+    from .CreateMetricRequest import CreateMetricRequest as CreateMetricRequest
+    from .CreateMetricRequestCategoriesItem import (
+        CreateMetricRequestCategoriesItem as CreateMetricRequestCategoriesItem,
+    )
+    from .CreateMetricRequestFilters import (
+        CreateMetricRequestFilters as CreateMetricRequestFilters,
+    )
+    from .CreateMetricResponse import CreateMetricResponse as CreateMetricResponse
+    from .CreateMetricVersionRequest import (
+        CreateMetricVersionRequest as CreateMetricVersionRequest,
+    )
+    from .CreateMetricVersionResponse import (
+        CreateMetricVersionResponse as CreateMetricVersionResponse,
+    )
+    from .Datapoint import Datapoint as Datapoint
+    from .DatapointMapping import DatapointMapping as DatapointMapping
+    from .DatapointResult import DatapointResult as DatapointResult
+    from .Dataset import Dataset as Dataset
+    from .DeleteAnnotationQueueResponse import (
+        DeleteAnnotationQueueResponse as DeleteAnnotationQueueResponse,
+    )
+    from .DeleteChartResponse import DeleteChartResponse as DeleteChartResponse
+    from .DeleteConfigurationResponse import (
+        DeleteConfigurationResponse as DeleteConfigurationResponse,
+    )
+    from .DeleteDatapointParams import DeleteDatapointParams as DeleteDatapointParams
+    from .DeleteDatapointResponse import (
+        DeleteDatapointResponse as DeleteDatapointResponse,
+    )
+    from .DeleteDatasetParams import DeleteDatasetParams as DeleteDatasetParams
+    from .DeleteDatasetResponse import DeleteDatasetResponse as DeleteDatasetResponse
+    from .DeleteExperimentRunParams import (
+        DeleteExperimentRunParams as DeleteExperimentRunParams,
+    )
+    from .DeleteExperimentRunResponse import (
+        DeleteExperimentRunResponse as DeleteExperimentRunResponse,
+    )
+    from .DeleteMetricResponse import DeleteMetricResponse as DeleteMetricResponse
+    from .DeleteResult import DeleteResult as DeleteResult
+    from .DeployMetricVersionResponse import (
+        DeployMetricVersionResponse as DeployMetricVersionResponse,
+    )
+    from .Event import Event as Event
+    from .EventComparisonDetail import EventComparisonDetail as EventComparisonDetail
+    from .EventDetail import EventDetail as EventDetail
+    from .EventFeedback import EventFeedback as EventFeedback
+    from .EventMetricData import EventMetricData as EventMetricData
+    from .EventMetricDataMetadata import (
+        EventMetricDataMetadata as EventMetricDataMetadata,
+    )
+    from .EventSearchFilter import EventSearchFilter as EventSearchFilter
+    from .EventSearchFiltersArray import (
+        EventSearchFiltersArray as EventSearchFiltersArray,
+    )
+    from .ExperimentRunObject import ExperimentRunObject as ExperimentRunObject
+    from .ExperimentSchemaField import ExperimentSchemaField as ExperimentSchemaField
+    from .ExperimentSchemaMappingEntry import (
+        ExperimentSchemaMappingEntry as ExperimentSchemaMappingEntry,
+    )
+    from .ExportEventsResponse import ExportEventsResponse as ExportEventsResponse
+    from .FiltersArray import FiltersArray as FiltersArray
+    from .GetAnnotationQueueByIdResponse import (
+        GetAnnotationQueueByIdResponse as GetAnnotationQueueByIdResponse,
+    )
+    from .GetAnnotationQueueByIdResponseFilters import (
+        GetAnnotationQueueByIdResponseFilters as GetAnnotationQueueByIdResponseFilters,
+    )
+    from .GetAnnotationQueuesResponse import (
+        GetAnnotationQueuesResponse as GetAnnotationQueuesResponse,
+    )
+    from .GetAnnotationQueuesResponseQueuesItem import (
+        GetAnnotationQueuesResponseQueuesItem as GetAnnotationQueuesResponseQueuesItem,
+    )
+    from .GetAnnotationQueuesResponseQueuesItemFilters import (
+        GetAnnotationQueuesResponseQueuesItemFilters as GetAnnotationQueuesResponseQueuesItemFilters,
+    )
+    from .GetChartResponse import GetChartResponse as GetChartResponse
+    from .GetChartResponseData import GetChartResponseData as GetChartResponseData
+    from .GetChartsResponse import GetChartsResponse as GetChartsResponse
+    from .GetChartsResponseDataItem import (
+        GetChartsResponseDataItem as GetChartsResponseDataItem,
+    )
+    from .GetConfigurationsQuery import GetConfigurationsQuery as GetConfigurationsQuery
+    from .GetConfigurationsResponse import (
+        GetConfigurationsResponse as GetConfigurationsResponse,
+    )
+    from .GetDatapointParams import GetDatapointParams as GetDatapointParams
+    from .GetDatapointResponse import GetDatapointResponse as GetDatapointResponse
+    from .GetDatapointsQuery import GetDatapointsQuery as GetDatapointsQuery
+    from .GetDatapointsResponse import GetDatapointsResponse as GetDatapointsResponse
+    from .GetDatasetsResponse import GetDatasetsResponse as GetDatasetsResponse
+    from .GetEventResponse import GetEventResponse as GetEventResponse
+    from .GetEventResponseEvent import GetEventResponseEvent as GetEventResponseEvent
+    from .GetEventsQuery import GetEventsQuery as GetEventsQuery
+    from .GetEventsResponse import GetEventsResponse as GetEventsResponse
+    from .GetEventsSchemaLegacyDateRangeOneOf1 import (
+        GetEventsSchemaLegacyDateRangeOneOf1 as GetEventsSchemaLegacyDateRangeOneOf1,
+    )
+    from .GetEventsSchemaResponse import (
+        GetEventsSchemaResponse as GetEventsSchemaResponse,
+    )
+    from .GetExperimentCompareEventsResponse import (
+        GetExperimentCompareEventsResponse as GetExperimentCompareEventsResponse,
+    )
+    from .GetExperimentRunCompareResponse import (
+        GetExperimentRunCompareResponse as GetExperimentRunCompareResponse,
+    )
+    from .GetExperimentRunMetricsQuery import (
+        GetExperimentRunMetricsQuery as GetExperimentRunMetricsQuery,
+    )
+    from .GetExperimentRunMetricsResponse import (
+        GetExperimentRunMetricsResponse as GetExperimentRunMetricsResponse,
+    )
+    from .GetExperimentRunParams import GetExperimentRunParams as GetExperimentRunParams
+    from .GetExperimentRunResponse import (
+        GetExperimentRunResponse as GetExperimentRunResponse,
+    )
+    from .GetExperimentRunResultResponse import (
+        GetExperimentRunResultResponse as GetExperimentRunResultResponse,
+    )
+    from .GetExperimentRunsQuery import GetExperimentRunsQuery as GetExperimentRunsQuery
+    from .GetExperimentRunsResponse import (
+        GetExperimentRunsResponse as GetExperimentRunsResponse,
+    )
+    from .GetMetricsQuery import GetMetricsQuery as GetMetricsQuery
+    from .GetMetricsResponse import GetMetricsResponse as GetMetricsResponse
+    from .GetMetricVersionsResponse import (
+        GetMetricVersionsResponse as GetMetricVersionsResponse,
+    )
+    from .GetRunSchemaDateRangeOneOf1 import (
+        GetRunSchemaDateRangeOneOf1 as GetRunSchemaDateRangeOneOf1,
+    )
+    from .GetRunsDateRangeOneOf1 import GetRunsDateRangeOneOf1 as GetRunsDateRangeOneOf1
+    from .GetRunsSchemaDateRangeOneOf1 import (
+        GetRunsSchemaDateRangeOneOf1 as GetRunsSchemaDateRangeOneOf1,
+    )
+    from .InsertResult import InsertResult as InsertResult
+    from .LegacyDeleteDatasetQuery import (
+        LegacyDeleteDatasetQuery as LegacyDeleteDatasetQuery,
+    )
+    from .LegacyEvent import LegacyEvent as LegacyEvent
+    from .LegacyExportEventsRequest import (
+        LegacyExportEventsRequest as LegacyExportEventsRequest,
+    )
+    from .LegacyExportEventsRequestDateRange import (
+        LegacyExportEventsRequestDateRange as LegacyExportEventsRequestDateRange,
+    )
+    from .LegacyGetEventsSchemaQuery import (
+        LegacyGetEventsSchemaQuery as LegacyGetEventsSchemaQuery,
+    )
+    from .LegacyGetExperimentRunCompareEventsQuery import (
+        LegacyGetExperimentRunCompareEventsQuery as LegacyGetExperimentRunCompareEventsQuery,
+    )
+    from .LegacyGetExperimentRunCompareParams import (
+        LegacyGetExperimentRunCompareParams as LegacyGetExperimentRunCompareParams,
+    )
+    from .LegacyGetExperimentRunCompareQuery import (
+        LegacyGetExperimentRunCompareQuery as LegacyGetExperimentRunCompareQuery,
+    )
+    from .LegacyGetExperimentRunResultQuery import (
+        LegacyGetExperimentRunResultQuery as LegacyGetExperimentRunResultQuery,
+    )
+    from .LegacyPostEventBatchRequest import (
+        LegacyPostEventBatchRequest as LegacyPostEventBatchRequest,
+    )
+    from .LegacyPostEventRequest import LegacyPostEventRequest as LegacyPostEventRequest
+    from .LegacyPostEventRequestEvent import (
+        LegacyPostEventRequestEvent as LegacyPostEventRequestEvent,
+    )
+    from .LegacyRemoveDatapointFromDatasetParams import (
+        LegacyRemoveDatapointFromDatasetParams as LegacyRemoveDatapointFromDatasetParams,
+    )
+    from .LegacyRunMetricRequest import LegacyRunMetricRequest as LegacyRunMetricRequest
+    from .LegacyRunMetricRequestEvent import (
+        LegacyRunMetricRequestEvent as LegacyRunMetricRequestEvent,
+    )
+    from .LegacyRunMetricRequestEventFeedback import (
+        LegacyRunMetricRequestEventFeedback as LegacyRunMetricRequestEventFeedback,
+    )
+    from .LegacyRunMetricRequestMetric import (
+        LegacyRunMetricRequestMetric as LegacyRunMetricRequestMetric,
+    )
+    from .LegacyRunMetricRequestMetricCategoriesItem import (
+        LegacyRunMetricRequestMetricCategoriesItem as LegacyRunMetricRequestMetricCategoriesItem,
+    )
+    from .LegacyRunMetricRequestMetricFilters import (
+        LegacyRunMetricRequestMetricFilters as LegacyRunMetricRequestMetricFilters,
+    )
+    from .LegacyStartSessionRequest import (
+        LegacyStartSessionRequest as LegacyStartSessionRequest,
+    )
+    from .LegacyStartSessionRequestSession import (
+        LegacyStartSessionRequestSession as LegacyStartSessionRequestSession,
+    )
+    from .LegacyUpdateDatasetRequest import (
+        LegacyUpdateDatasetRequest as LegacyUpdateDatasetRequest,
+    )
+    from .LegacyUpdateEventRequest import (
+        LegacyUpdateEventRequest as LegacyUpdateEventRequest,
+    )
+    from .LegacyUpdateMetricRequest import (
+        LegacyUpdateMetricRequest as LegacyUpdateMetricRequest,
+    )
+    from .LegacyUpdateMetricRequestCategoriesItem import (
+        LegacyUpdateMetricRequestCategoriesItem as LegacyUpdateMetricRequestCategoriesItem,
+    )
+    from .LegacyUpdateMetricRequestFilters import (
+        LegacyUpdateMetricRequestFilters as LegacyUpdateMetricRequestFilters,
+    )
+    from .MetricComparison import MetricComparison as MetricComparison
+    from .MetricDatapoints import MetricDatapoints as MetricDatapoints
+    from .MetricDetail import MetricDetail as MetricDetail
+    from .MetricItem import MetricItem as MetricItem
+    from .MetricItemCategoriesItem import (
+        MetricItemCategoriesItem as MetricItemCategoriesItem,
+    )
+    from .MetricItemFilters import MetricItemFilters as MetricItemFilters
+    from .MetricsAggregation import MetricsAggregation as MetricsAggregation
+    from .MetricVersion import MetricVersion as MetricVersion
+    from .MetricVersionContent import MetricVersionContent as MetricVersionContent
+    from .MetricVersionContentCategoriesItem import (
+        MetricVersionContentCategoriesItem as MetricVersionContentCategoriesItem,
+    )
+    from .MetricVersionContentFilters import (
+        MetricVersionContentFilters as MetricVersionContentFilters,
+    )
+    from .MetricVersionContentRequest import (
+        MetricVersionContentRequest as MetricVersionContentRequest,
+    )
+    from .MetricVersionContentRequestCategoriesItem import (
+        MetricVersionContentRequestCategoriesItem as MetricVersionContentRequestCategoriesItem,
+    )
+    from .MetricVersionContentRequestFilters import (
+        MetricVersionContentRequestFilters as MetricVersionContentRequestFilters,
+    )
+    from .ModelEvent import ModelEvent as ModelEvent
+    from .Pagination import Pagination as Pagination
+    from .PassingRange import PassingRange as PassingRange
+    from .PostEventBatchRequest import PostEventBatchRequest as PostEventBatchRequest
+    from .PostEventBatchResponse import PostEventBatchResponse as PostEventBatchResponse
+    from .PostEventRequest import PostEventRequest as PostEventRequest
+    from .PostEventResponse import PostEventResponse as PostEventResponse
+    from .PostExperimentRunRequest import (
+        PostExperimentRunRequest as PostExperimentRunRequest,
+    )
+    from .PostExperimentRunResponse import (
+        PostExperimentRunResponse as PostExperimentRunResponse,
+    )
+    from .PostModelEventBatchRequest import (
+        PostModelEventBatchRequest as PostModelEventBatchRequest,
+    )
+    from .PostModelEventRequest import PostModelEventRequest as PostModelEventRequest
+    from .PostSessionRequest import PostSessionRequest as PostSessionRequest
+    from .PostSessionRequestFeedback import (
+        PostSessionRequestFeedback as PostSessionRequestFeedback,
+    )
+    from .PostSessionStartResponse import (
+        PostSessionStartResponse as PostSessionStartResponse,
+    )
+    from .PutExperimentRunRequest import (
+        PutExperimentRunRequest as PutExperimentRunRequest,
+    )
+    from .PutExperimentRunResponse import (
+        PutExperimentRunResponse as PutExperimentRunResponse,
+    )
+    from .QueryFilter import QueryFilter as QueryFilter
+    from .RelativeDateRange import RelativeDateRange as RelativeDateRange
+    from .RemoveDatapointResponse import (
+        RemoveDatapointResponse as RemoveDatapointResponse,
+    )
+    from .ResponseFormat import ResponseFormat as ResponseFormat
+    from .RunMetricRequest import RunMetricRequest as RunMetricRequest
+    from .RunMetricRequestEvent import RunMetricRequestEvent as RunMetricRequestEvent
+    from .RunMetricRequestEventFeedback import (
+        RunMetricRequestEventFeedback as RunMetricRequestEventFeedback,
+    )
+    from .RunMetricRequestMetric import RunMetricRequestMetric as RunMetricRequestMetric
+    from .RunMetricRequestMetricCategoriesItem import (
+        RunMetricRequestMetricCategoriesItem as RunMetricRequestMetricCategoriesItem,
+    )
+    from .RunMetricRequestMetricFilters import (
+        RunMetricRequestMetricFilters as RunMetricRequestMetricFilters,
+    )
+    from .RunMetricResponse import RunMetricResponse as RunMetricResponse
+    from .SearchEventsRequest import SearchEventsRequest as SearchEventsRequest
+    from .SearchEventsRequestDateRange import (
+        SearchEventsRequestDateRange as SearchEventsRequestDateRange,
+    )
+    from .SelectedFunction import SelectedFunction as SelectedFunction
+    from .SessionEventBatchRequest import (
+        SessionEventBatchRequest as SessionEventBatchRequest,
+    )
+    from .SessionProperties import SessionProperties as SessionProperties
+    from .SessionTracesResponse import SessionTracesResponse as SessionTracesResponse
+    from .SingleFilter import SingleFilter as SingleFilter
+    from .StartSessionRequest import StartSessionRequest as StartSessionRequest
+    from .TemplateItem import TemplateItem as TemplateItem
+    from .TODOSchema import TODOSchema as TODOSchema
+    from .UpdateAnnotationQueueRequest import (
+        UpdateAnnotationQueueRequest as UpdateAnnotationQueueRequest,
+    )
+    from .UpdateAnnotationQueueRequestFilters import (
+        UpdateAnnotationQueueRequestFilters as UpdateAnnotationQueueRequestFilters,
+    )
+    from .UpdateAnnotationQueueResponse import (
+        UpdateAnnotationQueueResponse as UpdateAnnotationQueueResponse,
+    )
+    from .UpdateAnnotationQueueResponseQueue import (
+        UpdateAnnotationQueueResponseQueue as UpdateAnnotationQueueResponseQueue,
+    )
+    from .UpdateAnnotationQueueResponseQueueFilters import (
+        UpdateAnnotationQueueResponseQueueFilters as UpdateAnnotationQueueResponseQueueFilters,
+    )
+    from .UpdateChartRequest import UpdateChartRequest as UpdateChartRequest
+    from .UpdateChartResponse import UpdateChartResponse as UpdateChartResponse
+    from .UpdateChartResponseData import (
+        UpdateChartResponseData as UpdateChartResponseData,
+    )
+    from .UpdateConfigurationRequest import (
+        UpdateConfigurationRequest as UpdateConfigurationRequest,
+    )
+    from .UpdateConfigurationResponse import (
+        UpdateConfigurationResponse as UpdateConfigurationResponse,
+    )
+    from .UpdateDatapointParams import UpdateDatapointParams as UpdateDatapointParams
+    from .UpdateDatapointRequest import UpdateDatapointRequest as UpdateDatapointRequest
+    from .UpdateDatapointResponse import (
+        UpdateDatapointResponse as UpdateDatapointResponse,
+    )
+    from .UpdateDatapointResponseResult import (
+        UpdateDatapointResponseResult as UpdateDatapointResponseResult,
+    )
+    from .UpdateDatasetRequest import UpdateDatasetRequest as UpdateDatasetRequest
+    from .UpdateDatasetResponse import UpdateDatasetResponse as UpdateDatasetResponse
+    from .UpdateEventRequest import UpdateEventRequest as UpdateEventRequest
+    from .UpdateMetricRequest import UpdateMetricRequest as UpdateMetricRequest
+    from .UpdateMetricRequestCategoriesItem import (
+        UpdateMetricRequestCategoriesItem as UpdateMetricRequestCategoriesItem,
+    )
+    from .UpdateMetricRequestFilters import (
+        UpdateMetricRequestFilters as UpdateMetricRequestFilters,
+    )
+    from .UpdateMetricRequestThreshold import (
+        UpdateMetricRequestThreshold as UpdateMetricRequestThreshold,
+    )
+    from .UpdateMetricResponse import UpdateMetricResponse as UpdateMetricResponse
+
+__all__ = sorted(_MODEL_NAMES)
+
+
+class _ModelsModule(types.ModuleType):
+    """Keeps model classes, not their modules, under the model names."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing submodule X makes the import system set package.X to the
+        # module; every model module defines a class of the same name
+        if name in _MODEL_NAMES and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a model on first access."""
+    if name not in _MODEL_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    importlib.import_module(f".{name}", __name__)
+    return globals()[name]
+
+
+def __dir__() -> List[str]:
+    """List loaded attributes plus all model names."""
+    return sorted(set(globals()) | _MODEL_NAMES)
+
+
+sys.modules[__name__].__class__ = _ModelsModule
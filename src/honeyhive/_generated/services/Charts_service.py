@@ -2,14 +2,26 @@ from typing import *
 
 import httpx
 
-from ..api_config import APIConfig, HTTPException, _serialize_query_params
-from ..models import *
+from ..api_config import (
+    APIConfig,
+    HTTPException,
+    _serialize_query_params,
+    get_default_api_config,
+)
+from ..models import (
+    CreateChartRequest,
+    CreateChartResponse,
+    DeleteChartResponse,
+    GetChartResponse,
+    GetChartsResponse,
+    UpdateChartRequest,
+    UpdateChartResponse,
+)
 
 
 def getCharts(api_config_override: Optional[APIConfig] = None) -> GetChartsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/charts"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -18,15 +30,13 @@ def getCharts(api_config_override: Optional[APIConfig] = None) -> GetChartsRespo
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -42,9 +52,8 @@ def getCharts(api_config_override: Optional[APIConfig] = None) -> GetChartsRespo
 def createChart(
     api_config_override: Optional[APIConfig] = None, *, data: CreateChartRequest
 ) -> CreateChartResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/charts"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -53,16 +62,14 @@ def createChart(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -78,9 +85,8 @@ def createChart(
 def getChart(
     api_config_override: Optional[APIConfig] = None, *, chart_id: str
 ) -> GetChartResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/charts/{chart_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -89,15 +95,13 @@ def getChart(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -116,9 +120,8 @@ def updateChart(
     chart_id: str,
     data: UpdateChartRequest,
 ) -> UpdateChartResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/charts/{chart_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -127,16 +130,14 @@ def updateChart(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "put",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "put",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -152,9 +153,8 @@ def updateChart(
 def deleteChart(
     api_config_override: Optional[APIConfig] = None, *, chart_id: str
 ) -> DeleteChartResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/charts/{chart_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -163,15 +163,13 @@ def deleteChart(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "delete",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
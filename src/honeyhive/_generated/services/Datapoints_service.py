@@ -2,8 +2,23 @@ from typing import *
 
 import httpx
 
-from ..api_config import APIConfig, HTTPException, _serialize_query_params
-from ..models import *
+from ..api_config import (
+    APIConfig,
+    HTTPException,
+    _serialize_query_params,
+    get_default_api_config,
+)
+from ..models import (
+    BatchCreateDatapointsRequest,
+    BatchCreateDatapointsResponse,
+    CreateDatapointRequest,
+    CreateDatapointResponse,
+    DeleteDatapointResponse,
+    GetDatapointResponse,
+    GetDatapointsResponse,
+    UpdateDatapointRequest,
+    UpdateDatapointResponse,
+)
 
 
 def getDatapoints(
@@ -12,9 +27,8 @@ def getDatapoints(
     datapoint_ids: Optional[List[str]] = None,
     dataset_name: Optional[str] = None,
 ) -> GetDatapointsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datapoints"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {
@@ -26,15 +40,13 @@ def getDatapoints(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -52,9 +64,8 @@ def getDatapoints(
 def createDatapoint(
     api_config_override: Optional[APIConfig] = None, *, data: CreateDatapointRequest
 ) -> CreateDatapointResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datapoints"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -63,16 +74,14 @@ def createDatapoint(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -94,9 +103,8 @@ def batchCreateDatapoints(
     *,
     data: BatchCreateDatapointsRequest,
 ) -> BatchCreateDatapointsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datapoints/batch"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -105,16 +113,14 @@ def batchCreateDatapoints(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -134,9 +140,8 @@ def batchCreateDatapoints(
 def getDatapoint(
     api_config_override: Optional[APIConfig] = None, *, datapoint_id: str
 ) -> GetDatapointResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datapoints/{datapoint_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -145,15 +150,13 @@ def getDatapoint(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -172,9 +175,8 @@ def updateDatapoint(
     datapoint_id: str,
     data: UpdateDatapointRequest,
 ) -> UpdateDatapointResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datapoints/{datapoint_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -183,16 +185,14 @@ def updateDatapoint(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "put",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "put",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -212,9 +212,8 @@ def updateDatapoint(
 def deleteDatapoint(
     api_config_override: Optional[APIConfig] = None, *, datapoint_id: str
 ) -> DeleteDatapointResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datapoints/{datapoint_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -223,15 +222,13 @@ def deleteDatapoint(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "delete",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
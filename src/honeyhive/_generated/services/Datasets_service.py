@@ -2,8 +2,24 @@ from typing import *
 
 import httpx
 
-from ..api_config import APIConfig, HTTPException, _serialize_query_params
-from ..models import *
+from ..api_config import (
+    APIConfig,
+    HTTPException,
+    _serialize_query_params,
+    get_default_api_config,
+)
+from ..models import (
+    AddDatapointsResponse,
+    AddDatapointsToDatasetRequest,
+    CreateDatasetRequest,
+    CreateDatasetResponse,
+    DeleteDatasetResponse,
+    GetDatasetsResponse,
+    LegacyUpdateDatasetRequest,
+    RemoveDatapointResponse,
+    UpdateDatasetRequest,
+    UpdateDatasetResponse,
+)
 
 
 def getDatasets(
@@ -12,9 +28,8 @@ def getDatasets(
     dataset_id: Optional[str] = None,
     name: Optional[str] = None,
 ) -> GetDatasetsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datasets"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {"dataset_id": dataset_id, "name": name}
@@ -23,15 +38,13 @@ def getDatasets(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -47,9 +60,8 @@ def getDatasets(
 def createDataset(
     api_config_override: Optional[APIConfig] = None, *, data: CreateDatasetRequest
 ) -> CreateDatasetResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datasets"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -58,16 +70,14 @@ def createDataset(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -85,9 +95,8 @@ def createDataset(
 def updateDatasetLegacy(
     api_config_override: Optional[APIConfig] = None, *, data: LegacyUpdateDatasetRequest
 ) -> UpdateDatasetResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datasets"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -96,16 +105,14 @@ def updateDatasetLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "put",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "put",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -123,9 +130,8 @@ def updateDatasetLegacy(
 def deleteDatasetLegacy(
     api_config_override: Optional[APIConfig] = None, *, dataset_id: str
 ) -> DeleteDatasetResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datasets"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {"dataset_id": dataset_id}
@@ -134,15 +140,13 @@ def deleteDatasetLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "delete",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -163,9 +167,8 @@ def updateDataset(
     dataset_id: str,
     data: UpdateDatasetRequest,
 ) -> UpdateDatasetResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datasets/{dataset_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -174,16 +177,14 @@ def updateDataset(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "put",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "put",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -201,9 +202,8 @@ def updateDataset(
 def deleteDataset(
     api_config_override: Optional[APIConfig] = None, *, dataset_id: str
 ) -> DeleteDatasetResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datasets/{dataset_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -212,15 +212,13 @@ def deleteDataset(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "delete",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -241,9 +239,8 @@ def addDatapoints(
     dataset_id: str,
     data: AddDatapointsToDatasetRequest,
 ) -> AddDatapointsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datasets/{dataset_id}/datapoints"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -252,16 +249,14 @@ def addDatapoints(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -282,9 +277,8 @@ def removeDatapoint(
     dataset_id: str,
     datapoint_id: str,
 ) -> RemoveDatapointResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datasets/{dataset_id}/datapoints/{datapoint_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -293,15 +287,13 @@ def removeDatapoint(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "delete",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -324,9 +316,8 @@ def removeDatapointLegacy(
     dataset_id: str,
     datapoint_id: str,
 ) -> RemoveDatapointResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/datasets/{dataset_id}/{datapoint_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -335,15 +326,13 @@ def removeDatapointLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "delete",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
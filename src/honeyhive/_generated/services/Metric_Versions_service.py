@@ -2,16 +2,25 @@ from typing import *
 
 import httpx
 
-from ..api_config import APIConfig, HTTPException, _serialize_query_params
-from ..models import *
+from ..api_config import (
+    APIConfig,
+    HTTPException,
+    _serialize_query_params,
+    get_default_api_config,
+)
+from ..models import (
+    CreateMetricVersionRequest,
+    CreateMetricVersionResponse,
+    DeployMetricVersionResponse,
+    GetMetricVersionsResponse,
+)
 
 
 def getMetricVersions(
     api_config_override: Optional[APIConfig] = None, *, metric_id: str
 ) -> GetMetricVersionsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/metrics/{metric_id}/versions"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -20,15 +29,13 @@ def getMetricVersions(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -51,9 +58,8 @@ def createMetricVersion(
     metric_id: str,
     data: CreateMetricVersionRequest,
 ) -> CreateMetricVersionResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/metrics/{metric_id}/versions"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -62,16 +68,14 @@ def createMetricVersion(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -94,9 +98,8 @@ def deployMetricVersion(
     metric_id: str,
     version_name: str,
 ) -> DeployMetricVersionResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/metrics/{metric_id}/versions/{version_name}/deploy"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -105,15 +108,13 @@ def deployMetricVersion(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -2,8 +2,24 @@ from typing import *
 
 import httpx
 
-from ..api_config import APIConfig, HTTPException, _serialize_query_params
-from ..models import *
+from ..api_config import (
+    APIConfig,
+    HTTPException,
+    _serialize_query_params,
+    get_default_api_config,
+)
+from ..models import (
+    CreateMetricRequest,
+    CreateMetricResponse,
+    DeleteMetricResponse,
+    GetMetricsResponse,
+    LegacyRunMetricRequest,
+    LegacyUpdateMetricRequest,
+    RunMetricRequest,
+    RunMetricResponse,
+    UpdateMetricRequest,
+    UpdateMetricResponse,
+)
 
 
 def getMetrics(
@@ -12,9 +28,8 @@ def getMetrics(
     type: Optional[str] = None,
     id: Optional[str] = None,
 ) -> GetMetricsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/metrics"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {"type": type, "id": id}
@@ -23,15 +38,13 @@ def getMetrics(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -47,9 +60,8 @@ def getMetrics(
 def createMetric(
     api_config_override: Optional[APIConfig] = None, *, data: CreateMetricRequest
 ) -> CreateMetricResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/metrics"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -58,16 +70,14 @@ def createMetric(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -83,9 +93,8 @@ def createMetric(
 def updateMetricLegacy(
     api_config_override: Optional[APIConfig] = None, *, data: LegacyUpdateMetricRequest
 ) -> UpdateMetricResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/metrics"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -94,16 +103,14 @@ def updateMetricLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "put",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "put",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -119,9 +126,8 @@ def updateMetricLegacy(
 def deleteMetricLegacy(
     api_config_override: Optional[APIConfig] = None, *, metric_id: str
 ) -> DeleteMetricResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/metrics"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {"metric_id": metric_id}
@@ -130,15 +136,13 @@ def deleteMetricLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "delete",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -157,9 +161,8 @@ def updateMetric(
     metric_id: str,
     data: UpdateMetricRequest,
 ) -> UpdateMetricResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/metrics/{metric_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -168,16 +171,14 @@ def updateMetric(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "put",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "put",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -193,9 +194,8 @@ def updateMetric(
 def deleteMetric(
     api_config_override: Optional[APIConfig] = None, *, metric_id: str
 ) -> DeleteMetricResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/metrics/{metric_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -204,15 +204,13 @@ def deleteMetric(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "delete",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -228,9 +226,8 @@ def deleteMetric(
 def runMetric(
     api_config_override: Optional[APIConfig] = None, *, data: RunMetricRequest
 ) -> RunMetricResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/metrics/run"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -239,16 +236,14 @@ def runMetric(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -264,9 +259,8 @@ def runMetric(
 def runMetricLegacy(
     api_config_override: Optional[APIConfig] = None, *, data: LegacyRunMetricRequest
 ) -> RunMetricResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/metrics/run_metric"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -275,16 +269,14 @@ def runMetricLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    with httpx.Client(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_client()
+    response = client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -2,16 +2,28 @@ from typing import *
 
 import httpx
 
-from ..api_config import APIConfig, HTTPException, _serialize_query_params
-from ..models import *
+from ..api_config import (
+    APIConfig,
+    HTTPException,
+    _serialize_query_params,
+    get_default_api_config,
+)
+from ..models import (
+    CreateChartRequest,
+    CreateChartResponse,
+    DeleteChartResponse,
+    GetChartResponse,
+    GetChartsResponse,
+    UpdateChartRequest,
+    UpdateChartResponse,
+)
 
 
 async def getCharts(
     api_config_override: Optional[APIConfig] = None,
 ) -> GetChartsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/charts"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -20,15 +32,13 @@ async def getCharts(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -44,9 +54,8 @@ async def getCharts(
 async def createChart(
     api_config_override: Optional[APIConfig] = None, *, data: CreateChartRequest
 ) -> CreateChartResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/charts"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -55,16 +64,14 @@ async def createChart(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -80,9 +87,8 @@ async def createChart(
 async def getChart(
     api_config_override: Optional[APIConfig] = None, *, chart_id: str
 ) -> GetChartResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/charts/{chart_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -91,15 +97,13 @@ async def getChart(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -118,9 +122,8 @@ async def updateChart(
     chart_id: str,
     data: UpdateChartRequest,
 ) -> UpdateChartResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/charts/{chart_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -129,16 +132,14 @@ async def updateChart(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "put",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "put",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -154,9 +155,8 @@ async def updateChart(
 async def deleteChart(
     api_config_override: Optional[APIConfig] = None, *, chart_id: str
 ) -> DeleteChartResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/charts/{chart_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -165,15 +165,13 @@ async def deleteChart(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "delete",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -2,8 +2,20 @@ from typing import *
 
 import httpx
 
-from ..api_config import APIConfig, HTTPException, _serialize_query_params
-from ..models import *
+from ..api_config import (
+    APIConfig,
+    HTTPException,
+    _serialize_query_params,
+    get_default_api_config,
+)
+from ..models import (
+    CreateConfigurationRequest,
+    CreateConfigurationResponse,
+    DeleteConfigurationResponse,
+    GetConfigurationsResponse,
+    UpdateConfigurationRequest,
+    UpdateConfigurationResponse,
+)
 
 
 async def getConfigurations(
@@ -13,9 +25,8 @@ async def getConfigurations(
     env: Optional[str] = None,
     tags: Optional[str] = None,
 ) -> GetConfigurationsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/configurations"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {"name": name, "env": env, "tags": tags}
@@ -24,15 +35,13 @@ async def getConfigurations(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -52,9 +61,8 @@ async def getConfigurations(
 async def createConfiguration(
     api_config_override: Optional[APIConfig] = None, *, data: CreateConfigurationRequest
 ) -> CreateConfigurationResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/configurations"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -63,16 +71,14 @@ async def createConfiguration(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -95,9 +101,8 @@ async def updateConfiguration(
     configId: str,
     data: UpdateConfigurationRequest,
 ) -> UpdateConfigurationResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/configurations/{configId}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -106,16 +111,14 @@ async def updateConfiguration(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "put",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "put",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -135,9 +138,8 @@ async def updateConfiguration(
 async def deleteConfiguration(
     api_config_override: Optional[APIConfig] = None, *, configId: str
 ) -> DeleteConfigurationResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/configurations/{configId}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -146,15 +148,13 @@ async def deleteConfiguration(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "delete",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -2,16 +2,37 @@ from typing import *
 
 import httpx
 
-from ..api_config import APIConfig, HTTPException, _serialize_query_params
-from ..models import *
+from ..api_config import (
+    APIConfig,
+    HTTPException,
+    _serialize_query_params,
+    get_default_api_config,
+)
+from ..models import (
+    ExportEventsResponse,
+    GetEventResponse,
+    GetEventsSchemaLegacyDateRangeOneOf1,
+    GetEventsSchemaResponse,
+    LegacyExportEventsRequest,
+    LegacyPostEventBatchRequest,
+    LegacyPostEventRequest,
+    LegacyUpdateEventRequest,
+    PostEventBatchRequest,
+    PostEventBatchResponse,
+    PostEventRequest,
+    PostEventResponse,
+    PostModelEventBatchRequest,
+    PostModelEventRequest,
+    SearchEventsRequest,
+    UpdateEventRequest,
+)
 
 
 async def createEventLegacy(
     api_config_override: Optional[APIConfig] = None, *, data: LegacyPostEventRequest
 ) -> PostEventResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/events"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -20,16 +41,14 @@ async def createEventLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -45,9 +64,8 @@ async def createEventLegacy(
 async def updateEventLegacy(
     api_config_override: Optional[APIConfig] = None, *, data: LegacyUpdateEventRequest
 ) -> None:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/events"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -56,16 +74,14 @@ async def updateEventLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "put",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "put",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -81,9 +97,8 @@ async def updateEventLegacy(
 async def createEvent(
     api_config_override: Optional[APIConfig] = None, *, data: PostEventRequest
 ) -> PostEventResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/events"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -92,16 +107,14 @@ async def createEvent(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -117,9 +130,8 @@ async def createEvent(
 async def getEvent(
     api_config_override: Optional[APIConfig] = None, *, event_id: str
 ) -> GetEventResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/events/{event_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -128,15 +140,13 @@ async def getEvent(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -155,9 +165,8 @@ async def updateEvent(
     event_id: str,
     data: UpdateEventRequest,
 ) -> None:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/events/{event_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -166,16 +175,14 @@ async def updateEvent(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "put",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "put",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -191,9 +198,8 @@ async def updateEvent(
 async def exportEventsLegacy(
     api_config_override: Optional[APIConfig] = None, *, data: LegacyExportEventsRequest
 ) -> ExportEventsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/events/export"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -202,16 +208,14 @@ async def exportEventsLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -227,9 +231,8 @@ async def exportEventsLegacy(
 async def searchEvents(
     api_config_override: Optional[APIConfig] = None, *, data: SearchEventsRequest
 ) -> ExportEventsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/events/search"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -238,16 +241,14 @@ async def searchEvents(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -263,9 +264,8 @@ async def searchEvents(
 async def createEventBatch(
     api_config_override: Optional[APIConfig] = None, *, data: PostEventBatchRequest
 ) -> PostEventBatchResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/events/batch"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -274,16 +274,14 @@ async def createEventBatch(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -301,9 +299,8 @@ async def createEventBatch(
 async def createModelEventLegacy(
     api_config_override: Optional[APIConfig] = None, *, data: PostModelEventRequest
 ) -> PostEventResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/events/model"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -312,16 +309,14 @@ async def createModelEventLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -339,9 +334,8 @@ async def createEventBatchLegacy(
     *,
     data: LegacyPostEventBatchRequest,
 ) -> PostEventBatchResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/events/batch"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -350,16 +344,14 @@ async def createEventBatchLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -377,9 +369,8 @@ async def createEventBatchLegacy(
 async def createModelEventBatchLegacy(
     api_config_override: Optional[APIConfig] = None, *, data: PostModelEventBatchRequest
 ) -> PostEventBatchResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/events/model/batch"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -388,16 +379,14 @@ async def createModelEventBatchLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -418,9 +407,8 @@ async def getEventsSchemaLegacy(
     dateRange: Optional[Union[str, GetEventsSchemaLegacyDateRangeOneOf1]] = None,
     evaluation_id: Optional[str] = None,
 ) -> GetEventsSchemaResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/events/schema"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {
@@ -432,15 +420,13 @@ async def getEventsSchemaLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -2,8 +2,29 @@ from typing import *
 
 import httpx
 
-from ..api_config import APIConfig, HTTPException, _serialize_query_params
-from ..models import *
+from ..api_config import (
+    APIConfig,
+    HTTPException,
+    _serialize_query_params,
+    get_default_api_config,
+)
+from ..models import (
+    DeleteExperimentRunResponse,
+    GetEventsSchemaResponse,
+    GetExperimentCompareEventsResponse,
+    GetExperimentRunCompareResponse,
+    GetExperimentRunMetricsResponse,
+    GetExperimentRunResponse,
+    GetExperimentRunResultResponse,
+    GetExperimentRunsResponse,
+    GetRunSchemaDateRangeOneOf1,
+    GetRunsDateRangeOneOf1,
+    GetRunsSchemaDateRangeOneOf1,
+    PostExperimentRunRequest,
+    PostExperimentRunResponse,
+    PutExperimentRunRequest,
+    PutExperimentRunResponse,
+)
 
 
 async def getRuns(
@@ -19,9 +40,8 @@ async def getRuns(
     sort_by: Optional[str] = None,
     sort_order: Optional[str] = None,
 ) -> GetExperimentRunsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {
@@ -40,15 +60,13 @@ async def getRuns(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -68,9 +86,8 @@ async def getRuns(
 async def createRun(
     api_config_override: Optional[APIConfig] = None, *, data: PostExperimentRunRequest
 ) -> PostExperimentRunResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -79,16 +96,14 @@ async def createRun(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -110,9 +125,8 @@ async def getRunsSchema(
     *,
     dateRange: Optional[Union[str, GetRunsSchemaDateRangeOneOf1]] = None,
 ) -> GetEventsSchemaResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs/schema"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {"dateRange": dateRange}
@@ -121,15 +135,13 @@ async def getRunsSchema(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -149,9 +161,8 @@ async def getRunsSchema(
 async def getRun(
     api_config_override: Optional[APIConfig] = None, *, run_id: str
 ) -> GetExperimentRunResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs/{run_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -160,15 +171,13 @@ async def getRun(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -191,9 +200,8 @@ async def updateRun(
     run_id: str,
     data: PutExperimentRunRequest,
 ) -> PutExperimentRunResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs/{run_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -202,16 +210,14 @@ async def updateRun(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "put",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "put",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -231,9 +237,8 @@ async def updateRun(
 async def deleteRun(
     api_config_override: Optional[APIConfig] = None, *, run_id: str
 ) -> DeleteExperimentRunResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs/{run_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -242,15 +247,13 @@ async def deleteRun(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "delete",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -273,9 +276,8 @@ async def getRunSchema(
     run_id: str,
     dateRange: Optional[Union[str, GetRunSchemaDateRangeOneOf1]] = None,
 ) -> GetEventsSchemaResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs/{run_id}/schema"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {"dateRange": dateRange}
@@ -284,15 +286,13 @@ async def getRunSchema(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -316,9 +316,8 @@ async def getExperimentRunMetrics(
     dateRange: Optional[str] = None,
     filters: Optional[Union[str, List[Dict[str, Any]]]] = None,
 ) -> GetExperimentRunMetricsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs/{run_id}/metrics"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {"dateRange": dateRange, "filters": filters}
@@ -327,15 +326,13 @@ async def getExperimentRunMetrics(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -359,9 +356,8 @@ async def getExperimentSummary(
     aggregate_function: Optional[str] = None,
     filters: Optional[Union[str, List[Dict[str, Any]]]] = None,
 ) -> GetExperimentRunResultResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs/{run_id}/summary"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {
@@ -373,15 +369,13 @@ async def getExperimentSummary(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -405,9 +399,8 @@ async def getExperimentResultLegacy(
     aggregate_function: Optional[str] = None,
     filters: Optional[Union[str, List[Dict[str, Any]]]] = None,
 ) -> GetExperimentRunResultResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs/{run_id}/result"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {
@@ -419,15 +412,13 @@ async def getExperimentResultLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -452,9 +443,8 @@ async def getExperimentComparison(
     aggregate_function: Optional[str] = None,
     filters: Optional[Union[str, List[Dict[str, Any]]]] = None,
 ) -> GetExperimentRunCompareResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs/{new_run_id}/compare/{old_run_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {
@@ -466,15 +456,13 @@ async def getExperimentComparison(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -499,9 +487,8 @@ async def getExperimentComparisonLegacy(
     aggregate_function: Optional[str] = None,
     filters: Optional[Union[str, List[Dict[str, Any]]]] = None,
 ) -> GetExperimentRunCompareResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs/{new_run_id}/compare-with/{old_run_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {
@@ -513,15 +500,13 @@ async def getExperimentComparisonLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -549,9 +534,8 @@ async def getExperimentCompareEvents(
     limit: Optional[int] = None,
     page: Optional[int] = None,
 ) -> GetExperimentCompareEventsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs/{new_run_id}/compare/{old_run_id}/events"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {
@@ -566,15 +550,13 @@ async def getExperimentCompareEvents(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -602,9 +584,8 @@ async def getExperimentCompareEventsLegacy(
     limit: Optional[int] = None,
     page: Optional[int] = None,
 ) -> GetExperimentCompareEventsResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/runs/compare/events"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {
@@ -621,15 +602,13 @@ async def getExperimentCompareEventsLegacy(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -2,16 +2,28 @@ from typing import *
 
 import httpx
 
-from ..api_config import APIConfig, HTTPException, _serialize_query_params
-from ..models import *
+from ..api_config import (
+    APIConfig,
+    HTTPException,
+    _serialize_query_params,
+    get_default_api_config,
+)
+from ..models import (
+    CreateAnnotationQueueRequest,
+    CreateAnnotationQueueResponse,
+    DeleteAnnotationQueueResponse,
+    GetAnnotationQueueByIdResponse,
+    GetAnnotationQueuesResponse,
+    UpdateAnnotationQueueRequest,
+    UpdateAnnotationQueueResponse,
+)
 
 
 async def getQueues(
     api_config_override: Optional[APIConfig] = None, *, enabled: Optional[bool] = None
 ) -> GetAnnotationQueuesResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/queues"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {"enabled": enabled}
@@ -20,15 +32,13 @@ async def getQueues(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -50,9 +60,8 @@ async def createQueue(
     *,
     data: CreateAnnotationQueueRequest,
 ) -> CreateAnnotationQueueResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/queues"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -61,16 +70,14 @@ async def createQueue(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "post",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "post",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 201:
         raise HTTPException(
@@ -90,9 +97,8 @@ async def createQueue(
 async def getQueue(
     api_config_override: Optional[APIConfig] = None, *, queue_id: str
 ) -> GetAnnotationQueueByIdResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/queues/{queue_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -101,15 +107,13 @@ async def getQueue(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "get",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "get",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -132,9 +136,8 @@ async def updateQueue(
     queue_id: str,
     data: UpdateAnnotationQueueRequest,
 ) -> UpdateAnnotationQueueResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/queues/{queue_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -143,16 +146,14 @@ async def updateQueue(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "put",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-            json=data.model_dump(exclude_none=True),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "put",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+        json=data.model_dump(exclude_none=True),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -172,9 +173,8 @@ async def updateQueue(
 async def deleteQueue(
     api_config_override: Optional[APIConfig] = None, *, queue_id: str
 ) -> DeleteAnnotationQueueResponse:
-    api_config = api_config_override if api_config_override else APIConfig()
+    api_config = api_config_override or get_default_api_config()
 
-    base_path = api_config.base_path
     path = f"/v1/queues/{queue_id}"
     headers = api_config.get_default_headers()
     query_params: Dict[str, Any] = {}
@@ -183,15 +183,13 @@ async def deleteQueue(
         key: value for (key, value) in query_params.items() if value is not None
     }
 
-    async with httpx.AsyncClient(
-        base_url=base_path, verify=api_config.verify, timeout=api_config.timeout
-    ) as client:
-        response = await client.request(
-            "delete",
-            httpx.URL(path),
-            headers=headers,
-            params=_serialize_query_params(query_params),
-        )
+    client = api_config.get_async_client()
+    response = await client.request(
+        "delete",
+        httpx.URL(path),
+        headers=headers,
+        params=_serialize_query_params(query_params),
+    )
 
     if response.status_code != 200:
         raise HTTPException(
@@ -59,6 +59,7 @@ from honeyhive._generated.services import (
 )
 from honeyhive._generated.services import async_Metrics_service as metrics_svc_async
 from honeyhive._generated.services import async_Sessions_service as sessions_svc_async
+from honeyhive.config.models.http_client import HTTPClientConfig
 
 # Import models used in type hints
 from honeyhive.models import (
@@ -966,20 +967,17 @@ class EventsAPI(BaseAPI):
 
         # Execute with retry logic for transient errors (502, 503, 504, etc.)
         retry_config = RetryConfig.default()
-        with httpx.Client(
-            base_url=base_path,
-            verify=self._api_config.verify,
-            timeout=EXPORT_TIMEOUT,
-        ) as client:
-            response = retry_config.execute(
-                lambda: client.request(
-                    "POST",
-                    "/v1/events/export",
-                    headers=headers,
-                    json=request_body,
-                ),
-                operation="export()",
-            )
+        client = self._api_config.get_client()
+        response = retry_config.execute(
+            lambda: client.request(
+                "POST",
+                "/v1/events/export",
+                headers=headers,
+                json=request_body,
+                timeout=EXPORT_TIMEOUT,
+            ),
+            operation="export()",
+        )
 
         data = response.json()
         events = data.get("events", [])
@@ -1241,20 +1239,17 @@ class EventsAPI(BaseAPI):
 
         # Execute with retry logic for transient errors (502, 503, 504, etc.)
         retry_config = RetryConfig.default()
-        async with httpx.AsyncClient(
-            base_url=base_path,
-            verify=self._api_config.verify,
-            timeout=EXPORT_TIMEOUT,
-        ) as client:
-            response = await retry_config.execute_async(
-                lambda: client.request(
-                    "POST",
-                    "/v1/events/export",
-                    headers=headers,
-                    json=request_body,
-                ),
-                operation="export_async()",
-            )
+        client = self._api_config.get_async_client()
+        response = await retry_config.execute_async(
+            lambda: client.request(
+                "POST",
+                "/v1/events/export",
+                headers=headers,
+                json=request_body,
+                timeout=EXPORT_TIMEOUT,
+            ),
+            operation="export_async()",
+        )
 
         data = response.json()
         events = data.get("events", [])
@@ -2088,6 +2083,7 @@ class HoneyHive:
         test_mode: Optional[bool] = None,
         verbose: Optional[bool] = None,
         tracer_instance: Optional[Any] = None,
+        http_config: Optional["HTTPClientConfig"] = None,
     ) -> None:
         """Initialize the HoneyHive client.
 
@@ -2108,11 +2104,15 @@ class HoneyHive:
             retry_config: Retry configuration (accepted for backwards compat, not used).
             rate_limit_calls: Max calls per time window (accepted for backwards compat).
             rate_limit_window: Time window in seconds (accepted for backwards compat).
-            max_connections: Max connections in pool (accepted for backwards compat).
-            max_keepalive: Max keepalive connections (accepted for backwards compat).
+            max_connections: Max connections in the shared connection pool.
+                Overrides ``http_config.max_connections``.
+            max_keepalive: Max idle keep-alive connections in the shared pool.
+                Overrides ``http_config.max_keepalive_connections``.
             test_mode: Enable test mode (accepted for backwards compat, not used).
             verbose: Enable verbose logging (accepted for backwards compat, not used).
             tracer_instance: Tracer instance (accepted for backwards compat, not used).
+            http_config: Transport settings for the shared keep-alive HTTP
+                clients. Defaults to ``HTTPClientConfig()`` (environment-driven).
         """
         import os
 
@@ -2161,6 +2161,23 @@ class HoneyHive:
         resolved_timeout = _resolve_api_timeout(timeout)
         if resolved_timeout is not None:
             api_config_kwargs["timeout"] = resolved_timeout
+
+        # Pool limits for the keep-alive clients shared by every service call.
+        # Explicit constructor args win over HTTPClientConfig (HH_* env vars).
+        if http_config is None:
+            http_config = HTTPClientConfig()
+        api_config_kwargs["max_connections"] = (
+            max_connections
+            if max_connections is not None
+            else http_config.max_connections
+        )
+        api_config_kwargs["max_keepalive_connections"] = (
+            max_keepalive
+            if max_keepalive is not None
+            else http_config.max_keepalive_connections
+        )
+        api_config_kwargs["keepalive_expiry"] = http_config.keepalive_expiry
+        api_config_kwargs["pool_timeout"] = http_config.pool_timeout
         self._api_config = APIConfig(**api_config_kwargs)
 
         # Initialize API namespaces
@@ -2211,3 +2228,31 @@ class HoneyHive:
     def server_url(self, value: str) -> None:
         """Set the HoneyHive API server URL."""
         self._api_config.base_path = value
+
+    def close(self) -> None:
+        """Close the shared HTTP clients and their pooled connections.
+
+        The async client is closed on the event loop it was used on. The
+        client stays usable; a new connection pool is opened on next use.
+        """
+        self._api_config.close()
+
+    async def aclose(self) -> None:
+        """Close the shared sync and async HTTP clients."""
+        await self._api_config.aclose()
+
+    def __enter__(self) -> "HoneyHive":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Context manager exit - closes the shared clients."""
+        self.close()
+
+    async def __aenter__(self) -> "HoneyHive":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit - closes both shared clients."""
+        await self.aclose()
@@ -12,8 +12,13 @@ import httpx
 import yaml
 
 from ..api.client import HoneyHive
+from ..config.models.otlp import OTLPConfig
 from ..config.models.tracer import TracerConfig
 from ..tracer import HoneyHiveTracer
+from ..tracer.processing.pipeline_status import (
+    default_status_directory,
+    read_pipeline_status,
+)
 from ..utils.cache import close_global_cache, get_global_cache
 from ..utils.connection_pool import close_global_pool, get_global_pool
 
@@ -409,12 +414,29 @@ def monitor() -> None:
     """
 
 
+def _status_directory(status_dir: Optional[str]) -> str:
+    """Resolve the pipeline status directory (option, HH_OTLP_STATUS_DIR, default)."""
+    return status_dir or OTLPConfig().otlp_status_dir or default_status_directory()
+
+
+_STATUS_DIR_HELP = (
+    "Directory where traced processes publish their export pipeline status "
+    "(default: HH_OTLP_STATUS_DIR or the per-user temp directory)"
+)
+
+
 @monitor.command()
-def status() -> None:
+@click.option("--status-dir", default=None, help=_STATUS_DIR_HELP)
+def status(status_dir: Optional[str]) -> None:
     """Show system status.
 
     Display comprehensive status information including configuration,
-    tracer status, cache performance, and system health metrics.
+    tracer status, cache performance, and system health metrics. Export
+    pipeline status (circuit breaker state) is read from the status files
+    that processes running HoneyHive tracers publish.
+
+    Args:
+        status_dir: Pipeline status directory override
     """
     try:
         # Configuration status using per-instance configuration
@@ -466,6 +488,21 @@ def status() -> None:
         except Exception as e:
             click.echo(f"✗ Connection pool error: {e}")
 
+        # Export pipeline status published by traced processes
+        click.echo("\n=== Export Pipeline Status ===")
+        try:
+            directory = _status_directory(status_dir)
+            processes = read_pipeline_status(directory)
+            if not processes:
+                click.echo(f"No pipeline status published in {directory}")
+            for process in processes:
+                _echo_process_header(process)
+                for pipeline in process["pipelines"]:
+                    _echo_pipeline_header(pipeline)
+                    _echo_circuit(pipeline.get("circuit"))
+        except Exception as e:
+            click.echo(f"✗ Export pipeline error: {e}")
+
     except Exception as e:
         click.echo(f"Failed to get status: {e}", err=True)
         sys.exit(1)
@@ -474,17 +511,21 @@ def status() -> None:
 @monitor.command()
 @click.option("--duration", type=int, default=60, help="Monitor duration in seconds")
 @click.option("--interval", type=float, default=5.0, help="Update interval in seconds")
-def watch(duration: int, interval: float) -> None:
+@click.option("--status-dir", default=None, help=_STATUS_DIR_HELP)
+def watch(duration: int, interval: float, status_dir: Optional[str]) -> None:
     """Monitor system in real-time.
 
     Continuously monitor HoneyHive system performance metrics
-    including cache statistics and connection pool performance.
+    including cache statistics, connection pool performance and the export
+    pipeline metrics that processes running HoneyHive tracers publish.
 
     Args:
         duration: Total monitoring duration in seconds
         interval: Update interval between status checks in seconds
+        status_dir: Pipeline status directory override
     """
     try:
+        directory = _status_directory(status_dir)
         click.echo(f"Monitoring for {duration} seconds (updates every {interval}s)")
         click.echo("Press Ctrl+C to stop early")
         click.echo()
@@ -518,6 +559,8 @@ def watch(duration: int, interval: float) -> None:
                 click.echo(f"  Pool Misses: {pool_stats['pool_misses']}")
                 click.echo(f"  Active Connections: {pool_stats['active_connections']}")
 
+                _echo_pipeline_stats(directory)
+
                 time.sleep(interval)
 
             except KeyboardInterrupt:
@@ -533,6 +576,90 @@ def watch(duration: int, interval: float) -> None:
         sys.exit(1)
 
 
+def _echo_process_header(process: Dict[str, Any]) -> None:
+    """Print the pid and last update time of a published status."""
+    updated = time.strftime("%H:%M:%S", time.localtime(process["updated_at"]))
+    stale = " (stale)" if process.get("stale") else ""
+    click.echo(f"Process {process['pid']} (updated {updated}){stale}")
+
+
+def _echo_pipeline_header(pipeline: Dict[str, Any]) -> None:
+    """Print the project and exporter type of a published pipeline."""
+    if "error" in pipeline:
+        click.echo(f"  ✗ Tracer error: {pipeline['error']}")
+        return
+    click.echo(
+        f"  Tracer: {pipeline.get('project') or 'unknown'}"
+        f" ({pipeline.get('exporter') or 'no exporter'})"
+    )
+
+
+def _echo_circuit(circuit: Optional[Dict[str, Any]]) -> None:
+    """Print published circuit breaker state."""
+    if not circuit:
+        click.echo("    Circuit: not available for this exporter")
+        return
+    click.echo(f"    Circuit: {circuit['state']}")
+    click.echo(
+        f"      Consecutive Failures: {circuit['consecutive_failures']}"
+        f"/{circuit['failure_threshold']}"
+    )
+    click.echo(f"      Short-circuited Batches: {circuit['short_circuited_batches']}")
+    transitions = circuit["recent_transitions"]
+    if transitions:
+        last = transitions[-1]
+        click.echo(
+            f"      Last Transition: {last['from']} -> {last['to']} at "
+            f"{time.strftime('%H:%M:%S', time.localtime(last['at']))}"
+        )
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    """Format a latency in seconds as milliseconds."""
+    return "-" if value is None else f"{value * 1000:.1f}ms"
+
+
+def _echo_pipeline_stats(directory: str) -> None:
+    """Print export pipeline metrics published by traced processes."""
+    processes = read_pipeline_status(directory)
+    click.echo()
+    click.echo("Export Pipeline:")
+    if not processes:
+        click.echo(f"  No pipeline status published in {directory}")
+        return
+    for process in processes:
+        _echo_process_header(process)
+        for pipeline in process["pipelines"]:
+            _echo_pipeline_header(pipeline)
+            if "error" not in pipeline:
+                _echo_pipeline_metrics(pipeline)
+
+
+def _echo_pipeline_metrics(pipeline: Dict[str, Any]) -> None:
+    """Print queue, batch, HTTP and circuit figures of a published pipeline."""
+    stats = pipeline.get("pipeline") or {}
+    queue = stats.get("gauges", {}).get("queue") or {}
+    histograms = stats.get("histograms", {})
+    http = histograms.get("exporter.http_seconds") or {}
+    batches = histograms.get("batch.spans") or {}
+    circuit = pipeline.get("circuit")
+    click.echo(
+        f"    Queue: {queue.get('queue_size', 0)}/{queue.get('max_queue_size', 0)}"
+        f", Dropped: {queue.get('dropped_spans', 0)}"
+    )
+    click.echo(
+        f"    Batches: {batches.get('count', 0)}"
+        f", p50 size: {batches.get('p50') or 0:.0f} spans"
+    )
+    click.echo(
+        f"    HTTP: {http.get('count', 0)} requests"
+        f", p50 {_format_seconds(http.get('p50'))}"
+        f", p99 {_format_seconds(http.get('p99'))}"
+    )
+    if circuit:
+        click.echo(f"    Circuit: {circuit['state']}")
+
+
 @cli.group()
 def performance() -> None:
     """Performance analysis commands.
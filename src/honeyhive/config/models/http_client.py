@@ -75,7 +75,7 @@ class HTTPClientConfig(BaseHoneyHiveConfig):
     )
 
     max_connections: int = Field(  # type: ignore[call-overload,pydantic-alias]
-        default=10,
+        default=100,
         description="Maximum connections in pool",
         validation_alias=AliasChoices("HH_MAX_CONNECTIONS", "max_connections"),
         examples=[10, 50, 100],
@@ -99,7 +99,7 @@ class HTTPClientConfig(BaseHoneyHiveConfig):
 
     pool_timeout: float = Field(  # type: ignore[call-overload,pydantic-alias]
         default=10.0,
-        description="Pool timeout in seconds",
+        description="Seconds to wait for a free pooled connection",
         validation_alias=AliasChoices("HH_POOL_TIMEOUT", "pool_timeout"),
         examples=[10.0, 30.0, 60.0],
     )
@@ -177,7 +177,7 @@ class HTTPClientConfig(BaseHoneyHiveConfig):
         env_data = {
             "timeout": _get_env_float("HH_TIMEOUT", 30.0),
             "max_connections": _get_env_int(
-                "HH_MAX_CONNECTIONS", _get_env_int("HTTP_MAX_CONNECTIONS", 10)
+                "HH_MAX_CONNECTIONS", _get_env_int("HTTP_MAX_CONNECTIONS", 100)
             ),
             "max_keepalive_connections": _get_env_int(
                 "HH_MAX_KEEPALIVE_CONNECTIONS",
@@ -111,6 +111,230 @@ class OTLPConfig(BaseHoneyHiveConfig):
         examples=["http/json", "http/protobuf"],
     )
 
+    otlp_compression: str = Field(  # type: ignore[call-overload,pydantic-alias]
+        default="gzip",
+        description=(
+            "OTLP request body compression: 'gzip' (default), 'zstd' "
+            "(requires honeyhive[zstd]) or 'none'"
+        ),
+        validation_alias=AliasChoices(
+            "HH_OTLP_COMPRESSION", "OTEL_EXPORTER_OTLP_COMPRESSION", "otlp_compression"
+        ),
+        examples=["gzip", "zstd", "none"],
+    )
+
+    otlp_compression_min_bytes: int = Field(  # type: ignore[call-overload,pydantic-alias]  # pylint: disable=line-too-long
+        default=1024,
+        description="Minimum serialized payload size in bytes before compressing",
+        validation_alias=AliasChoices(
+            "HH_OTLP_COMPRESSION_MIN_BYTES", "otlp_compression_min_bytes"
+        ),
+        examples=[0, 1024, 4096],
+    )
+
+    otlp_spool_dir: Optional[str] = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=None,
+        description=(
+            "Directory for the on-disk spool of failed export batches "
+            "(disabled when unset)"
+        ),
+        validation_alias=AliasChoices("HH_OTLP_SPOOL_DIR", "otlp_spool_dir"),
+        examples=["/var/tmp/honeyhive-spool", "~/.honeyhive/spool"],
+    )
+
+    otlp_spool_max_bytes: int = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=64 * 1024 * 1024,
+        description="Maximum disk space used by the export spool in bytes",
+        validation_alias=AliasChoices(
+            "HH_OTLP_SPOOL_MAX_BYTES", "otlp_spool_max_bytes"
+        ),
+        examples=[16 * 1024 * 1024, 64 * 1024 * 1024],
+    )
+
+    otlp_spool_max_age: float = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=86400.0,
+        description="Spooled batches older than this many seconds are discarded",
+        validation_alias=AliasChoices("HH_OTLP_SPOOL_MAX_AGE", "otlp_spool_max_age"),
+        examples=[3600.0, 86400.0],
+    )
+
+    otlp_async_export: bool = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=False,
+        description=(
+            "Export spans with the asyncio/httpx exporter on a dedicated event "
+            "loop instead of the blocking requests-based exporter"
+        ),
+        validation_alias=AliasChoices("HH_OTLP_ASYNC_EXPORT", "otlp_async_export"),
+    )
+
+    otlp_http2: bool = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=True,
+        description=(
+            "Use HTTP/2 for async export when the 'h2' package is installed "
+            "(honeyhive[http2])"
+        ),
+        validation_alias=AliasChoices("HH_OTLP_HTTP2", "otlp_http2"),
+    )
+
+    otlp_max_in_flight: int = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=16,
+        description="Maximum concurrent export requests for async export",
+        validation_alias=AliasChoices("HH_OTLP_MAX_IN_FLIGHT", "otlp_max_in_flight"),
+        examples=[4, 16, 64],
+    )
+
+    otlp_attribute_aliases: str = Field(  # type: ignore[call-overload,pydantic-alias]
+        default="span",
+        description=(
+            "Where traceloop.association.properties.* aliases of core "
+            "honeyhive.* attributes are written: 'span' (default, on every "
+            "span), 'export' (added per span while encoding) or 'resource' "
+            "(once per resource block; needs backend support)"
+        ),
+        validation_alias=AliasChoices(
+            "HH_OTLP_ATTRIBUTE_ALIASES", "otlp_attribute_aliases"
+        ),
+        examples=["span", "export", "resource"],
+    )
+
+    otlp_retry_max_attempts: int = Field(  # type: ignore[call-overload,pydantic-alias]  # pylint: disable=line-too-long
+        default=5,
+        description=(
+            "Attempts per export batch including the first; connection "
+            "errors, 408, 429 and 5xx are retried (1 disables retries)"
+        ),
+        validation_alias=AliasChoices(
+            "HH_OTLP_RETRY_MAX_ATTEMPTS", "otlp_retry_max_attempts"
+        ),
+        examples=[1, 3, 5],
+    )
+
+    otlp_retry_base_delay: float = Field(  # type: ignore[call-overload,pydantic-alias]  # pylint: disable=line-too-long
+        default=0.1,
+        description="Minimum delay between export attempts in seconds",
+        validation_alias=AliasChoices(
+            "HH_OTLP_RETRY_BASE_DELAY", "otlp_retry_base_delay"
+        ),
+        examples=[0.05, 0.1, 0.5],
+    )
+
+    otlp_retry_max_delay: float = Field(  # type: ignore[call-overload,pydantic-alias]  # pylint: disable=line-too-long
+        default=5.0,
+        description=(
+            "Maximum jittered delay between export attempts in seconds "
+            "(Retry-After may ask for longer, up to export_timeout)"
+        ),
+        validation_alias=AliasChoices(
+            "HH_OTLP_RETRY_MAX_DELAY", "otlp_retry_max_delay"
+        ),
+        examples=[1.0, 5.0, 10.0],
+    )
+
+    otlp_retry_budget_ratio: float = Field(  # type: ignore[call-overload,pydantic-alias]  # pylint: disable=line-too-long
+        default=0.1,
+        description=(
+            "Retries allowed per exported batch across the exporter once the "
+            "burst allowance is spent (0.0 - 1.0)"
+        ),
+        validation_alias=AliasChoices(
+            "HH_OTLP_RETRY_BUDGET_RATIO", "otlp_retry_budget_ratio"
+        ),
+        examples=[0.05, 0.1, 0.2],
+    )
+
+    otlp_circuit_failure_threshold: int = Field(  # type: ignore[call-overload,pydantic-alias]  # pylint: disable=line-too-long
+        default=5,
+        description=(
+            "Consecutive failed exports that open the export circuit breaker "
+            "(0 disables the breaker)"
+        ),
+        validation_alias=AliasChoices(
+            "HH_OTLP_CIRCUIT_FAILURE_THRESHOLD", "otlp_circuit_failure_threshold"
+        ),
+        examples=[0, 3, 5, 10],
+    )
+
+    otlp_circuit_reset_timeout: float = Field(  # type: ignore[call-overload,pydantic-alias]  # pylint: disable=line-too-long
+        default=30.0,
+        description=(
+            "Seconds the export circuit stays open before a single probe export is sent"
+        ),
+        validation_alias=AliasChoices(
+            "HH_OTLP_CIRCUIT_RESET_TIMEOUT", "otlp_circuit_reset_timeout"
+        ),
+        examples=[5.0, 30.0, 60.0],
+    )
+
+    otlp_circuit_open_policy: str = Field(  # type: ignore[call-overload,pydantic-alias]  # pylint: disable=line-too-long
+        default="spool",
+        description=(
+            "What to do with batches while the export circuit is open: "
+            "'spool' (default, when otlp_spool_dir is set) or 'drop'"
+        ),
+        validation_alias=AliasChoices(
+            "HH_OTLP_CIRCUIT_OPEN_POLICY", "otlp_circuit_open_policy"
+        ),
+        examples=["spool", "drop"],
+    )
+
+    otlp_shared_export: bool = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=False,
+        description=(
+            "Share one export queue, worker pool and connection pool with "
+            "other tracers in the process that export to the same endpoint "
+            "with the same settings"
+        ),
+        validation_alias=AliasChoices("HH_OTLP_SHARED_EXPORT", "otlp_shared_export"),
+    )
+
+    otlp_lifecycle_mode: str = Field(  # type: ignore[call-overload,pydantic-alias]
+        default="auto",
+        description=(
+            "Flush and shutdown behaviour: 'standard', 'serverless' (flush "
+            "within the remaining invocation time without fixed sleeps, spool "
+            "leftovers to the temp directory) or 'auto' (serverless on AWS "
+            "Lambda)"
+        ),
+        validation_alias=AliasChoices("HH_OTLP_LIFECYCLE_MODE", "otlp_lifecycle_mode"),
+        examples=["auto", "standard", "serverless"],
+    )
+
+    otlp_serverless_flush_budget: float = Field(  # type: ignore[call-overload,pydantic-alias]  # pylint: disable=line-too-long
+        default=2.0,
+        description=(
+            "Maximum seconds spent flushing at the end of a serverless "
+            "invocation or shutdown (further capped by the invocation's "
+            "remaining time)"
+        ),
+        validation_alias=AliasChoices(
+            "HH_OTLP_SERVERLESS_FLUSH_BUDGET", "otlp_serverless_flush_budget"
+        ),
+        examples=[0.5, 2.0, 5.0],
+    )
+
+    otlp_status_dir: Optional[str] = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=None,
+        description=(
+            "Directory where each process publishes its export pipeline "
+            "status for 'honeyhive monitor' (per-user temp directory when "
+            "unset)"
+        ),
+        validation_alias=AliasChoices("HH_OTLP_STATUS_DIR", "otlp_status_dir"),
+        examples=["/var/run/honeyhive", "~/.honeyhive/status"],
+    )
+
+    otlp_status_interval: float = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=5.0,
+        description=(
+            "Seconds between writes of the export pipeline status file "
+            "(0 disables publishing)"
+        ),
+        validation_alias=AliasChoices(
+            "HH_OTLP_STATUS_INTERVAL", "otlp_status_interval"
+        ),
+        examples=[0.0, 5.0, 30.0],
+    )
+
     # Batch processing settings
     batch_size: int = Field(  # type: ignore[call-overload,pydantic-alias]
         default=100,
@@ -135,6 +359,18 @@ class OTLPConfig(BaseHoneyHiveConfig):
         examples=[256, 512, 1024],
     )
 
+    max_export_batch_bytes: int = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=4 * 1024 * 1024,
+        description=(
+            "Estimated encoded size in bytes at which a batch is cut "
+            "(0 disables the byte limit)"
+        ),
+        validation_alias=AliasChoices(
+            "HH_MAX_EXPORT_BATCH_BYTES", "max_export_batch_bytes"
+        ),
+        examples=[1048576, 4194304, 0],
+    )
+
     export_timeout: float = Field(  # type: ignore[call-overload,pydantic-alias]
         default=30.0,
         description="Export timeout in seconds",
@@ -142,6 +378,33 @@ class OTLPConfig(BaseHoneyHiveConfig):
         examples=[10.0, 30.0, 60.0],
     )
 
+    max_queue_size: int = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=8192,
+        description="Maximum number of ended spans buffered for export",
+        validation_alias=AliasChoices("HH_MAX_QUEUE_SIZE", "max_queue_size"),
+        examples=[2048, 8192, 32768],
+    )
+
+    export_workers: int = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=1,
+        description=(
+            "Number of span export threads; more than one only overlaps "
+            "exports for exporters that set supports_concurrent_export"
+        ),
+        validation_alias=AliasChoices("HH_EXPORT_WORKERS", "export_workers"),
+        examples=[1, 2, 4],
+    )
+
+    queue_drop_policy: str = Field(  # type: ignore[call-overload,pydantic-alias]
+        default="drop_oldest",
+        description=(
+            "Which span to drop when the export queue is full: "
+            "'drop_oldest' (default) or 'drop_newest'"
+        ),
+        validation_alias=AliasChoices("HH_QUEUE_DROP_POLICY", "queue_drop_policy"),
+        examples=["drop_oldest", "drop_newest"],
+    )
+
     model_config = SettingsConfigDict(
         validate_assignment=True,
         extra="forbid",
@@ -158,10 +421,52 @@ class OTLPConfig(BaseHoneyHiveConfig):
             "otlp_protocol": os.getenv("HH_OTLP_PROTOCOL")
             or os.getenv("OTEL_EXPORTER_OTLP_PROTOCOL")
             or "http/json",
+            "otlp_compression": os.getenv("HH_OTLP_COMPRESSION")
+            or os.getenv("OTEL_EXPORTER_OTLP_COMPRESSION")
+            or "gzip",
+            "otlp_compression_min_bytes": _get_env_int(
+                "HH_OTLP_COMPRESSION_MIN_BYTES", 1024
+            ),
+            "otlp_spool_dir": os.getenv("HH_OTLP_SPOOL_DIR"),
+            "otlp_spool_max_bytes": _get_env_int(
+                "HH_OTLP_SPOOL_MAX_BYTES", 64 * 1024 * 1024
+            ),
+            "otlp_spool_max_age": _get_env_float("HH_OTLP_SPOOL_MAX_AGE", 86400.0),
+            "otlp_async_export": _get_env_bool("HH_OTLP_ASYNC_EXPORT", False),
+            "otlp_http2": _get_env_bool("HH_OTLP_HTTP2", True),
+            "otlp_max_in_flight": _get_env_int("HH_OTLP_MAX_IN_FLIGHT", 16),
+            "otlp_attribute_aliases": os.getenv("HH_OTLP_ATTRIBUTE_ALIASES") or "span",
+            "otlp_retry_max_attempts": _get_env_int("HH_OTLP_RETRY_MAX_ATTEMPTS", 5),
+            "otlp_retry_base_delay": _get_env_float("HH_OTLP_RETRY_BASE_DELAY", 0.1),
+            "otlp_retry_max_delay": _get_env_float("HH_OTLP_RETRY_MAX_DELAY", 5.0),
+            "otlp_retry_budget_ratio": _get_env_float(
+                "HH_OTLP_RETRY_BUDGET_RATIO", 0.1
+            ),
+            "otlp_circuit_failure_threshold": _get_env_int(
+                "HH_OTLP_CIRCUIT_FAILURE_THRESHOLD", 5
+            ),
+            "otlp_circuit_reset_timeout": _get_env_float(
+                "HH_OTLP_CIRCUIT_RESET_TIMEOUT", 30.0
+            ),
+            "otlp_circuit_open_policy": os.getenv("HH_OTLP_CIRCUIT_OPEN_POLICY")
+            or "spool",
+            "otlp_shared_export": _get_env_bool("HH_OTLP_SHARED_EXPORT", False),
+            "otlp_lifecycle_mode": os.getenv("HH_OTLP_LIFECYCLE_MODE") or "auto",
+            "otlp_serverless_flush_budget": _get_env_float(
+                "HH_OTLP_SERVERLESS_FLUSH_BUDGET", 2.0
+            ),
+            "otlp_status_dir": os.getenv("HH_OTLP_STATUS_DIR"),
+            "otlp_status_interval": _get_env_float("HH_OTLP_STATUS_INTERVAL", 5.0),
             "batch_size": _get_env_int("HH_BATCH_SIZE", 100),
             "flush_interval": _get_env_float("HH_FLUSH_INTERVAL", 5.0),
             "max_export_batch_size": _get_env_int("HH_MAX_EXPORT_BATCH_SIZE", 512),
+            "max_export_batch_bytes": _get_env_int(
+                "HH_MAX_EXPORT_BATCH_BYTES", 4 * 1024 * 1024
+            ),
             "export_timeout": _get_env_float("HH_EXPORT_TIMEOUT", 30.0),
+            "max_queue_size": _get_env_int("HH_MAX_QUEUE_SIZE", 8192),
+            "export_workers": _get_env_int("HH_EXPORT_WORKERS", 1),
+            "queue_drop_policy": os.getenv("HH_QUEUE_DROP_POLICY") or "drop_oldest",
         }
 
         # Merge environment data with provided data (provided data takes precedence)
@@ -256,6 +561,364 @@ class OTLPConfig(BaseHoneyHiveConfig):
             return 5.0  # Safe default
         return v  # type: ignore[no-any-return]
 
+    @field_validator("otlp_compression", mode="before")
+    @classmethod
+    def validate_otlp_compression(cls, v: Any) -> str:
+        """Validate OTLP compression name with graceful degradation."""
+        if v is None:
+            return "gzip"
+        name = str(v).strip().lower()
+        if name in ("", "identity", "off", "false"):
+            return "none"
+        if name not in ("gzip", "zstd", "none"):
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_compression: %s. Using default 'gzip'.",
+                v,
+                extra={"honeyhive_data": {"invalid_compression": v}},
+            )
+            return "gzip"
+        return name
+
+    @field_validator("otlp_compression_min_bytes", mode="before")
+    @classmethod
+    def validate_otlp_compression_min_bytes(cls, v: Any) -> int:
+        """Validate compression threshold with graceful degradation."""
+        try:
+            v = int(v) if v is not None else 1024
+        except (ValueError, TypeError):
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_compression_min_bytes type: expected int, got %s. "
+                "Using default 1024.",
+                type(v).__name__,
+                extra={"honeyhive_data": {"invalid_min_bytes": v}},
+            )
+            return 1024
+        if v < 0:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_compression_min_bytes: must be >= 0, got %s. Using 0.",
+                v,
+                extra={"honeyhive_data": {"invalid_min_bytes": v}},
+            )
+            return 0
+        return v  # type: ignore[no-any-return]
+
+    @field_validator("otlp_spool_dir", mode="before")
+    @classmethod
+    def validate_otlp_spool_dir(cls, v: Any) -> Optional[str]:
+        """Normalize the spool directory; blank values disable the spool."""
+        if v is None:
+            return None
+        path = str(v).strip()
+        return os.path.expanduser(path) if path else None
+
+    @field_validator("otlp_spool_max_bytes", mode="before")
+    @classmethod
+    def validate_otlp_spool_max_bytes(cls, v: Any) -> int:
+        """Validate the spool size cap with graceful degradation."""
+        default = 64 * 1024 * 1024
+        try:
+            v = int(v) if v is not None else default
+        except (ValueError, TypeError):
+            v = -1
+        if v <= 0:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_spool_max_bytes: must be a positive int. "
+                "Using default %s.",
+                default,
+                extra={"honeyhive_data": {"invalid_spool_max_bytes": v}},
+            )
+            return default
+        return v  # type: ignore[no-any-return]
+
+    @field_validator("otlp_spool_max_age", mode="before")
+    @classmethod
+    def validate_otlp_spool_max_age(cls, v: Any) -> float:
+        """Validate the spool age cap with graceful degradation."""
+        default = 86400.0
+        try:
+            v = float(v) if v is not None else default
+        except (ValueError, TypeError):
+            v = -1.0
+        if v <= 0:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_spool_max_age: must be a positive number of "
+                "seconds. Using default %s.",
+                default,
+                extra={"honeyhive_data": {"invalid_spool_max_age": v}},
+            )
+            return default
+        return v  # type: ignore[no-any-return]
+
+    @field_validator("otlp_max_in_flight", mode="before")
+    @classmethod
+    def validate_otlp_max_in_flight(cls, v: Any) -> int:
+        """Validate the async export concurrency limit with graceful degradation."""
+        try:
+            v = int(v) if v is not None else 16
+        except (ValueError, TypeError):
+            v = -1
+        if v <= 0:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_max_in_flight: must be a positive int. Using default 16.",
+                extra={"honeyhive_data": {"invalid_max_in_flight": v}},
+            )
+            return 16
+        return v  # type: ignore[no-any-return]
+
+    @field_validator("otlp_retry_max_attempts", mode="before")
+    @classmethod
+    def validate_otlp_retry_max_attempts(cls, v: Any) -> int:
+        """Validate the export attempt limit with graceful degradation."""
+        try:
+            v = int(v) if v is not None else 5
+        except (ValueError, TypeError):
+            v = -1
+        if v <= 0:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_retry_max_attempts: must be a positive int. "
+                "Using default 5.",
+                extra={"honeyhive_data": {"invalid_retry_max_attempts": v}},
+            )
+            return 5
+        return v  # type: ignore[no-any-return]
+
+    @field_validator("otlp_retry_base_delay", "otlp_retry_max_delay", mode="before")
+    @classmethod
+    def validate_otlp_retry_delays(cls, v: Any, info: Any) -> float:
+        """Validate retry delays with graceful degradation."""
+        default = 0.1 if info.field_name == "otlp_retry_base_delay" else 5.0
+        try:
+            v = float(v) if v is not None else default
+        except (ValueError, TypeError):
+            v = -1.0
+        if v < 0:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid %s: must be a non-negative number of seconds. "
+                "Using default %s.",
+                info.field_name,
+                default,
+                extra={"honeyhive_data": {"invalid_retry_delay": v}},
+            )
+            return default
+        return v  # type: ignore[no-any-return]
+
+    @field_validator("otlp_retry_budget_ratio", mode="before")
+    @classmethod
+    def validate_otlp_retry_budget_ratio(cls, v: Any) -> float:
+        """Validate the retry budget ratio, clamping it to 0.0 - 1.0."""
+        try:
+            ratio = float(v) if v is not None else 0.1
+        except (ValueError, TypeError):
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_retry_budget_ratio: %s. Using default 0.1.",
+                v,
+                extra={"honeyhive_data": {"invalid_retry_budget_ratio": v}},
+            )
+            return 0.1
+        return min(1.0, max(0.0, ratio))
+
+    @field_validator("otlp_circuit_failure_threshold", mode="before")
+    @classmethod
+    def validate_otlp_circuit_failure_threshold(cls, v: Any) -> int:
+        """Validate the circuit breaker threshold with graceful degradation."""
+        try:
+            v = int(v) if v is not None else 5
+        except (ValueError, TypeError):
+            v = -1
+        if v < 0:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_circuit_failure_threshold: must be a non-negative "
+                "int. Using default 5.",
+                extra={"honeyhive_data": {"invalid_circuit_failure_threshold": v}},
+            )
+            return 5
+        return v  # type: ignore[no-any-return]
+
+    @field_validator("otlp_circuit_reset_timeout", mode="before")
+    @classmethod
+    def validate_otlp_circuit_reset_timeout(cls, v: Any) -> float:
+        """Validate the circuit breaker reset timeout with graceful degradation."""
+        try:
+            v = float(v) if v is not None else 30.0
+        except (ValueError, TypeError):
+            v = -1.0
+        if v <= 0:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_circuit_reset_timeout: must be a positive number "
+                "of seconds. Using default 30.0.",
+                extra={"honeyhive_data": {"invalid_circuit_reset_timeout": v}},
+            )
+            return 30.0
+        return v  # type: ignore[no-any-return]
+
+    @field_validator("otlp_lifecycle_mode", mode="before")
+    @classmethod
+    def validate_otlp_lifecycle_mode(cls, v: Any) -> str:
+        """Validate the lifecycle mode with graceful degradation."""
+        mode = str(v).strip().lower() if v is not None else "auto"
+        if mode not in ("auto", "standard", "serverless"):
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_lifecycle_mode: %s. Using default 'auto'.",
+                v,
+                extra={"honeyhive_data": {"invalid_lifecycle_mode": v}},
+            )
+            return "auto"
+        return mode
+
+    @field_validator("otlp_serverless_flush_budget", mode="before")
+    @classmethod
+    def validate_otlp_serverless_flush_budget(cls, v: Any) -> float:
+        """Validate the serverless flush budget with graceful degradation."""
+        try:
+            v = float(v) if v is not None else 2.0
+        except (ValueError, TypeError):
+            v = -1.0
+        if v <= 0:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_serverless_flush_budget: must be a positive number "
+                "of seconds. Using default 2.0.",
+                extra={"honeyhive_data": {"invalid_serverless_flush_budget": v}},
+            )
+            return 2.0
+        return v  # type: ignore[no-any-return]
+
+    @field_validator("otlp_status_dir", mode="before")
+    @classmethod
+    def validate_otlp_status_dir(cls, v: Any) -> Optional[str]:
+        """Normalize the status directory; blank values use the default."""
+        if v is None:
+            return None
+        path = str(v).strip()
+        return os.path.expanduser(path) if path else None
+
+    @field_validator("otlp_status_interval", mode="before")
+    @classmethod
+    def validate_otlp_status_interval(cls, v: Any) -> float:
+        """Validate the status interval with graceful degradation."""
+        try:
+            v = float(v) if v is not None else 5.0
+        except (ValueError, TypeError):
+            v = -1.0
+        if v < 0:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_status_interval: must be a non-negative number "
+                "of seconds. Using default 5.0.",
+                extra={"honeyhive_data": {"invalid_status_interval": v}},
+            )
+            return 5.0
+        return v  # type: ignore[no-any-return]
+
+    @field_validator("otlp_circuit_open_policy", mode="before")
+    @classmethod
+    def validate_otlp_circuit_open_policy(cls, v: Any) -> str:
+        """Validate the open-circuit policy with graceful degradation."""
+        policy = str(v).strip().lower() if v is not None else "spool"
+        if policy not in ("spool", "drop"):
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_circuit_open_policy: %s. Using default 'spool'.",
+                v,
+                extra={"honeyhive_data": {"invalid_circuit_open_policy": v}},
+            )
+            return "spool"
+        return policy
+
+    @field_validator("max_queue_size", mode="before")
+    @classmethod
+    def validate_max_queue_size(cls, v: Any) -> int:
+        """Validate the span queue capacity with graceful degradation."""
+        try:
+            v = int(v) if v is not None else 8192
+        except (ValueError, TypeError):
+            v = -1
+        if v <= 0:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid max_queue_size: must be a positive int. Using default 8192.",
+                extra={"honeyhive_data": {"invalid_max_queue_size": v}},
+            )
+            return 8192
+        return v  # type: ignore[no-any-return]
+
+    @field_validator("max_export_batch_bytes", mode="before")
+    @classmethod
+    def validate_max_export_batch_bytes(cls, v: Any) -> int:
+        """Validate the batch byte ceiling with graceful degradation."""
+        try:
+            v = int(v) if v is not None else 4 * 1024 * 1024
+        except (ValueError, TypeError):
+            v = -1
+        if v < 0:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid max_export_batch_bytes: must be a non-negative int. "
+                "Using default 4194304.",
+                extra={"honeyhive_data": {"invalid_max_export_batch_bytes": v}},
+            )
+            return 4 * 1024 * 1024
+        return v  # type: ignore[no-any-return]
+
+    @field_validator("export_workers", mode="before")
+    @classmethod
+    def validate_export_workers(cls, v: Any) -> int:
+        """Validate the export worker count with graceful degradation."""
+        try:
+            v = int(v) if v is not None else 1
+        except (ValueError, TypeError):
+            v = -1
+        if v <= 0:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid export_workers: must be a positive int. Using default 1.",
+                extra={"honeyhive_data": {"invalid_export_workers": v}},
+            )
+            return 1
+        return v  # type: ignore[no-any-return]
+
+    @field_validator("queue_drop_policy", mode="before")
+    @classmethod
+    def validate_queue_drop_policy(cls, v: Any) -> str:
+        """Validate the span queue drop policy with graceful degradation."""
+        policy = str(v).strip().lower() if v is not None else "drop_oldest"
+        if policy not in ("drop_oldest", "drop_newest"):
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid queue_drop_policy: %s. Using default 'drop_oldest'.",
+                v,
+                extra={"honeyhive_data": {"invalid_queue_drop_policy": v}},
+            )
+            return "drop_oldest"
+        return policy
+
+    @field_validator("otlp_attribute_aliases", mode="before")
+    @classmethod
+    def validate_otlp_attribute_aliases(cls, v: Any) -> str:
+        """Validate the attribute alias mode with graceful degradation."""
+        mode = str(v).strip().lower() if v is not None else "span"
+        if mode not in ("span", "export", "resource"):
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                "Invalid otlp_attribute_aliases: %s. Using default 'span'.",
+                v,
+                extra={"honeyhive_data": {"invalid_attribute_aliases": v}},
+            )
+            return "span"
+        return mode
+
     @field_validator("otlp_headers", mode="before")
     @classmethod
     def validate_otlp_headers(
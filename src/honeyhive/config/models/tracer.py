@@ -112,6 +112,8 @@ class TracerConfig(BaseHoneyHiveConfig):
         - server_url: Custom HoneyHive server URL (from HH_API_URL env var)
         - disable_http_tracing: Disable HTTP request tracing (disabled by default)
         - disable_batch: Disable batch processing of spans
+        - async_session_creation: Create the session in the background
+          instead of blocking tracer initialization
         - requests_session: Custom requests.Session for OTLP span export
           (caller-owned; not closed by the SDK on shutdown)
 
@@ -170,6 +172,17 @@ class TracerConfig(BaseHoneyHiveConfig):
         validation_alias=AliasChoices("HH_DISABLE_BATCH", "disable_batch"),
     )
 
+    async_session_creation: bool = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=False,
+        description=(
+            "Generate the session_id client-side and create the session in "
+            "the backend from a background worker instead of during init"
+        ),
+        validation_alias=AliasChoices(
+            "HH_ASYNC_SESSION_CREATION", "async_session_creation"
+        ),
+    )
+
     disable_tracing: bool = Field(  # type: ignore[call-overload,pydantic-alias]
         default=False,
         description="Disable all tracing functionality",
@@ -221,6 +234,81 @@ class TracerConfig(BaseHoneyHiveConfig):
         examples=[1048576, 5242880, 10485760, 20971520],  # 1MB, 5MB, 10MB, 20MB
     )
 
+    span_size_policy: str = Field(  # type: ignore[call-overload,pydantic-alias]
+        default="truncate",
+        description=(
+            "What to do with spans larger than max_span_size: 'truncate' "
+            "(shorten the largest low-priority attribute values), 'drop' "
+            "or 'off'"
+        ),
+        validation_alias=AliasChoices("HH_SPAN_SIZE_POLICY", "span_size_policy"),
+        examples=["truncate", "drop", "off"],
+    )
+
+    attribute_encoding: str = Field(  # type: ignore[call-overload,pydantic-alias]
+        default="flatten",
+        description=(
+            "How dict/list values are stored on spans: 'flatten' (one "
+            "attribute per leaf) or 'structured' (one attribute per value, "
+            "exported as OTLP kvlistValue/arrayValue)"
+        ),
+        validation_alias=AliasChoices("HH_ATTRIBUTE_ENCODING", "attribute_encoding"),
+        examples=["flatten", "structured"],
+    )
+
+    # Sampling Configuration
+    sampling_ratio: float = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=1.0,
+        description=(
+            "Fraction of sessions to export (head sampling keyed by "
+            "session_id, 0.0 - 1.0)"
+        ),
+        validation_alias=AliasChoices("HH_SAMPLING_RATIO", "sampling_ratio"),
+        examples=[1.0, 0.25, 0.01],
+    )
+
+    tail_sampling: bool = Field(  # type: ignore[call-overload,pydantic-alias]
+        default=False,
+        description=(
+            "Buffer sessions dropped by head sampling and keep them anyway "
+            "if they contain errors, slow spans or tail_sampling_event_types"
+        ),
+        validation_alias=AliasChoices("HH_TAIL_SAMPLING", "tail_sampling"),
+    )
+
+    tail_sampling_slow_span_ms: float = Field(  # type: ignore[call-overload,pydantic-alias]  # pylint: disable=line-too-long
+        default=5000.0,
+        description="Spans at least this long (ms) make tail sampling keep a session",
+        validation_alias=AliasChoices(
+            "HH_TAIL_SAMPLING_SLOW_SPAN_MS", "tail_sampling_slow_span_ms"
+        ),
+        examples=[1000.0, 5000.0, 30000.0],
+    )
+
+    tail_sampling_event_types: Optional[str] = Field(  # type: ignore[call-overload,pydantic-alias]  # pylint: disable=line-too-long
+        None,
+        description=(
+            "Comma-separated event types (e.g. 'model,chain') that make tail "
+            "sampling keep a session; a list is also accepted"
+        ),
+        validation_alias=AliasChoices(
+            "HH_TAIL_SAMPLING_EVENT_TYPES", "tail_sampling_event_types"
+        ),
+        examples=["model", "model,chain"],
+    )
+
+    tail_sampling_decision_wait: float = Field(  # type: ignore[call-overload,pydantic-alias]  # pylint: disable=line-too-long
+        default=30.0,
+        description=(
+            "Seconds after its first span that a buffered session with no "
+            "error, slow span or keep event type is dropped"
+        ),
+        validation_alias=AliasChoices(
+            "HH_TAIL_SAMPLING_DECISION_WAIT", "tail_sampling_decision_wait"
+        ),
+        examples=[10.0, 30.0, 120.0],
+    )
+
     # Core Attribute Preservation Configuration
     preserve_core_attributes: bool = Field(  # type: ignore[pydantic-alias]
         default=True,
@@ -378,6 +466,95 @@ class TracerConfig(BaseHoneyHiveConfig):
         validated = _safe_validate_string(v, "source", allow_none=False, default="dev")
         return validated or "dev"  # Ensure we always return a non-None value
 
+    @field_validator("span_size_policy", mode="before")
+    @classmethod
+    def validate_span_size_policy(cls, v: Any) -> str:
+        """Validate the span size policy with graceful degradation.
+
+        Args:
+            v: The policy name to validate
+
+        Returns:
+            The normalized policy name, or "truncate" if invalid
+        """
+        policy = str(v).strip().lower() if v is not None else "truncate"
+        if policy not in ("truncate", "drop", "off"):
+            logger.warning(
+                "Invalid span_size_policy: %s. Using default 'truncate'.",
+                v,
+                extra={"honeyhive_data": {"invalid_span_size_policy": v}},
+            )
+            return "truncate"
+        return policy
+
+    @field_validator("attribute_encoding", mode="before")
+    @classmethod
+    def validate_attribute_encoding(cls, v: Any) -> str:
+        """Validate the attribute encoding with graceful degradation.
+
+        Args:
+            v: The encoding name to validate
+
+        Returns:
+            The normalized encoding name, or "flatten" if invalid
+        """
+        encoding = str(v).strip().lower() if v is not None else "flatten"
+        if encoding not in ("flatten", "structured"):
+            logger.warning(
+                "Invalid attribute_encoding: %s. Using default 'flatten'.",
+                v,
+                extra={"honeyhive_data": {"invalid_attribute_encoding": v}},
+            )
+            return "flatten"
+        return encoding
+
+    @field_validator("sampling_ratio", mode="before")
+    @classmethod
+    def validate_sampling_ratio(cls, v: Any) -> float:
+        """Validate the session sampling ratio with graceful degradation.
+
+        Args:
+            v: The ratio to validate
+
+        Returns:
+            The ratio clamped to 0.0 - 1.0, or 1.0 if invalid
+        """
+        try:
+            ratio = float(v) if v is not None else 1.0
+        except (ValueError, TypeError):
+            logger.warning(
+                "Invalid sampling_ratio: %s. Using default 1.0.",
+                v,
+                extra={"honeyhive_data": {"invalid_sampling_ratio": v}},
+            )
+            return 1.0
+        return min(1.0, max(0.0, ratio))
+
+    @field_validator("tail_sampling_event_types", mode="before")
+    @classmethod
+    def validate_tail_sampling_event_types(cls, v: Any) -> Optional[str]:
+        """Normalize tail sampling event types to a comma-separated string.
+
+        Args:
+            v: Comma-separated string or list of event types
+
+        Returns:
+            Comma-separated event types, or None when empty
+        """
+        if v is None:
+            return None
+        items = v.split(",") if isinstance(v, str) else v
+        try:
+            names = [str(item).strip() for item in items]
+        except TypeError:
+            logger.warning(
+                "Invalid tail_sampling_event_types: %s. Ignoring.",
+                v,
+                extra={"honeyhive_data": {"invalid_tail_sampling_event_types": v}},
+            )
+            return None
+        return ",".join(name for name in names if name) or None
+
     @field_validator("session_id", mode="before")
     @classmethod
     def validate_session_id(cls, v: Any) -> Optional[str]:
@@ -11,7 +11,12 @@ The experiments module replaces the legacy evaluation module while maintaining
 backward compatibility through deprecation aliases.
 """
 
-from honeyhive.experiments.core import ExperimentContext, evaluate, run_experiment
+from honeyhive.experiments.core import (
+    ExperimentContext,
+    evaluate,
+    iter_experiment_results,
+    run_experiment,
+)
 from honeyhive.experiments.evaluators import (
     EvalResult,
     EvalSettings,
@@ -45,6 +50,7 @@ __all__ = [
     # Core functionality
     "ExperimentContext",
     "run_experiment",
+    "iter_experiment_results",
     "evaluate",
     # Utilities
     "generate_external_dataset_id",
@@ -8,24 +8,46 @@ This module provides the core experiment execution functionality including:
 
 # pylint: disable=too-many-lines
 import asyncio
+import contextvars
 import functools
 import inspect
 import os
 import threading
 import uuid
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sized,
+    Tuple,
+    Union,
+)
 from uuid import UUID
 
 import httpx
+from opentelemetry import baggage
+from opentelemetry import context as otel_context
 
 from honeyhive._generated.api_config import HTTPException
 from honeyhive.api.client import HoneyHive
 from honeyhive.experiments.evaluators import evaluator as evaluator_class
 from honeyhive.experiments.results import get_run_result
 from honeyhive.experiments.utils import (
+    generate_external_datapoint_id,
+    generate_external_dataset_id,
     prepare_external_dataset,
     prepare_run_request_data,
 )
@@ -37,6 +59,10 @@ from honeyhive.models import (
 from honeyhive.tracer import HoneyHiveTracer
 from honeyhive.tracer.instrumentation.decorators import trace
 from honeyhive.tracer.lifecycle.flush import force_flush_tracer
+from honeyhive.tracer.lifecycle.serverless import (
+    flush_at_handler_end,
+    is_serverless_mode,
+)
 from honeyhive.utils.git_context import get_git_context
 from honeyhive.utils.logger import get_logger, safe_log
 
@@ -277,11 +303,33 @@ class ExperimentContext:  # pylint: disable=too-few-public-methods
             "source": self.source,
         }
 
+    def to_pooled_tracer_config(self) -> Dict[str, Any]:
+        """
+        Convert to initialization config for a pooled (per-worker) tracer.
+
+        Like :meth:`to_tracer_config` without the datapoint: a pooled tracer
+        serves many datapoints, which are bound through baggage instead.
 
-def run_experiment(
+        Returns:
+            Dictionary of tracer initialization kwargs
+        """
+        tracer_config = {
+            "is_evaluation": True,
+            "run_id": self.run_id,
+            "dataset_id": self.dataset_id,
+            "source": self.source,
+            # Sessions are created per datapoint, not at tracer init
+            "skip_backend_session_creation": True,
+        }
+        if self.run_name:
+            tracer_config["session_name"] = self.run_name
+        return tracer_config
+
+
+def iter_experiment_results(
     function: Callable,
-    dataset: List[Dict[str, Any]],
-    datapoint_ids: List[str],
+    dataset: Iterable[Dict[str, Any]],
+    datapoint_ids: Optional[Iterable[str]],
     *,
     server_url: Optional[str] = None,
     experiment_context: ExperimentContext,
@@ -290,67 +338,51 @@ def run_experiment(
     verbose: bool = False,
     instrumentors: Optional[List[Callable[[], Any]]] = None,
     evaluators: Optional[List[Callable]] = None,
-) -> List[Dict[str, Any]]:
+    pooled_tracers: bool = False,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
     """
-    Run experiment with tracer multi-instance pattern.
+    Run experiment, yielding each datapoint's result as it completes.
 
-    CRITICAL: Each datapoint gets its OWN tracer instance for isolation.
-    This prevents:
-    - Metadata contamination between datapoints
-    - Race conditions in concurrent execution
-    - Session ID collisions
+    Streaming form of :func:`run_experiment`. ``dataset`` and
+    ``datapoint_ids`` may be any iterables (generators, JSONL readers,
+    database cursors); they are read as workers free up, with at most
+    ``max_in_flight`` datapoints submitted and not yet yielded, so memory
+    stays flat however long the dataset is.
 
-    Threading Model:
-    - Uses ThreadPoolExecutor (not multiprocessing)
-    - I/O-bound operations (LLM calls, API requests)
-    - Each tracer instance is completely isolated
-    - Python 3.11+ GIL improvements for I/O
+    Teardown (tracer flush, uninstrumenting) runs when the generator is
+    exhausted or closed. Results are yielded in completion order.
 
     Args:
-        function: User function to execute against each datapoint. Can be either
-            a synchronous function or an async function. Async functions are
-            automatically detected and executed with asyncio.run().
-        dataset: List of datapoint dictionaries
-        datapoint_ids: List of datapoint IDs (parallel to dataset)
+        function: User function (sync or async), see :func:`run_experiment`
+        dataset: Datapoint dictionaries (any iterable)
+        datapoint_ids: IDs parallel to ``dataset``, or None to generate
+            EXT- IDs per datapoint while reading
+            (see :func:`~honeyhive.experiments.utils.generate_external_datapoint_id`)
         experiment_context: ExperimentContext with run metadata
-        api_key: HoneyHive API key for tracer (or set HONEYHIVE_API_KEY env var)
+        api_key: HoneyHive API key for tracer
         max_workers: ThreadPool size (default: 10)
         verbose: Enable verbose logging
-        instrumentors: List of instrumentor factory functions. Each factory should
-            return a new instrumentor instance when called. This ensures each
-            datapoint gets its own instrumentor instance for proper trace routing.
-            Example: [lambda: OpenAIInstrumentor(), lambda: AnthropicInstrumentor()]
-        evaluators: Optional list of evaluator callables. When set, each
-            evaluator runs inline on the user function's outputs inside
-            the per-datapoint chain span; their normalized scores attach
-            to the chain span via ``enrich_span`` before the span closes.
+        instrumentors: Instrumentor factory functions
+        evaluators: Evaluator callables run inline per datapoint
+        pooled_tracers: Reuse one tracer per worker thread
+        max_in_flight: Maximum datapoints submitted but not yet yielded
+            (default: twice ``max_workers``)
 
-    Returns:
-        List of execution results (one per datapoint)
+    Yields:
+        Execution result of each datapoint
 
-    Examples:
-        >>> def my_function(inputs, ground_truth):
-        ...     return {"output": "test"}
-        >>>
-        >>> # Async functions are also supported
-        >>> async def my_async_function(inputs, ground_truth):
-        ...     result = await some_async_call()
-        ...     return {"output": result}
-        >>>
-        >>> context = ExperimentContext(
-        ...     run_id="run-123",
-        ...     dataset_id="ds-456",
-        ... )
-        >>>
-        >>> results = run_experiment(
-        ...     function=my_function,  # or my_async_function
-        ...     dataset=[{"inputs": {}, "ground_truth": {}}],
-        ...     datapoint_ids=["dp-1"],
+    Raises:
+        ValueError: If ``dataset`` and ``datapoint_ids`` differ in length
+
+    Example:
+        >>> for result in iter_experiment_results(
+        ...     my_function,
+        ...     read_jsonl("dataset.jsonl"),
+        ...     None,
         ...     experiment_context=context,
-        ...     api_key="hh_...",
-        ...     max_workers=10,
-        ...     instrumentors=[lambda: OpenAIInstrumentor()]
-        ... )
+        ... ):
+        ...     print(result["datapoint_id"], result["status"])
     """
     is_async = asyncio.iscoroutinefunction(function)
     user_fn_accepts_tracer = "tracer" in inspect.signature(function).parameters
@@ -368,6 +400,26 @@ def run_experiment(
     active_instrumentors: List[Any] = []
     binding_tracer: List[Any] = []  # singleton container so the closure can mutate it
 
+    # Pooled mode: one tracer per worker thread, flushed after the pool drains
+    worker_state = threading.local()
+    worker_tracers: List[Any] = []
+    worker_tracers_lock = threading.Lock()
+
+    def get_worker_tracer() -> Any:
+        """Get this worker thread's pooled tracer, creating it on first use."""
+        tracer = getattr(worker_state, "tracer", None)
+        if tracer is None:
+            tracer = HoneyHiveTracer(
+                api_key=api_key,
+                server_url=server_url,
+                verbose=verbose,
+                **experiment_context.to_pooled_tracer_config(),
+            )
+            worker_state.tracer = tracer
+            with worker_tracers_lock:
+                worker_tracers.append(tracer)
+        return tracer
+
     def process_datapoint(
         datapoint: Dict[str, Any], datapoint_id: str
     ) -> Dict[str, Any]:
@@ -386,18 +438,34 @@ def run_experiment(
         inputs = datapoint.get("inputs", {})
         ground_truth = datapoint.get("ground_truth")
 
-        # Create tracer config for this datapoint with inputs
-        tracer_config = experiment_context.to_tracer_config(datapoint_id)
-        tracer_config["inputs"] = inputs  # Set session inputs
+        pooled_session_id: Optional[str] = None
+        context_token = None
+        if pooled_tracers:
+            # Reuse the worker's tracer; the datapoint's session and
+            # evaluation metadata live in baggage until it finishes
+            tracer = get_worker_tracer()
+            session_name = experiment_context.run_name or function.__name__
+            pooled_session_id = _start_pooled_session(
+                tracer, experiment_context, datapoint_id, session_name, inputs
+            )
+            context_token = otel_context.attach(
+                _pooled_datapoint_context(
+                    experiment_context, datapoint_id, pooled_session_id, session_name
+                )
+            )
+        else:
+            # Create tracer config for this datapoint with inputs
+            tracer_config = experiment_context.to_tracer_config(datapoint_id)
+            tracer_config["inputs"] = inputs  # Set session inputs
 
-        if experiment_context.run_name:
-            tracer_config["session_name"] = experiment_context.run_name
+            if experiment_context.run_name:
+                tracer_config["session_name"] = experiment_context.run_name
 
-        # Create NEW tracer instance for this datapoint
-        # Each tracer is completely isolated (own API client, logger, state)
-        tracer = HoneyHiveTracer(
-            api_key=api_key, server_url=server_url, verbose=verbose, **tracer_config
-        )
+            # Create NEW tracer instance for this datapoint
+            # Each tracer is completely isolated (own API client, logger, state)
+            tracer = HoneyHiveTracer(
+                api_key=api_key, server_url=server_url, verbose=verbose, **tracer_config
+            )
 
         # Instrument once for the whole experiment under the module lock.
         # An instrumentor that raises here stays uninstrumented for the rest
@@ -519,7 +587,7 @@ def run_experiment(
 
             # Capture session ID from tracer for linking to run
             # Outputs will be enriched later via UpdateEventRequest after tracer flush
-            session_id = getattr(tracer, "session_id", None)
+            session_id = pooled_session_id or getattr(tracer, "session_id", None)
 
             return {
                 "datapoint_id": datapoint_id,
@@ -542,7 +610,7 @@ def run_experiment(
             )
 
             # Capture session ID even on failure
-            session_id = getattr(tracer, "session_id", None)
+            session_id = pooled_session_id or getattr(tracer, "session_id", None)
 
             return {
                 "datapoint_id": datapoint_id,
@@ -555,12 +623,16 @@ def run_experiment(
             }
 
         finally:
+            if context_token is not None:
+                otel_context.detach(context_token)
             # CRITICAL: Flush tracer to ensure all spans sent. Instrumentor
             # teardown happens once after the pool drains (in run_experiment)
             # so an early-finishing datapoint doesn't unwrap the client out
-            # from under a sibling that's still mid-call.
+            # from under a sibling that's still mid-call. Pooled tracers are
+            # flushed once after the pool drains.
             try:
-                force_flush_tracer(tracer)
+                if not pooled_tracers:
+                    _flush_experiment_tracer(tracer)
             except Exception as e:
                 # Use safe_log for flush errors (tracer may be shutting down)
                 safe_log(
@@ -572,7 +644,12 @@ def run_experiment(
                 )
 
     # Validate inputs
-    if len(dataset) != len(datapoint_ids):
+    if (
+        datapoint_ids is not None
+        and isinstance(dataset, Sized)
+        and isinstance(datapoint_ids, Sized)
+        and len(dataset) != len(datapoint_ids)
+    ):
         raise ValueError(
             f"Dataset length ({len(dataset)}) does not match datapoint_ids length ({len(datapoint_ids)})"
         )
@@ -580,78 +657,83 @@ def run_experiment(
     if verbose:
         # Module-level orchestration logging (no tracer instance)
         logger.info(
-            "Executing function against %d datapoints with %d workers",
-            len(dataset),
+            "Executing function against %s datapoints with %d workers",
+            len(dataset) if isinstance(dataset, Sized) else "streamed",
             max_workers,
         )
 
-    # Use ThreadPoolExecutor for I/O-bound concurrent execution
-    results = []
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all datapoint executions
-        future_to_datapoint = {}
-        for datapoint, datapoint_id in zip(dataset, datapoint_ids):
-            future = executor.submit(process_datapoint, datapoint, datapoint_id)
-            future_to_datapoint[future] = datapoint_id
-
-        # Collect results as they complete
-        for future in as_completed(future_to_datapoint):
-            datapoint_id = future_to_datapoint[future]
+    # Use ThreadPoolExecutor for I/O-bound concurrent execution. Datapoints
+    # are submitted through a bounded window and results are yielded as
+    # they complete, so neither the input nor the results are held whole.
+    window = max(1, max_in_flight or 2 * max_workers)
+    success_count = 0
+    failed_count = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = _pair_datapoints(dataset, datapoint_ids)
+            future_to_datapoint: Dict[Future, str] = {}
+            exhausted = False
+            while True:
+                # Top up the window of in-flight datapoints
+                while not exhausted and len(future_to_datapoint) < window:
+                    item = next(pending, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    datapoint, datapoint_id = item
+                    future = executor.submit(process_datapoint, datapoint, datapoint_id)
+                    future_to_datapoint[future] = datapoint_id
+                if not future_to_datapoint:
+                    break
+
+                # Collect results as they complete
+                done, _ = wait(future_to_datapoint, return_when=FIRST_COMPLETED)
+                for future in done:
+                    datapoint_id = future_to_datapoint.pop(future)
+                    result = _collect_datapoint_result(future, datapoint_id, verbose)
+                    if result.get("status") == "success":
+                        success_count += 1
+                    elif result.get("status") == "failed":
+                        failed_count += 1
+                    yield result
+    finally:
+        # Flush the pooled worker tracers (the binding tracer is one of them)
+        for tracer in worker_tracers:
             try:
-                result = future.result()
-                results.append(result)
-
-                if verbose:
-                    status = result.get("status", "unknown")
-                    # Module-level logging (tracer already flushed)
-                    logger.info("Completed datapoint %s: %s", datapoint_id, status)
-
+                _flush_experiment_tracer(tracer)
             except Exception as e:
-                # Module-level error logging (tracer context lost)
-                logger.error(
-                    "Unexpected error processing datapoint %s: %s",
-                    datapoint_id,
-                    str(e),
-                    exc_info=True,
-                )
-                results.append(
-                    {
-                        "datapoint_id": datapoint_id,
-                        "status": "failed",
-                        "error": str(e),
-                    }
+                logger.warning(
+                    "Failed to flush pooled tracer for experiment: %s", str(e)
                 )
 
-    # Flush the binding tracer. Every wrapped span across the experiment
-    # was emitted through its provider, and short scripts / container
-    # exits can race the BatchSpanProcessor's 5 s tick and atexit hook.
-    if binding_tracer:
-        try:
-            force_flush_tracer(binding_tracer[0])
-        except Exception as e:
-            logger.warning("Failed to flush binding tracer for experiment: %s", str(e))
+        # Flush the binding tracer. Every wrapped span across the experiment
+        # was emitted through its provider, and short scripts / container
+        # exits can race the BatchSpanProcessor's 5 s tick and atexit hook.
+        if binding_tracer and not pooled_tracers:
+            try:
+                force_flush_tracer(binding_tracer[0])
+            except Exception as e:
+                logger.warning(
+                    "Failed to flush binding tracer for experiment: %s", str(e)
+                )
 
-    # Uninstrument once every datapoint has finished — unwrapping the
-    # wrapped client while a sibling is still mid-call would silently drop
-    # its spans.
-    for instrumentor in active_instrumentors:
-        try:
-            instrumentor.uninstrument()
-            if verbose:
-                logger.info(
-                    "Uninstrumented %s for experiment",
+        # Uninstrument once every datapoint has finished — unwrapping the
+        # wrapped client while a sibling is still mid-call would silently drop
+        # its spans.
+        for instrumentor in active_instrumentors:
+            try:
+                instrumentor.uninstrument()
+                if verbose:
+                    logger.info(
+                        "Uninstrumented %s for experiment",
+                        type(instrumentor).__name__,
+                    )
+            except Exception as e:
+                logger.warning(
+                    "Failed to uninstrument %s: %s",
                     type(instrumentor).__name__,
+                    str(e),
                 )
-        except Exception as e:
-            logger.warning(
-                "Failed to uninstrument %s: %s",
-                type(instrumentor).__name__,
-                str(e),
-            )
-
-    # Log summary
-    success_count = sum(1 for r in results if r.get("status") == "success")
-    failed_count = sum(1 for r in results if r.get("status") == "failed")
 
     if verbose:
         # Module-level summary logging
@@ -661,7 +743,248 @@ def run_experiment(
             failed_count,
         )
 
-    return results
+
+def run_experiment(
+    function: Callable,
+    dataset: Iterable[Dict[str, Any]],
+    datapoint_ids: Optional[Iterable[str]],
+    *,
+    server_url: Optional[str] = None,
+    experiment_context: ExperimentContext,
+    api_key: Optional[str] = None,
+    max_workers: int = 10,
+    verbose: bool = False,
+    instrumentors: Optional[List[Callable[[], Any]]] = None,
+    evaluators: Optional[List[Callable]] = None,
+    pooled_tracers: bool = False,
+    max_in_flight: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run experiment with tracer multi-instance pattern.
+
+    CRITICAL: Each datapoint gets its OWN tracer instance for isolation.
+    This prevents:
+    - Metadata contamination between datapoints
+    - Race conditions in concurrent execution
+    - Session ID collisions
+
+    Pooled Mode (``pooled_tracers=True``):
+    - Each worker thread creates one tracer (provider, exporter, batch
+      processor, API client) on its first datapoint and reuses it
+    - Each datapoint still gets its own session; its session_id, run_id,
+      dataset_id and datapoint_id are bound through baggage for the
+      duration of the datapoint, so spans are isolated as before
+    - Worker tracers are flushed once after the pool drains instead of
+      after every datapoint
+    - The tracer passed to the function has no ``session_id`` of its own;
+      threads started by the function must copy the context
+      (``contextvars.copy_context()``) for their spans to join the session
+
+    Threading Model:
+    - Uses ThreadPoolExecutor (not multiprocessing)
+    - I/O-bound operations (LLM calls, API requests)
+    - Each tracer instance is completely isolated
+    - Python 3.11+ GIL improvements for I/O
+
+    Args:
+        function: User function to execute against each datapoint. Can be either
+            a synchronous function or an async function. Async functions are
+            automatically detected and executed with asyncio.run().
+        dataset: Datapoint dictionaries (a list or any iterable)
+        datapoint_ids: Datapoint IDs parallel to dataset, or None to generate
+            EXT- IDs per datapoint
+        experiment_context: ExperimentContext with run metadata
+        api_key: HoneyHive API key for tracer (or set HONEYHIVE_API_KEY env var)
+        max_workers: ThreadPool size (default: 10)
+        verbose: Enable verbose logging
+        instrumentors: List of instrumentor factory functions. Each factory should
+            return a new instrumentor instance when called. This ensures each
+            datapoint gets its own instrumentor instance for proper trace routing.
+            Example: [lambda: OpenAIInstrumentor(), lambda: AnthropicInstrumentor()]
+        evaluators: Optional list of evaluator callables. When set, each
+            evaluator runs inline on the user function's outputs inside
+            the per-datapoint chain span; their normalized scores attach
+            to the chain span via ``enrich_span`` before the span closes.
+        pooled_tracers: Reuse one tracer per worker thread instead of
+            creating one per datapoint (default: False). Cuts tracer setup,
+            flush and memory costs on large datasets.
+        max_in_flight: Maximum datapoints submitted to the pool at once
+            (default: twice ``max_workers``). Use
+            :func:`iter_experiment_results` to also stream the results.
+
+    Returns:
+        List of execution results (one per datapoint)
+
+    Examples:
+        >>> def my_function(inputs, ground_truth):
+        ...     return {"output": "test"}
+        >>>
+        >>> # Async functions are also supported
+        >>> async def my_async_function(inputs, ground_truth):
+        ...     result = await some_async_call()
+        ...     return {"output": result}
+        >>>
+        >>> context = ExperimentContext(
+        ...     run_id="run-123",
+        ...     dataset_id="ds-456",
+        ... )
+        >>>
+        >>> results = run_experiment(
+        ...     function=my_function,  # or my_async_function
+        ...     dataset=[{"inputs": {}, "ground_truth": {}}],
+        ...     datapoint_ids=["dp-1"],
+        ...     experiment_context=context,
+        ...     api_key="hh_...",
+        ...     max_workers=10,
+        ...     instrumentors=[lambda: OpenAIInstrumentor()]
+        ... )
+    """
+    return list(
+        iter_experiment_results(
+            function,
+            dataset,
+            datapoint_ids,
+            server_url=server_url,
+            experiment_context=experiment_context,
+            api_key=api_key,
+            max_workers=max_workers,
+            verbose=verbose,
+            instrumentors=instrumentors,
+            evaluators=evaluators,
+            pooled_tracers=pooled_tracers,
+            max_in_flight=max_in_flight,
+        )
+    )
+
+
+def _pair_datapoints(
+    dataset: Iterable[Dict[str, Any]], datapoint_ids: Optional[Iterable[str]]
+) -> Iterator[Tuple[Dict[str, Any], str]]:
+    """Pair datapoints with their IDs lazily, generating EXT- IDs if None."""
+    if datapoint_ids is None:
+        for index, datapoint in enumerate(dataset):
+            custom_id = datapoint.get("id") or datapoint.get("datapoint_id")
+            yield datapoint, generate_external_datapoint_id(datapoint, index, custom_id)
+        return
+
+    ids = iter(datapoint_ids)
+    for datapoint in dataset:
+        datapoint_id = next(ids, None)
+        if datapoint_id is None:
+            raise ValueError("Dataset length does not match datapoint_ids length")
+        yield datapoint, datapoint_id
+    if next(ids, None) is not None:
+        raise ValueError("Dataset length does not match datapoint_ids length")
+
+
+def _collect_datapoint_result(
+    future: Future, datapoint_id: str, verbose: bool
+) -> Dict[str, Any]:
+    """Get a finished datapoint's result, turning a crash into a failure."""
+    try:
+        result: Dict[str, Any] = future.result()
+        if verbose:
+            status = result.get("status", "unknown")
+            # Module-level logging (tracer already flushed)
+            logger.info("Completed datapoint %s: %s", datapoint_id, status)
+        return result
+    except Exception as e:
+        # Module-level error logging (tracer context lost)
+        logger.error(
+            "Unexpected error processing datapoint %s: %s",
+            datapoint_id,
+            str(e),
+            exc_info=True,
+        )
+        return {
+            "datapoint_id": datapoint_id,
+            "status": "failed",
+            "error": str(e),
+        }
+
+
+def _flush_experiment_tracer(tracer: Any) -> None:
+    """Flush a tracer's spans after its datapoint(s) finished."""
+    if is_serverless_mode(tracer):
+        # Bounded flush; leftovers are spooled, not waited for
+        flush_at_handler_end(tracer)
+    else:
+        force_flush_tracer(tracer)
+
+
+def _start_pooled_session(
+    tracer: Any,
+    experiment_context: ExperimentContext,
+    datapoint_id: str,
+    session_name: str,
+    inputs: Dict[str, Any],
+) -> str:
+    """Create the session of one datapoint on a pooled tracer.
+
+    Sends the same session a per-datapoint tracer creates at init (name,
+    inputs and run/dataset/datapoint metadata). The session ID is generated
+    client-side, so a failed request still leaves the spans grouped: pooled
+    tracers mark their spans for session auto-creation.
+    """
+    session_id = str(uuid.uuid4())
+    if getattr(tracer, "test_mode", False) or not getattr(tracer, "client", None):
+        return session_id
+
+    metadata = {
+        "run_id": str(experiment_context.run_id),
+        "dataset_id": str(experiment_context.dataset_id),
+        "datapoint_id": str(datapoint_id),
+    }
+    try:
+        response = tracer.client.sessions.start(
+            data={
+                "project": getattr(tracer, "project_name", None),
+                "session_name": session_name,
+                "source": experiment_context.source,
+                "session_id": session_id,
+                "inputs": inputs,
+                "metadata": metadata,
+            }
+        )
+        response_session_id = getattr(response, "session_id", None)
+        if isinstance(response_session_id, str) and response_session_id:
+            session_id = response_session_id
+    except Exception as e:
+        # Graceful degradation - the spans carry the generated session ID
+        safe_log(
+            tracer,
+            "warning",
+            "Failed to create session for datapoint %s: %s",
+            datapoint_id,
+            str(e),
+        )
+    return session_id
+
+
+def _pooled_datapoint_context(
+    experiment_context: ExperimentContext,
+    datapoint_id: str,
+    session_id: str,
+    session_name: str,
+) -> Any:
+    """Build the context binding one datapoint's session and metadata.
+
+    The span processor reads these baggage keys before falling back to the
+    tracer's own values, so spans of concurrent datapoints sharing a pooled
+    tracer stay separated.
+    """
+    ctx = otel_context.get_current()
+    items = {
+        "session_id": session_id,
+        "session_name": session_name,
+        "run_id": experiment_context.run_id,
+        "dataset_id": experiment_context.dataset_id,
+        "datapoint_id": datapoint_id,
+    }
+    for key, value in items.items():
+        if value:
+            ctx = baggage.set_baggage(key, str(value), ctx)
+    return ctx
 
 
 def _update_run_with_results(  # pylint: disable=too-many-branches
@@ -672,8 +995,13 @@ def _update_run_with_results(  # pylint: disable=too-many-branches
     external_dataset_id: str,
     client: Any,
     verbose: bool,
+    datapoint_ids: Optional[List[str]] = None,
 ) -> None:
-    """Update run with session IDs and final status."""
+    """Update run with session IDs and final status.
+
+    ``datapoint_ids`` is set for streamed datasets, whose run was created
+    before the datapoints were read.
+    """
     # Collect session IDs from execution results
     session_ids = []
     for result in execution_results:
@@ -703,6 +1031,9 @@ def _update_run_with_results(  # pylint: disable=too-many-branches
         if session_ids:
             update_data["event_ids"] = session_ids
 
+        if datapoint_ids:
+            update_data["datapoint_ids"] = datapoint_ids
+
         # Build metadata
         update_metadata: Dict[str, Any] = {}
 
@@ -968,8 +1299,11 @@ def _run_evaluators_for_datapoint(
 
     results: List[EvaluatorMetricResult] = []
     with ThreadPoolExecutor(max_workers=min(max_workers, len(evaluators))) as executor:
+        # Each evaluator runs in a copy of the caller's context so spans it
+        # creates keep the datapoint's baggage (session, run, datapoint)
         futures = [
             executor.submit(
+                contextvars.copy_context().run,
                 _run_single_evaluator,
                 eval_func,
                 inputs,
@@ -1097,7 +1431,7 @@ def _attach_metrics_to_span(results: List[EvaluatorMetricResult], tracer: Any) -
 def evaluate(  # pylint: disable=too-many-locals,too-many-branches
     function: Callable,
     *,
-    dataset: Optional[List[Dict[str, Any]]] = None,
+    dataset: Optional[Iterable[Dict[str, Any]]] = None,
     dataset_id: Optional[str] = None,
     evaluators: Optional[List[Callable]] = None,
     instrumentors: Optional[List[Callable[[], Any]]] = None,
@@ -1110,6 +1444,7 @@ def evaluate(  # pylint: disable=too-many-locals,too-many-branches
     aggregate_function: str = "average",
     verbose: bool = False,
     print_results: bool = True,
+    pooled_tracers: bool = False,
 ) -> Any:
     """
     Run experiment evaluation with backend aggregation.
@@ -1125,7 +1460,12 @@ def evaluate(  # pylint: disable=too-many-locals,too-many-branches
         function: User function to execute against each datapoint. Can be either
             a synchronous function or an async function. Async functions are
             automatically detected and executed with asyncio.run().
-        dataset: External dataset (list of dicts with 'inputs' and 'ground_truth')
+        dataset: External dataset (dicts with 'inputs' and 'ground_truth').
+            A list or tuple is hashed into a deterministic EXT- dataset ID
+            up front. Any other iterable (generator, JSONL reader, database
+            cursor) is streamed: datapoints are read as workers free up,
+            the dataset ID is derived from the run ID and the run's
+            datapoint IDs are recorded when it completes.
         dataset_id: HoneyHive dataset ID (alternative to external dataset)
         evaluators: List of evaluator functions (optional)
         instrumentors: List of instrumentor factory functions. Each factory should
@@ -1145,6 +1485,8 @@ def evaluate(  # pylint: disable=too-many-locals,too-many-branches
         verbose: Enable verbose logging
         print_results: Print formatted results table after evaluation
             (default: True)
+        pooled_tracers: Reuse one tracer per worker thread instead of one
+            per datapoint (default: False). See :func:`run_experiment`.
 
     Returns:
         ExperimentResultSummary with backend-computed aggregates
@@ -1229,19 +1571,37 @@ def evaluate(  # pylint: disable=too-many-locals,too-many-branches
 
     # Initialize client - passing explicit values ensures both HONEYHIVE_* and HH_*
     # environment variables work (client's config only checks HH_* prefix)
-    client_params = {"api_key": api_key}
-    if server_url:
-        client_params["base_url"] = server_url
-    client = HoneyHive(**client_params)
+    client = HoneyHive(api_key=api_key, base_url=server_url or None)
+
+    # Generate a client-side UUID if no run_id was provided. The backend also
+    # generates a UUID when run_id is omitted, but we do it here so the
+    # default run name ("experiment-{short_id}") is derived from the same ID
+    # that will be sent in the request.
+    run_id = run_id or str(uuid.uuid4())
 
     # Step 1: Prepare dataset
-    if dataset is not None:
+    streamed = dataset is not None and not isinstance(dataset, (list, tuple))
+    if streamed:
+        # Streamed external dataset - a stream cannot be hashed before it
+        # is read, so its ID is scoped to the run; datapoint IDs are
+        # generated per datapoint while reading
+        assert dataset is not None
+        external_dataset_id = generate_external_dataset_id(
+            [], custom_id=f"stream-{run_id}"
+        )
+        datapoint_ids: List[str] = []
+
+        if verbose:
+            logger.info("Streaming external dataset: %s", external_dataset_id)
+    elif dataset is not None:
         # External dataset - generate EXT- IDs
+        dataset_list = list(dataset)
         if verbose:
-            logger.info("Preparing external dataset with %d datapoints", len(dataset))
+            logger.info(
+                "Preparing external dataset with %d datapoints", len(dataset_list)
+            )
 
-        external_dataset_id, datapoint_ids = prepare_external_dataset(dataset)
-        dataset_list = dataset
+        external_dataset_id, datapoint_ids = prepare_external_dataset(dataset_list)
 
         if verbose:
             logger.info("Generated external dataset ID: %s", external_dataset_id)
@@ -1319,11 +1679,6 @@ def evaluate(  # pylint: disable=too-many-locals,too-many-branches
             logger.info("DEBUG - datapoint_ids collected: %s", datapoint_ids)
 
     # Step 2: Create experiment run
-    # Generate a client-side UUID if no run_id was provided. The backend also
-    # generates a UUID when run_id is omitted, but we do it here so the
-    # default run name ("experiment-{short_id}") is derived from the same ID
-    # that will be sent in the request.
-    run_id = run_id or str(uuid.uuid4())
     normalized_name = name.strip() if name else None
     run_name = normalized_name or f"experiment-{run_id[:8]}"
 
@@ -1382,29 +1737,56 @@ def evaluate(  # pylint: disable=too-many-locals,too-many-branches
     )
 
     # Step 4: Execute experiment with tracer multi-instance
-    if verbose:
-        logger.info(
-            "Executing function against %d datapoints with %d workers",
-            len(dataset_list),
-            max_workers,
+    execution_results: Iterable[Dict[str, Any]]
+    if streamed:
+        if verbose:
+            logger.info(
+                "Executing function against streamed datapoints with %d workers",
+                max_workers,
+            )
+
+        # Results stream out of a bounded window of in-flight datapoints
+        execution_results = iter_experiment_results(
+            function,
+            dataset,  # type: ignore[arg-type]
+            None,
+            server_url=server_url,
+            experiment_context=context,
+            api_key=api_key,
+            max_workers=max_workers,
+            verbose=verbose,
+            instrumentors=instrumentors,
+            evaluators=evaluators,
+            pooled_tracers=pooled_tracers,
         )
+    else:
+        if verbose:
+            logger.info(
+                "Executing function against %d datapoints with %d workers",
+                len(dataset_list),
+                max_workers,
+            )
 
-    execution_results = run_experiment(
-        function=function,
-        dataset=dataset_list,
-        datapoint_ids=datapoint_ids,
-        server_url=server_url,
-        experiment_context=context,
-        api_key=api_key,
-        max_workers=max_workers,
-        verbose=verbose,
-        instrumentors=instrumentors,
-        evaluators=evaluators,
-    )
+        execution_results = run_experiment(
+            function=function,
+            dataset=dataset_list,
+            datapoint_ids=datapoint_ids,
+            server_url=server_url,
+            experiment_context=context,
+            api_key=api_key,
+            max_workers=max_workers,
+            verbose=verbose,
+            instrumentors=instrumentors,
+            evaluators=evaluators,
+            pooled_tracers=pooled_tracers,
+        )
 
     if verbose:
         logger.info("Enriching sessions with outputs and ground_truth")
 
+    # Enrich each session as its result arrives; only the IDs are kept for
+    # the run update, not the outputs
+    linked_results: List[Dict[str, Any]] = []
     for result in execution_results:
         session_id = result.get("session_id")
         if session_id:
@@ -1415,14 +1797,22 @@ def evaluate(  # pylint: disable=too-many-locals,too-many-branches
                 client=client,
                 verbose=verbose,
             )
+        linked_results.append(
+            {"session_id": session_id, "datapoint_id": result.get("datapoint_id")}
+        )
 
     _update_run_with_results(
         run_id=run_id,
         run_name=run_name,
-        execution_results=execution_results,
+        execution_results=linked_results,
         external_dataset_id=external_dataset_id,
         client=client,
         verbose=verbose,
+        datapoint_ids=(
+            [r["datapoint_id"] for r in linked_results if r["datapoint_id"]]
+            if streamed
+            else None
+        ),
     )
 
     # Step 7: Retrieve aggregated results from backend
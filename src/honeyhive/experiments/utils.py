@@ -4,15 +4,61 @@ This module provides utility functions for:
 - External dataset ID generation with EXT- prefix
 - External datapoint ID generation
 - Run request data preparation with EXT- transformation
+
+Dataset and datapoint IDs hash the JSON of each datapoint incrementally, so a
+dataset is never serialized as a whole and each datapoint only once.
 """
 
 import hashlib
 import json
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def _with_ext_prefix(custom_id: str) -> str:
+    """Add the EXT- prefix to a custom ID unless it already has it."""
+    if not custom_id.startswith("EXT-"):
+        return f"EXT-{custom_id}"
+    return custom_id
+
+
+def _datapoint_json(datapoint: Dict[str, Any]) -> str:
+    """Serialize a datapoint the way the ID hashes expect."""
+    return json.dumps(datapoint, sort_keys=True)
+
+
+def _hashed_datapoint_id(content: str, index: int) -> str:
+    """Build a datapoint ID from the datapoint's JSON and its index."""
+    hash_value = hashlib.sha256(f"{content}{index}".encode()).hexdigest()[:16]
+    return f"EXT-{hash_value}"
+
+
+class _DatasetHasher:
+    """Incremental dataset hash.
+
+    Feeding each datapoint's JSON in order gives the same digest as hashing
+    ``json.dumps(datapoints, sort_keys=True)``, without building that string.
+    """
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256(b"[")
+        self._count = 0
+
+    def update(self, content: str) -> None:
+        """Add the next datapoint's JSON."""
+        if self._count:
+            self._hash.update(b", ")
+        self._hash.update(content.encode())
+        self._count += 1
+
+    def dataset_id(self) -> str:
+        """Get the EXT- dataset ID of the datapoints added so far."""
+        digest = self._hash.copy()
+        digest.update(b"]")
+        return f"EXT-{digest.hexdigest()[:16]}"
 
 
 def generate_external_dataset_id(
-    datapoints: List[Dict[str, Any]], custom_id: Optional[str] = None
+    datapoints: Iterable[Dict[str, Any]], custom_id: Optional[str] = None
 ) -> str:
     """
     Generate EXT- prefixed dataset ID for external datasets.
@@ -21,7 +67,7 @@ def generate_external_dataset_id(
     They require an EXT- prefix to distinguish them from HoneyHive datasets.
 
     Args:
-        datapoints: List of datapoint dictionaries
+        datapoints: Datapoint dictionaries (any iterable)
         custom_id: Optional custom ID (will be prefixed with EXT-)
 
     Returns:
@@ -37,14 +83,13 @@ def generate_external_dataset_id(
     """
     if custom_id:
         # Ensure custom ID has EXT- prefix
-        if not custom_id.startswith("EXT-"):
-            return f"EXT-{custom_id}"
-        return custom_id
+        return _with_ext_prefix(custom_id)
 
     # Generate hash-based ID for deterministic identification
-    content = json.dumps(datapoints, sort_keys=True)
-    hash_value = hashlib.sha256(content.encode()).hexdigest()[:16]
-    return f"EXT-{hash_value}"
+    hasher = _DatasetHasher()
+    for datapoint in datapoints:
+        hasher.update(_datapoint_json(datapoint))
+    return hasher.dataset_id()
 
 
 def generate_external_datapoint_id(
@@ -70,27 +115,24 @@ def generate_external_datapoint_id(
         'EXT-dp-1'
     """
     if custom_id:
-        if not custom_id.startswith("EXT-"):
-            return f"EXT-{custom_id}"
-        return custom_id
+        return _with_ext_prefix(custom_id)
 
     # Generate hash-based ID with index for uniqueness
-    content = json.dumps(datapoint, sort_keys=True)
-    hash_value = hashlib.sha256(f"{content}{index}".encode()).hexdigest()[:16]
-    return f"EXT-{hash_value}"
+    return _hashed_datapoint_id(_datapoint_json(datapoint), index)
 
 
 def prepare_external_dataset(
-    datapoints: List[Dict[str, Any]], custom_dataset_id: Optional[str] = None
+    datapoints: Iterable[Dict[str, Any]], custom_dataset_id: Optional[str] = None
 ) -> Tuple[str, List[str]]:
     """
     Prepare external dataset with EXT- IDs.
 
     This function generates a dataset ID and datapoint IDs for an external
-    dataset, ensuring all IDs have the EXT- prefix.
+    dataset, ensuring all IDs have the EXT- prefix. Each datapoint is
+    serialized once for both IDs.
 
     Args:
-        datapoints: List of datapoint dictionaries
+        datapoints: Datapoint dictionaries (any iterable)
         custom_dataset_id: Optional custom dataset ID
 
     Returns:
@@ -107,16 +149,25 @@ def prepare_external_dataset(
         >>> all(dp_id.startswith("EXT-") for dp_id in datapoint_ids)
         True
     """
-    # Generate dataset ID
-    dataset_id = generate_external_dataset_id(datapoints, custom_dataset_id)
+    hasher = _DatasetHasher()
 
-    # Generate datapoint IDs
+    # Generate datapoint IDs, feeding the dataset hash on the way
     datapoint_ids = []
     for idx, dp in enumerate(datapoints):
+        content = _datapoint_json(dp)
+        hasher.update(content)
         # Check if datapoint already has an ID
         custom_dp_id = dp.get("id") or dp.get("datapoint_id")
-        dp_id = generate_external_datapoint_id(dp, idx, custom_dp_id)
-        datapoint_ids.append(dp_id)
+        if custom_dp_id:
+            datapoint_ids.append(_with_ext_prefix(custom_dp_id))
+        else:
+            datapoint_ids.append(_hashed_datapoint_id(content, idx))
+
+    # Generate dataset ID
+    if custom_dataset_id:
+        dataset_id = _with_ext_prefix(custom_dataset_id)
+    else:
+        dataset_id = hasher.dataset_id()
 
     return dataset_id, datapoint_ids
 
@@ -33,6 +33,7 @@ from ...utils.logger import safe_log
 from ..infra import build_otel_resources
 from ..instrumentation.initialization import initialize_tracer_instance
 from ..lifecycle.core import get_lock_config
+from ..processing.pipeline_metrics import PipelineMetrics
 
 # Removed TracerConfigInterface - replaced with DotDict config
 
@@ -296,6 +297,8 @@ class HoneyHiveTracerBase:  # pylint: disable=too-many-instance-attributes
         self.tracer = None
         self.span_processor = None
         self.propagator = None
+        # Counters and histograms shared by the processors and the exporter
+        self._pipeline_metrics = PipelineMetrics()
         # Provider management for multi-instance architecture
         self.is_main_provider = False
         self._tracer_id = None
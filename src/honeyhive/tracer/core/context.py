@@ -20,8 +20,10 @@ from opentelemetry.context import Context
 
 from ...models import UpdateEventRequest
 from ...utils.logger import safe_log
+from ..instrumentation.initialization import wait_for_session_start
 from ..lifecycle import force_flush_tracer, shutdown_tracer
 from ..processing.context import get_current_baggage
+from ..processing.export_hub import SharedExportChannel
 
 # Context processing imports - handle potential circular imports gracefully
 try:
@@ -111,6 +113,58 @@ class TracerContextMixin(TracerContextInterface):
         # Proceed with standard tracer shutdown
         shutdown_tracer(self)
 
+    def get_pipeline_stats(self) -> Dict[str, Any]:
+        """Get export pipeline metrics for this tracer.
+
+        Covers the span processor, the batch export queue and the exporter:
+        counters, fixed-bucket histograms with estimated p50/p90/p99 (for
+        example ``exporter.http_seconds``) and gauges such as the queue
+        depth, dropped spans and the exporter's session statistics.
+
+        With ``otlp_shared_export`` the queue and exporter belong to the
+        shared export hub, so the hub's metrics are included as well. They
+        cover every tracer of the hub; the tracer's own values take
+        precedence where names overlap.
+
+        Returns:
+            Dictionary with ``counters``, ``histograms`` and ``gauges``
+        """
+        metrics = getattr(self, "_pipeline_metrics", None)
+        stats: Dict[str, Any] = (
+            metrics.snapshot()
+            if metrics is not None
+            else {"counters": {}, "histograms": {}, "gauges": {}}
+        )
+        exporter = getattr(self, "otlp_exporter", None)
+        if isinstance(exporter, SharedExportChannel):
+            shared = exporter.hub.metrics.snapshot()
+            for section in ("counters", "histograms", "gauges"):
+                stats[section] = {**shared[section], **stats[section]}
+        return stats
+
+    def export_pipeline_metrics(self, meter_provider: Optional[Any] = None) -> int:
+        """Report export pipeline metrics as OpenTelemetry metrics.
+
+        Registers observable instruments named ``honeyhive.pipeline.*`` on a
+        meter from ``meter_provider`` (the global meter provider by default).
+        Call it after the tracer is initialized.
+
+        Args:
+            meter_provider: Optional OpenTelemetry ``MeterProvider``
+
+        Returns:
+            Number of instruments registered
+        """
+        # pylint: disable=import-outside-toplevel
+        from opentelemetry import metrics as otel_metrics
+
+        pipeline_metrics = getattr(self, "_pipeline_metrics", None)
+        if pipeline_metrics is None:
+            return 0
+        provider = meter_provider or otel_metrics.get_meter_provider()
+        meter = provider.get_meter("honeyhive.pipeline")
+        return int(pipeline_metrics.register_otel_instruments(meter))
+
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     # Justification: Session enrichment requires multiple optional parameters
     # for comprehensive session data (inputs, outputs, metadata, config, etc.).
@@ -229,6 +283,10 @@ class TracerContextMixin(TracerContextInterface):
                 target_session_id = self._get_session_id_for_enrichment_dynamically()
 
             if target_session_id and update_params:
+                # A session created in the background must exist before update
+                if target_session_id == getattr(self, "_session_id", None):
+                    wait_for_session_start(self)
+
                 # Update session via EventsAPI (sessions are events in the backend)
                 if self.client is not None and hasattr(self.client, "events"):
                     # Build update data dict with event_id and update params
@@ -12,17 +12,21 @@ This module provides comprehensive infrastructure detection capabilities includi
 from .environment import (
     EnvironmentDetector,
     get_comprehensive_environment_analysis,
+    get_environment_snapshot,
     get_environment_type,
     get_performance_characteristics,
     get_resource_constraints,
+    reset_environment_snapshot,
 )
 from .resources import build_otel_resources
 
 __all__ = [
     "EnvironmentDetector",
     "get_comprehensive_environment_analysis",
+    "get_environment_snapshot",
     "get_environment_type",
     "get_performance_characteristics",
     "get_resource_constraints",
+    "reset_environment_snapshot",
     "build_otel_resources",
 ]
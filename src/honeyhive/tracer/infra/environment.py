@@ -14,15 +14,49 @@ The detection logic is designed to be:
 - Gracefully degrading on errors
 - Cache-friendly for repeated calls
 - OpenTelemetry resource convention compliant
+
+The module-level functions share one process-wide snapshot
+(:func:`get_environment_snapshot`), so creating more tracers does not probe
+cgroups, ``platform`` and CPU counts again. The snapshot is taken again after
+a fork, or when one of the environment variables detection reads changes.
 """
 
+import copy
 import multiprocessing
 import os
 import platform
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 from ...utils.logger import safe_log
 
+# Environment variables read during detection; a change invalidates the snapshot
+_DETECTION_ENV_VARS = (
+    "AWS_LAMBDA_FUNCTION_NAME",
+    "AWS_LAMBDA_FUNCTION_MEMORY_SIZE",
+    "AWS_LAMBDA_FUNCTION_TIMEOUT",
+    "AWS_LAMBDA_FUNCTION_VERSION",
+    "AWS_REGION",
+    "AZURE_REGION",
+    "AZURE_RESOURCE_GROUP",
+    "DOCKER_CONTAINER",
+    "GCP_PROJECT",
+    "GOOGLE_CLOUD_PROJECT",
+    "GOOGLE_CLOUD_REGION",
+    "HH_HIGH_CONCURRENCY",
+    "HH_SESSION_NAME",
+    "HOSTNAME",
+    "K8S_CLUSTER_NAME",
+    "K8S_DEPLOYMENT_NAME",
+    "K8S_NAMESPACE",
+    "K8S_POD_NAME",
+    "KUBERNETES_SERVICE_HOST",
+    "WEBSITE_RESOURCE_GROUP",
+)
+
+_SNAPSHOT: Dict[str, Any] = {}
+_SNAPSHOT_LOCK = threading.Lock()
+
 
 class EnvironmentDetector:
     """Comprehensive environment and resource detection."""
@@ -814,6 +848,51 @@ class EnvironmentDetector:
         self._cache.clear()
 
 
+def _snapshot_key() -> Tuple[Any, ...]:
+    """Build the key a snapshot is valid for (process and detection inputs)."""
+    return (os.getpid(),) + tuple(os.environ.get(name) for name in _DETECTION_ENV_VARS)
+
+
+def get_environment_snapshot(tracer_instance: Optional[Any] = None) -> Dict[str, Any]:
+    """Get the process-wide environment analysis, detecting it once.
+
+    The first call runs :meth:`EnvironmentDetector.get_comprehensive_analysis`;
+    later calls from any tracer return a copy of the same result until the
+    process forks or a detection environment variable changes.
+
+    Args:
+        tracer_instance: Optional tracer instance for logging context
+
+    Returns:
+        Copy of the complete environment analysis
+    """
+    key = _snapshot_key()
+    with _SNAPSHOT_LOCK:
+        if _SNAPSHOT.get("key") != key:
+            analysis = EnvironmentDetector(tracer_instance).get_comprehensive_analysis()
+            _SNAPSHOT["key"] = key
+            _SNAPSHOT["analysis"] = analysis
+        analysis = _SNAPSHOT["analysis"]
+    return copy.deepcopy(analysis)
+
+
+def reset_environment_snapshot() -> None:
+    """Discard the process-wide snapshot so the next call detects again."""
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOT.clear()
+
+
+def _reset_snapshot_after_fork() -> None:
+    """Give a forked child a fresh lock and an empty snapshot."""
+    global _SNAPSHOT_LOCK  # pylint: disable=global-statement
+    _SNAPSHOT_LOCK = threading.Lock()
+    _SNAPSHOT.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_snapshot_after_fork)
+
+
 # Convenience functions for common use cases
 def get_environment_type(tracer_instance: Optional[Any] = None) -> str:
     """Get the primary environment type.
@@ -824,8 +903,7 @@ def get_environment_type(tracer_instance: Optional[Any] = None) -> str:
     Returns:
         Primary environment type string
     """
-    detector = EnvironmentDetector(tracer_instance)
-    return detector.detect_primary_environment_type()
+    return str(get_environment_snapshot(tracer_instance)["environment_type"])
 
 
 def get_resource_constraints(tracer_instance: Optional[Any] = None) -> Dict[str, Any]:
@@ -837,8 +915,7 @@ def get_resource_constraints(tracer_instance: Optional[Any] = None) -> Dict[str,
     Returns:
         Dictionary with resource constraints
     """
-    detector = EnvironmentDetector(tracer_instance)
-    return detector.detect_resource_constraints()
+    return dict(get_environment_snapshot(tracer_instance)["resource_constraints"])
 
 
 def get_performance_characteristics(
@@ -852,47 +929,36 @@ def get_performance_characteristics(
     Returns:
         Dictionary with performance characteristics
     """
-    detector = EnvironmentDetector(tracer_instance)
-    return detector.detect_performance_characteristics()
+    return dict(
+        get_environment_snapshot(tracer_instance)["performance_characteristics"]
+    )
 
 
 def get_comprehensive_environment_analysis(
     tracer_instance: Optional[Any] = None,
 ) -> Dict[str, Any]:
-    """Get comprehensive environment analysis with per-tracer caching.
+    """Get comprehensive environment analysis from the process-wide snapshot.
 
-    Each tracer instance maintains its own environment detector and cache,
-    ensuring full isolation in multi-instance architectures.
+    All tracers share one detection per process; each call returns its own
+    copy, so callers may modify the result.
 
     Args:
-        tracer_instance: Optional tracer instance for logging and cache isolation
+        tracer_instance: Optional tracer instance for logging context
 
     Returns:
         Complete environment analysis
     """
-    # Use tracer-specific detector if tracer instance provided
-    if tracer_instance is not None:
-        # Check if tracer already has an environment detector
-        if not hasattr(tracer_instance, "_environment_detector"):
-            # Protected access required for multi-instance architecture
-            tracer_instance._environment_detector = EnvironmentDetector(tracer_instance)  # pylint: disable=protected-access
-
-        return dict(
-            tracer_instance._environment_detector.get_comprehensive_analysis()  # pylint: disable=protected-access
-        )
-
-    # For standalone usage (no tracer), create a temporary detector
-    detector = EnvironmentDetector(None)
-    return detector.get_comprehensive_analysis()
+    return get_environment_snapshot(tracer_instance)
 
 
 def clear_environment_cache(tracer_instance: Optional[Any] = None) -> None:
-    """Clear environment detection cache for a specific tracer instance.
+    """Clear environment detection caches to force re-detection.
 
     Args:
-        tracer_instance: Tracer instance whose cache should be cleared.
-                        If None, this is a no-op for standalone usage.
+        tracer_instance: Tracer instance whose own detector cache (if any)
+            should also be cleared
     """
+    reset_environment_snapshot()
     if tracer_instance is not None and hasattr(
         tracer_instance, "_environment_detector"
     ):
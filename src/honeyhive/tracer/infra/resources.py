@@ -5,14 +5,14 @@ import sys
 from typing import Any, Dict, Optional
 
 from ...utils.logger import safe_log
-from .environment import EnvironmentDetector
+from .environment import get_environment_snapshot
 
 
 def build_otel_resources(tracer_instance: Optional[Any] = None) -> Dict[str, Any]:
     """Build comprehensive OpenTelemetry resource attributes.
 
-    This function uses the EnvironmentDetector to create a complete set of
-    OpenTelemetry-compliant resource attributes.
+    This function uses the process-wide environment snapshot to create a
+    complete set of OpenTelemetry-compliant resource attributes.
 
     Args:
         tracer_instance: Optional tracer instance for logging and context
@@ -23,8 +23,8 @@ def build_otel_resources(tracer_instance: Optional[Any] = None) -> Dict[str, Any
     resources = {}
 
     try:
-        # Use the comprehensive environment detector
-        detector = EnvironmentDetector(tracer_instance)
+        # Shared environment detection (computed once per process)
+        snapshot = get_environment_snapshot(tracer_instance)
 
         # Process information (always available)
         resources.update(
@@ -46,16 +46,16 @@ def build_otel_resources(tracer_instance: Optional[Any] = None) -> Dict[str, Any
             }
         )
 
-        # System information from environment detector
-        system_info = detector.detect_system_info()
+        # System information from the environment snapshot
+        system_info = snapshot["system_info"]
         resources.update(system_info)
 
         # Container information
-        container_info = detector.detect_container_environment()
+        container_info = snapshot["container_info"]
         resources.update(container_info)
 
         # Cloud provider information
-        cloud_info = detector.detect_cloud_environment()
+        cloud_info = snapshot["cloud_info"]
         resources.update(cloud_info)
 
         if tracer_instance:
@@ -66,6 +66,10 @@ from ...models.tracing import TracingParams
 from ...utils.logger import safe_log
 from .. import registry
 from ..processing.context import _add_experiment_attributes
+from ..processing.structured_attributes import (
+    set_structured_attribute,
+    uses_structured_attributes,
+)
 from ..utils import convert_enum_to_string
 from .enrichment import enrich_span_unified as otel_enrich_span
 from .span_utils import _set_span_attributes
@@ -99,12 +103,15 @@ COMPLEX_ATTRIBUTES = {
 }
 
 
-def _set_params_attributes(span: Any, params: TracingParams) -> None:
+def _set_params_attributes(
+    span: Any, params: TracingParams, structured: bool = False
+) -> None:
     """Dynamically set all TracingParams attributes using reflection.
 
     Args:
         span: OpenTelemetry span object to set attributes on
         params: TracingParams object containing attributes to set
+        structured: Store dict/list values as structured attributes
     """
     if span is None:
         return
@@ -125,7 +132,7 @@ def _set_params_attributes(span: Any, params: TracingParams) -> None:
     for param_name, span_attr in COMPLEX_ATTRIBUTES.items():
         value = getattr(params, param_name, None)
         if value is not None:
-            _set_span_attributes(span, span_attr, value)
+            _set_span_attributes(span, span_attr, value, structured=structured)
 
 
 def _set_experiment_attributes(span: Any) -> None:
@@ -152,11 +159,14 @@ def _set_experiment_attributes(span: Any) -> None:
         pass
 
 
-def _set_kwargs_attributes(span: Any, **kwargs: Any) -> None:
+def _set_kwargs_attributes(
+    span: Any, *, structured: bool = False, **kwargs: Any
+) -> None:
     """Dynamically process kwargs, excluding reserved keywords.
 
     Args:
         span: OpenTelemetry span object to set attributes on
+        structured: Store dict/list values as structured attributes
         **kwargs: Keyword arguments to process as span attributes
     """
     if span is None:
@@ -168,13 +178,19 @@ def _set_kwargs_attributes(span: Any, **kwargs: Any) -> None:
     for key, value in kwargs.items():
         if key not in reserved_keys and value is not None:
             try:
-                _set_span_attributes(span, f"honeyhive_{key}", value)
+                _set_span_attributes(
+                    span, f"honeyhive_{key}", value, structured=structured
+                )
             except Exception:
                 pass
 
 
 def _capture_function_inputs(
-    span: Any, func: Callable, args: tuple, kwargs: Dict[str, Any]
+    span: Any,
+    func: Callable,
+    args: tuple,
+    kwargs: Dict[str, Any],
+    structured: bool = False,
 ) -> None:
     """Capture function arguments as honeyhive_inputs.* attributes.
 
@@ -211,11 +227,13 @@ def _capture_function_inputs(
                 if isinstance(param_value, (str, int, float, bool, type(None))):
                     # Simple types: set directly
                     span.set_attribute(f"honeyhive_inputs.{param_name}", param_value)
+                elif isinstance(param_value, (dict, list)) and structured:
+                    # Exported as OTLP kvlistValue/arrayValue
+                    set_structured_attribute(
+                        span, f"honeyhive_inputs.{param_name}", param_value
+                    )
                 elif isinstance(param_value, (dict, list)):
                     # Complex types: JSON serialize
-                    # TODO: support threading through JSON structures here so we
-                    # can serialize to OTLP kvlist_value:
-                    # https://opentelemetry.io/docs/specs/otel/common/attribute-type-mapping/#associative-arrays-with-unique-keys
                     serialized = json.dumps(param_value)
                     span.set_attribute(f"honeyhive_inputs.{param_name}", serialized)
                 else:
@@ -326,6 +344,8 @@ def _execute_with_tracing_sync(
 
     # Start timing for duration calculation
     start_time = time.time()
+    # Dict/list values become single kvlist attributes in structured mode
+    structured = uses_structured_attributes(tracer)
 
     try:
         with tracer.start_span(
@@ -333,12 +353,12 @@ def _execute_with_tracing_sync(
         ) as span:
             if span is not None:
                 # Use dynamic attribute management
-                _set_params_attributes(span, params)
+                _set_params_attributes(span, params, structured)
                 _set_experiment_attributes(span)
-                _set_kwargs_attributes(span, **decorator_kwargs)
+                _set_kwargs_attributes(span, structured=structured, **decorator_kwargs)
 
                 # ✅ TASK 4: Auto-capture function inputs
-                _capture_function_inputs(span, func, args, func_kwargs)
+                _capture_function_inputs(span, func, args, func_kwargs, structured)
 
                 # Set up baggage context for multi-instance tracer isolation
                 _setup_decorator_baggage_context(tracer, span)
@@ -403,10 +423,20 @@ def _execute_with_tracing_sync(
             if span is not None:
                 try:
                     if params.outputs:
-                        _set_span_attributes(span, "honeyhive_outputs", params.outputs)
+                        _set_span_attributes(
+                            span,
+                            "honeyhive_outputs",
+                            params.outputs,
+                            structured=structured,
+                        )
                     else:
                         # Use function result as output
-                        _set_span_attributes(span, "honeyhive_outputs.result", result)
+                        _set_span_attributes(
+                            span,
+                            "honeyhive_outputs.result",
+                            result,
+                            structured=structured,
+                        )
                 except Exception:
                     pass
 
@@ -482,6 +512,8 @@ async def _execute_with_tracing(
 
     # Start timing for duration calculation
     start_time = time.time()
+    # Dict/list values become single kvlist attributes in structured mode
+    structured = uses_structured_attributes(tracer)
 
     try:
         with tracer.start_span(
@@ -489,12 +521,12 @@ async def _execute_with_tracing(
         ) as span:
             if span is not None:
                 # Use dynamic attribute management
-                _set_params_attributes(span, params)
+                _set_params_attributes(span, params, structured)
                 _set_experiment_attributes(span)
-                _set_kwargs_attributes(span, **decorator_kwargs)
+                _set_kwargs_attributes(span, structured=structured, **decorator_kwargs)
 
                 # ✅ TASK 4: Auto-capture function inputs
-                _capture_function_inputs(span, func, args, func_kwargs)
+                _capture_function_inputs(span, func, args, func_kwargs, structured)
 
                 # Set up baggage context for multi-instance tracer isolation
                 _setup_decorator_baggage_context(tracer, span)
@@ -551,10 +583,20 @@ async def _execute_with_tracing(
             if span is not None:
                 try:
                     if params.outputs:
-                        _set_span_attributes(span, "honeyhive_outputs", params.outputs)
+                        _set_span_attributes(
+                            span,
+                            "honeyhive_outputs",
+                            params.outputs,
+                            structured=structured,
+                        )
                     else:
                         # Use function result as output
-                        _set_span_attributes(span, "honeyhive_outputs.result", result)
+                        _set_span_attributes(
+                            span,
+                            "honeyhive_outputs.result",
+                            result,
+                            structured=structured,
+                        )
                 except Exception:
                     pass
 
@@ -14,6 +14,7 @@ while adding new functionality. All main branch usage patterns are supported.
 # for parameter normalization and enrichment logic
 
 # Standard library imports
+import functools
 from contextlib import _GeneratorContextManager, contextmanager
 from typing import Any, Dict, Iterator, Optional, Union
 
@@ -22,6 +23,7 @@ from opentelemetry import context, trace
 
 from ...models import UpdateEventRequest
 from ...utils.logger import safe_log
+from ..processing.structured_attributes import uses_structured_attributes
 from ..registry import discover_tracer
 
 # Local imports
@@ -339,19 +341,23 @@ def enrich_span_core(  # pylint: disable=too-many-locals,too-many-statements
             return {"success": False, "span": NoOpSpan(), "error": "No active span"}
 
         attribute_count: int = 0
+        # Structured encoding stores dicts/lists as single kvlist attributes
+        set_attributes = _set_span_attributes
+        if uses_structured_attributes(tracer_instance):
+            set_attributes = functools.partial(_set_span_attributes, structured=True)
 
         # STEP 1: Apply reserved namespaces first (highest priority)
         # These use _set_span_attributes for recursive dict/list handling
         if metadata:
-            _set_span_attributes(current_span, "honeyhive_metadata", metadata)
+            set_attributes(current_span, "honeyhive_metadata", metadata)
             attribute_count += len(metadata)
 
         if metrics:
-            _set_span_attributes(current_span, "honeyhive_metrics", metrics)
+            set_attributes(current_span, "honeyhive_metrics", metrics)
             attribute_count += len(metrics)
 
         if feedback:
-            _set_span_attributes(current_span, "honeyhive_feedback", feedback)
+            set_attributes(current_span, "honeyhive_feedback", feedback)
             attribute_count += len(feedback)
 
         if inputs:
@@ -369,7 +375,7 @@ def enrich_span_core(  # pylint: disable=too-many-locals,too-many-statements
                     ),
                 },
             )
-            _set_span_attributes(current_span, "honeyhive_inputs", inputs)
+            set_attributes(current_span, "honeyhive_inputs", inputs)
             attribute_count += len(inputs)
             # Verify attributes were set
             if verbose and hasattr(current_span, "attributes"):
@@ -387,22 +393,20 @@ def enrich_span_core(  # pylint: disable=too-many-locals,too-many-statements
                 )
 
         if outputs:
-            _set_span_attributes(current_span, "honeyhive_outputs", outputs)
+            set_attributes(current_span, "honeyhive_outputs", outputs)
             attribute_count += len(outputs)
 
         if config:
-            _set_span_attributes(current_span, "honeyhive_config", config)
+            set_attributes(current_span, "honeyhive_config", config)
             attribute_count += len(config)
 
         if user_properties:
-            _set_span_attributes(
-                current_span, "honeyhive_user_properties", user_properties
-            )
+            set_attributes(current_span, "honeyhive_user_properties", user_properties)
             attribute_count += len(user_properties)
 
         # STEP 2: Apply simple attributes dict → metadata (overwrites conflicts)
         if attributes:
-            _set_span_attributes(current_span, "honeyhive_metadata", attributes)
+            set_attributes(current_span, "honeyhive_metadata", attributes)
             attribute_count += len(attributes)
 
         # STEP 3: Apply arbitrary kwargs → metadata (lowest priority, wins conflicts)
@@ -428,15 +432,13 @@ def enrich_span_core(  # pylint: disable=too-many-locals,too-many-statements
         if not metrics and "metrics" in kwargs:
             metrics_from_kwargs = kwargs.pop("metrics")
             if metrics_from_kwargs:
-                _set_span_attributes(
-                    current_span, "honeyhive_metrics", metrics_from_kwargs
-                )
+                set_attributes(current_span, "honeyhive_metrics", metrics_from_kwargs)
                 attribute_count += len(metrics_from_kwargs)
 
         if not user_properties and "user_properties" in kwargs:
             user_properties_from_kwargs = kwargs.pop("user_properties")
             if user_properties_from_kwargs:
-                _set_span_attributes(
+                set_attributes(
                     current_span,
                     "honeyhive_user_properties",
                     user_properties_from_kwargs,
@@ -446,38 +448,30 @@ def enrich_span_core(  # pylint: disable=too-many-locals,too-many-statements
         if not feedback and "feedback" in kwargs:
             feedback_from_kwargs = kwargs.pop("feedback")
             if feedback_from_kwargs:
-                _set_span_attributes(
-                    current_span, "honeyhive_feedback", feedback_from_kwargs
-                )
+                set_attributes(current_span, "honeyhive_feedback", feedback_from_kwargs)
                 attribute_count += len(feedback_from_kwargs)
 
         if not inputs and "inputs" in kwargs:
             inputs_from_kwargs = kwargs.pop("inputs")
             if inputs_from_kwargs:
-                _set_span_attributes(
-                    current_span, "honeyhive_inputs", inputs_from_kwargs
-                )
+                set_attributes(current_span, "honeyhive_inputs", inputs_from_kwargs)
                 attribute_count += len(inputs_from_kwargs)
 
         if not outputs and "outputs" in kwargs:
             outputs_from_kwargs = kwargs.pop("outputs")
             if outputs_from_kwargs:
-                _set_span_attributes(
-                    current_span, "honeyhive_outputs", outputs_from_kwargs
-                )
+                set_attributes(current_span, "honeyhive_outputs", outputs_from_kwargs)
                 attribute_count += len(outputs_from_kwargs)
 
         if not config and "config" in kwargs:
             config_from_kwargs = kwargs.pop("config")
             if config_from_kwargs:
-                _set_span_attributes(
-                    current_span, "honeyhive_config", config_from_kwargs
-                )
+                set_attributes(current_span, "honeyhive_config", config_from_kwargs)
                 attribute_count += len(config_from_kwargs)
 
         kwargs_filtered = {k: v for k, v in kwargs.items() if k not in reserved_params}
         if kwargs_filtered:
-            _set_span_attributes(current_span, "honeyhive_metadata", kwargs_filtered)
+            set_attributes(current_span, "honeyhive_metadata", kwargs_filtered)
             attribute_count += len(kwargs_filtered)
 
         # Handle special non-namespaced attributes
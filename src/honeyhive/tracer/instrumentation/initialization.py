@@ -10,7 +10,9 @@ It implements the multi-instance architecture with proper provider integration.
 
 import inspect
 import os
+import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
@@ -29,7 +31,11 @@ from ..integration.detection import (
     atomic_provider_detection_and_setup,
     set_global_provider,
 )
+from ..lifecycle.serverless import DEFAULT_SERVERLESS_SPOOL_DIR, is_serverless_mode
+from ..processing.batch_processor import get_batch_settings
 from ..processing.context import setup_baggage_context
+from ..processing.export_hub import acquire_channel
+from ..processing.otlp_async_exporter import DEFAULT_MAX_IN_FLIGHT, AsyncOTLPExporter
 from ..processing.otlp_exporter import HoneyHiveOTLPExporter
 from ..processing.otlp_profiles import get_environment_optimized_config
 from ..processing.otlp_session import (
@@ -37,7 +43,16 @@ from ..processing.otlp_session import (
     create_dynamic_otlp_config,
     get_default_otlp_config,
 )
+from ..processing.otlp_spool import (
+    DEFAULT_SPOOL_MAX_AGE_SECONDS,
+    DEFAULT_SPOOL_MAX_BYTES,
+)
+from ..processing.pipeline_status import (
+    DEFAULT_STATUS_INTERVAL,
+    start_status_publisher,
+)
 from ..processing.span_processor import HoneyHiveSpanProcessor
+from ..utils import get_otlp_setting
 
 if TYPE_CHECKING:
     from ..core import HoneyHiveTracer
@@ -47,6 +62,13 @@ if TYPE_CHECKING:
 # Protected access needed for tracer initialization and state management
 # too-many-lines disabled due to extensive informative docstrings
 
+# Background session creation (async_session_creation)
+SESSION_START_WORKERS = 4
+SESSION_START_WAIT_SECONDS = 5.0
+
+_SESSION_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_SESSION_EXECUTOR_LOCK = threading.Lock()
+
 
 def _get_sdk_version() -> str:
     """Get the SDK version string for use in headers."""
@@ -190,6 +212,9 @@ def initialize_tracer_instance(tracer_instance: "HoneyHiveTracerBase") -> None:
     # Step 4: Register tracer for auto-discovery (assigns _tracer_id)
     _register_tracer_instance(tracer_instance)
 
+    # Publish pipeline status for `honeyhive monitor` in other processes
+    _start_pipeline_status(tracer_instance)
+
     # Step 5: Setup baggage context (after registration so _tracer_id is available)
     _setup_baggage_context(tracer_instance)
 
@@ -287,8 +312,8 @@ def _initialize_otel_components(tracer_instance: Any) -> None:
     tracer_instance._max_span_size = max_span_size
 
     # Create SpanLimits to pass to provider creation
-    # Note: max_span_size is NOT in SpanLimits - it's enforced separately
-    # in span processor
+    # Note: max_span_size is NOT in SpanLimits - HoneyHiveSpanProcessor
+    # enforces it in on_end (see processing/span_size.py)
     span_limits = SpanLimits(
         max_attributes=max_attributes,
         max_events=max_events,
@@ -827,22 +852,96 @@ def _create_otlp_exporter(tracer_instance: Any) -> Optional[Any]:
             {"session": custom_session} if custom_session is not None else {}
         )
 
-        otlp_exporter = HoneyHiveOTLPExporter(
-            tracer_instance=tracer_instance,
-            session_config=session_config,
-            use_optimized_session=True,
-            protocol=otlp_protocol,  # Use configured protocol (defaults to http/json)
-            endpoint=otlp_endpoint,
-            headers={
+        export_kwargs: Dict[str, Any] = {
+            "tracer_instance": tracer_instance,
+            "session_config": session_config,
+            "protocol": otlp_protocol,  # Use configured protocol (defaults to http/json)
+            "endpoint": otlp_endpoint,
+            "headers": {
                 "Authorization": f"Bearer {tracer_instance.config.api_key}",
                 "X-Source": tracer_instance.source_environment,
                 "hh-client-version": _get_sdk_version(),
                 "hh-client-language": "python",
                 "hh-client-package": "honeyhive",
             },
-            timeout=30.0,  # 30 second timeout for exports
-            **session_kwargs,
-        )
+            "timeout": 30.0,  # 30 second timeout for exports
+            "compression": get_otlp_setting(
+                tracer_instance, "otlp_compression", "gzip"
+            ),
+            "compression_min_bytes": get_otlp_setting(
+                tracer_instance, "otlp_compression_min_bytes", 1024
+            ),
+            # Serverless mode keeps leftovers on local disk for the next
+            # invocation unless a spool directory is configured
+            "spool_dir": get_otlp_setting(tracer_instance, "otlp_spool_dir", None)
+            or (
+                DEFAULT_SERVERLESS_SPOOL_DIR
+                if is_serverless_mode(tracer_instance)
+                else None
+            ),
+            "spool_max_bytes": get_otlp_setting(
+                tracer_instance, "otlp_spool_max_bytes", DEFAULT_SPOOL_MAX_BYTES
+            ),
+            "spool_max_age_seconds": get_otlp_setting(
+                tracer_instance, "otlp_spool_max_age", DEFAULT_SPOOL_MAX_AGE_SECONDS
+            ),
+            "attribute_aliases": get_otlp_setting(
+                tracer_instance, "otlp_attribute_aliases", "span"
+            ),
+        }
+
+        otlp_exporter: Any
+        if get_otlp_setting(tracer_instance, "otlp_async_export", False):
+            # asyncio/httpx exporter on its own event loop; a requests
+            # session does not apply
+            otlp_exporter = AsyncOTLPExporter(
+                http2=get_otlp_setting(tracer_instance, "otlp_http2", True),
+                max_in_flight=get_otlp_setting(
+                    tracer_instance, "otlp_max_in_flight", DEFAULT_MAX_IN_FLIGHT
+                ),
+                **export_kwargs,
+            )
+        else:
+            export_kwargs.update(
+                retry_max_attempts=get_otlp_setting(
+                    tracer_instance, "otlp_retry_max_attempts", 5
+                ),
+                retry_base_delay=get_otlp_setting(
+                    tracer_instance, "otlp_retry_base_delay", 0.1
+                ),
+                retry_max_delay=get_otlp_setting(
+                    tracer_instance, "otlp_retry_max_delay", 5.0
+                ),
+                retry_deadline=get_otlp_setting(
+                    tracer_instance, "export_timeout", 30.0
+                ),
+                retry_budget_ratio=get_otlp_setting(
+                    tracer_instance, "otlp_retry_budget_ratio", 0.1
+                ),
+                circuit_failure_threshold=get_otlp_setting(
+                    tracer_instance, "otlp_circuit_failure_threshold", 5
+                ),
+                circuit_reset_timeout=get_otlp_setting(
+                    tracer_instance, "otlp_circuit_reset_timeout", 30.0
+                ),
+                circuit_open_policy=get_otlp_setting(
+                    tracer_instance, "otlp_circuit_open_policy", "spool"
+                ),
+            )
+            if custom_session is None and get_otlp_setting(
+                tracer_instance, "otlp_shared_export", False
+            ):
+                # One queue, worker pool and connection pool per destination
+                # for all tracers of the process
+                otlp_exporter = acquire_channel(
+                    export_kwargs,
+                    get_batch_settings(tracer_instance),
+                    tracer_instance=tracer_instance,
+                )
+            else:
+                otlp_exporter = HoneyHiveOTLPExporter(
+                    use_optimized_session=True, **export_kwargs, **session_kwargs
+                )
 
         safe_log(tracer_instance, "info", "OTLP exporter created successfully")
         return otlp_exporter
@@ -1371,6 +1470,10 @@ def _create_new_session(tracer_instance: Any) -> None:
             "inputs": tracer_instance.config.session.inputs,
             "metadata": session_metadata if session_metadata else None,
         }
+        if tracer_instance.config.get("async_session_creation", False):
+            _start_session_in_background(tracer_instance, session_params)
+            return
+
         session_response = tracer_instance.client.sessions.start(data=session_params)
 
         # Response can be a Pydantic model or dict with 'session_id' attribute/key
@@ -1453,6 +1556,135 @@ def _create_new_session(tracer_instance: Any) -> None:
         )
 
 
+def _get_session_executor() -> ThreadPoolExecutor:
+    """Get the worker pool shared by background session creation."""
+    global _SESSION_EXECUTOR  # pylint: disable=global-statement
+    with _SESSION_EXECUTOR_LOCK:
+        if _SESSION_EXECUTOR is None:
+            _SESSION_EXECUTOR = ThreadPoolExecutor(
+                max_workers=SESSION_START_WORKERS,
+                thread_name_prefix="honeyhive-session-start",
+            )
+        return _SESSION_EXECUTOR
+
+
+def _start_session_in_background(
+    tracer_instance: Any, session_params: Dict[str, Any]
+) -> None:
+    """Assign a client-side session_id and create the session asynchronously.
+
+    The tracer can emit spans immediately. Until the backend confirms the
+    session, spans carry ``honeyhive.session_auto_create`` so ingestion
+    creates the session row if the start call is slow or fails.
+
+    :param tracer_instance: The tracer instance to create the session for
+    :type tracer_instance: HoneyHiveTracer
+    :param session_params: ``sessions.start`` request data
+    :type session_params: Dict[str, Any]
+    """
+    session_id = (session_params.get("session_id") or str(uuid.uuid4())).lower()
+    session_params = dict(session_params, session_id=session_id)
+    tracer_instance.session_id = session_id
+    tracer_instance._session_id = session_id
+    tracer_instance._session_auto_create = True
+
+    tracer_instance._session_start_future = _get_session_executor().submit(
+        _run_background_session_start, tracer_instance, session_params
+    )
+    safe_log(
+        tracer_instance,
+        "debug",
+        "Deferred session creation to background worker",
+        honeyhive_data={
+            "session_id": session_id,
+            "session_name": session_params.get("session_name"),
+        },
+    )
+
+
+def _run_background_session_start(
+    tracer_instance: Any, session_params: Dict[str, Any]
+) -> bool:
+    """Create a deferred session in the backend (runs on the worker pool).
+
+    :param tracer_instance: The tracer the session belongs to
+    :type tracer_instance: HoneyHiveTracer
+    :param session_params: ``sessions.start`` request data with the session_id
+        already assigned to the tracer
+    :type session_params: Dict[str, Any]
+    :return: True if the backend created the session with that session_id
+    :rtype: bool
+    """
+    session_id = session_params["session_id"]
+    try:
+        session_response = tracer_instance.client.sessions.start(data=session_params)
+        response_session_id = getattr(session_response, "session_id", None)
+        if response_session_id is None and isinstance(session_response, dict):
+            response_session_id = session_response.get("session_id")
+
+        if response_session_id and str(response_session_id).lower() == session_id:
+            # The session row exists: spans no longer need the auto-create flag
+            tracer_instance._session_auto_create = False
+            safe_log(
+                tracer_instance,
+                "info",
+                "Created new session",
+                honeyhive_data={
+                    "session_id": session_id,
+                    "session_name": session_params.get("session_name"),
+                    "background": True,
+                },
+            )
+            return True
+
+        safe_log(
+            tracer_instance,
+            "warning",
+            "Background session creation returned no matching session_id; "
+            "spans will create the session on ingestion",
+            honeyhive_data={
+                "session_id": session_id,
+                "response_session_id": response_session_id,
+            },
+        )
+    except Exception as e:
+        # Graceful degradation - spans keep the auto-create flag
+        safe_log(
+            tracer_instance,
+            "warning",
+            f"Background session creation failed ({e}); "
+            "spans will create the session on ingestion",
+            honeyhive_data={
+                "session_id": session_id,
+                "error_type": type(e).__name__,
+                "operation": "background_session_creation",
+            },
+        )
+    return False
+
+
+def wait_for_session_start(
+    tracer_instance: Any, timeout: Optional[float] = SESSION_START_WAIT_SECONDS
+) -> Optional[bool]:
+    """Wait for a tracer's background session creation to finish.
+
+    :param tracer_instance: The tracer instance
+    :type tracer_instance: HoneyHiveTracer
+    :param timeout: Maximum seconds to wait (None waits indefinitely)
+    :type timeout: Optional[float]
+    :return: True if the session was created, False if creation failed or is
+        still running at the timeout, None if creation was not deferred
+    :rtype: Optional[bool]
+    """
+    future = getattr(tracer_instance, "_session_start_future", None)
+    if not isinstance(future, Future):
+        return None
+    try:
+        return bool(future.result(timeout=timeout))
+    except Exception:
+        return False
+
+
 def _setup_baggage_context(tracer_instance: Any) -> None:
     """Setup baggage context for the tracer instance.
 
@@ -1462,6 +1694,36 @@ def _setup_baggage_context(tracer_instance: Any) -> None:
     setup_baggage_context(tracer_instance)
 
 
+def _start_pipeline_status(tracer_instance: Any) -> None:
+    """Start publishing this process's export pipeline status.
+
+    One publisher per process reports all registered tracers, configured by
+    the first tracer with an exporter (``otlp_status_dir`` and
+    ``otlp_status_interval``).
+
+    :param tracer_instance: The tracer instance
+    :type tracer_instance: HoneyHiveTracer
+    """
+    if getattr(tracer_instance, "otlp_exporter", None) is None:
+        return
+    try:
+        start_status_publisher(
+            directory=get_otlp_setting(tracer_instance, "otlp_status_dir", None),
+            interval=get_otlp_setting(
+                tracer_instance, "otlp_status_interval", DEFAULT_STATUS_INTERVAL
+            ),
+            tracer_instance=tracer_instance,
+        )
+    except Exception as e:
+        # Graceful degradation - never crash host
+        safe_log(
+            tracer_instance,
+            "debug",
+            f"Failed to start pipeline status publisher: {e}",
+            honeyhive_data={"error_type": type(e).__name__},
+        )
+
+
 def _register_tracer_instance(tracer_instance: Any) -> None:
     """Register tracer instance for auto-discovery.
 
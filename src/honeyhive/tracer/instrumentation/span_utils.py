@@ -8,8 +8,12 @@ decorators and enrichment modules to avoid circular dependencies.
 import json
 from typing import Any
 
+from ..processing.structured_attributes import set_structured_attribute
 
-def _set_span_attributes(span: Any, prefix: str, value: Any) -> None:
+
+def _set_span_attributes(
+    span: Any, prefix: str, value: Any, structured: bool = False
+) -> None:
     """Set span attributes with proper type handling and JSON serialization.
 
     Recursively sets span attributes for complex data structures, handling
@@ -19,12 +23,20 @@ def _set_span_attributes(span: Any, prefix: str, value: Any) -> None:
         span: OpenTelemetry span object
         prefix: Attribute name prefix
         value: Value to set as attribute
+        structured: Store dicts and lists as one structured attribute
+            (exported as kvlistValue/arrayValue) instead of flattening them
     """
     # Defense in depth: Skip None values entirely to prevent "null" strings
     if value is None:
         return
 
-    if isinstance(value, dict):
+    if structured and isinstance(value, (dict, list)):
+        try:
+            set_structured_attribute(span, prefix, value)
+        except Exception:
+            # Silently handle any exceptions when setting span attributes
+            pass
+    elif isinstance(value, dict):
         # Filter out None values from dict before recursing (defense in depth)
         for k, v in value.items():
             if v is not None:  # Skip None values
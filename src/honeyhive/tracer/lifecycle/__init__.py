@@ -18,13 +18,18 @@ from .core import (
     register_tracer_for_atexit_cleanup,
     unregister_tracer_from_atexit_cleanup,
 )
-from .flush import force_flush_tracer
+from .flush import flush_tracer_components, force_flush_tracer
+from .serverless import flush_at_handler_end, is_serverless_mode, serverless_handler
 from .shutdown import graceful_shutdown_all, shutdown_tracer, wait_for_pending_spans
 
 # Maintain the original __all__ exports for backward compatibility
 __all__ = [
     "shutdown_tracer",
     "force_flush_tracer",
+    "flush_tracer_components",
+    "flush_at_handler_end",
+    "serverless_handler",
+    "is_serverless_mode",
     "graceful_shutdown_all",
     "register_tracer_for_atexit_cleanup",
     "unregister_tracer_from_atexit_cleanup",
@@ -1,8 +1,9 @@
 """Force flush operations for tracer lifecycle management.
 
 This module handles all force flush operations including tracer providers,
-span processors, and batch processors with comprehensive error handling
-and timeout management.
+span processors, and batch processors with comprehensive error handling.
+Each distinct processor is flushed once, concurrently with the others, and
+the whole flush shares a single deadline.
 """
 
 # pylint: disable=cyclic-import
@@ -12,7 +13,9 @@ and timeout management.
 # The cycle ensures that flush operations can be properly coordinated with
 # shutdown while maintaining modular separation of flush-specific logic.
 
-from typing import Any, List, Tuple
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from ...utils.logger import safe_log
 from .core import acquire_lifecycle_lock_optimized
@@ -51,28 +54,55 @@ def force_flush_tracer(tracer_instance: Any, timeout_millis: float = 30000) -> b
 
     **Note:**
 
-    This function attempts to flush multiple components in sequence:
-    the tracer provider, custom span processors, and batch processors.
-    It returns True only if all components flush successfully.
+    ``timeout_millis`` is one budget for the whole flush, not a timeout per
+    component. See :func:`flush_tracer_components` for the components that
+    are flushed and for per-component results.
     """
-    safe_log(tracer_instance, "debug", "Force flush requested")
+    return bool(flush_tracer_components(tracer_instance, timeout_millis)["success"])
 
-    flush_results: List[Tuple[str, bool]] = []
 
-    safe_log(
-        tracer_instance,
-        "debug",
-        f"force_flush_tracer: Acquiring _lifecycle_lock (timeout: {timeout_millis}ms)",
-    )
+def flush_tracer_components(
+    tracer_instance: Any, timeout_millis: float = 30000
+) -> Dict[str, Any]:
+    """Flush every distinct flushable component of a tracer within one deadline.
+
+    The components are the tracer's span processor and the span processors
+    registered on its provider, deduplicated by identity (the HoneyHive span
+    processor is usually registered on the provider too). A provider whose
+    processors cannot be listed is flushed as a whole instead. Components are
+    flushed concurrently, each with the time left until the deadline, so the
+    worst-case wait is ``timeout_millis`` rather than a multiple of it. A
+    component that returns after the deadline, or is still flushing at the
+    deadline, is reported as timed out.
+
+    :param tracer_instance: The tracer instance to flush
+    :type tracer_instance: HoneyHiveTracer
+    :param timeout_millis: Overall time budget in milliseconds, including the
+        wait for the lifecycle lock
+    :type timeout_millis: float
+    :return: ``success``, ``elapsed_ms`` and ``components``, a mapping of
+        component name to its ``success``, ``timed_out``, ``elapsed_ms`` and
+        ``error``
+    :rtype: Dict[str, Any]
+
+    **Example:**
+
+    .. code-block:: python
+
+        report = flush_tracer_components(tracer, timeout_millis=5000)
+        slow = [
+            name
+            for name, result in report["components"].items()
+            if result["timed_out"]
+        ]
+    """
+    safe_log(tracer_instance, "debug", "Force flush requested")
+    started = time.monotonic()
+    flush_timeout_seconds = timeout_millis / 1000.0
+    deadline = started + flush_timeout_seconds
+    report: Dict[str, Any] = {"success": False, "elapsed_ms": 0.0, "components": {}}
 
     try:
-        safe_log(
-            tracer_instance,
-            "debug",
-            "force_flush_tracer: Attempting to acquire _lifecycle_lock...",
-        )
-        # Use environment-optimized flush timeout
-        flush_timeout_seconds = timeout_millis / 1000.0
         with acquire_lifecycle_lock_optimized(
             "flush", custom_timeout=flush_timeout_seconds
         ) as acquired:
@@ -82,27 +112,22 @@ def force_flush_tracer(tracer_instance: Any, timeout_millis: float = 30000) -> b
                     "warning",
                     f"Failed to acquire _lifecycle_lock ({flush_timeout_seconds}s)",
                 )
-                return False
-            safe_log(
-                tracer_instance,
-                "debug",
-                "force_flush_tracer: Successfully acquired _lifecycle_lock",
-            )
-            # 1. Flush the tracer provider if available and supports it
-            _flush_tracer_provider(tracer_instance, timeout_millis, flush_results)
+                return report
 
-            # 2. Flush our custom span processor if available
-            _flush_span_processor(tracer_instance, timeout_millis, flush_results)
-
-            # 3. Flush any batch span processors attached to the provider
-            _flush_batch_processors(tracer_instance, timeout_millis, flush_results)
+            targets = _get_flush_targets(tracer_instance)
+            report["components"] = _flush_concurrently(
+                tracer_instance, targets, deadline
+            )
 
-        # Calculate overall result
-        overall_success = all(result for _, result in flush_results)
+        flush_results: List[Tuple[str, bool]] = [
+            (name, result["success"]) for name, result in report["components"].items()
+        ]
+        report["success"] = all(result for _, result in flush_results)
+        report["elapsed_ms"] = round((time.monotonic() - started) * 1000, 3)
 
-        _log_flush_results(tracer_instance, overall_success, flush_results)
+        _log_flush_results(tracer_instance, report["success"], flush_results)
 
-        return overall_success
+        return report
 
     except Exception as e:
         # Graceful degradation - never crash host
@@ -116,196 +141,173 @@ def force_flush_tracer(tracer_instance: Any, timeout_millis: float = 30000) -> b
                 "operation": "force_flush_tracer",
             },
         )
-        return False
+        report["success"] = False
+        return report
 
 
-def _flush_tracer_provider(
-    tracer_instance: Any, timeout_millis: float, flush_results: List[Tuple[str, bool]]
-) -> None:
-    """Flush the tracer provider component.
+def _get_provider_processors(provider: Any) -> Optional[List[Any]]:
+    """List the span processors registered on a provider.
+
+    :param provider: Tracer provider
+    :type provider: Any
+    :return: The processors, or None if the provider does not expose them
+    :rtype: Optional[List[Any]]
+    """
+    active = getattr(provider, "_active_span_processor", None)
+    processors = getattr(active, "_span_processors", None)
+    if not isinstance(processors, (list, tuple)):
+        processors = getattr(provider, "_span_processors", None)
+    if isinstance(processors, (list, tuple)):
+        return list(processors)
+    return None
+
+
+def _get_flush_targets(tracer_instance: Any) -> List[Tuple[str, Any]]:
+    """Get the distinct flushable components of a tracer.
 
     :param tracer_instance: The tracer instance
     :type tracer_instance: HoneyHiveTracer
-    :param timeout_millis: Timeout in milliseconds
-    :type timeout_millis: float
-    :param flush_results: List to append results to
-    :type flush_results: List[Tuple[str, bool]]
+    :return: (name, component) pairs, each component listed once
+    :rtype: List[Tuple[str, Any]]
     """
-    if tracer_instance.provider and hasattr(tracer_instance.provider, "force_flush"):
-        try:
-            provider_result = tracer_instance.provider.force_flush(
-                timeout_millis=int(timeout_millis)
-            )
-            flush_results.append(("provider", provider_result))
-            safe_log(
-                tracer_instance,
-                "debug",
-                "Provider force_flush completed",
-                honeyhive_data={
-                    "success": provider_result,
-                    "operation": "provider_flush",
-                },
-            )
-        except Exception as e:
-            flush_results.append(("provider", False))
-            # Graceful degradation - never crash host
-            safe_log(
-                tracer_instance,
-                "error",
-                "Provider force_flush error",
-                honeyhive_data={
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                    "operation": "provider_flush",
-                },
-            )
+    targets: List[Tuple[str, Any]] = []
+    seen = set()
+
+    def _add(name: str, component: Any) -> None:
+        if component is None or not hasattr(component, "force_flush"):
+            return
+        if id(component) in seen:
+            return
+        seen.add(id(component))
+        targets.append((name, component))
+
+    _add("span_processor", getattr(tracer_instance, "span_processor", None))
+
+    provider = getattr(tracer_instance, "provider", None)
+    processors = _get_provider_processors(provider)
+    if processors is None:
+        _add("provider", provider)
     else:
-        safe_log(
-            tracer_instance,
-            "debug",
-            "Provider does not support force_flush",
-            honeyhive_data={"operation": "provider_flush"},
-        )
-        flush_results.append(("provider", True))  # Consider successful if not supported
+        for index, processor in enumerate(processors, 1):
+            _add(f"processor_{index}", processor)
+    return targets
 
 
-def _flush_span_processor(
-    tracer_instance: Any, timeout_millis: float, flush_results: List[Tuple[str, bool]]
-) -> None:
-    """Flush the custom span processor component.
+def _flush_component(
+    tracer_instance: Any, name: str, component: Any, deadline: float
+) -> Dict[str, Any]:
+    """Flush one component with the time left until the deadline.
 
     :param tracer_instance: The tracer instance
     :type tracer_instance: HoneyHiveTracer
-    :param timeout_millis: Timeout in milliseconds
-    :type timeout_millis: float
-    :param flush_results: List to append results to
-    :type flush_results: List[Tuple[str, bool]]
+    :param name: Component name for results and logs
+    :type name: str
+    :param component: Object with a ``force_flush(timeout_millis=...)`` method
+    :type component: Any
+    :param deadline: ``time.monotonic()`` deadline
+    :type deadline: float
+    :return: ``success``, ``timed_out`` (the deadline had passed when the
+        component returned), ``elapsed_ms`` and ``error``
+    :rtype: Dict[str, Any]
     """
-    if tracer_instance.span_processor and hasattr(
-        tracer_instance.span_processor, "force_flush"
-    ):
-        try:
-            processor_result = tracer_instance.span_processor.force_flush(
-                timeout_millis=timeout_millis
-            )
-            flush_results.append(("span_processor", processor_result))
-            safe_log(
-                tracer_instance,
-                "debug",
-                "Span processor force_flush completed",
-                honeyhive_data={
-                    "success": processor_result,
-                    "operation": "span_processor_flush",
-                },
-            )
-        except Exception as e:
-            flush_results.append(("span_processor", False))
-            # Graceful degradation - never crash host
-            safe_log(
-                tracer_instance,
-                "error",
-                "Span processor force_flush error",
-                honeyhive_data={
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                    "operation": "span_processor_flush",
-                },
-            )
-    else:
-        flush_results.append(
-            ("span_processor", True)
-        )  # Consider successful if not available
-
-
-def _get_batch_processors(tracer_instance: Any) -> List[Any]:
-    """Extract batch processors from tracer provider."""
-    if not (
-        tracer_instance.provider
-        and hasattr(tracer_instance.provider, "_span_processors")
-    ):
-        return []
-
-    batch_processors = []
-    for processor in getattr(tracer_instance.provider, "_span_processors", []):
-        if hasattr(processor, "force_flush"):
-            batch_processors.append(processor)
-    return batch_processors
-
-
-def _flush_single_processor(
-    processor: Any, timeout_millis: float, processor_index: int, tracer_instance: Any
-) -> bool:
-    """Flush a single batch processor."""
+    started = time.monotonic()
+    result: Dict[str, Any] = {
+        "success": False,
+        "timed_out": False,
+        "elapsed_ms": None,
+        "error": None,
+    }
     try:
-        result = processor.force_flush(timeout_millis=int(timeout_millis))
-        safe_log(
-            tracer_instance,
-            "debug",
-            "Batch processor force_flush completed",
-            honeyhive_data={
-                "processor_index": processor_index,
-                "success": result,
-                "operation": "batch_processor_flush",
-            },
-        )
-        return bool(result)
+        remaining_millis = max(0, int((deadline - started) * 1000))
+        result["success"] = bool(component.force_flush(timeout_millis=remaining_millis))
     except Exception as e:
+        result["error"] = str(e)
         # Graceful degradation - never crash host
         safe_log(
             tracer_instance,
             "error",
-            "Batch processor force_flush error",
+            "Component force_flush error",
             honeyhive_data={
-                "processor_index": processor_index,
+                "component": name,
                 "error": str(e),
                 "error_type": type(e).__name__,
-                "operation": "batch_processor_flush",
+                "operation": "component_flush",
             },
         )
-        return False
+    finished = time.monotonic()
+    result["timed_out"] = finished >= deadline
+    result["elapsed_ms"] = round((finished - started) * 1000, 3)
+    safe_log(
+        tracer_instance,
+        "debug",
+        "Component force_flush completed",
+        honeyhive_data={
+            "component": name,
+            "success": result["success"],
+            "timed_out": result["timed_out"],
+            "elapsed_ms": result["elapsed_ms"],
+            "operation": "component_flush",
+        },
+    )
+    return result
 
 
-def _flush_batch_processors(
-    tracer_instance: Any, timeout_millis: float, flush_results: List[Tuple[str, bool]]
-) -> None:
-    """Flush any batch span processors attached to the provider.
+def _flush_concurrently(
+    tracer_instance: Any, targets: List[Tuple[str, Any]], deadline: float
+) -> Dict[str, Dict[str, Any]]:
+    """Flush components in parallel and collect their results at the deadline.
+
+    A single component is flushed on the calling thread. Otherwise each
+    component is flushed on a daemon thread; threads still running at the
+    deadline are left to finish in the background.
 
     :param tracer_instance: The tracer instance
     :type tracer_instance: HoneyHiveTracer
-    :param timeout_millis: Timeout in milliseconds
-    :type timeout_millis: float
-    :param flush_results: List to append results to
-    :type flush_results: List[Tuple[str, bool]]
+    :param targets: (name, component) pairs from :func:`_get_flush_targets`
+    :type targets: List[Tuple[str, Any]]
+    :param deadline: ``time.monotonic()`` deadline
+    :type deadline: float
+    :return: Result of each component, by name, in target order
+    :rtype: Dict[str, Dict[str, Any]]
     """
-    try:
-        batch_processors = _get_batch_processors(tracer_instance)
+    if len(targets) == 1:
+        name, component = targets[0]
+        return {name: _flush_component(tracer_instance, name, component, deadline)}
 
-        if not batch_processors:
-            flush_results.append(("batch_processors", True))
-            return
+    results: Dict[str, Dict[str, Any]] = {}
+    threads = []
+    for name, component in targets:
 
-        batch_results = []
-        for i, processor in enumerate(batch_processors):
-            result = _flush_single_processor(
-                processor, timeout_millis, i + 1, tracer_instance
-            )
-            batch_results.append(result)
-
-        flush_results.append(("batch_processors", all(batch_results)))
+        def _run(name: str = name, component: Any = component) -> None:
+            results[name] = _flush_component(tracer_instance, name, component, deadline)
 
-    except Exception as e:
-        flush_results.append(("batch_processors", False))
-        # Graceful degradation - never crash host
-        safe_log(
-            tracer_instance,
-            "error",
-            "Batch processors flush error",
-            honeyhive_data={
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "operation": "batch_processors_flush",
-            },
+        thread = threading.Thread(
+            target=_run, name=f"honeyhive-flush-{name}", daemon=True
         )
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+
+    ordered: Dict[str, Dict[str, Any]] = {}
+    for name, _ in targets:
+        result = results.get(name)
+        if result is None:
+            safe_log(
+                tracer_instance,
+                "warning",
+                "Component force_flush did not finish before the deadline",
+                honeyhive_data={"component": name, "operation": "component_flush"},
+            )
+            result = {
+                "success": False,
+                "timed_out": True,
+                "elapsed_ms": None,
+                "error": None,
+            }
+        ordered[name] = result
+    return ordered
 
 
 def _log_flush_results(
@@ -0,0 +1,203 @@
+"""Serverless lifecycle mode for short-lived invocations (AWS Lambda).
+
+In the standard mode ``shutdown_tracer`` waits 100 ms for spans to finish,
+flushes with a 5 s timeout and retries with 10 s. In a function runtime that
+is billed time on every container teardown, and a process that is frozen
+between invocations cannot rely on background export threads. The serverless
+mode instead:
+
+- flushes synchronously at the end of each invocation
+  (:func:`flush_at_handler_end` or the :func:`serverless_handler` decorator)
+  and on shutdown, within one budget: ``otlp_serverless_flush_budget``,
+  capped by the invocation's remaining time minus a safety margin;
+- skips the grace sleep and the retry flush on shutdown;
+- moves spans still queued at the deadline to the on-disk spool (by default
+  ``honeyhive-spool`` in the temp directory, ``/tmp`` on Lambda) and, when
+  time is left after a successful flush, sends batches spooled by earlier
+  invocations.
+
+``otlp_lifecycle_mode`` selects the mode; ``auto`` (the default) enables it
+when ``AWS_LAMBDA_FUNCTION_NAME`` is set.
+"""
+
+import functools
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from ...utils.logger import safe_log
+from ..utils import get_otlp_setting
+from .flush import flush_tracer_components
+
+LIFECYCLE_AUTO = "auto"
+LIFECYCLE_STANDARD = "standard"
+LIFECYCLE_SERVERLESS = "serverless"
+LIFECYCLE_MODES = (LIFECYCLE_AUTO, LIFECYCLE_STANDARD, LIFECYCLE_SERVERLESS)
+
+DEFAULT_SERVERLESS_FLUSH_BUDGET = 2.0
+DEFAULT_SERVERLESS_SPOOL_DIR = os.path.join(tempfile.gettempdir(), "honeyhive-spool")
+
+# Invocation time kept free for the runtime to return the response
+SAFETY_MARGIN_MILLIS = 200.0
+
+HandlerT = TypeVar("HandlerT", bound=Callable[..., Any])
+
+
+def is_serverless_mode(tracer_instance: Any) -> bool:
+    """Check whether a tracer uses the serverless lifecycle mode.
+
+    :param tracer_instance: The tracer instance
+    :type tracer_instance: HoneyHiveTracer
+    :return: True for ``serverless``, or ``auto`` on AWS Lambda
+    :rtype: bool
+    """
+    mode = get_otlp_setting(tracer_instance, "otlp_lifecycle_mode", LIFECYCLE_AUTO)
+    if mode == LIFECYCLE_SERVERLESS:
+        return True
+    if mode == LIFECYCLE_AUTO:
+        return bool(os.environ.get("AWS_LAMBDA_FUNCTION_NAME"))
+    return False
+
+
+def get_flush_budget_millis(tracer_instance: Any, context: Any = None) -> float:
+    """Get the time available for a serverless flush.
+
+    :param tracer_instance: The tracer instance
+    :type tracer_instance: HoneyHiveTracer
+    :param context: Optional Lambda context; its remaining time minus a
+        safety margin caps the configured budget
+    :type context: Any
+    :return: Budget in milliseconds (0 when the invocation is out of time)
+    :rtype: float
+    """
+    budget = 1000.0 * float(
+        get_otlp_setting(
+            tracer_instance,
+            "otlp_serverless_flush_budget",
+            DEFAULT_SERVERLESS_FLUSH_BUDGET,
+        )
+    )
+    get_remaining = getattr(context, "get_remaining_time_in_millis", None)
+    if callable(get_remaining):
+        try:
+            budget = min(budget, float(get_remaining()) - SAFETY_MARGIN_MILLIS)
+        except (TypeError, ValueError):
+            pass
+    return max(0.0, budget)
+
+
+def flush_at_handler_end(tracer_instance: Any, context: Any = None) -> Dict[str, Any]:
+    """Export a tracer's spans synchronously within the invocation budget.
+
+    Flushes every component once (see
+    :func:`~honeyhive.tracer.lifecycle.flush.flush_tracer_components`). Spans
+    still queued when the budget runs out are moved to the spool; if the
+    flush succeeded with time to spare, spooled batches of earlier
+    invocations are sent.
+
+    :param tracer_instance: The tracer instance to flush
+    :type tracer_instance: HoneyHiveTracer
+    :param context: Optional Lambda context (``get_remaining_time_in_millis``)
+    :type context: Any
+    :return: The flush report plus ``budget_ms``, ``spooled_spans`` and
+        ``spool_drained`` (None when no replay was attempted)
+    :rtype: Dict[str, Any]
+
+    **Example:**
+
+    .. code-block:: python
+
+        def lambda_handler(event, context):
+            try:
+                return handle(event)
+            finally:
+                flush_at_handler_end(tracer, context)
+    """
+    started = time.monotonic()
+    budget_millis = get_flush_budget_millis(tracer_instance, context)
+    report = flush_tracer_components(tracer_instance, budget_millis)
+    report["budget_ms"] = budget_millis
+    report["spooled_spans"] = 0
+    report["spool_drained"] = None
+
+    try:
+        span_processor = getattr(tracer_instance, "span_processor", None)
+        if (
+            not report["success"]
+            and span_processor is not None
+            and hasattr(span_processor, "spool_pending_spans")
+        ):
+            report["spooled_spans"] = span_processor.spool_pending_spans()
+
+        exporter = getattr(tracer_instance, "otlp_exporter", None)
+        spool_stats: Optional[Dict[str, Any]] = None
+        if exporter is not None and hasattr(exporter, "get_spool_stats"):
+            spool_stats = exporter.get_spool_stats()
+        remaining = budget_millis / 1000 - (time.monotonic() - started)
+        if (
+            exporter is not None
+            and report["success"]
+            and remaining > 0
+            and isinstance(spool_stats, dict)
+            and spool_stats.get("pending_batches")
+        ):
+            report["spool_drained"] = bool(exporter.replay_spool(remaining))
+    except Exception as e:
+        # Graceful degradation - never crash host
+        safe_log(
+            tracer_instance,
+            "warning",
+            "Serverless spool handling failed",
+            honeyhive_data={
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "operation": "serverless_flush",
+            },
+        )
+
+    report["elapsed_ms"] = round((time.monotonic() - started) * 1000, 3)
+    safe_log(
+        tracer_instance,
+        "debug",
+        "Serverless flush completed",
+        honeyhive_data={
+            "success": report["success"],
+            "budget_ms": budget_millis,
+            "elapsed_ms": report["elapsed_ms"],
+            "spooled_spans": report["spooled_spans"],
+            "spool_drained": report["spool_drained"],
+        },
+    )
+    return report
+
+
+def serverless_handler(tracer_instance: Any) -> Callable[[HandlerT], HandlerT]:
+    """Decorate a ``handler(event, context)`` to flush when it returns.
+
+    :param tracer_instance: The tracer whose spans are flushed
+    :type tracer_instance: HoneyHiveTracer
+    :return: Decorator calling :func:`flush_at_handler_end` after every
+        invocation, including failed ones
+    :rtype: Callable
+
+    **Example:**
+
+    .. code-block:: python
+
+        @serverless_handler(tracer)
+        def lambda_handler(event, context):
+            ...
+    """
+
+    def decorator(handler: HandlerT) -> HandlerT:
+        @functools.wraps(handler)
+        def wrapper(event: Any, context: Any = None, *args: Any, **kwargs: Any) -> Any:
+            try:
+                return handler(event, context, *args, **kwargs)
+            finally:
+                flush_at_handler_end(tracer_instance, context)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -25,6 +25,7 @@ from .core import (
     get_lock_config,
 )
 from .flush import force_flush_tracer
+from .serverless import flush_at_handler_end, is_serverless_mode
 
 
 def shutdown_tracer(tracer_instance: Any) -> None:
@@ -80,51 +81,58 @@ def shutdown_tracer(tracer_instance: Any) -> None:
         # Protected access required for multi-instance lifecycle management
         tracer_instance._instance_shutdown = True  # pylint: disable=protected-access
 
-        # Brief grace period for existing spans to complete naturally
-        time.sleep(0.1)
-
-        # Force flush with extended timeout and retry logic (before lock acquisition)
-        timeout_ms = 5000  # Extended timeout for production
-
-        safe_log(
-            tracer_instance,
-            "debug",
-            "Starting pre-lock force flush for data loss prevention",
-            honeyhive_data={
-                "timeout_ms": timeout_ms,
-                "test_mode": test_mode,
-                "phase": "pre_lock_data_preservation",
-            },
-        )
+        if is_serverless_mode(tracer_instance):
+            # No grace sleep or retry: one flush within the serverless
+            # budget, spans left over go to the spool
+            flush_success = bool(flush_at_handler_end(tracer_instance)["success"])
+        else:
+            # Brief grace period for existing spans to complete naturally
+            time.sleep(0.1)
 
-        flush_success = force_flush_tracer(tracer_instance, timeout_millis=timeout_ms)
+            # Force flush with extended timeout and retry logic (before lock acquisition)
+            timeout_ms = 5000  # Extended timeout for production
 
-        # Retry logic for critical data preservation (production only)
-        if not flush_success:
             safe_log(
                 tracer_instance,
-                "warning",
-                f"Pre-lock flush failed (timeout: {timeout_ms}ms), retrying",
+                "debug",
+                "Starting pre-lock force flush for data loss prevention",
+                honeyhive_data={
+                    "timeout_ms": timeout_ms,
+                    "test_mode": test_mode,
+                    "phase": "pre_lock_data_preservation",
+                },
             )
 
-            retry_timeout_ms = timeout_ms * 2
             flush_success = force_flush_tracer(
-                tracer_instance, timeout_millis=retry_timeout_ms
+                tracer_instance, timeout_millis=timeout_ms
             )
 
-            if flush_success:
+            # Retry logic for critical data preservation (production only)
+            if not flush_success:
                 safe_log(
                     tracer_instance,
-                    "info",
-                    f"Pre-lock flush succeeded on retry ({retry_timeout_ms}ms)",
+                    "warning",
+                    f"Pre-lock flush failed (timeout: {timeout_ms}ms), retrying",
                 )
-            else:
-                safe_log(
-                    tracer_instance,
-                    "error",
-                    f"Pre-lock flush failed after retry ({retry_timeout_ms}ms), "
-                    "continuing with shutdown - potential data loss",
+
+                retry_timeout_ms = timeout_ms * 2
+                flush_success = force_flush_tracer(
+                    tracer_instance, timeout_millis=retry_timeout_ms
                 )
+
+                if flush_success:
+                    safe_log(
+                        tracer_instance,
+                        "info",
+                        f"Pre-lock flush succeeded on retry ({retry_timeout_ms}ms)",
+                    )
+                else:
+                    safe_log(
+                        tracer_instance,
+                        "error",
+                        f"Pre-lock flush failed after retry ({retry_timeout_ms}ms), "
+                        "continuing with shutdown - potential data loss",
+                    )
     else:
         # Test mode: skip pre-lock flush to prevent pytest-xdist worker conflicts
         safe_log(
@@ -248,54 +256,59 @@ def _shutdown_without_lock(tracer_instance: Any) -> None:
                 True
             )
 
-            # Brief grace period for existing spans to complete naturally
-            time.sleep(0.1)
-
-            # Phase 2: Force flush with extended timeout and retry logic
-            timeout_ms = 5000  # Extended timeout for production
-
-            safe_log(
-                tracer_instance,
-                "debug",
-                "Starting force flush with data loss prevention (without lock)",
-                honeyhive_data={
-                    "timeout_ms": timeout_ms,
-                    "test_mode": test_mode,
-                    "phase": "graceful_drain_complete",
-                },
-            )
+            if is_serverless_mode(tracer_instance):
+                # No grace sleep or retry: one flush within the serverless
+                # budget, spans left over go to the spool
+                flush_at_handler_end(tracer_instance)
+            else:
+                # Brief grace period for existing spans to complete naturally
+                time.sleep(0.1)
 
-            flush_success = force_flush_tracer(
-                tracer_instance, timeout_millis=timeout_ms
-            )
+                # Phase 2: Force flush with extended timeout and retry logic
+                timeout_ms = 5000  # Extended timeout for production
 
-            # Retry logic for critical data preservation (production only)
-            if not flush_success:
                 safe_log(
                     tracer_instance,
-                    "warning",
-                    f"Initial flush failed (timeout: {timeout_ms}ms), retrying",
+                    "debug",
+                    "Starting force flush with data loss prevention (without lock)",
+                    honeyhive_data={
+                        "timeout_ms": timeout_ms,
+                        "test_mode": test_mode,
+                        "phase": "graceful_drain_complete",
+                    },
                 )
 
-                # Retry with double timeout
-                retry_timeout_ms = timeout_ms * 2
                 flush_success = force_flush_tracer(
-                    tracer_instance, timeout_millis=retry_timeout_ms
+                    tracer_instance, timeout_millis=timeout_ms
                 )
 
-                if flush_success:
+                # Retry logic for critical data preservation (production only)
+                if not flush_success:
                     safe_log(
                         tracer_instance,
-                        "info",
-                        f"Flush succeeded on retry (timeout: {retry_timeout_ms}ms)",
+                        "warning",
+                        f"Initial flush failed (timeout: {timeout_ms}ms), retrying",
                     )
-                else:
-                    safe_log(
-                        tracer_instance,
-                        "error",
-                        f"Flush failed after retry (timeout: {retry_timeout_ms}ms), "
-                        "proceeding with shutdown - potential data loss",
+
+                    # Retry with double timeout
+                    retry_timeout_ms = timeout_ms * 2
+                    flush_success = force_flush_tracer(
+                        tracer_instance, timeout_millis=retry_timeout_ms
                     )
+
+                    if flush_success:
+                        safe_log(
+                            tracer_instance,
+                            "info",
+                            f"Flush succeeded on retry (timeout: {retry_timeout_ms}ms)",
+                        )
+                    else:
+                        safe_log(
+                            tracer_instance,
+                            "error",
+                            f"Flush failed after retry (timeout: {retry_timeout_ms}ms), "
+                            "proceeding with shutdown - potential data loss",
+                        )
         else:
             # Test mode: skip flush to prevent pytest-xdist worker conflicts
             safe_log(
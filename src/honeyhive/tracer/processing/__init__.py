@@ -15,6 +15,7 @@ from .context import (
 )
 
 # OTLP export
+from .otlp_async_exporter import AsyncBatchSpanProcessor, AsyncOTLPExporter
 from .otlp_exporter import HoneyHiveOTLPExporter
 
 # Span processing
@@ -25,6 +26,8 @@ __all__ = [
     "HoneyHiveSpanProcessor",
     # OTLP export
     "HoneyHiveOTLPExporter",
+    "AsyncOTLPExporter",
+    "AsyncBatchSpanProcessor",
     # Context management
     "extract_context_from_carrier",
     "get_current_baggage",
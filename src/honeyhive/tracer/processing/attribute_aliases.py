@@ -0,0 +1,133 @@
+"""Compatibility aliases for core HoneyHive span attributes.
+
+For ingestion compatibility the span processor mirrors ``honeyhive.session_id``,
+``honeyhive.project``, ``honeyhive.source`` and ``honeyhive.parent_id`` as
+``traceloop.association.properties.*``. The ``otlp_attribute_aliases`` setting
+(``HH_OTLP_ATTRIBUTE_ALIASES``) controls where the mirrored copies live:
+
+- ``span`` (default): both keys are set on every span
+- ``export``: spans carry only the canonical keys and exporters add the
+  aliases back to each span while encoding. The request body is unchanged,
+  but the aliases no longer count toward ``max_attributes`` or span memory.
+- ``resource``: spans carry only the canonical keys. The OTLP JSON serializer
+  groups each batch by alias values and emits the aliases once per
+  ``resourceSpans`` block as resource attributes, which gives the smallest
+  payloads. Only use this mode if the ingestion endpoint reads association
+  properties from resource attributes. Protobuf export falls back to
+  ``export``.
+
+An alias whose value differs from its canonical key is always kept on the
+span.
+"""
+
+from typing import Any, Dict, Mapping
+
+from opentelemetry.sdk.trace import ReadableSpan
+
+from ...utils.logger import safe_log
+from ..utils import get_otlp_setting
+
+ALIAS_MODE_SPAN = "span"
+ALIAS_MODE_EXPORT = "export"
+ALIAS_MODE_RESOURCE = "resource"
+ALIAS_MODES = (ALIAS_MODE_SPAN, ALIAS_MODE_EXPORT, ALIAS_MODE_RESOURCE)
+
+# Canonical key → compatibility alias
+ATTRIBUTE_ALIASES: Dict[str, str] = {
+    "honeyhive.session_id": "traceloop.association.properties.session_id",
+    "honeyhive.project": "traceloop.association.properties.project",
+    "honeyhive.source": "traceloop.association.properties.source",
+    "honeyhive.parent_id": "traceloop.association.properties.parent_id",
+}
+
+
+def resolve_alias_mode(mode: Any, tracer_instance: Any = None) -> str:
+    """Normalize an alias mode name, falling back to ``span``.
+
+    Args:
+        mode: Requested mode (case-insensitive); None selects the default
+        tracer_instance: Optional tracer instance for logging context
+
+    Returns:
+        One of :data:`ALIAS_MODES`
+    """
+    if mode is None:
+        return ALIAS_MODE_SPAN
+    name = str(mode).strip().lower()
+    if name in ALIAS_MODES:
+        return name
+    safe_log(
+        tracer_instance,
+        "warning",
+        "Unknown attribute alias mode '%s', using '%s'",
+        mode,
+        ALIAS_MODE_SPAN,
+        honeyhive_data={"supported": list(ALIAS_MODES)},
+    )
+    return ALIAS_MODE_SPAN
+
+
+def get_alias_mode(tracer_instance: Any) -> str:
+    """Read ``otlp_attribute_aliases`` from a tracer's unified config.
+
+    Args:
+        tracer_instance: Tracer whose config to read (may be None)
+
+    Returns:
+        One of :data:`ALIAS_MODES`
+    """
+    mode = get_otlp_setting(tracer_instance, "otlp_attribute_aliases", None)
+    if not isinstance(mode, str):
+        return ALIAS_MODE_SPAN
+    return resolve_alias_mode(mode, tracer_instance)
+
+
+def compact_aliases(attributes: Dict[str, Any]) -> None:
+    """Remove aliases that duplicate their canonical key, in place."""
+    for canonical, alias in ATTRIBUTE_ALIASES.items():
+        value = attributes.get(canonical)
+        if value is not None and attributes.get(alias) == value:
+            del attributes[alias]
+
+
+def missing_aliases(attributes: Mapping[str, Any]) -> Dict[str, Any]:
+    """Aliases to restore for a compacted attribute mapping.
+
+    Args:
+        attributes: Span attributes
+
+    Returns:
+        ``{alias: value}`` for every canonical key present without its alias
+    """
+    restored: Dict[str, Any] = {}
+    for canonical, alias in ATTRIBUTE_ALIASES.items():
+        value = attributes.get(canonical)
+        if value is not None and alias not in attributes:
+            restored[alias] = value
+    return restored
+
+
+def with_aliases(span: ReadableSpan) -> ReadableSpan:
+    """Return the span with its compatibility aliases restored.
+
+    Used by encoders that cannot add attributes while serializing
+    (Protobuf). Returns the span itself when nothing is missing.
+    """
+    attributes = span.attributes or {}
+    restored = missing_aliases(attributes)
+    if not restored:
+        return span
+    return ReadableSpan(
+        name=span.name,
+        context=span.context,
+        parent=span.parent,
+        resource=span.resource,
+        attributes={**attributes, **restored},
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
@@ -0,0 +1,587 @@
+"""HoneyHive batch span processor driven by the tracer's OTLP configuration.
+
+OpenTelemetry's ``BatchSpanProcessor`` uses fixed defaults (a 2048 span queue,
+5 s delay, 512 span batches, one export thread) and silently drops spans when
+its queue overflows. :class:`HoneyHiveBatchSpanProcessor` replaces it with:
+
+- a bounded ring buffer sized by ``max_queue_size`` (default 8192)
+- an explicit drop policy: ``drop_oldest`` (default) evicts the oldest queued
+  span to make room, ``drop_newest`` rejects the incoming span
+- optional extra export worker threads (``export_workers``, default 1). The
+  ``SpanExporter`` contract does not allow concurrent ``export`` calls, so
+  calls stay serialized unless the exporter sets
+  ``supports_concurrent_export = True``; only then does a slow request stop
+  holding up the rest of the queue
+- batches cut at ``max_export_batch_bytes`` of estimated encoded size, so a
+  few spans with long LLM completions cannot push a request past the
+  server's body limit
+- counters for queued, exported, failed and dropped spans, plus batch size
+  and export latency histograms in the tracer's pipeline metrics
+- optional per-owner accounting, so tracers sharing one processor (see
+  :mod:`honeyhive.tracer.processing.export_hub`) can flush just their own
+  spans
+
+Settings come from ``OTLPConfig``: ``batch_size`` (spans that trigger an
+export), ``max_export_batch_size`` (spans per request),
+``max_export_batch_bytes`` (estimated bytes per request), ``flush_interval``
+(maximum delay before a partial batch is sent) and ``export_timeout``.
+"""
+
+# pylint: disable=too-many-instance-attributes
+# Justification: The processor tracks queue, worker and counter state
+
+import collections
+import contextlib
+import os
+import threading
+import time
+import weakref
+from typing import (
+    Any,
+    ContextManager,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from opentelemetry.context import (
+    _SUPPRESS_INSTRUMENTATION_KEY,
+    Context,
+    attach,
+    detach,
+    set_value,
+)
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from ...utils.logger import safe_log
+from ..utils import get_otlp_setting
+from .pipeline_metrics import (
+    LATENCY_BUCKETS,
+    SPAN_COUNT_BUCKETS,
+    PipelineMetrics,
+    pipeline_metrics_for,
+)
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+DROP_POLICIES = (DROP_OLDEST, DROP_NEWEST)
+
+DEFAULT_MAX_QUEUE_SIZE = 8192
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_EXPORT_BATCH_SIZE = 512
+DEFAULT_MAX_EXPORT_BATCH_BYTES = 4 * 1024 * 1024
+DEFAULT_FLUSH_INTERVAL = 5.0
+DEFAULT_EXPORT_TIMEOUT = 30.0
+DEFAULT_EXPORT_WORKERS = 1
+
+# Approximate OTLP JSON overhead of a span (ids, timestamps, kind, status)
+# and of one attribute entry ({"key":..,"value":{"stringValue":..}})
+_SPAN_OVERHEAD_BYTES = 256
+_ATTRIBUTE_OVERHEAD_BYTES = 32
+
+
+def _attributes_size(attributes: Any) -> int:
+    if not attributes:
+        return 0
+    size = 0
+    for key, value in attributes.items():
+        size += _ATTRIBUTE_OVERHEAD_BYTES + len(key)
+        if isinstance(value, str):
+            size += len(value)
+        elif isinstance(value, (list, tuple)):
+            size += sum(len(str(item)) + 8 for item in value)
+        else:
+            size += len(str(value))
+    return size
+
+
+def estimate_span_size(span: ReadableSpan) -> int:
+    """Estimate the OTLP JSON encoded size of a span in bytes.
+
+    The estimate counts names, attribute keys and values of the span and its
+    events and links plus a fixed per-item overhead. It is cheap enough to
+    run for every ended span and errs on the large side for typical spans.
+
+    Args:
+        span: Span to measure
+
+    Returns:
+        Estimated encoded size in bytes
+    """
+    size = _SPAN_OVERHEAD_BYTES + len(span.name or "")
+    size += _attributes_size(span.attributes)
+    for event in span.events or ():
+        size += _ATTRIBUTE_OVERHEAD_BYTES + len(event.name or "")
+        size += _attributes_size(event.attributes)
+    for link in span.links or ():
+        size += _SPAN_OVERHEAD_BYTES // 2 + _attributes_size(link.attributes)
+    return size
+
+
+def split_batches(
+    spans: Sequence[ReadableSpan],
+    max_spans: int,
+    max_bytes: int = 0,
+    sizes: Optional[Iterable[int]] = None,
+) -> List[List[ReadableSpan]]:
+    """Split spans into batches bounded by span count and estimated bytes.
+
+    A span larger than ``max_bytes`` on its own still forms a batch of one.
+
+    Args:
+        spans: Spans to split, in export order
+        max_spans: Maximum number of spans per batch
+        max_bytes: Maximum estimated bytes per batch (0 disables the limit)
+        sizes: Precomputed sizes matching ``spans``; estimated when omitted
+
+    Returns:
+        List of batches preserving span order
+    """
+    if not max_bytes:
+        return [list(spans[i : i + max_spans]) for i in range(0, len(spans), max_spans)]
+    if sizes is None:
+        sizes = (estimate_span_size(span) for span in spans)
+    batches: List[List[ReadableSpan]] = []
+    batch: List[ReadableSpan] = []
+    batch_bytes = 0
+    for span, size in zip(spans, sizes):
+        if batch and (len(batch) >= max_spans or batch_bytes + size > max_bytes):
+            batches.append(batch)
+            batch, batch_bytes = [], 0
+        batch.append(span)
+        batch_bytes += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def get_batch_settings(tracer_instance: Any) -> Dict[str, Any]:
+    """Read batch processor settings from a tracer's ``config.otlp`` section.
+
+    Args:
+        tracer_instance: Tracer whose unified config to read (may be None)
+
+    Returns:
+        Keyword arguments for :class:`HoneyHiveBatchSpanProcessor`
+    """
+
+    def _setting(name: str, default: Any) -> Any:
+        return get_otlp_setting(tracer_instance, name, default)
+
+    return {
+        "max_queue_size": _setting("max_queue_size", DEFAULT_MAX_QUEUE_SIZE),
+        "batch_size": _setting("batch_size", DEFAULT_BATCH_SIZE),
+        "max_export_batch_size": _setting(
+            "max_export_batch_size", DEFAULT_MAX_EXPORT_BATCH_SIZE
+        ),
+        "max_export_batch_bytes": _setting(
+            "max_export_batch_bytes", DEFAULT_MAX_EXPORT_BATCH_BYTES
+        ),
+        "schedule_delay_millis": (
+            _setting("flush_interval", DEFAULT_FLUSH_INTERVAL) * 1000
+        ),
+        "export_timeout_millis": (
+            _setting("export_timeout", DEFAULT_EXPORT_TIMEOUT) * 1000
+        ),
+        "export_workers": _setting("export_workers", DEFAULT_EXPORT_WORKERS),
+        "drop_policy": _setting("queue_drop_policy", DROP_OLDEST),
+    }
+
+
+class HoneyHiveBatchSpanProcessor(SpanProcessor):
+    """Batch span processor with a bounded ring buffer and worker threads.
+
+    Ended spans are queued with their estimated encoded size; a worker
+    exports as soon as ``batch_size`` spans or ``max_export_batch_bytes`` are
+    waiting, or every ``schedule_delay_millis`` otherwise, sending at most
+    ``max_export_batch_size`` spans and ``max_export_batch_bytes`` per
+    request. When the queue is full the ``drop_policy`` decides which span is
+    lost, and every drop is counted.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        *,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_export_batch_size: int = DEFAULT_MAX_EXPORT_BATCH_SIZE,
+        max_export_batch_bytes: int = DEFAULT_MAX_EXPORT_BATCH_BYTES,
+        schedule_delay_millis: float = DEFAULT_FLUSH_INTERVAL * 1000,
+        export_timeout_millis: float = DEFAULT_EXPORT_TIMEOUT * 1000,
+        export_workers: int = DEFAULT_EXPORT_WORKERS,
+        drop_policy: str = DROP_OLDEST,
+        tracer_instance: Any = None,
+        metrics: Optional[PipelineMetrics] = None,
+    ) -> None:
+        """Initialize the processor and start its export workers.
+
+        Args:
+            exporter: Exporter that sends batches; ``export`` is called by one
+                worker at a time unless it sets
+                ``supports_concurrent_export = True``
+            max_queue_size: Capacity of the span ring buffer
+            batch_size: Number of queued spans that triggers an export
+            max_export_batch_size: Maximum number of spans per export call
+            max_export_batch_bytes: Maximum estimated encoded bytes per
+                export call (0 disables the byte limit)
+            schedule_delay_millis: Maximum delay before a partial batch is sent
+            export_timeout_millis: Default timeout for flush and shutdown
+            export_workers: Number of export threads; more than one only
+                overlaps exports for exporters that support it
+            drop_policy: "drop_oldest" or "drop_newest" when the queue is full
+            tracer_instance: Optional tracer instance for logging context
+            metrics: Pipeline metrics registry; defaults to the tracer's
+        """
+        self.exporter = exporter
+        self.tracer_instance = tracer_instance
+        self.max_queue_size = max(1, int(max_queue_size))
+        self.max_export_batch_size = max(
+            1, min(int(max_export_batch_size), self.max_queue_size)
+        )
+        self.batch_size = max(1, min(int(batch_size), self.max_export_batch_size))
+        self.max_export_batch_bytes = max(0, int(max_export_batch_bytes))
+        self.schedule_delay = max(0.001, float(schedule_delay_millis) / 1000)
+        self.export_timeout = max(0.001, float(export_timeout_millis) / 1000)
+        self.export_workers = max(1, int(export_workers))
+        if drop_policy not in DROP_POLICIES:
+            safe_log(
+                tracer_instance,
+                "warning",
+                f"Unknown span queue drop policy '{drop_policy}', using "
+                f"'{DROP_OLDEST}'",
+                honeyhive_data={"supported": list(DROP_POLICIES)},
+            )
+            drop_policy = DROP_OLDEST
+        self.drop_policy = drop_policy
+
+        self._queue: Deque[ReadableSpan] = collections.deque()
+        # Estimated encoded size and owner of each queued span, in queue order
+        self._sizes: Deque[int] = collections.deque()
+        self._owners: Deque[Any] = collections.deque()
+        # Queued plus in-flight span count of each owner other than None
+        self._pending: Dict[Any, int] = {}
+        self._queued_bytes = 0
+        self._condition = threading.Condition(threading.Lock())
+        # Serializes export() unless the exporter declares it safe to overlap
+        self._export_guard: ContextManager[Any] = (
+            contextlib.nullcontext()
+            if getattr(exporter, "supports_concurrent_export", False) is True
+            else threading.Lock()
+        )
+        self._exporting = 0
+        self._flush_waiters = 0
+        self._is_shutdown = False
+        self._drop_warned = False
+        self._stats = {
+            "queued_spans": 0,
+            "exported_spans": 0,
+            "failed_spans": 0,
+            "dropped_spans": 0,
+            "export_batches": 0,
+        }
+        if metrics is None:
+            metrics = pipeline_metrics_for(tracer_instance)
+        self._batch_spans = metrics.histogram("batch.spans", SPAN_COUNT_BUCKETS)
+        self._batch_export_seconds = metrics.histogram(
+            "batch.export_seconds", LATENCY_BUCKETS
+        )
+        self._workers: List[threading.Thread] = []
+        self._start_workers()
+
+        # Worker threads do not survive fork(); restart them in the child
+        if hasattr(os, "register_at_fork"):
+            weak_reinit = weakref.WeakMethod(self._at_fork_reinit)
+
+            def _reinit_after_fork() -> None:
+                reinit = weak_reinit()
+                if reinit is not None:
+                    reinit()
+
+            os.register_at_fork(after_in_child=_reinit_after_fork)
+
+        safe_log(
+            tracer_instance,
+            "debug",
+            "HoneyHiveBatchSpanProcessor initialized",
+            honeyhive_data={
+                "max_queue_size": self.max_queue_size,
+                "batch_size": self.batch_size,
+                "max_export_batch_size": self.max_export_batch_size,
+                "max_export_batch_bytes": self.max_export_batch_bytes,
+                "schedule_delay_seconds": self.schedule_delay,
+                "export_workers": self.export_workers,
+                "drop_policy": self.drop_policy,
+            },
+        )
+
+    # ------------------------------------------------------------------
+    # SpanProcessor interface
+    # ------------------------------------------------------------------
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        """No-op; spans are queued when they end."""
+
+    def on_end(self, span: ReadableSpan, owner: Any = None) -> None:
+        """Queue an ended span, applying the drop policy when full.
+
+        Args:
+            span: Ended span
+            owner: Optional owner whose pending spans ``force_flush`` can
+                wait for separately
+        """
+        if self._is_shutdown or not span.context.trace_flags.sampled:
+            return
+
+        size = estimate_span_size(span) if self.max_export_batch_bytes else 0
+        warn = False
+        with self._condition:
+            if len(self._queue) >= self.max_queue_size:
+                self._stats["dropped_spans"] += 1
+                warn = not self._drop_warned
+                self._drop_warned = True
+                if self.drop_policy == DROP_OLDEST:
+                    self._queue.popleft()
+                    self._queued_bytes -= self._sizes.popleft()
+                    self._release_owner(self._owners.popleft(), 1)
+            if len(self._queue) < self.max_queue_size:
+                self._queue.append(span)
+                self._sizes.append(size)
+                self._owners.append(owner)
+                if owner is not None:
+                    self._pending[owner] = self._pending.get(owner, 0) + 1
+                self._queued_bytes += size
+                self._stats["queued_spans"] += 1
+                if self._batch_ready():
+                    self._condition.notify()
+
+        if warn:
+            safe_log(
+                self.tracer_instance,
+                "warning",
+                "HoneyHive span queue is full, dropping spans (%s)",
+                self.drop_policy,
+                honeyhive_data={"max_queue_size": self.max_queue_size},
+            )
+
+    def force_flush(
+        self, timeout_millis: Optional[float] = None, owner: Any = None
+    ) -> bool:
+        """Export every queued span and wait for in-flight exports.
+
+        Args:
+            timeout_millis: Maximum time to wait; defaults to the export timeout
+            owner: Only wait until this owner's spans are exported (spans
+                queued ahead of them are exported first)
+
+        Returns:
+            True if the queue (or the owner's spans) drained within the timeout
+        """
+        timeout = (
+            self.export_timeout if timeout_millis is None else timeout_millis / 1000
+        )
+        if owner is None:
+
+            def drained() -> bool:
+                return not self._queue and not self._exporting
+
+        else:
+
+            def drained() -> bool:
+                return owner not in self._pending
+
+        with self._condition:
+            if self._is_shutdown and not self._workers:
+                return True
+            self._flush_waiters += 1
+            self._condition.notify_all()
+            try:
+                return self._condition.wait_for(drained, timeout)
+            finally:
+                self._flush_waiters -= 1
+
+    def shutdown(self) -> None:
+        """Drain the queue, stop the workers and shut down the exporter."""
+        with self._condition:
+            if self._is_shutdown:
+                return
+            self._is_shutdown = True
+            self._condition.notify_all()
+        deadline = time.monotonic() + self.export_timeout
+        for worker in self._workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+        self._workers = []
+        self.exporter.shutdown()
+
+    def drain(self) -> List[ReadableSpan]:
+        """Remove and return every queued span (in-flight batches excluded).
+
+        Used when a flush deadline passes, so the caller can spool what is
+        left instead of losing it.
+        """
+        with self._condition:
+            spans = list(self._queue)
+            for owner in self._owners:
+                self._release_owner(owner, 1)
+            self._queue.clear()
+            self._sizes.clear()
+            self._owners.clear()
+            self._queued_bytes = 0
+            self._condition.notify_all()
+            return spans
+
+    def pending_spans(self, owner: Any) -> int:
+        """Get the number of an owner's spans queued or being exported."""
+        with self._condition:
+            return self._pending.get(owner, 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth and span counters."""
+        with self._condition:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats.update(
+                {
+                    "queue_size": len(self._queue),
+                    "queued_bytes": self._queued_bytes,
+                    "max_queue_size": self.max_queue_size,
+                    "exports_in_flight": self._exporting,
+                    "export_workers": self.export_workers,
+                    "concurrent_export": isinstance(
+                        self._export_guard, contextlib.nullcontext
+                    ),
+                    "drop_policy": self.drop_policy,
+                }
+            )
+            return stats
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _start_workers(self) -> None:
+        self._workers = [
+            threading.Thread(
+                target=self._worker,
+                name=f"honeyhive-batch-export-{index}",
+                daemon=True,
+            )
+            for index in range(self.export_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def _at_fork_reinit(self) -> None:
+        """Reset locks and restart workers in a forked child process."""
+        self._condition = threading.Condition(threading.Lock())
+        if not isinstance(self._export_guard, contextlib.nullcontext):
+            self._export_guard = threading.Lock()
+        self._queue.clear()
+        self._sizes.clear()
+        self._owners.clear()
+        self._pending.clear()
+        self._queued_bytes = 0
+        self._exporting = 0
+        self._flush_waiters = 0
+        if not self._is_shutdown:
+            self._start_workers()
+
+    def _export_now(self) -> bool:
+        """Whether a worker should skip waiting for the timer."""
+        if self._is_shutdown:
+            return True
+        return bool(self._queue) and (self._flush_waiters > 0 or self._batch_ready())
+
+    def _batch_ready(self) -> bool:
+        """Whether enough spans or bytes are queued for a full batch."""
+        return len(self._queue) >= self.batch_size or bool(
+            self.max_export_batch_bytes
+            and self._queued_bytes >= self.max_export_batch_bytes
+        )
+
+    def _release_owner(self, owner: Any, count: int) -> None:
+        """Subtract exported or dropped spans from an owner's pending count."""
+        if owner is None:
+            return
+        remaining = self._pending.get(owner, 0) - count
+        if remaining > 0:
+            self._pending[owner] = remaining
+        else:
+            self._pending.pop(owner, None)
+
+    def _next_batch(self) -> Optional[Tuple[List[ReadableSpan], Dict[Any, int]]]:
+        """Wait for work and pop a batch with its span count per owner.
+
+        None tells the worker to exit.
+        """
+        with self._condition:
+            if not self._export_now():
+                self._condition.wait(self.schedule_delay)
+            if not self._queue:
+                if not self._exporting:
+                    self._drop_warned = False
+                return None if self._is_shutdown else ([], {})
+            batch: List[ReadableSpan] = []
+            owners: Dict[Any, int] = {}
+            batch_bytes = 0
+            while self._queue and len(batch) < self.max_export_batch_size:
+                size = self._sizes[0]
+                if (
+                    batch
+                    and self.max_export_batch_bytes
+                    and batch_bytes + size > self.max_export_batch_bytes
+                ):
+                    break
+                batch.append(self._queue.popleft())
+                batch_bytes += self._sizes.popleft()
+                owner = self._owners.popleft()
+                if owner is not None:
+                    owners[owner] = owners.get(owner, 0) + 1
+            self._queued_bytes -= batch_bytes
+            self._exporting += 1
+            return batch, owners
+
+    def _worker(self) -> None:
+        while True:
+            work = self._next_batch()
+            if work is None:
+                return
+            batch, owners = work
+            if not batch:
+                continue
+            start = time.perf_counter()
+            success = self._export(batch)
+            self._batch_export_seconds.record(time.perf_counter() - start)
+            self._batch_spans.record(len(batch))
+            with self._condition:
+                self._exporting -= 1
+                self._stats["export_batches"] += 1
+                key = "exported_spans" if success else "failed_spans"
+                self._stats[key] += len(batch)
+                for owner, count in owners.items():
+                    self._release_owner(owner, count)
+                self._condition.notify_all()
+
+    def _export(self, batch: List[ReadableSpan]) -> bool:
+        """Export one batch without tracing the export itself."""
+        token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+        try:
+            with self._export_guard:
+                return self.exporter.export(batch) == SpanExportResult.SUCCESS
+        except Exception as e:
+            safe_log(
+                self.tracer_instance,
+                "error",
+                f"Exception while exporting span batch: {e}",
+                honeyhive_data={
+                    "error_type": type(e).__name__,
+                    "span_count": len(batch),
+                },
+            )
+            return False
+        finally:
+            detach(token)
@@ -0,0 +1,233 @@
+"""Process-wide export pipeline shared by tracers with the same destination.
+
+Each tracer normally owns an exporter, a pooled ``requests.Session`` and a
+batch processor with its own worker threads. A service that creates one
+tracer per project therefore runs hundreds of export threads and connection
+pools against the same endpoint. With ``otlp_shared_export`` enabled, tracers
+join an :class:`ExportHub` instead:
+
+- Hubs are keyed by the exporter settings: endpoint, headers (API key and
+  source), protocol, compression, retry, circuit and spool settings, the
+  HTTP session settings (pool size, retries, timeout), plus the batch
+  settings. Tracers whose settings differ get separate hubs.
+- A hub owns one :class:`HoneyHiveOTLPExporter` (one connection pool, retry
+  budget and circuit breaker) and one :class:`HoneyHiveBatchSpanProcessor`
+  (one queue and worker pool).
+- Each tracer gets a :class:`SharedExportChannel`. Spans keep their own
+  tracer's resource and session attributes, and a batch mixing several
+  tracers is serialized with one ``resourceSpans`` entry per resource.
+- ``force_flush`` on a channel waits only for that tracer's spans.
+  ``shutdown`` flushes the tracer's spans and leaves the hub, which is shut
+  down when its last tracer leaves.
+
+Tracers with a custom ``requests_session`` or async export keep a private
+pipeline.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from ...utils.logger import safe_log
+from .batch_processor import HoneyHiveBatchSpanProcessor
+from .otlp_exporter import HoneyHiveOTLPExporter
+from .pipeline_metrics import PipelineMetrics
+
+# Exporter arguments that are per tracer and do not separate hubs
+_UNKEYED_ARGUMENTS = ("tracer_instance",)
+
+_HUBS: Dict[Tuple[Tuple[str, str], ...], "ExportHub"] = {}
+_HUBS_LOCK = threading.Lock()
+
+
+def hub_key(
+    export_kwargs: Dict[str, Any], batch_settings: Dict[str, Any]
+) -> Tuple[Tuple[str, str], ...]:
+    """Build the key under which tracers share a hub.
+
+    Args:
+        export_kwargs: ``HoneyHiveOTLPExporter`` keyword arguments
+        batch_settings: ``HoneyHiveBatchSpanProcessor`` keyword arguments
+
+    Returns:
+        Hashable key; equal settings give equal keys
+    """
+    items = []
+    for settings, prefix in ((export_kwargs, ""), (batch_settings, "batch.")):
+        for name, value in settings.items():
+            if name in _UNKEYED_ARGUMENTS:
+                continue
+            if name == "session_config" and value is not None:
+                value = value.to_dict()
+            if isinstance(value, dict):
+                value = sorted(value.items())
+            items.append((prefix + name, repr(value)))
+    return tuple(sorted(items))
+
+
+class ExportHub:
+    """Exporter and batch processor shared by several tracers."""
+
+    def __init__(
+        self,
+        key: Tuple[Tuple[str, str], ...],
+        export_kwargs: Dict[str, Any],
+        batch_settings: Dict[str, Any],
+    ) -> None:
+        """Create the shared exporter and batch processor.
+
+        Args:
+            key: Key of this hub in the registry
+            export_kwargs: ``HoneyHiveOTLPExporter`` keyword arguments; the
+                exporter is not tied to any tracer
+            batch_settings: ``HoneyHiveBatchSpanProcessor`` keyword arguments
+        """
+        self.key = key
+        self.endpoint = export_kwargs.get("endpoint")
+        self.metrics = PipelineMetrics()
+        kwargs = dict(export_kwargs)
+        kwargs["tracer_instance"] = None
+        self.exporter = HoneyHiveOTLPExporter(metrics=self.metrics, **kwargs)
+        self.processor = HoneyHiveBatchSpanProcessor(
+            self.exporter, metrics=self.metrics, **batch_settings
+        )
+        self.metrics.register_gauge("queue", self.processor.get_stats)
+        self.tracer_count = 0
+
+    def shutdown(self) -> None:
+        """Drain the queue and shut down the exporter."""
+        self.processor.shutdown()
+
+
+def acquire_channel(
+    export_kwargs: Dict[str, Any],
+    batch_settings: Dict[str, Any],
+    tracer_instance: Any = None,
+) -> "SharedExportChannel":
+    """Join (or create) the hub for these settings.
+
+    Args:
+        export_kwargs: ``HoneyHiveOTLPExporter`` keyword arguments
+        batch_settings: ``HoneyHiveBatchSpanProcessor`` keyword arguments
+        tracer_instance: Tracer the channel belongs to
+
+    Returns:
+        A new channel of the tracer into the hub
+    """
+    key = hub_key(export_kwargs, batch_settings)
+    with _HUBS_LOCK:
+        hub = _HUBS.get(key)
+        if hub is None:
+            hub = _HUBS[key] = ExportHub(key, export_kwargs, batch_settings)
+        hub.tracer_count += 1
+        tracer_count = hub.tracer_count
+    safe_log(
+        tracer_instance,
+        "debug",
+        "Joined shared export pipeline",
+        honeyhive_data={
+            "endpoint": export_kwargs.get("endpoint"),
+            "tracers": tracer_count,
+        },
+    )
+    return SharedExportChannel(hub, tracer_instance)
+
+
+def _release_hub(hub: ExportHub) -> None:
+    """Leave a hub, shutting it down when it has no tracers left."""
+    with _HUBS_LOCK:
+        hub.tracer_count -= 1
+        if hub.tracer_count > 0:
+            return
+        if _HUBS.get(hub.key) is hub:
+            del _HUBS[hub.key]
+    hub.shutdown()
+
+
+def get_hub_stats() -> Dict[str, Any]:
+    """Get the endpoint, tracer count and metrics of every live hub."""
+    with _HUBS_LOCK:
+        hubs = list(_HUBS.values())
+    return {
+        "hubs": [
+            {
+                "endpoint": hub.endpoint,
+                "tracers": hub.tracer_count,
+                "metrics": hub.metrics.snapshot(),
+            }
+            for hub in hubs
+        ]
+    }
+
+
+class SharedExportChannel(SpanExporter):
+    """A tracer's connection to a shared :class:`ExportHub`.
+
+    Used by ``HoneyHiveSpanProcessor`` both as its exporter (immediate mode
+    exports through the hub's exporter) and as its batch processor (spans
+    are queued on the hub's processor, tagged with this channel).
+    """
+
+    def __init__(self, hub: ExportHub, tracer_instance: Any = None) -> None:
+        """Initialize the channel (use :func:`acquire_channel`).
+
+        Args:
+            hub: Joined hub
+            tracer_instance: Tracer the channel belongs to
+        """
+        self.hub = hub
+        self.tracer_instance = tracer_instance
+        self._lock = threading.Lock()
+        self._is_shutdown = False
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """Export spans now through the shared exporter."""
+        if self._is_shutdown:
+            return SpanExportResult.FAILURE
+        return self.hub.exporter.export(spans)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        """Queue an ended span on the shared batch processor."""
+        if not self._is_shutdown:
+            self.hub.processor.on_end(span, owner=self)
+
+    def force_flush(self, timeout_millis: Optional[float] = 30000) -> bool:
+        """Wait until this tracer's queued spans are exported.
+
+        Args:
+            timeout_millis: Maximum time to wait
+
+        Returns:
+            True if this tracer's spans were exported within the timeout
+        """
+        if self._is_shutdown:
+            return True
+        return self.hub.processor.force_flush(timeout_millis, owner=self)
+
+    def shutdown(self) -> None:
+        """Flush this tracer's spans and leave the hub (idempotent)."""
+        with self._lock:
+            if self._is_shutdown:
+                return
+            self._is_shutdown = True
+        try:
+            self.hub.processor.force_flush(owner=self)
+        finally:
+            _release_hub(self.hub)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the shared queue statistics plus this tracer's pending spans."""
+        stats = self.hub.processor.get_stats()
+        stats["pending_spans"] = self.hub.processor.pending_spans(self)
+        stats["shared_tracers"] = self.hub.tracer_count
+        return stats
+
+    def get_session_stats(self) -> Dict[str, Any]:
+        """Get the shared exporter's connection pool and export statistics."""
+        return self.hub.exporter.get_session_stats()
+
+    def get_circuit_stats(self) -> Dict[str, Any]:
+        """Get the shared exporter's circuit breaker state."""
+        return self.hub.exporter.get_circuit_stats()
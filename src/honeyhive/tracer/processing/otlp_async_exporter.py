@@ -0,0 +1,731 @@
+"""Native asyncio OTLP exporter for services that run on an event loop.
+
+The default export path uses ``requests`` (JSON) or the OpenTelemetry
+Protobuf exporter, both of which block the ``BatchSpanProcessor`` worker
+thread for the duration of every POST. This module provides an
+``httpx.AsyncClient`` based alternative:
+
+- :class:`AsyncOTLPExporter` posts batches from a dedicated event loop thread
+  (or a caller-provided loop) with many requests in flight at once,
+  multiplexed over HTTP/2 when the optional ``h2`` package is installed
+  (``pip install honeyhive[http2]``)
+- :class:`AsyncBatchSpanProcessor` queues ended spans and dispatches batches
+  to the exporter without waiting for earlier batches to complete
+
+Encodings, compression and the on-disk spool behave exactly as in
+:class:`~honeyhive.tracer.processing.otlp_exporter.HoneyHiveOTLPExporter`, and
+the exporter accepts the same constructor arguments.
+"""
+
+# pylint: disable=too-many-instance-attributes
+# Justification: The exporter tracks loop, client, encoding and counter state
+
+import asyncio
+import collections
+import concurrent.futures
+import threading
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set
+
+import httpx
+from opentelemetry.context import Context
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from ...utils.logger import safe_log
+from .attribute_aliases import ALIAS_MODE_SPAN, resolve_alias_mode, with_aliases
+from .batch_processor import (
+    DEFAULT_MAX_EXPORT_BATCH_BYTES,
+    DROP_OLDEST,
+    DROP_POLICIES,
+    split_batches,
+)
+from .otlp_compression import (
+    COMPRESSION_GZIP,
+    COMPRESSION_NONE,
+    DEFAULT_COMPRESSION_MIN_BYTES,
+    CompressionStats,
+    compress_payload,
+    resolve_compression,
+)
+from .otlp_exporter import HTTP_PAYLOAD_TOO_LARGE
+from .otlp_json_serializer import OTLPJSONSerializer
+from .otlp_session import OTLPSessionConfig, get_default_otlp_config
+from .otlp_spool import (
+    DEFAULT_SPOOL_MAX_AGE_SECONDS,
+    DEFAULT_SPOOL_MAX_BYTES,
+    ExportSpool,
+    SpoolReplayer,
+    is_retryable_status,
+)
+from .structured_attributes import with_structured_values
+
+try:
+    import h2  # type: ignore[import-not-found]  # noqa: F401  # pylint: disable=unused-import
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_MAX_IN_FLIGHT = 16
+
+_JSON_CONTENT_TYPE = "application/json"
+_PROTOBUF_CONTENT_TYPE = "application/x-protobuf"
+
+
+class _EventLoopThread:
+    """Event loop running forever in a daemon thread."""
+
+    def __init__(self, name: str) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the loop and wait for the thread to exit."""
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self.loop.close()
+
+
+class AsyncOTLPExporter(SpanExporter):
+    """OTLP exporter that posts batches with ``httpx.AsyncClient``.
+
+    Batches are encoded as OTLP JSON (``http/json``, default) or Protobuf
+    (``http/protobuf``) and sent from an event loop, with up to
+    ``max_in_flight`` requests outstanding at once. Coroutine callers use
+    :meth:`export_async`; thread callers use :meth:`submit` (non-blocking) or
+    the standard blocking :meth:`export`. A batch rejected with HTTP 413 is
+    split in half and both halves are exported concurrently.
+    """
+
+    def __init__(
+        self,
+        tracer_instance: Any = None,
+        session_config: Optional[OTLPSessionConfig] = None,
+        protocol: str = "http/json",
+        *,
+        http2: bool = True,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        client: Optional[httpx.AsyncClient] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the exporter and start its event loop thread.
+
+        Args:
+            tracer_instance: Optional tracer instance for logging context
+            session_config: Connection pool sizes and default timeout; uses
+                the tracer's default OTLP session config when None
+            protocol: OTLP protocol format
+                - "http/json" (default) or "http/protobuf"
+            http2: Negotiate HTTP/2 when the ``h2`` package is installed
+            max_in_flight: Maximum number of concurrent export requests
+            client: Optional caller-owned ``httpx.AsyncClient``; it must be
+                bound to ``loop`` when one is given
+            loop: Optional running event loop to export on instead of a
+                dedicated loop thread
+            **kwargs: Same export arguments as HoneyHiveOTLPExporter:
+                ``endpoint`` (required), ``headers``, ``timeout``,
+                ``compression``, ``compression_min_bytes``, ``spool_dir``,
+                ``spool_max_bytes``, ``spool_max_age_seconds`` and
+                ``attribute_aliases``. Arguments
+                specific to ``requests`` (such as ``session``) are ignored.
+        """
+        endpoint = kwargs.pop("endpoint", None)
+        if not endpoint:
+            raise ValueError("endpoint is required for OTLP exporter")
+
+        self.tracer_instance = tracer_instance
+        self.session_config = session_config or get_default_otlp_config(tracer_instance)
+        self.protocol = protocol.lower()
+        self._use_json = self.protocol != "http/protobuf"
+        self.endpoint = endpoint.rstrip("/")
+        self.timeout = kwargs.pop("timeout", None) or self.session_config.timeout
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.http2 = bool(http2) and HTTP2_AVAILABLE
+        self._is_shutdown = False
+
+        self.headers = dict(kwargs.pop("headers", None) or {})
+        self.headers.pop("Content-Encoding", None)
+        self.headers["Content-Type"] = (
+            _JSON_CONTENT_TYPE if self._use_json else _PROTOBUF_CONTENT_TYPE
+        )
+
+        compression = resolve_compression(
+            kwargs.pop("compression", None), tracer_instance
+        )
+        compression_min_bytes = kwargs.pop(
+            "compression_min_bytes", DEFAULT_COMPRESSION_MIN_BYTES
+        )
+        if not self._use_json:
+            # Match the Protobuf exporter: gzip only, no size threshold
+            if compression != COMPRESSION_NONE:
+                compression = COMPRESSION_GZIP
+            compression_min_bytes = 0
+        self.compression = compression
+        self.compression_min_bytes = max(0, int(compression_min_bytes))
+        self._compression_stats = CompressionStats(
+            self.compression, self.compression_min_bytes
+        )
+        self.attribute_aliases = resolve_alias_mode(
+            kwargs.pop("attribute_aliases", None), tracer_instance
+        )
+        self._serializer = (
+            OTLPJSONSerializer(alias_mode=self.attribute_aliases)
+            if self._use_json
+            else None
+        )
+
+        spool_dir = kwargs.pop("spool_dir", None)
+        spool_max_bytes = kwargs.pop("spool_max_bytes", DEFAULT_SPOOL_MAX_BYTES)
+        spool_max_age_seconds = kwargs.pop(
+            "spool_max_age_seconds", DEFAULT_SPOOL_MAX_AGE_SECONDS
+        )
+        if kwargs:
+            safe_log(
+                tracer_instance,
+                "debug",
+                "AsyncOTLPExporter ignoring unsupported arguments",
+                honeyhive_data={"ignored": sorted(kwargs)},
+            )
+
+        self._loop_thread: Optional[_EventLoopThread] = None
+        if loop is None:
+            self._loop_thread = _EventLoopThread("honeyhive-otlp-async-export")
+            loop = self._loop_thread.loop
+        self.loop = loop
+
+        self._owns_client = client is None
+        self._client: Optional[httpx.AsyncClient] = client
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending: Set["concurrent.futures.Future[SpanExportResult]"] = set()
+        self._pending_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "exported_batches": 0,
+            "failed_batches": 0,
+            "exported_spans": 0,
+            "max_observed_in_flight": 0,
+        }
+        self._in_flight = 0
+
+        self._spool: Optional[ExportSpool] = None
+        self._spool_replayer: Optional[SpoolReplayer] = None
+        if spool_dir:
+            spool = ExportSpool(
+                spool_dir,
+                max_bytes=spool_max_bytes,
+                max_age_seconds=spool_max_age_seconds,
+                tracer_instance=tracer_instance,
+            )
+            if spool.open():
+                self._spool = spool
+                self._spool_replayer = SpoolReplayer(
+                    spool, self._post_body_blocking, tracer_instance=tracer_instance
+                )
+                self._spool_replayer.start()
+
+        safe_log(
+            tracer_instance,
+            "info",
+            "AsyncOTLPExporter initialized",
+            honeyhive_data={
+                "endpoint": self.endpoint,
+                "protocol": self.protocol,
+                "http2": self.http2,
+                "http2_requested": bool(http2),
+                "max_in_flight": self.max_in_flight,
+                "compression": self.compression,
+                "dedicated_loop": self._loop_thread is not None,
+                "spool_directory": self._spool.directory if self._spool else None,
+            },
+        )
+        if http2 and not HTTP2_AVAILABLE:
+            safe_log(
+                tracer_instance,
+                "debug",
+                "HTTP/2 requested but 'h2' is not installed, using HTTP/1.1 "
+                "(install with: pip install honeyhive[http2])",
+            )
+
+    # ------------------------------------------------------------------
+    # Export entry points
+    # ------------------------------------------------------------------
+
+    async def export_async(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """Export spans from a coroutine running on :attr:`loop`.
+
+        Args:
+            spans: Sequence of ReadableSpan objects to export
+
+        Returns:
+            SpanExportResult indicating success or failure
+        """
+        if self._is_shutdown:
+            safe_log(
+                self.tracer_instance,
+                "debug",
+                "Async exporter already shutdown, skipping export",
+            )
+            return SpanExportResult.FAILURE
+        if not spans:
+            return SpanExportResult.SUCCESS
+
+        result = await self._export_batch(spans)
+        if result is not None:
+            return result
+
+        # The server rejected the body as too large: export both halves
+        middle = len(spans) // 2
+        results = await asyncio.gather(
+            self.export_async(spans[:middle]), self.export_async(spans[middle:])
+        )
+        if all(item == SpanExportResult.SUCCESS for item in results):
+            return SpanExportResult.SUCCESS
+        return SpanExportResult.FAILURE
+
+    async def _export_batch(
+        self, spans: Sequence[ReadableSpan]
+    ) -> Optional[SpanExportResult]:
+        """POST one batch; None means it was too large and should be split."""
+        body: Optional[bytes] = None
+        content_encoding: Optional[str] = None
+        semaphore = self._get_semaphore()
+        async with semaphore:
+            self._track_in_flight(1)
+            try:
+                raw_body = self._encode(spans)
+                body, content_encoding = compress_payload(
+                    raw_body, self.compression, self.compression_min_bytes
+                )
+                safe_log(
+                    self.tracer_instance,
+                    "debug",
+                    "Exporting %d spans via async OTLP",
+                    len(spans),
+                    honeyhive_data=lambda: {
+                        "span_count": len(spans),
+                        "protocol": self.protocol,
+                        "payload_size_bytes": len(raw_body),
+                        "sent_size_bytes": len(body or b""),
+                        "content_encoding": content_encoding,
+                    },
+                )
+
+                response = await self._post(body, content_encoding)
+                self._compression_stats.record(
+                    len(raw_body), len(body), content_encoding is not None
+                )
+
+                if response.status_code == 200:
+                    self._record_result(True, len(spans))
+                    if self._spool_replayer is not None:
+                        # The backend is reachable again: drain the spool now
+                        self._spool_replayer.notify()
+                    return SpanExportResult.SUCCESS
+
+                if response.status_code == HTTP_PAYLOAD_TOO_LARGE and len(spans) > 1:
+                    safe_log(
+                        self.tracer_instance,
+                        "warning",
+                        "OTLP payload too large (%d spans, %d bytes), splitting batch",
+                        len(spans),
+                        len(body),
+                    )
+                    return None
+
+                safe_log(
+                    self.tracer_instance,
+                    "error",
+                    f"Async OTLP export failed with status {response.status_code}",
+                    honeyhive_data={
+                        "status_code": response.status_code,
+                        "response_body": (
+                            response.text[:500] if response.text else None
+                        ),
+                        "span_count": len(spans),
+                    },
+                )
+                if is_retryable_status(response.status_code):
+                    await self._spool_body(body, content_encoding, len(spans))
+                self._record_result(False, len(spans))
+                return SpanExportResult.FAILURE
+
+            except Exception as e:
+                safe_log(
+                    self.tracer_instance,
+                    "error",
+                    f"Error exporting spans via async OTLP: {e}",
+                    honeyhive_data={
+                        "error_type": type(e).__name__,
+                        "span_count": len(spans),
+                    },
+                )
+                if body is not None:
+                    await self._spool_body(body, content_encoding, len(spans))
+                self._record_result(False, len(spans))
+                return SpanExportResult.FAILURE
+            finally:
+                self._track_in_flight(-1)
+
+    def submit(
+        self, spans: Sequence[ReadableSpan]
+    ) -> "concurrent.futures.Future[SpanExportResult]":
+        """Schedule an export on the loop without waiting for it.
+
+        Safe to call from any thread other than the loop's own thread.
+
+        Args:
+            spans: Sequence of ReadableSpan objects to export
+
+        Returns:
+            Future resolving to the SpanExportResult
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.export_async(list(spans)), self.loop
+        )
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard_pending)
+        return future
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """Export spans, blocking until the request completes.
+
+        Args:
+            spans: Sequence of ReadableSpan objects to export
+
+        Returns:
+            SpanExportResult indicating success or failure
+        """
+        if self._is_shutdown:
+            return SpanExportResult.FAILURE
+        if self._on_loop_thread():
+            # Waiting here would deadlock the loop; dispatch and report success
+            self.submit(spans)
+            return SpanExportResult.SUCCESS
+        try:
+            return self.submit(spans).result(self._request_timeout() + 5.0)
+        except Exception as e:
+            safe_log(
+                self.tracer_instance,
+                "error",
+                f"Async OTLP export did not complete: {e}",
+                honeyhive_data={"error_type": type(e).__name__},
+            )
+            return SpanExportResult.FAILURE
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Wait for exports started with :meth:`submit` to finish."""
+        with self._pending_lock:
+            pending = list(self._pending)
+        if not pending:
+            return True
+        if self._on_loop_thread():
+            return False
+        _, not_done = concurrent.futures.wait(pending, timeout=timeout_millis / 1000)
+        return not not_done
+
+    def shutdown(self) -> None:
+        """Finish in-flight exports, close the client and stop the loop."""
+        if self._is_shutdown:
+            return
+        self.force_flush(timeout_millis=5000)
+        self._is_shutdown = True
+
+        if self._spool_replayer is not None:
+            self._spool_replayer.stop(timeout=1.0)
+        if self._spool is not None:
+            self._spool.close()
+
+        if self._client is not None and self._owns_client:
+            if self._on_loop_thread():
+                self.loop.create_task(self._client.aclose())
+            elif self.loop.is_running():
+                try:
+                    asyncio.run_coroutine_threadsafe(
+                        self._client.aclose(), self.loop
+                    ).result(5.0)
+                except Exception:
+                    pass
+        if self._loop_thread is not None:
+            self._loop_thread.stop()
+        safe_log(self.tracer_instance, "debug", "AsyncOTLPExporter shutdown completed")
+
+    def get_session_stats(self) -> Dict[str, Any]:
+        """Get export counters, compression and spool statistics."""
+        with self._stats_lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["in_flight"] = self._in_flight
+        stats.update(
+            {
+                "session_type": "async",
+                "protocol": self.protocol,
+                "http2": self.http2,
+                "max_in_flight": self.max_in_flight,
+                "session_config": self.session_config.to_dict(),
+                "compression": self._compression_stats.to_dict(),
+            }
+        )
+        if self._spool is not None:
+            stats["spool"] = self._spool.get_stats()
+        return stats
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _encode(self, spans: Sequence[ReadableSpan]) -> bytes:
+        """Encode spans as an OTLP JSON or Protobuf request body."""
+        if self._serializer is not None:
+            return self._serializer.serialize(spans)
+        spans = [with_structured_values(span) for span in spans]
+        if self.attribute_aliases != ALIAS_MODE_SPAN:
+            spans = [with_aliases(span) for span in spans]
+        return bytes(encode_spans(spans).SerializePartialToString())
+
+    def _request_timeout(self) -> float:
+        """Per-request timeout in seconds."""
+        return float(self.timeout) if self.timeout else 30.0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Create the client lazily so it binds to the export loop."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                timeout=self._request_timeout(),
+                limits=httpx.Limits(
+                    max_connections=max(
+                        self.session_config.pool_maxsize, self.max_in_flight
+                    ),
+                    max_keepalive_connections=self.session_config.pool_connections,
+                ),
+            )
+        return self._client
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Create the in-flight limiter lazily on the export loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self._semaphore
+
+    async def _post(
+        self, body: bytes, content_encoding: Optional[str]
+    ) -> httpx.Response:
+        """POST an encoded request body to the endpoint."""
+        headers = self.headers
+        if content_encoding:
+            headers = {**self.headers, "Content-Encoding": content_encoding}
+        return await self._get_client().post(
+            self.endpoint, content=body, headers=headers
+        )
+
+    def _post_body_blocking(self, body: bytes, content_encoding: Optional[str]) -> int:
+        """POST a spooled body from the replayer thread; returns the status."""
+        if self._is_shutdown:
+            raise RuntimeError("exporter is shut down")
+        future = asyncio.run_coroutine_threadsafe(
+            self._post(body, content_encoding), self.loop
+        )
+        return int(future.result(self._request_timeout() + 5.0).status_code)
+
+    async def _spool_body(
+        self, body: bytes, content_encoding: Optional[str], span_count: int
+    ) -> None:
+        """Keep a failed batch in the spool without blocking the loop."""
+        spool = self._spool
+        if spool is None:
+            return
+        stored = await asyncio.get_running_loop().run_in_executor(
+            None, spool.append, body, content_encoding
+        )
+        if stored:
+            safe_log(
+                self.tracer_instance,
+                "info",
+                "Spooled %d spans for replay",
+                span_count,
+                honeyhive_data={"spool_directory": spool.directory},
+            )
+
+    def _on_loop_thread(self) -> bool:
+        """Whether the caller is running on the export loop."""
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def _discard_pending(
+        self, future: "concurrent.futures.Future[SpanExportResult]"
+    ) -> None:
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def _track_in_flight(self, delta: int) -> None:
+        with self._stats_lock:
+            self._in_flight += delta
+            if self._in_flight > self._stats["max_observed_in_flight"]:
+                self._stats["max_observed_in_flight"] = self._in_flight
+
+    def _record_result(self, success: bool, span_count: int) -> None:
+        with self._stats_lock:
+            if success:
+                self._stats["exported_batches"] += 1
+                self._stats["exported_spans"] += span_count
+            else:
+                self._stats["failed_batches"] += 1
+
+
+class AsyncBatchSpanProcessor(SpanProcessor):
+    """Batch span processor that exports on an :class:`AsyncOTLPExporter` loop.
+
+    Unlike OpenTelemetry's ``BatchSpanProcessor``, which exports one batch at
+    a time from a worker thread, batches are dispatched as soon as they fill
+    up (or every ``schedule_delay_millis``) and run concurrently, bounded by
+    the exporter's ``max_in_flight``.
+    """
+
+    def __init__(
+        self,
+        exporter: AsyncOTLPExporter,
+        max_queue_size: int = 2048,
+        schedule_delay_millis: float = 5000,
+        max_export_batch_size: int = 512,
+        export_timeout_millis: float = 30000,
+        drop_policy: str = DROP_OLDEST,
+        max_export_batch_bytes: int = DEFAULT_MAX_EXPORT_BATCH_BYTES,
+    ) -> None:
+        """Initialize the processor and start its dispatch task.
+
+        Args:
+            exporter: Exporter whose loop runs the dispatch task
+            max_queue_size: Spans queued beyond this are dropped
+            schedule_delay_millis: Maximum delay before a partial batch is sent
+            max_export_batch_size: Maximum number of spans per request
+            export_timeout_millis: Default timeout for :meth:`force_flush`
+            drop_policy: "drop_oldest" or "drop_newest" when the queue is full
+            max_export_batch_bytes: Maximum estimated encoded bytes per
+                request (0 disables the byte limit)
+        """
+        self.exporter = exporter
+        self.max_queue_size = max(1, int(max_queue_size))
+        self.schedule_delay = max(0.0, schedule_delay_millis / 1000)
+        self.max_export_batch_size = max(
+            1, min(int(max_export_batch_size), self.max_queue_size)
+        )
+        self.max_export_batch_bytes = max(0, int(max_export_batch_bytes))
+        self.export_timeout_millis = export_timeout_millis
+        self.drop_policy = drop_policy if drop_policy in DROP_POLICIES else DROP_OLDEST
+
+        self._queue: Deque[ReadableSpan] = collections.deque()
+        self._queue_lock = threading.Lock()
+        self._dropped_spans = 0
+        self._is_shutdown = False
+        # Events bind to the loop on first use, so this is safe off-loop
+        self._wake = asyncio.Event()
+        self._tasks: Set["asyncio.Task[SpanExportResult]"] = set()
+        self._worker = asyncio.run_coroutine_threadsafe(self._run(), exporter.loop)
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        """No-op; spans are queued when they end."""
+
+    def on_end(self, span: ReadableSpan) -> None:
+        """Queue an ended span, waking the dispatcher when a batch is full."""
+        if self._is_shutdown or not span.context.trace_flags.sampled:
+            return
+        with self._queue_lock:
+            if len(self._queue) >= self.max_queue_size:
+                self._dropped_spans += 1
+                if self.drop_policy != DROP_OLDEST:
+                    return
+                self._queue.popleft()
+            self._queue.append(span)
+            full = len(self._queue) >= self.max_export_batch_size
+        if full:
+            self._wake_dispatcher()
+
+    def force_flush(self, timeout_millis: Optional[float] = None) -> bool:
+        """Export every queued span and wait for in-flight batches."""
+        if self._is_shutdown:
+            return True
+        timeout = (timeout_millis or self.export_timeout_millis) / 1000
+        if self.exporter._on_loop_thread():  # pylint: disable=protected-access
+            # Cannot block the loop we would be waiting on
+            self._wake_dispatcher()
+            return False
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._flush(), self.exporter.loop)
+            return bool(future.result(timeout))
+        except Exception:
+            return False
+
+    def shutdown(self) -> None:
+        """Flush queued spans, stop the dispatcher and shut down the exporter."""
+        if self._is_shutdown:
+            return
+        self.force_flush()
+        self._is_shutdown = True
+        self._wake_dispatcher()
+        try:
+            self._worker.result(timeout=1.0)
+        except Exception:
+            self._worker.cancel()
+        self.exporter.shutdown()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth and drop counters."""
+        with self._queue_lock:
+            return {
+                "queue_size": len(self._queue),
+                "max_queue_size": self.max_queue_size,
+                "dropped_spans": self._dropped_spans,
+                "in_flight_batches": len(self._tasks),
+            }
+
+    def _wake_dispatcher(self) -> None:
+        if not self.exporter.loop.is_closed():
+            self.exporter.loop.call_soon_threadsafe(self._wake.set)
+
+    def _take_batches(self) -> List[List[ReadableSpan]]:
+        """Pop everything queued, split into export-sized batches."""
+        with self._queue_lock:
+            spans = list(self._queue)
+            self._queue.clear()
+        return split_batches(
+            spans, self.max_export_batch_size, self.max_export_batch_bytes
+        )
+
+    def _dispatch(self) -> None:
+        """Start an export task per queued batch without awaiting them."""
+        for batch in self._take_batches():
+            task = asyncio.get_running_loop().create_task(
+                self.exporter.export_async(batch)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self) -> None:
+        """Dispatch loop: wake on a full batch or every schedule delay."""
+        while not self._is_shutdown:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.schedule_delay)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            self._dispatch()
+
+    async def _flush(self) -> bool:
+        """Dispatch queued spans and wait for every in-flight batch."""
+        self._dispatch()
+        if not self._tasks:
+            return True
+        results = await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        return all(result == SpanExportResult.SUCCESS for result in results)
@@ -0,0 +1,199 @@
+"""Circuit breaker for OTLP export requests.
+
+When the backend is down or slow, every export holds an export worker for up
+to the retry deadline. The queue then fills up and ``force_flush`` callers
+wait. :class:`ExportCircuitBreaker` stops sending once the backend is known
+to be failing:
+
+- ``closed``: exports are sent normally. After ``failure_threshold``
+  consecutive failed exports (error responses, connection errors or
+  timeouts) the circuit opens.
+- ``open``: exports skip the network. Depending on ``open_policy`` the batch
+  is written to the spool (``spool``, when one is configured) or dropped
+  (``drop``). Either way the export returns failure at once.
+- ``half_open``: ``reset_timeout`` seconds after opening, a single export
+  is let through as a probe while other exports are still short-circuited.
+  If the probe succeeds the circuit closes. If it fails the circuit opens
+  again for another ``reset_timeout``.
+"""
+
+# pylint: disable=too-many-instance-attributes
+# Justification: The breaker tracks its state plus a set of counters
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from ...utils.logger import safe_log
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+OPEN_POLICY_SPOOL = "spool"
+OPEN_POLICY_DROP = "drop"
+OPEN_POLICIES = (OPEN_POLICY_SPOOL, OPEN_POLICY_DROP)
+
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+DEFAULT_CIRCUIT_RESET_TIMEOUT = 30.0
+
+# Number of recent state transitions kept for get_stats()
+_TRANSITION_HISTORY = 20
+
+
+class ExportCircuitBreaker:
+    """Consecutive-failure circuit breaker with single-request probes.
+
+    One breaker is owned by each exporter and shared by all of its export
+    threads. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_CIRCUIT_RESET_TIMEOUT,
+        open_policy: str = OPEN_POLICY_SPOOL,
+        tracer_instance: Any = None,
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failed exports that open the
+                circuit (0 disables the breaker)
+            reset_timeout: Seconds the circuit stays open before a probe
+            open_policy: What to do with batches while open, ``spool`` or
+                ``drop``
+            tracer_instance: Optional tracer instance for logging context
+        """
+        self.failure_threshold = max(0, int(failure_threshold))
+        self.reset_timeout = max(0.0, float(reset_timeout))
+        self.open_policy = (
+            open_policy if open_policy in OPEN_POLICIES else OPEN_POLICY_SPOOL
+        )
+        self.tracer_instance = tracer_instance
+        self._lock = threading.Lock()
+        self._state = CIRCUIT_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._short_circuited_batches = 0
+        self._short_circuited_spans = 0
+        self._probes = 0
+        self._transitions: Deque[Dict[str, Any]] = deque(maxlen=_TRANSITION_HISTORY)
+        self._transition_counts: Dict[str, int] = {
+            CIRCUIT_OPEN: 0,
+            CIRCUIT_HALF_OPEN: 0,
+            CIRCUIT_CLOSED: 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the breaker can open at all."""
+        return self.failure_threshold > 0
+
+    @property
+    def state(self) -> str:
+        """Current state: ``closed``, ``open`` or ``half_open``."""
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Decide whether an export may use the network.
+
+        Moves an open circuit to half-open once ``reset_timeout`` has
+        passed; the caller that gets True in that case is the probe.
+
+        Returns:
+            True to send the export, False to short-circuit it
+        """
+        if not self.enabled:
+            return True
+        with self._lock:
+            if self._state == CIRCUIT_CLOSED:
+                return True
+            if self._probe_in_flight:
+                return False
+            if (
+                self._state == CIRCUIT_OPEN
+                and time.monotonic() - self._opened_at < self.reset_timeout
+            ):
+                return False
+            if self._state == CIRCUIT_OPEN:
+                self._transition(CIRCUIT_HALF_OPEN)
+            self._probe_in_flight = True
+            self._probes += 1
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful export, closing a half-open circuit."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+            if self._state != CIRCUIT_CLOSED:
+                self._transition(CIRCUIT_CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed export, opening the circuit when warranted."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == CIRCUIT_HALF_OPEN:
+                self._probe_in_flight = False
+                self._opened_at = time.monotonic()
+                self._transition(CIRCUIT_OPEN)
+            elif (
+                self._state == CIRCUIT_CLOSED
+                and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self._transition(CIRCUIT_OPEN)
+
+    def record_short_circuit(self, span_count: int) -> None:
+        """Count a batch that was not sent because the circuit is open."""
+        with self._lock:
+            self._short_circuited_batches += 1
+            self._short_circuited_spans += span_count
+
+    def _transition(self, state: str) -> None:
+        """Change state and log it (caller holds the lock)."""
+        previous, self._state = self._state, state
+        self._transition_counts[state] += 1
+        self._transitions.append({"from": previous, "to": state, "at": time.time()})
+        safe_log(
+            self.tracer_instance,
+            "info" if state == CIRCUIT_CLOSED else "warning",
+            "OTLP export circuit %s -> %s",
+            previous,
+            state,
+            honeyhive_data={
+                "consecutive_failures": self._consecutive_failures,
+                "reset_timeout": self.reset_timeout,
+                "open_policy": self.open_policy,
+            },
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the current state, counters and recent transitions."""
+        with self._lock:
+            probe_in: Optional[float] = None
+            if self._state == CIRCUIT_OPEN:
+                elapsed = time.monotonic() - self._opened_at
+                probe_in = round(max(0.0, self.reset_timeout - elapsed), 3)
+            return {
+                "enabled": self.enabled,
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout": self.reset_timeout,
+                "open_policy": self.open_policy,
+                "probe_in": probe_in,
+                "probes": self._probes,
+                "short_circuited_batches": self._short_circuited_batches,
+                "short_circuited_spans": self._short_circuited_spans,
+                "transition_counts": dict(self._transition_counts),
+                "recent_transitions": list(self._transitions),
+            }
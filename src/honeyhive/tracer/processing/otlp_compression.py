@@ -0,0 +1,159 @@
+"""Payload compression for OTLP HTTP exports.
+
+LLM spans carry large prompt/completion strings, so export payloads compress
+very well. This module encodes serialized OTLP request bodies with the HTTP
+``Content-Encoding`` selected by configuration:
+
+- ``gzip`` (default): always available via the standard library
+- ``zstd``: faster and smaller, requires the optional ``zstandard`` package
+  (``pip install honeyhive[zstd]``); falls back to gzip when missing
+- ``none``: send the body uncompressed
+
+Bodies smaller than the configured threshold are sent uncompressed because the
+encoding overhead outweighs the savings for tiny batches.
+"""
+
+import gzip
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from ...utils.logger import safe_log
+
+try:
+    import zstandard  # type: ignore[import-not-found]
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+COMPRESSION_NONE = "none"
+SUPPORTED_COMPRESSIONS = (COMPRESSION_GZIP, COMPRESSION_ZSTD, COMPRESSION_NONE)
+
+DEFAULT_COMPRESSION = COMPRESSION_GZIP
+DEFAULT_COMPRESSION_MIN_BYTES = 1024
+
+# Level 6 is zlib's default speed/ratio trade-off; zstd level 3 is its default.
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+
+# zstd compressors are not thread-safe, so keep one per export thread
+_zstd_local = threading.local()
+
+
+def resolve_compression(
+    compression: Optional[str], tracer_instance: Optional[Any] = None
+) -> str:
+    """Normalize a configured compression name to a supported encoding.
+
+    Args:
+        compression: Requested encoding (case-insensitive). ``None`` selects
+            the default (gzip).
+        tracer_instance: Optional tracer instance for logging context
+
+    Returns:
+        One of ``"gzip"``, ``"zstd"`` or ``"none"``
+    """
+    if compression is None:
+        return DEFAULT_COMPRESSION
+
+    name = str(compression).strip().lower()
+    if name in ("", "identity", "off", "false"):
+        return COMPRESSION_NONE
+    if name not in SUPPORTED_COMPRESSIONS:
+        safe_log(
+            tracer_instance,
+            "warning",
+            f"Unsupported OTLP compression '{compression}', using gzip",
+            honeyhive_data={"supported": list(SUPPORTED_COMPRESSIONS)},
+        )
+        return DEFAULT_COMPRESSION
+    if name == COMPRESSION_ZSTD and not ZSTD_AVAILABLE:
+        safe_log(
+            tracer_instance,
+            "warning",
+            "zstd compression requested but 'zstandard' is not installed, "
+            "using gzip (install with: pip install honeyhive[zstd])",
+        )
+        return DEFAULT_COMPRESSION
+    return name
+
+
+def compress_payload(
+    data: bytes, compression: str, min_bytes: int = DEFAULT_COMPRESSION_MIN_BYTES
+) -> Tuple[bytes, Optional[str]]:
+    """Compress an encoded request body.
+
+    Args:
+        data: Serialized request body
+        compression: Resolved encoding from :func:`resolve_compression`
+        min_bytes: Bodies smaller than this are returned unchanged
+
+    Returns:
+        Tuple of (body to send, ``Content-Encoding`` value or None when the
+        body was left uncompressed)
+    """
+    if compression == COMPRESSION_NONE or len(data) < min_bytes:
+        return data, None
+    if compression == COMPRESSION_ZSTD:
+        compressor = getattr(_zstd_local, "compressor", None)
+        if compressor is None:
+            compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+            _zstd_local.compressor = compressor
+        return compressor.compress(data), COMPRESSION_ZSTD
+    return gzip.compress(data, compresslevel=_GZIP_LEVEL), COMPRESSION_GZIP
+
+
+class CompressionStats:
+    """Thread-safe byte counters for compressed OTLP exports.
+
+    Tracks raw (serialized) versus on-the-wire byte totals so operators can
+    see the effective compression ratio via ``get_session_stats()``.
+    """
+
+    def __init__(self, compression: str, min_bytes: int) -> None:
+        """Initialize empty counters.
+
+        Args:
+            compression: Resolved encoding in use
+            min_bytes: Minimum body size that gets compressed
+        """
+        self.compression = compression
+        self.min_bytes = min_bytes
+        self._lock = threading.Lock()
+        self._raw_bytes = 0
+        self._sent_bytes = 0
+        self._compressed_requests = 0
+        self._uncompressed_requests = 0
+
+    def record(self, raw_size: int, sent_size: int, compressed: bool) -> None:
+        """Record one request body.
+
+        Args:
+            raw_size: Size of the serialized body before compression
+            sent_size: Size of the body actually sent
+            compressed: Whether a ``Content-Encoding`` was applied
+        """
+        with self._lock:
+            self._raw_bytes += raw_size
+            self._sent_bytes += sent_size
+            if compressed:
+                self._compressed_requests += 1
+            else:
+                self._uncompressed_requests += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a snapshot of the counters."""
+        with self._lock:
+            raw, sent = self._raw_bytes, self._sent_bytes
+            return {
+                "compression": self.compression,
+                "min_bytes": self.min_bytes,
+                "raw_bytes": raw,
+                "sent_bytes": sent,
+                "compressed_requests": self._compressed_requests,
+                "uncompressed_requests": self._uncompressed_requests,
+                "compression_ratio": round(sent / raw, 4) if raw else None,
+            }
@@ -5,7 +5,16 @@ wrapper around the standard OpenTelemetry OTLP exporter that includes:
 
 - Optimized HTTP session with connection pooling for better performance
 - Enhanced retry strategies for reliable span delivery
+- Streaming OTLP JSON serialization with cached resource/scope blocks
+- gzip/zstd payload compression with raw vs. sent byte counters
+- Retries with decorrelated jitter, Retry-After, a per-batch deadline and a
+  shared retry budget
+- Optional on-disk spool that keeps failed batches and replays them later
+- Circuit breaker that stops sending while the backend keeps failing
+- Batches rejected with HTTP 413 are bisected and retried as halves
 - Session statistics and monitoring capabilities
+- Serialization, request size and HTTP latency histograms in the tracer's
+  pipeline metrics
 - Graceful fallback to standard sessions if optimization fails
 
 All span processing should be completed by the HoneyHiveSpanProcessor before
@@ -14,11 +23,13 @@ spans reach this exporter, as ReadableSpan objects are immutable.
 
 import json
 import math
+import time
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
 
 import requests
 
 # Third-party imports
+from opentelemetry.exporter.otlp.proto.http import Compression
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
@@ -26,12 +37,56 @@ from opentelemetry.trace import StatusCode
 
 # Local imports
 from ...utils.logger import safe_log
+from .attribute_aliases import ALIAS_MODE_SPAN, resolve_alias_mode, with_aliases
+from .otlp_circuit import (
+    CIRCUIT_OPEN,
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+    DEFAULT_CIRCUIT_RESET_TIMEOUT,
+    OPEN_POLICY_SPOOL,
+    ExportCircuitBreaker,
+)
+from .otlp_compression import (
+    COMPRESSION_NONE,
+    DEFAULT_COMPRESSION_MIN_BYTES,
+    CompressionStats,
+    compress_payload,
+    resolve_compression,
+)
+from .otlp_json_serializer import OTLPJSONSerializer, group_by_resource
+from .otlp_retry import (
+    DEFAULT_RETRY_BASE_DELAY,
+    DEFAULT_RETRY_BUDGET_RATIO,
+    DEFAULT_RETRY_DEADLINE,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    DEFAULT_RETRY_MAX_DELAY,
+    ExportRetryPolicy,
+)
 from .otlp_session import (
     OTLPSessionConfig,
     create_optimized_otlp_session,
     get_default_otlp_config,
     get_session_stats,
 )
+from .otlp_spool import (
+    DEFAULT_SPOOL_MAX_AGE_SECONDS,
+    DEFAULT_SPOOL_MAX_BYTES,
+    ExportSpool,
+    SpoolReplayer,
+    is_retryable_status,
+)
+from .pipeline_metrics import (
+    BYTE_BUCKETS,
+    LATENCY_BUCKETS,
+    PipelineMetrics,
+    pipeline_metrics_for,
+)
+from .structured_attributes import (
+    expand_structured_attributes,
+    with_structured_values,
+)
+
+# Status returned when a request body exceeds the server's size limit
+HTTP_PAYLOAD_TOO_LARGE = 413
 
 
 class OTLPJSONExporter(SpanExporter):
@@ -40,7 +95,16 @@ class OTLPJSONExporter(SpanExporter):
     This exporter serializes spans to OTLP JSON format and sends them via HTTP POST
     with Content-Type: application/json. It implements the SpanExporter interface
     and can be used as a drop-in replacement for OTLPSpanExporter when JSON format
-    is required.
+    is required. Bodies of at least ``compression_min_bytes`` are compressed with
+    the configured ``Content-Encoding`` (gzip by default).
+
+    When an :class:`ExportRetryPolicy` is provided, connection errors and
+    retryable statuses (408, 429, 5xx) are retried with jittered backoff
+    first. When a :class:`ExportSpool` is provided, batches that still fail
+    are written to it and replayed in the background once exports succeed
+    again. A batch of
+    more than one span rejected with HTTP 413 is split in half and each half
+    is exported separately.
     """
 
     def __init__(
@@ -51,6 +115,12 @@ class OTLPJSONExporter(SpanExporter):
         session: Optional[requests.Session] = None,
         timeout: Optional[float] = None,
         tracer_instance: Any = None,
+        compression: Optional[str] = None,
+        compression_min_bytes: int = DEFAULT_COMPRESSION_MIN_BYTES,
+        spool: Optional[ExportSpool] = None,
+        attribute_aliases: Optional[str] = None,
+        retry_policy: Optional[ExportRetryPolicy] = None,
+        metrics: Optional[PipelineMetrics] = None,
     ) -> None:
         """Initialize the OTLP JSON exporter.
 
@@ -61,6 +131,18 @@ class OTLPJSONExporter(SpanExporter):
             session: Optional requests.Session to use for HTTP requests
             timeout: Optional timeout in seconds for HTTP requests
             tracer_instance: Optional tracer instance for logging context
+            compression: Request body encoding - "gzip" (default when None),
+                "zstd" (requires the ``zstandard`` package) or "none"
+            compression_min_bytes: Bodies smaller than this are sent
+                uncompressed
+            spool: Optional on-disk spool for failed batches. The exporter
+                opens it, replays it in the background and closes it on
+                shutdown.
+            attribute_aliases: Where compatibility aliases left off spans
+                are written: "span" (default), "export" or "resource"
+            retry_policy: Optional retry policy for export requests; without
+                one each batch is sent once
+            metrics: Pipeline metrics registry; defaults to the tracer's
         """
         self.endpoint = endpoint.rstrip("/")
         # Copy headers to avoid modifying the original dict
@@ -71,9 +153,41 @@ class OTLPJSONExporter(SpanExporter):
         self.timeout = timeout
         self.tracer_instance = tracer_instance
         self._is_shutdown = False
+        self.compression = resolve_compression(compression, tracer_instance)
+        self.compression_min_bytes = max(0, int(compression_min_bytes))
+        self._retry_policy = retry_policy
+        self._compression_stats = CompressionStats(
+            self.compression, self.compression_min_bytes
+        )
+        if metrics is None:
+            metrics = pipeline_metrics_for(tracer_instance)
+        self._serialize_seconds = metrics.histogram(
+            "exporter.serialize_seconds", LATENCY_BUCKETS
+        )
+        self._request_bytes = metrics.histogram("exporter.request_bytes", BYTE_BUCKETS)
+        self._http_seconds = metrics.histogram("exporter.http_seconds", LATENCY_BUCKETS)
+        self._responses = {
+            status_class: metrics.counter(f"exporter.responses_{status_class}xx")
+            for status_class in (2, 3, 4, 5)
+        }
+        self._request_errors = metrics.counter("exporter.request_errors")
+        # Caches encoded resource/scope blocks across batches
+        self._serializer = OTLPJSONSerializer(
+            alias_mode=resolve_alias_mode(attribute_aliases, tracer_instance)
+        )
+        self._spool: Optional[ExportSpool] = None
+        self._spool_replayer: Optional[SpoolReplayer] = None
+        if spool is not None and spool.open():
+            self._spool = spool
+            self._spool_replayer = SpoolReplayer(
+                spool, self._post_body, tracer_instance=tracer_instance
+            )
+            self._spool_replayer.start()
 
         # Always set Content-Type header for JSON (override any existing value)
         self.headers["Content-Type"] = "application/json"
+        # Content-Encoding is decided per request from the body size
+        self.headers.pop("Content-Encoding", None)
 
         safe_log(
             tracer_instance,
@@ -82,6 +196,11 @@ class OTLPJSONExporter(SpanExporter):
             honeyhive_data={
                 "endpoint": self.endpoint,
                 "content_type": self.headers.get("Content-Type"),
+                "compression": self.compression,
+                "compression_min_bytes": self.compression_min_bytes,
+                "orjson": self._serializer.uses_orjson,
+                "attribute_aliases": self._serializer.alias_mode,
+                "spool_directory": self._spool.directory if self._spool else None,
                 "has_session": self.session is not None,
             },
         )
@@ -118,9 +237,11 @@ class OTLPJSONExporter(SpanExporter):
             return {
                 "arrayValue": {"values": [cls._to_otlp_any_value(v) for v in value]}
             }
-        # TODO: serialize JSON to kvlist_value here so it doesnt fall through
-        # to stringValue:
-        # https://opentelemetry.io/docs/specs/otel/common/attribute-type-mapping/#associative-arrays-with-unique-keys
+        if isinstance(value, Mapping):
+            # https://opentelemetry.io/docs/specs/otel/common/attribute-type-mapping/#associative-arrays-with-unique-keys
+            return {"kvlistValue": {"values": cls._to_otlp_key_values(value)}}
+        if value is None:
+            return {}
         return {"stringValue": str(value)}
 
     @classmethod
@@ -153,7 +274,9 @@ class OTLPJSONExporter(SpanExporter):
 
         # Preserve native Python types so the backend gets int/float/bool/etc.
         # rather than stringified scalars.
-        attributes = self._to_otlp_key_values(span.attributes)
+        attributes = self._to_otlp_key_values(
+            expand_structured_attributes(span.attributes or {})
+        )
 
         # Convert events
         events = []
@@ -208,22 +331,36 @@ class OTLPJSONExporter(SpanExporter):
     ) -> Dict[str, Any]:
         """Convert spans to OTLP JSON payload format.
 
+        This is the reference dict representation of the request body; export()
+        uses :class:`OTLPJSONSerializer`, which produces the same JSON without
+        building the intermediate dicts.
+
         Groups spans by their instrumentation scope so the ingestion pipeline
         can correctly identify the instrumentor for each span. Previously all
         spans were placed under a single scope (the first span's), which caused
         misclassification when spans from different instrumentors (e.g.
         pydantic-ai and httpx) were batched together.
 
+        Spans from different resources (tracers sharing an export pipeline)
+        get one ``resourceSpans`` entry per resource.
+
         Args:
             spans: Sequence of ReadableSpan objects
 
         Returns:
             Dictionary in OTLP JSON format ready for HTTP POST
         """
-        if not spans:
-            return {"resourceSpans": []}
+        return {
+            "resourceSpans": [
+                self._resource_spans_to_otlp_json(resource_spans)
+                for resource_spans in (group_by_resource(spans) if spans else [])
+            ]
+        }
 
-        # Use first span's resource (all spans share the same TracerProvider resource)
+    def _resource_spans_to_otlp_json(
+        self, spans: Sequence[ReadableSpan]
+    ) -> Dict[str, Any]:
+        """Build one ``resourceSpans`` entry for spans sharing a resource."""
         first_span = spans[0]
         resource_attrs: List[Dict[str, Any]] = []
         if first_span.resource and first_span.resource.attributes:
@@ -252,13 +389,11 @@ class OTLPJSONExporter(SpanExporter):
                 }
             scope_groups[scope_key]["spans"].append(self._span_to_otlp_json(span))
 
-        resource_span = {
+        return {
             "resource": {"attributes": resource_attrs} if resource_attrs else {},
             "scopeSpans": list(scope_groups.values()),
         }
 
-        return {"resourceSpans": [resource_span]}
-
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
         """Export spans to HoneyHive via OTLP JSON format.
 
@@ -279,32 +414,39 @@ class OTLPJSONExporter(SpanExporter):
         if not spans:
             return SpanExportResult.SUCCESS
 
+        body: Optional[bytes] = None
+        content_encoding: Optional[str] = None
         try:
-            # Convert spans to OTLP JSON format
-            payload = self._spans_to_otlp_json_payload(spans)
-            json_data = json.dumps(payload)
+            # Encode spans straight to an OTLP JSON request body
+            start = time.perf_counter()
+            raw_body = self._serializer.serialize(spans)
+            body, content_encoding = compress_payload(
+                raw_body, self.compression, self.compression_min_bytes
+            )
+            self._serialize_seconds.record(time.perf_counter() - start)
+            self._request_bytes.record(len(body))
 
-            # Log the JSON payload for debugging
+            # Log the JSON payload for debugging; the pretty-printed copy is
+            # only rendered when debug logging is enabled
             safe_log(
                 self.tracer_instance,
                 "debug",
-                f"Exporting {len(spans)} spans via OTLP JSON",
-                honeyhive_data={
+                "Exporting %d spans via OTLP JSON",
+                len(spans),
+                honeyhive_data=lambda: {
                     "span_count": len(spans),
                     "endpoint": self.endpoint,
-                    "payload_size_bytes": len(json_data),
-                    "json_payload": json.dumps(
-                        payload, indent=2
-                    ),  # Pretty-printed for debugging
+                    "payload_size_bytes": len(raw_body),
+                    "sent_size_bytes": len(body),
+                    "content_encoding": content_encoding,
+                    "json_payload": json.dumps(json.loads(raw_body), indent=2),
                 },
             )
 
-            # Send HTTP POST request
-            response = self.session.post(
-                self.endpoint,
-                data=json_data,
-                headers=self.headers,
-                timeout=self.timeout,
+            # Send HTTP POST request, retrying transient failures
+            response = self._send(body, content_encoding)
+            self._compression_stats.record(
+                len(raw_body), len(body), content_encoding is not None
             )
 
             # Check response status
@@ -318,8 +460,14 @@ class OTLPJSONExporter(SpanExporter):
                         "status_code": response.status_code,
                     },
                 )
+                if self._spool_replayer is not None:
+                    # The backend is reachable again: drain the spool now
+                    self._spool_replayer.notify()
                 return SpanExportResult.SUCCESS
 
+            if response.status_code == HTTP_PAYLOAD_TOO_LARGE and len(spans) > 1:
+                return self._export_halves(spans, len(body))
+
             safe_log(
                 self.tracer_instance,
                 "error",
@@ -330,6 +478,8 @@ class OTLPJSONExporter(SpanExporter):
                     "span_count": len(spans),
                 },
             )
+            if is_retryable_status(response.status_code):
+                self._spool_body(body, content_encoding, len(spans))
             return SpanExportResult.FAILURE
 
         except Exception as e:
@@ -342,21 +492,187 @@ class OTLPJSONExporter(SpanExporter):
                     "span_count": len(spans),
                 },
             )
+            if body is not None:
+                self._spool_body(body, content_encoding, len(spans))
             return SpanExportResult.FAILURE
 
+    def _export_halves(
+        self, spans: Sequence[ReadableSpan], sent_bytes: int
+    ) -> SpanExportResult:
+        """Export both halves of a batch the server rejected as too large."""
+        safe_log(
+            self.tracer_instance,
+            "warning",
+            "OTLP payload too large (%d spans, %d bytes), splitting batch",
+            len(spans),
+            sent_bytes,
+        )
+        middle = len(spans) // 2
+        results = [self.export(spans[:middle]), self.export(spans[middle:])]
+        if all(result == SpanExportResult.SUCCESS for result in results):
+            return SpanExportResult.SUCCESS
+        return SpanExportResult.FAILURE
+
+    def _send(self, body: bytes, content_encoding: Optional[str]) -> Any:
+        """POST a request body, through the retry policy when configured."""
+        if self._retry_policy is None:
+            return self._post(body, content_encoding)
+        return self._retry_policy.call(
+            lambda timeout: self._post(body, content_encoding, timeout),
+            self.timeout,
+        )
+
+    def _post(
+        self,
+        body: bytes,
+        content_encoding: Optional[str],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """POST an encoded request body to the endpoint."""
+        headers = self.headers
+        if content_encoding:
+            headers = {**self.headers, "Content-Encoding": content_encoding}
+        start = time.perf_counter()
+        try:
+            response = self.session.post(
+                self.endpoint,
+                data=body,
+                headers=headers,
+                timeout=self.timeout if timeout is None else timeout,
+            )
+        except Exception:
+            self._request_errors.add()
+            raise
+        finally:
+            self._http_seconds.record(time.perf_counter() - start)
+        status_code = getattr(response, "status_code", None)
+        if isinstance(status_code, int) and status_code // 100 in self._responses:
+            self._responses[status_code // 100].add()
+        return response
+
+    def _post_body(self, body: bytes, content_encoding: Optional[str]) -> int:
+        """POST a spooled request body and return the HTTP status code."""
+        if self._is_shutdown:
+            raise RuntimeError("exporter is shut down")
+        return int(self._post(body, content_encoding).status_code)
+
+    def _spool_body(
+        self, body: bytes, content_encoding: Optional[str], span_count: int
+    ) -> None:
+        """Keep a failed batch in the spool for background replay."""
+        if self._spool is None:
+            return
+        if self._spool.append(body, content_encoding):
+            safe_log(
+                self.tracer_instance,
+                "info",
+                "Spooled %d spans for replay",
+                span_count,
+                honeyhive_data={"spool_directory": self._spool.directory},
+            )
+
+    def spool_spans(self, spans: Sequence[ReadableSpan]) -> bool:
+        """Encode spans and write them to the spool without sending them.
+
+        Used while the exporter's circuit breaker is open.
+
+        Returns:
+            True if the batch was spooled
+        """
+        if self._spool is None or self._is_shutdown or not spans:
+            return False
+        try:
+            body, content_encoding = compress_payload(
+                self._serializer.serialize(spans),
+                self.compression,
+                self.compression_min_bytes,
+            )
+            return self._spool.append(body, content_encoding)
+        except Exception as e:
+            safe_log(
+                self.tracer_instance,
+                "warning",
+                f"Failed to spool OTLP batch: {e}",
+                honeyhive_data={"error_type": type(e).__name__},
+            )
+            return False
+
+    def replay_spool(self, timeout: float) -> bool:
+        """Send spooled batches now, on the calling thread.
+
+        Used at the end of a serverless invocation, when the background
+        replayer may not get to run before the process is frozen.
+
+        Args:
+            timeout: Seconds available; each request is capped at the time left
+
+        Returns:
+            True if the spool is empty afterwards
+        """
+        if self._spool is None or self._is_shutdown:
+            return self._spool is None
+        deadline = time.monotonic() + timeout
+
+        def send(body: bytes, content_encoding: Optional[str]) -> int:
+            remaining = max(0.001, deadline - time.monotonic())
+            request_timeout = (
+                remaining if self.timeout is None else min(self.timeout, remaining)
+            )
+            return int(self._post(body, content_encoding, request_timeout).status_code)
+
+        return self._spool.replay(send, deadline=deadline)
+
+    def get_spool_stats(self) -> Optional[Dict[str, Any]]:
+        """Get spool counters, or None when no spool is configured."""
+        if self._spool is None:
+            return None
+        return self._spool.get_stats()
+
     def force_flush(self, timeout_millis: int = 30000) -> bool:
         """Force flush any buffered spans (no-op for this exporter)."""
         return True
 
+    def get_retry_stats(self) -> Optional[Dict[str, Any]]:
+        """Get retry counters, or None when no retry policy is configured."""
+        if self._retry_policy is None:
+            return None
+        return self._retry_policy.get_stats()
+
+    def get_compression_stats(self) -> Dict[str, Any]:
+        """Get raw vs. sent byte counters for exported request bodies.
+
+        Returns:
+            Dictionary with the encoding in use, byte totals and the
+            effective compression ratio (sent / raw)
+        """
+        return self._compression_stats.to_dict()
+
     def shutdown(self) -> None:
         """Shutdown the exporter."""
         if self._is_shutdown:
             return
         self._is_shutdown = True
+        if self._retry_policy is not None:
+            self._retry_policy.cancel()
+        # Unsent batches stay on disk and are replayed by the next process
+        if self._spool_replayer is not None:
+            self._spool_replayer.stop(timeout=1.0)
+        if self._spool is not None:
+            self._spool.close()
         if self.session and self._owns_session:
             self.session.close()
 
 
+def _to_otel_compression(compression: str) -> Compression:
+    """Map a resolved compression name to the Protobuf exporter's enum.
+
+    The OpenTelemetry HTTP exporter has no zstd support, so zstd maps to gzip.
+    """
+    if compression == COMPRESSION_NONE:
+        return Compression.NoCompression
+    return Compression.Gzip
+
+
 class HoneyHiveOTLPExporter(SpanExporter):
     """HoneyHive OTLP exporter with optimized connection pooling.
 
@@ -367,7 +683,12 @@ class HoneyHiveOTLPExporter(SpanExporter):
 
     Features:
     - Optimized HTTP session with connection pooling
-    - Enhanced retry strategies for reliable span delivery
+    - Export retries with decorrelated jitter, Retry-After, a per-batch
+      deadline and a shared retry budget (JSON)
+    - gzip/zstd request compression (JSON) or gzip (Protobuf)
+    - Optional on-disk spool with background replay for failed batches (JSON)
+    - Circuit breaker that spools or drops batches while the backend keeps
+      failing, probing it with single requests
     - Session statistics and monitoring capabilities
     - Graceful fallback to standard sessions if optimization fails
     """
@@ -389,7 +710,22 @@ class HoneyHiveOTLPExporter(SpanExporter):
             protocol: OTLP protocol format
                 - "http/json" (default) or "http/protobuf"
             **kwargs: Arguments passed to underlying OTLPSpanExporter or
-                OTLPJSONExporter
+                OTLPJSONExporter. ``compression`` ("gzip", "zstd" or "none") and
+                ``compression_min_bytes`` control request body encoding; the
+                Protobuf exporter only supports gzip and ignores the threshold.
+                ``spool_dir`` enables the on-disk spool for failed batches
+                (JSON only), capped by ``spool_max_bytes`` and
+                ``spool_max_age_seconds``. ``attribute_aliases`` selects where
+                compatibility aliases left off spans are written; Protobuf
+                export restores them on each span. ``retry_max_attempts``,
+                ``retry_base_delay``, ``retry_max_delay``, ``retry_deadline``
+                and ``retry_budget_ratio`` configure export retries (JSON);
+                the Protobuf exporter keeps OpenTelemetry's own retry loop.
+                ``circuit_failure_threshold`` (0 disables the breaker),
+                ``circuit_reset_timeout`` and ``circuit_open_policy``
+                (``spool`` or ``drop``) configure the circuit breaker.
+                ``metrics`` is the pipeline metrics registry to record into
+                (defaults to the tracer's).
         """
         self.tracer_instance = tracer_instance
         self.session_config = session_config or get_default_otlp_config(tracer_instance)
@@ -401,6 +737,43 @@ class HoneyHiveOTLPExporter(SpanExporter):
         self._is_shutdown = False
         self._use_json = self.protocol == "http/json"
         self._otlp_exporter: Union[OTLPSpanExporter, OTLPJSONExporter]
+        # Same object as _otlp_exporter for http/json; spool, retry and
+        # compression stats exist only there
+        self._json_exporter: Optional[OTLPJSONExporter] = None
+        compression = kwargs.pop("compression", None)
+        compression_min_bytes = kwargs.pop(
+            "compression_min_bytes", DEFAULT_COMPRESSION_MIN_BYTES
+        )
+        spool_dir = kwargs.pop("spool_dir", None)
+        spool_max_bytes = kwargs.pop("spool_max_bytes", DEFAULT_SPOOL_MAX_BYTES)
+        spool_max_age_seconds = kwargs.pop(
+            "spool_max_age_seconds", DEFAULT_SPOOL_MAX_AGE_SECONDS
+        )
+        self.attribute_aliases = resolve_alias_mode(
+            kwargs.pop("attribute_aliases", None), tracer_instance
+        )
+        retry_policy = ExportRetryPolicy(
+            max_attempts=kwargs.pop("retry_max_attempts", DEFAULT_RETRY_MAX_ATTEMPTS),
+            base_delay=kwargs.pop("retry_base_delay", DEFAULT_RETRY_BASE_DELAY),
+            max_delay=kwargs.pop("retry_max_delay", DEFAULT_RETRY_MAX_DELAY),
+            deadline=kwargs.pop("retry_deadline", DEFAULT_RETRY_DEADLINE),
+            budget_ratio=kwargs.pop("retry_budget_ratio", DEFAULT_RETRY_BUDGET_RATIO),
+            tracer_instance=tracer_instance,
+        )
+        metrics = kwargs.pop("metrics", None)
+        self._metrics = (
+            metrics if metrics is not None else pipeline_metrics_for(tracer_instance)
+        )
+        self._circuit = ExportCircuitBreaker(
+            failure_threshold=kwargs.pop(
+                "circuit_failure_threshold", DEFAULT_CIRCUIT_FAILURE_THRESHOLD
+            ),
+            reset_timeout=kwargs.pop(
+                "circuit_reset_timeout", DEFAULT_CIRCUIT_RESET_TIMEOUT
+            ),
+            open_policy=kwargs.pop("circuit_open_policy", OPEN_POLICY_SPOOL),
+            tracer_instance=tracer_instance,
+        )
 
         # Create optimized session if requested and not already provided
         if use_optimized_session and "session" not in kwargs:
@@ -438,13 +811,29 @@ class HoneyHiveOTLPExporter(SpanExporter):
                 raise ValueError("endpoint is required for OTLP exporter")
             headers = kwargs.get("headers", {})
             timeout = kwargs.get("timeout")
-            self._otlp_exporter = OTLPJSONExporter(
+            self._json_exporter = OTLPJSONExporter(
                 endpoint=endpoint,
                 headers=headers,
                 session=self._session,
                 timeout=timeout,
                 tracer_instance=tracer_instance,
+                compression=compression,
+                compression_min_bytes=compression_min_bytes,
+                attribute_aliases=self.attribute_aliases,
+                retry_policy=retry_policy,
+                metrics=self._metrics,
+                spool=(
+                    ExportSpool(
+                        spool_dir,
+                        max_bytes=spool_max_bytes,
+                        max_age_seconds=spool_max_age_seconds,
+                        tracer_instance=tracer_instance,
+                    )
+                    if spool_dir
+                    else None
+                ),
             )
+            self._otlp_exporter = self._json_exporter
             safe_log(
                 tracer_instance,
                 "info",
@@ -453,7 +842,19 @@ class HoneyHiveOTLPExporter(SpanExporter):
             )
         else:
             # Use standard Protobuf exporter
+            if spool_dir:
+                safe_log(
+                    tracer_instance,
+                    "warning",
+                    "OTLP spool is only supported with the http/json protocol",
+                    honeyhive_data={"protocol": self.protocol},
+                )
+            if compression is not None:
+                kwargs["compression"] = _to_otel_compression(
+                    resolve_compression(compression, tracer_instance)
+                )
             self._otlp_exporter = OTLPSpanExporter(**kwargs)
+        self._metrics.register_gauge("exporter", self.get_session_stats)
 
         # Log initialization details
         session_type = (
@@ -491,6 +892,9 @@ class HoneyHiveOTLPExporter(SpanExporter):
             )
             return SpanExportResult.FAILURE
 
+        if not self._circuit.allow_request():
+            return self._short_circuit(spans)
+
         safe_log(
             self.tracer_instance,
             "debug",
@@ -498,10 +902,17 @@ class HoneyHiveOTLPExporter(SpanExporter):
             honeyhive_data={"span_count": len(spans)},
         )
 
+        result = SpanExportResult.FAILURE
         try:
             # All span processing completed by HoneyHiveSpanProcessor
             # This exporter simply passes the spans to the underlying OTLP exporter
-            return self._otlp_exporter.export(spans)
+            if not self._use_json:
+                # The Protobuf encoder cannot add attributes while encoding,
+                # but maps decoded structured values to kvlist/array values
+                spans = [with_structured_values(span) for span in spans]
+                if self.attribute_aliases != ALIAS_MODE_SPAN:
+                    spans = [with_aliases(span) for span in spans]
+            result = self._otlp_exporter.export(spans)
 
         except Exception as e:
             safe_log(
@@ -510,7 +921,66 @@ class HoneyHiveOTLPExporter(SpanExporter):
                 f"Error in OTLP export: {e}",
                 honeyhive_data={"error_type": type(e).__name__},
             )
-            return SpanExportResult.FAILURE
+
+        if result == SpanExportResult.SUCCESS:
+            self._circuit.record_success()
+        else:
+            self._circuit.record_failure()
+        return result
+
+    def _short_circuit(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """Spool or drop a batch without sending it (circuit open)."""
+        self._circuit.record_short_circuit(len(spans))
+        spooled = (
+            self._json_exporter is not None
+            and self._circuit.open_policy == OPEN_POLICY_SPOOL
+            and self._json_exporter.spool_spans(spans)
+        )
+        safe_log(
+            self.tracer_instance,
+            "debug",
+            "OTLP export circuit open, %s %d spans",
+            "spooled" if spooled else "dropped",
+            len(spans),
+            honeyhive_data={"circuit_state": self._circuit.state},
+        )
+        return SpanExportResult.FAILURE
+
+    def get_circuit_stats(self) -> Dict[str, Any]:
+        """Get circuit breaker state, counters and recent transitions."""
+        return self._circuit.get_stats()
+
+    def spool_spans(self, spans: Sequence[ReadableSpan]) -> bool:
+        """Write spans to the spool without sending them.
+
+        Returns:
+            True if the batch was spooled (JSON export with a spool only)
+        """
+        if self._json_exporter is None or self._is_shutdown:
+            return False
+        return self._json_exporter.spool_spans(spans)
+
+    def get_spool_stats(self) -> Optional[Dict[str, Any]]:
+        """Get spool counters, or None when no spool is configured."""
+        if self._json_exporter is None:
+            return None
+        return self._json_exporter.get_spool_stats()
+
+    def replay_spool(self, timeout: float) -> bool:
+        """Send spooled batches now, on the calling thread.
+
+        Args:
+            timeout: Seconds available for the replay
+
+        Returns:
+            True if nothing is left in the spool; False while the circuit is
+            open, since the backend is known to be failing
+        """
+        if self._json_exporter is None or self._is_shutdown:
+            return True
+        if self._circuit.state == CIRCUIT_OPEN:
+            return False
+        return self._json_exporter.replay_spool(timeout)
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
         """Force flush any buffered spans."""
@@ -529,27 +999,45 @@ class HoneyHiveOTLPExporter(SpanExporter):
         Returns:
             Dictionary containing session and connection pool statistics
         """
+        stats: Dict[str, Any]
         if not self._session:
-            return {"error": "No session available", "session_type": "default"}
-
-        try:
-            stats = get_session_stats(self._session)
-            stats.update(
-                {
+            stats = {"error": "No session available", "session_type": "default"}
+        else:
+            try:
+                stats = get_session_stats(self._session)
+                stats.update(
+                    {
+                        "session_type": (
+                            "optimized" if self.use_optimized_session else "custom"
+                        ),
+                        "session_config": (
+                            self.session_config.to_dict()
+                            if self.session_config
+                            else None
+                        ),
+                    }
+                )
+            except Exception as e:
+                stats = {
+                    "error": f"Failed to get session stats: {e}",
                     "session_type": (
                         "optimized" if self.use_optimized_session else "custom"
                     ),
-                    "session_config": (
-                        self.session_config.to_dict() if self.session_config else None
-                    ),
                 }
-            )
-            return stats
-        except Exception as e:
-            return {
-                "error": f"Failed to get session stats: {e}",
-                "session_type": "optimized" if self.use_optimized_session else "custom",
-            }
+
+        stats["circuit"] = self._circuit.get_stats()
+        if self._json_exporter is not None:
+            try:
+                stats["compression"] = self._json_exporter.get_compression_stats()
+                retry_stats = self._json_exporter.get_retry_stats()
+                if retry_stats is not None:
+                    stats["retry"] = retry_stats
+                spool_stats = self._json_exporter.get_spool_stats()
+                if spool_stats is not None:
+                    stats["spool"] = spool_stats
+            except Exception:
+                pass
+        return stats
 
     def log_session_stats(self) -> None:
         """Log current session statistics for monitoring."""
@@ -0,0 +1,492 @@
+"""Streaming OTLP JSON serializer for span export.
+
+Encodes batches of ReadableSpans straight into an OTLP/HTTP JSON request body
+without building the intermediate ``{"resourceSpans": [...]}`` dict tree:
+
+- Resource blocks are encoded once per Resource (one per TracerProvider) and
+  instrumentation scope headers once per (name, version); both are reused
+  for every subsequent batch.
+- Attribute keys repeat across spans, so their JSON-quoted form is memoized,
+  as are whole KeyValue entries for short repeated values (session ids,
+  model names, token counts).
+- Span fields are written as string fragments and joined once per batch.
+- When ``orjson`` is installed (``pip install honeyhive[orjson]``) it is used to
+  quote string values, which dominates the cost for LLM prompt/completion
+  attributes. Otherwise the C-accelerated stdlib string encoder is used.
+
+With the default ``span`` attribute alias mode the output is semantically
+identical to ``json.dumps(OTLPJSONExporter._spans_to_otlp_json_payload(spans))``.
+In the ``export`` and ``resource`` modes the compatibility aliases that the
+span processor left off spans are written per span or once per resource
+block (see :mod:`honeyhive.tracer.processing.attribute_aliases`).
+"""
+
+import math
+import threading
+from json.encoder import encode_basestring_ascii  # type: ignore[attr-defined]
+from types import MappingProxyType, ModuleType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from opentelemetry.attributes import BoundedAttributes
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.trace import StatusCode
+
+from .attribute_aliases import (
+    ALIAS_MODE_EXPORT,
+    ALIAS_MODE_RESOURCE,
+    ALIAS_MODE_SPAN,
+    missing_aliases,
+    resolve_alias_mode,
+)
+from .structured_attributes import (
+    STRUCTURED_ATTRIBUTES_KEY,
+    expand_structured_attributes,
+)
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Bounded caches: keys and scopes are low-cardinality in practice, but user
+# supplied attribute names must not be able to grow memory without limit.
+_MAX_CACHED_KEYS = 4096
+_MAX_CACHED_PAIRS = 8192
+# Only short string values are worth memoizing as whole KeyValue entries
+_MAX_CACHED_VALUE_LEN = 128
+_MAX_CACHED_SCOPES = 256
+_MAX_CACHED_RESOURCES = 16
+# Scalar types whose complete KeyValue entries are memoized
+_PAIR_CACHED_TYPES = frozenset((str, int, bool, float))
+
+_STATUS_CODES = {
+    StatusCode.OK: '{"code":"STATUS_CODE_OK"',
+    StatusCode.ERROR: '{"code":"STATUS_CODE_ERROR"',
+}
+_STATUS_UNSET = '{"code":"STATUS_CODE_UNSET"'
+
+
+def _orjson_quote(value: str) -> str:
+    """Quote a string as a JSON string literal using orjson."""
+    if orjson is None:
+        return encode_basestring_ascii(value)
+    try:
+        encoded: bytes = orjson.dumps(value)
+    except orjson.JSONEncodeError:
+        # orjson rejects lone surrogates; the stdlib encoder escapes them
+        return encode_basestring_ascii(value)
+    return encoded.decode("utf-8")
+
+
+def _plain_attributes(attributes: Optional[Mapping[str, Any]]) -> Mapping[str, Any]:
+    """Get span or event attributes as a plain-dict snapshot.
+
+    Reading the SDK's BoundedAttributes through the Mapping protocol costs a
+    Python-level ``__getitem__`` per key. Its public ``copy()``, which the
+    read-only ``span.attributes`` proxy forwards, returns a plain dict.
+    """
+    if isinstance(attributes, (MappingProxyType, BoundedAttributes)):
+        return attributes.copy()
+    return attributes or {}
+
+
+def group_by_resource(spans: Sequence[ReadableSpan]) -> List[Sequence[ReadableSpan]]:
+    """Split spans into groups with equal resources, in first-seen order.
+
+    Spans from one TracerProvider share a single Resource object, so a batch
+    normally has one group; batches of a shared export pipeline mix the
+    resources of several tracers.
+    """
+    first = getattr(spans[0], "resource", None)
+    if all(getattr(span, "resource", None) is first for span in spans):
+        return [spans]
+    groups: Dict[Tuple[Tuple[str, str], ...], List[ReadableSpan]] = {}
+    keys: Dict[int, Tuple[Tuple[str, str], ...]] = {}
+    for span in spans:
+        resource = getattr(span, "resource", None)
+        key = keys.get(id(resource))
+        if key is None:
+            attributes = getattr(resource, "attributes", None) or {}
+            key = keys[id(resource)] = tuple(
+                sorted((str(name), repr(value)) for name, value in attributes.items())
+            )
+        groups.setdefault(key, []).append(span)
+    return list(groups.values())
+
+
+class OTLPJSONSerializer:
+    """Encode span batches as OTLP/HTTP JSON request bodies.
+
+    One serializer is owned by each OTLPJSONExporter; its caches are shared by
+    every batch that exporter sends. Thread-safe: caches are only ever
+    populated with immutable strings, and eviction is guarded by a lock.
+    """
+
+    def __init__(
+        self, use_orjson: Optional[bool] = None, alias_mode: str = ALIAS_MODE_SPAN
+    ) -> None:
+        """Initialize the serializer.
+
+        Args:
+            use_orjson: Force orjson on/off for string quoting. Defaults to
+                using orjson when it is installed.
+            alias_mode: Where to write compatibility aliases missing from
+                spans: "span" (as-is), "export" (per span) or "resource"
+                (once per resource block)
+        """
+        self.alias_mode = resolve_alias_mode(alias_mode)
+        if use_orjson is None:
+            use_orjson = ORJSON_AVAILABLE
+        self.uses_orjson = bool(use_orjson and ORJSON_AVAILABLE)
+        self._quote: Callable[[str], str] = (
+            _orjson_quote if self.uses_orjson else encode_basestring_ascii
+        )
+        self._lock = threading.Lock()
+        self._key_cache: Dict[str, str] = {}
+        self._string_key_cache: Dict[str, str] = {}
+        self._pair_cache: Dict[Tuple[str, type, Any], str] = {}
+        self._scope_cache: Dict[Tuple[str, str], str] = {}
+        self._resource_cache: Dict[int, Tuple[Any, str]] = {}
+        self._kind_cache: Dict[Any, str] = {}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def serialize(self, spans: Sequence[ReadableSpan]) -> bytes:
+        """Serialize spans into a UTF-8 encoded OTLP JSON request body.
+
+        Spans are grouped by resource and then by instrumentation scope
+        (first-seen order), matching the dict-based payload builder. In
+        ``resource`` alias mode there is one resource block per resource and
+        distinct set of alias values.
+
+        Args:
+            spans: Spans to encode
+
+        Returns:
+            Request body bytes
+        """
+        if not spans:
+            return b'{"resourceSpans":[]}'
+
+        parts = ['{"resourceSpans":[']
+        for resource_index, resource_spans in enumerate(group_by_resource(spans)):
+            if resource_index:
+                parts.append(",")
+            if self.alias_mode != ALIAS_MODE_RESOURCE:
+                self._write_resource_spans(parts, resource_spans, None)
+                continue
+            # One resource block per distinct set of alias values
+            groups: Dict[
+                Tuple[Tuple[str, str], ...],
+                Tuple[Dict[str, Any], List[ReadableSpan]],
+            ] = {}
+            for span in resource_spans:
+                aliases = missing_aliases(_plain_attributes(span.attributes))
+                group_key = tuple((key, str(value)) for key, value in aliases.items())
+                group = groups.get(group_key)
+                if group is None:
+                    group = groups[group_key] = (aliases, [])
+                group[1].append(span)
+            for index, (aliases, group_spans) in enumerate(groups.values()):
+                if index:
+                    parts.append(",")
+                self._write_resource_spans(parts, group_spans, aliases)
+        parts.append("]}")
+        return "".join(parts).encode("utf-8")
+
+    def _write_resource_spans(
+        self,
+        parts: List[str],
+        spans: Sequence[ReadableSpan],
+        resource_aliases: Optional[Dict[str, Any]],
+    ) -> None:
+        """Append one ``resourceSpans`` entry holding ``spans``.
+
+        ``spans`` share one resource and are grouped by instrumentation scope
+        (first-seen order), matching the dict-based payload builder.
+        """
+        # Each scope group is a list of JSON fragments; spans append into the
+        # fragment list of their scope and everything is joined exactly once.
+        scope_groups: Dict[Tuple[str, str], List[str]] = {}
+        # Spans from one tracer share a scope object; resolve each object once
+        outputs_by_scope: Dict[int, List[str]] = {}
+        write_span = self._write_span
+        for span in spans:
+            scope = getattr(span, "instrumentation_scope", None)
+            out = outputs_by_scope.get(id(scope))
+            if out is None:
+                out = self._scope_output(scope_groups, scope)
+                outputs_by_scope[id(scope)] = out
+            if len(out) > 1:
+                out.append(",")
+            write_span(out, span)
+
+        resource = self._encode_resource(spans[0].resource)
+        if resource_aliases:
+            extra: List[str] = []
+            self._write_key_values(extra, resource_aliases)
+            if resource == "{}":
+                resource = '{"attributes":[' + "".join(extra) + "]}"
+            else:
+                resource = resource[:-2] + "," + "".join(extra) + "]}"
+        parts.extend(('{"resource":', resource, ',"scopeSpans":['))
+        first_group = True
+        for out in scope_groups.values():
+            if not first_group:
+                parts.append(",")
+            first_group = False
+            parts.extend(out)
+            parts.append("]}")
+        parts.append("]}")
+
+    def _scope_output(
+        self, scope_groups: Dict[Tuple[str, str], List[str]], scope: Any
+    ) -> List[str]:
+        """Get (or start) the fragment list for a scope's spans."""
+        if scope:
+            scope_key = (scope.name or "unknown", scope.version or "")
+        else:
+            scope_key = ("unknown", "")
+        out = scope_groups.get(scope_key)
+        if out is None:
+            out = scope_groups[scope_key] = [self._encode_scope_header(scope_key)]
+        return out
+
+    def clear_caches(self) -> None:
+        """Drop all cached resource, scope and key encodings."""
+        with self._lock:
+            self._key_cache.clear()
+            self._string_key_cache.clear()
+            self._pair_cache.clear()
+            self._scope_cache.clear()
+            self._resource_cache.clear()
+            self._kind_cache.clear()
+
+    # ------------------------------------------------------------------
+    # Cached blocks
+    # ------------------------------------------------------------------
+
+    def _encode_resource(self, resource: Any) -> str:
+        """Encode the resource block, cached per Resource object."""
+        cached = self._resource_cache.get(id(resource))
+        # Holding a reference to the resource keeps its id() from being reused
+        if cached is not None and cached[0] is resource:
+            return cached[1]
+
+        attributes = getattr(resource, "attributes", None) if resource else None
+        if attributes:
+            out = ['{"attributes":[']
+            self._write_key_values(out, attributes)
+            out.append("]}")
+            encoded = "".join(out)
+        else:
+            encoded = "{}"
+
+        with self._lock:
+            if len(self._resource_cache) >= _MAX_CACHED_RESOURCES:
+                self._resource_cache.clear()
+            self._resource_cache[id(resource)] = (resource, encoded)
+        return encoded
+
+    def _encode_scope_header(self, scope_key: Tuple[str, str]) -> str:
+        """Encode ``{"scope":{...},"spans":[`` for a scope, cached."""
+        header = self._scope_cache.get(scope_key)
+        if header is not None:
+            return header
+
+        name, version = scope_key
+        scope = '{"name":' + self._quote(name)
+        if version:
+            scope += ',"version":' + self._quote(version)
+        header = '{"scope":' + scope + '},"spans":['
+
+        with self._lock:
+            if len(self._scope_cache) >= _MAX_CACHED_SCOPES:
+                self._scope_cache.clear()
+            self._scope_cache[scope_key] = header
+        return header
+
+    def _encode_key(self, key: str, cache: Dict[str, str]) -> str:
+        """Encode and cache the KeyValue prefix for an attribute key.
+
+        ``self._key_cache`` holds ``{"key":K,"value":`` prefixes and
+        ``self._string_key_cache`` the same followed by ``{"stringValue":``.
+        """
+        prefix = '{"key":' + self._quote(key) + ',"value":'
+        if cache is self._string_key_cache:
+            prefix += '{"stringValue":'
+        with self._lock:
+            if len(cache) >= _MAX_CACHED_KEYS:
+                cache.clear()
+            cache[key] = prefix
+        return prefix
+
+    def _encode_kind(self, kind: Any) -> str:
+        """Encode a SpanKind as a quoted ``SPAN_KIND_*`` string, cached."""
+        encoded = self._kind_cache.get(kind)
+        if encoded is not None:
+            return encoded
+
+        name = kind.name
+        if not name.startswith("SPAN_KIND_"):
+            name = f"SPAN_KIND_{name}"
+        encoded = self._quote(name)
+        with self._lock:
+            if len(self._kind_cache) >= _MAX_CACHED_SCOPES:
+                self._kind_cache.clear()
+            self._kind_cache[kind] = encoded
+        return encoded
+
+    # ------------------------------------------------------------------
+    # Values
+    # ------------------------------------------------------------------
+
+    def _encode_any_value(self, value: Any) -> str:
+        """Encode a Python attribute value as an OTLP AnyValue JSON object.
+
+        Mirrors ``OTLPJSONExporter._to_otlp_any_value``: int64 values are
+        JSON strings, non-finite floats fall back to strings, sequences
+        become arrayValue, mappings kvlistValue and anything else is
+        stringified.
+        """
+        # bool before int: bool is a subclass of int
+        if isinstance(value, bool):
+            return '{"boolValue":true}' if value else '{"boolValue":false}'
+        if isinstance(value, int):
+            return '{"intValue":"' + str(value) + '"}'
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return '{"stringValue":"' + str(value) + '"}'
+            return '{"doubleValue":' + float.__repr__(value) + "}"
+        if isinstance(value, str):
+            return '{"stringValue":' + self._quote(value) + "}"
+        if isinstance(value, (list, tuple)):
+            encode = self._encode_any_value
+            return (
+                '{"arrayValue":{"values":['
+                + ",".join([encode(item) for item in value])
+                + "]}}"
+            )
+        if isinstance(value, Mapping):
+            if not value:
+                return '{"kvlistValue":{"values":[]}}'
+            out = ['{"kvlistValue":{"values":[']
+            self._write_key_values(out, value)
+            out.append("]}}")
+            return "".join(out)
+        if value is None:
+            return "{}"
+        return '{"stringValue":' + self._quote(str(value)) + "}"
+
+    def _write_key_values(self, out: List[str], attributes: Mapping[str, Any]) -> None:
+        """Append the body of an OTLP KeyValue list for ``attributes``."""
+        pair_cache = self._pair_cache
+        string_key_cache = self._string_key_cache
+        quote = self._quote
+        append = out.append
+        extend = out.extend
+        for key, value in attributes.items():
+            value_type = type(value)
+            if value_type is str:
+                if len(value) > _MAX_CACHED_VALUE_LEN:
+                    # Long unique strings (prompts, completions): quote inline
+                    prefix = string_key_cache.get(key)
+                    if prefix is None:
+                        prefix = self._encode_key(key, string_key_cache)
+                    extend((prefix, quote(value), "}},"))
+                    continue
+            elif value_type not in _PAIR_CACHED_TYPES:
+                prefix = self._key_cache.get(key)
+                if prefix is None:
+                    prefix = self._encode_key(key, self._key_cache)
+                extend((prefix, self._encode_any_value(value), "},"))
+                continue
+
+            # Short strings and scalars repeat across spans (session ids,
+            # models, token counts): reuse the fully encoded KeyValue entry.
+            # The type is part of the cache key because True == 1 == 1.0.
+            cache_key = (key, value_type, value)
+            entry = pair_cache.get(cache_key)
+            if entry is None:
+                entry = self._encode_pair(cache_key)
+            append(entry)
+
+        # Every entry ends with a comma; drop the final one
+        if out[-1][-1] == ",":
+            out[-1] = out[-1][:-1]
+
+    def _encode_pair(self, cache_key: Tuple[str, type, Any]) -> str:
+        """Encode and cache a complete ``{"key":...,"value":{...}},`` entry."""
+        key, _, value = cache_key
+        prefix = self._key_cache.get(key)
+        if prefix is None:
+            prefix = self._encode_key(key, self._key_cache)
+        entry = prefix + self._encode_any_value(value) + "},"
+        with self._lock:
+            if len(self._pair_cache) >= _MAX_CACHED_PAIRS:
+                self._pair_cache.clear()
+            self._pair_cache[cache_key] = entry
+        return entry
+
+    # ------------------------------------------------------------------
+    # Spans
+    # ------------------------------------------------------------------
+
+    def _write_span(self, out: List[str], span: ReadableSpan) -> None:
+        """Append one span, encoded as an OTLP JSON Span object."""
+        context = span.context
+        parent = span.parent
+        parent_span_id = getattr(parent, "span_id", None) if parent else None
+        parent_json = f'"{parent_span_id:016x}"' if parent_span_id else "null"
+        kind = span.kind
+        quote = self._quote
+
+        out.append(
+            f'{{"traceId":"{context.trace_id:032x}","spanId":"{context.span_id:016x}",'
+            f'"parentSpanId":{parent_json},"name":{quote(span.name)},'
+            f'"kind":{self._kind_cache.get(kind) or self._encode_kind(kind)},'
+            f'"startTimeUnixNano":"{span.start_time}",'
+            f'"endTimeUnixNano":"{span.end_time}","attributes":['
+        )
+
+        attributes = _plain_attributes(span.attributes)
+        if attributes:
+            if STRUCTURED_ATTRIBUTES_KEY in attributes:
+                attributes = expand_structured_attributes(attributes)
+            self._write_key_values(out, attributes)
+        if self.alias_mode == ALIAS_MODE_EXPORT:
+            aliases = missing_aliases(attributes)
+            if aliases:
+                if attributes:
+                    out.append(",")
+                self._write_key_values(out, aliases)
+
+        events = span.events
+        if events:
+            out.append('],"events":[')
+            separator = ""
+            for event in events:
+                out.append(
+                    f'{separator}{{"timeUnixNano":"{event.timestamp}",'
+                    f'"name":{quote(event.name)},"attributes":['
+                )
+                event_attributes = _plain_attributes(event.attributes)
+                if event_attributes:
+                    self._write_key_values(out, event_attributes)
+                out.append("]}")
+                separator = ","
+            out.append('],"status":')
+        else:
+            out.append('],"events":[],"status":')
+
+        status = span.status
+        out.append(_STATUS_CODES.get(status.status_code, _STATUS_UNSET))
+        if status.description:
+            out.append(',"message":' + quote(status.description))
+        out.append("}}")
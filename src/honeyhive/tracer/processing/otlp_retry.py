@@ -0,0 +1,278 @@
+"""Retry policy for OTLP export requests.
+
+The pooled session's ``urllib3.Retry`` never retries POST, which is not in
+its default ``allowed_methods``, so a batch that hit a 429 or 503 went
+straight to the spool or was lost. :class:`ExportRetryPolicy` retries export
+POSTs inside the exporter:
+
+- Connection errors, timeouts and retryable statuses (408, 429, 5xx) are
+  retried. Other responses, including 413, are returned unchanged.
+- Delays use decorrelated jitter:
+  ``delay = min(max_delay, uniform(base_delay, previous_delay * 3))``.
+- ``Retry-After`` (delta-seconds or an HTTP date) sets the minimum delay.
+- Each batch has a deadline (``export_timeout``). A retry whose delay would
+  end after the deadline is not attempted, and each attempt's HTTP timeout
+  is capped at the time left.
+- All batches of an exporter share a retry budget. Every batch deposits
+  ``budget_ratio`` tokens, every retry spends one, and the balance is capped
+  at ``budget_min_retries``. During an outage retries are therefore limited
+  to about ``budget_ratio`` per batch and cannot multiply the load on the
+  backend.
+"""
+
+import email.utils
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from ...utils.logger import safe_log
+from .otlp_spool import is_retryable_status
+
+DEFAULT_RETRY_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_BASE_DELAY = 0.1
+DEFAULT_RETRY_MAX_DELAY = 5.0
+DEFAULT_RETRY_DEADLINE = 30.0
+DEFAULT_RETRY_BUDGET_RATIO = 0.1
+DEFAULT_RETRY_BUDGET_MIN_RETRIES = 10
+
+# Errors raised by requests that are worth another attempt
+RETRYABLE_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+
+# Final outcome of each batch, as reported by get_stats()
+OUTCOMES = (
+    "success",
+    "recovered",
+    "non_retryable",
+    "exhausted",
+    "deadline_exceeded",
+    "budget_exhausted",
+    "cancelled",
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header into seconds from now.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Non-negative delay in seconds, or None if absent or unparseable
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryBudget:
+    """Token bucket limiting retries to a fraction of first attempts."""
+
+    def __init__(self, ratio: float, min_retries: int) -> None:
+        """Initialize a full budget.
+
+        Args:
+            ratio: Tokens deposited per batch
+            min_retries: Bucket capacity (retries allowed in a burst)
+        """
+        self.ratio = ratio
+        self.capacity = float(max(1, min_retries))
+        self._balance = self.capacity
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Credit one batch."""
+        with self._lock:
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend one retry, if the budget allows it."""
+        with self._lock:
+            if self._balance < 1.0:
+                return False
+            self._balance -= 1.0
+            return True
+
+    @property
+    def balance(self) -> float:
+        """Current number of retry tokens."""
+        with self._lock:
+            return self._balance
+
+
+class ExportRetryPolicy:
+    """Retry export requests with jittered backoff, a deadline and a budget.
+
+    One policy is owned by each exporter and shared by all of its export
+    threads. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_RETRY_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_RETRY_BASE_DELAY,
+        max_delay: float = DEFAULT_RETRY_MAX_DELAY,
+        deadline: float = DEFAULT_RETRY_DEADLINE,
+        budget_ratio: float = DEFAULT_RETRY_BUDGET_RATIO,
+        budget_min_retries: int = DEFAULT_RETRY_BUDGET_MIN_RETRIES,
+        tracer_instance: Any = None,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            max_attempts: Attempts per batch, including the first (1 disables
+                retries)
+            base_delay: Minimum delay between attempts in seconds
+            max_delay: Maximum jittered delay in seconds (``Retry-After`` may
+                exceed it, up to the deadline)
+            deadline: Time budget per batch in seconds, across all attempts
+            budget_ratio: Retry tokens earned per batch
+            budget_min_retries: Retry token capacity
+            tracer_instance: Optional tracer instance for logging context
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = max(0.0, float(base_delay))
+        self.max_delay = max(self.base_delay, float(max_delay))
+        self.deadline = max(0.001, float(deadline))
+        self.budget = RetryBudget(max(0.0, float(budget_ratio)), budget_min_retries)
+        self.tracer_instance = tracer_instance
+        self._random = random.Random()
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._attempts = 0
+        self._retries = 0
+        self._retry_after_honoured = 0
+        self._outcomes: Dict[str, int] = dict.fromkeys(OUTCOMES, 0)
+
+    def call(
+        self, send: Callable[[Optional[float]], Any], request_timeout: Optional[float]
+    ) -> Any:
+        """Send a request, retrying transient failures.
+
+        Args:
+            send: Performs one attempt given its HTTP timeout in seconds and
+                returns a response with ``status_code`` and ``headers``
+            request_timeout: Configured per-request timeout (None for none)
+
+        Returns:
+            The last response
+
+        Raises:
+            Exception: The last error, if the final attempt raised
+        """
+        deadline = time.monotonic() + self.deadline
+        self.budget.deposit()
+        delay = self.base_delay
+        attempt = 0
+        while True:
+            attempt += 1
+            remaining = max(0.001, deadline - time.monotonic())
+            timeout = (
+                remaining
+                if request_timeout is None
+                else min(request_timeout, remaining)
+            )
+            with self._lock:
+                self._attempts += 1
+
+            error: Optional[BaseException] = None
+            response: Any = None
+            retry_after: Optional[float] = None
+            try:
+                response = send(timeout)
+            except RETRYABLE_EXCEPTIONS as e:
+                error = e
+            else:
+                if not is_retryable_status(response.status_code):
+                    if response.status_code < 300:
+                        self._record("success" if attempt == 1 else "recovered")
+                    else:
+                        self._record("non_retryable")
+                    return response
+                headers = getattr(response, "headers", None) or {}
+                retry_after = parse_retry_after(headers.get("Retry-After"))
+
+            delay = min(
+                self.max_delay, self._random.uniform(self.base_delay, delay * 3)
+            )
+            wait = max(delay, retry_after or 0.0)
+            outcome = self._stop_reason(attempt, wait, deadline)
+            if outcome is None:
+                with self._lock:
+                    self._retries += 1
+                    if retry_after is not None:
+                        self._retry_after_honoured += 1
+                safe_log(
+                    self.tracer_instance,
+                    "debug",
+                    "Retrying OTLP export in %.3fs (attempt %d/%d)",
+                    wait,
+                    attempt + 1,
+                    self.max_attempts,
+                    honeyhive_data={
+                        "status_code": getattr(response, "status_code", None),
+                        "error_type": type(error).__name__ if error else None,
+                        "retry_after": retry_after,
+                    },
+                )
+                if self._cancelled.wait(wait):
+                    outcome = "cancelled"
+
+            if outcome is not None:
+                self._record(outcome)
+                if outcome != "exhausted":
+                    safe_log(
+                        self.tracer_instance,
+                        "warning",
+                        "OTLP export not retried: %s",
+                        outcome,
+                        honeyhive_data={"attempts": attempt},
+                    )
+                if error is not None:
+                    raise error
+                return response
+
+    def _stop_reason(self, attempt: int, wait: float, deadline: float) -> Optional[str]:
+        """Get the outcome that ends the batch, or None to retry."""
+        if attempt >= self.max_attempts:
+            return "exhausted"
+        if self._cancelled.is_set():
+            return "cancelled"
+        if time.monotonic() + wait >= deadline:
+            return "deadline_exceeded"
+        if not self.budget.withdraw():
+            return "budget_exhausted"
+        return None
+
+    def _record(self, outcome: str) -> None:
+        with self._lock:
+            self._outcomes[outcome] += 1
+
+    def cancel(self) -> None:
+        """Stop waiting between attempts (called on exporter shutdown)."""
+        self._cancelled.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get attempt, retry and per-outcome batch counters."""
+        with self._lock:
+            return {
+                "max_attempts": self.max_attempts,
+                "attempts": self._attempts,
+                "retries": self._retries,
+                "retry_after_honoured": self._retry_after_honoured,
+                "budget_balance": round(self.budget.balance, 2),
+                "outcomes": dict(self._outcomes),
+            }
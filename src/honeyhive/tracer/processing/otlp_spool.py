@@ -0,0 +1,748 @@
+"""Durable on-disk spool for OTLP export batches that failed to send.
+
+When the HoneyHive endpoint is unreachable (connection errors, timeouts,
+HTTP 408/429/5xx) the exporter writes the already serialized and compressed
+request body to a write-ahead spool instead of dropping it. A background
+replayer drains the spool with exponential backoff once exports succeed again.
+
+Layout of the spool directory:
+
+- ``segment-<seq>.log``: append-only segment files. Each record is a fixed
+  header (magic, creation time, CRC32, body length, batch id, content
+  encoding) followed by the request body exactly as it was sent.
+- ``acked.log``: append-only list of batch ids that were delivered (or
+  discarded) during replay.
+- ``spool.lock``: advisory lock so only one process uses a directory.
+
+Crash safety: records and acks are fsynced before they are relied upon. A
+torn record at the end of a segment fails its length/CRC check and is
+ignored, and a batch delivered just before a crash but not yet acked is
+replayed again on restart (at-least-once delivery). Batch ids are derived
+from the body, so the same batch is never stored twice.
+
+Caps: the spool never exceeds ``max_bytes`` on disk (oldest segments are
+evicted first) and records older than ``max_age_seconds`` are discarded
+instead of replayed.
+"""
+
+# pylint: disable=too-many-instance-attributes
+# Justification: The spool tracks segment state plus a set of counters
+
+import hashlib
+import os
+import random
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Set
+
+from ...utils.logger import safe_log
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+DEFAULT_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_SPOOL_MAX_AGE_SECONDS = 24 * 60 * 60.0
+DEFAULT_SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+
+DEFAULT_REPLAY_INITIAL_BACKOFF = 1.0
+DEFAULT_REPLAY_MAX_BACKOFF = 60.0
+
+_MAGIC = b"HHS1"
+# magic, created_at, crc32(body), len(body), batch id, content encoding
+_HEADER = struct.Struct(">4sdII16s8s")
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".log"
+_ACK_FILE = "acked.log"
+_LOCK_FILE = "spool.lock"
+
+# Sends a spooled body with its Content-Encoding and returns the HTTP status
+SpoolSender = Callable[[bytes, Optional[str]], int]
+
+
+def is_retryable_status(status_code: int) -> bool:
+    """Whether a failed export is worth spooling and retrying later.
+
+    Client errors other than 408/429 (bad payload, auth) will fail the same
+    way on replay, so only timeouts, throttling and server errors qualify.
+    """
+    return status_code in (408, 429) or status_code >= 500
+
+
+@dataclass
+class _SpoolRecord:
+    """Index entry for one spooled request body."""
+
+    batch_id: str
+    created_at: float
+    offset: int
+    length: int
+    content_encoding: Optional[str]
+
+
+@dataclass
+class _Segment:
+    """One append-only segment file and the records it holds."""
+
+    seq: int
+    path: str
+    size: int = 0
+    records: List[_SpoolRecord] = field(default_factory=list)
+
+
+class ExportSpool:
+    """Segmented, size- and age-capped write-ahead spool of export bodies.
+
+    Thread-safe. Call :meth:`open` before use; when the directory cannot be
+    used (permissions, another process holds it) the spool stays disabled
+    and :meth:`append` returns False.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        max_bytes: int = DEFAULT_SPOOL_MAX_BYTES,
+        max_age_seconds: float = DEFAULT_SPOOL_MAX_AGE_SECONDS,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        tracer_instance: Any = None,
+    ) -> None:
+        """Initialize the spool.
+
+        Args:
+            directory: Spool directory (created if missing)
+            max_bytes: Maximum total size of all segment files
+            max_age_seconds: Records older than this are discarded
+            segment_max_bytes: Segment size at which a new segment is started
+            tracer_instance: Optional tracer instance for logging context
+        """
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_bytes = max(1, int(max_bytes))
+        self.max_age_seconds = float(max_age_seconds)
+        self.segment_max_bytes = max(1, min(int(segment_max_bytes), self.max_bytes))
+        self.tracer_instance = tracer_instance
+
+        self._lock = threading.RLock()
+        # Serializes replays (background replayer vs. synchronous flush)
+        self._replay_lock = threading.Lock()
+        self._is_open = False
+        self._lock_file: Optional[BinaryIO] = None
+        self._segments: List[_Segment] = []
+        self._active: Optional[_Segment] = None
+        self._active_file: Optional[BinaryIO] = None
+        self._next_seq = 0
+        self._pending: Dict[str, _Segment] = {}
+        self._acked: Set[str] = set()
+        self._ack_file: Optional[BinaryIO] = None
+        self._stats = {
+            "spooled_batches": 0,
+            "spooled_bytes": 0,
+            "deduplicated_batches": 0,
+            "replayed_batches": 0,
+            "replayed_bytes": 0,
+            "rejected_batches": 0,
+            "expired_batches": 0,
+            "evicted_batches": 0,
+            "corrupt_records": 0,
+            "replay_failures": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def open(self) -> bool:
+        """Create/lock the directory and index any records left from a crash.
+
+        Returns:
+            True if the spool is usable
+        """
+        with self._lock:
+            if self._is_open:
+                return True
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                if not self._acquire_directory_lock():
+                    safe_log(
+                        self.tracer_instance,
+                        "warning",
+                        "OTLP spool directory is in use by another process, "
+                        "spooling disabled",
+                        honeyhive_data={"directory": self.directory},
+                    )
+                    return False
+                self._load_acks()
+                self._load_segments()
+                self._compact_acks()
+                self._ack_file = open(  # pylint: disable=consider-using-with
+                    os.path.join(self.directory, _ACK_FILE), "ab"
+                )
+            except OSError as e:
+                safe_log(
+                    self.tracer_instance,
+                    "warning",
+                    f"Failed to open OTLP spool, spooling disabled: {e}",
+                    honeyhive_data={
+                        "directory": self.directory,
+                        "error_type": type(e).__name__,
+                    },
+                )
+                self._release_directory_lock()
+                return False
+
+            self._is_open = True
+            if self._pending:
+                safe_log(
+                    self.tracer_instance,
+                    "info",
+                    "OTLP spool recovered %d unsent batches",
+                    len(self._pending),
+                    honeyhive_data={"directory": self.directory},
+                )
+            return True
+
+    def close(self) -> None:
+        """Close open files and release the directory lock."""
+        with self._lock:
+            for handle in (self._active_file, self._ack_file):
+                if handle is not None:
+                    try:
+                        handle.close()
+                    except OSError:
+                        pass
+            self._active_file = None
+            self._active = None
+            self._ack_file = None
+            self._release_directory_lock()
+            self._is_open = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the spool is open and accepting batches."""
+        return self._is_open
+
+    def has_pending(self) -> bool:
+        """Whether any spooled batches are waiting for replay."""
+        return bool(self._pending)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, body: bytes, content_encoding: Optional[str] = None) -> bool:
+        """Durably store a request body for later replay.
+
+        Args:
+            body: Request body exactly as it was (or would have been) sent
+            content_encoding: ``Content-Encoding`` of ``body``, if any
+
+        Returns:
+            True if the body is stored (or already was)
+        """
+        batch_id = hashlib.sha256(body).digest()[:16]
+        batch_key = batch_id.hex()
+        record_size = _HEADER.size + len(body)
+
+        with self._lock:
+            if not self._is_open:
+                return False
+            if batch_key in self._pending:
+                self._stats["deduplicated_batches"] += 1
+                return True
+            if record_size > self.max_bytes:
+                self._stats["evicted_batches"] += 1
+                return False
+
+            try:
+                self._make_room(record_size)
+                segment = self._writable_segment(record_size)
+                created_at = time.time()
+                header = _HEADER.pack(
+                    _MAGIC,
+                    created_at,
+                    zlib.crc32(body),
+                    len(body),
+                    batch_id,
+                    (content_encoding or "").encode("ascii")[:8],
+                )
+                handle = self._active_file
+                assert handle is not None
+                handle.write(header + body)
+                handle.flush()
+                os.fsync(handle.fileno())
+            except OSError as e:
+                safe_log(
+                    self.tracer_instance,
+                    "warning",
+                    f"Failed to write batch to OTLP spool: {e}",
+                    honeyhive_data={"error_type": type(e).__name__},
+                )
+                return False
+
+            segment.records.append(
+                _SpoolRecord(
+                    batch_id=batch_key,
+                    created_at=created_at,
+                    offset=segment.size,
+                    length=len(body),
+                    content_encoding=content_encoding,
+                )
+            )
+            segment.size += record_size
+            self._pending[batch_key] = segment
+            self._stats["spooled_batches"] += 1
+            self._stats["spooled_bytes"] += len(body)
+            return True
+
+    # ------------------------------------------------------------------
+    # Replay
+    # ------------------------------------------------------------------
+
+    def replay(self, send: SpoolSender, deadline: Optional[float] = None) -> bool:
+        """Send spooled batches oldest first until one fails.
+
+        Delivered batches, batches rejected with a non-retryable status and
+        expired batches are acknowledged; fully acknowledged segments are
+        deleted. Only one replay runs at a time; a concurrent call waits for
+        the running one (until ``deadline``) so no batch is sent twice.
+
+        Args:
+            send: Callable that posts a body and returns the HTTP status code
+            deadline: Optional ``time.monotonic()`` time after which no
+                further batch is sent
+
+        Returns:
+            True if the spool was fully drained
+        """
+        wait = -1.0 if deadline is None else max(0.0, deadline - time.monotonic())
+        if not self._replay_lock.acquire(timeout=wait):
+            return False
+        try:
+            return self._replay_pending(send, deadline)
+        finally:
+            self._replay_lock.release()
+
+    def _replay_pending(self, send: SpoolSender, deadline: Optional[float]) -> bool:
+        """Replay pending batches; the caller holds ``_replay_lock``."""
+        with self._lock:
+            if not self._is_open:
+                return False
+            # Seal the active segment so new failures go to a fresh one
+            self._seal_active_segment()
+            work = [
+                (segment, record)
+                for segment in self._segments
+                for record in segment.records
+                if record.batch_id in self._pending
+                and record.batch_id not in self._acked
+            ]
+
+        drained = True
+        expiry = time.time() - self.max_age_seconds
+        for segment, record in work:
+            if deadline is not None and time.monotonic() >= deadline:
+                drained = False
+                break
+            if record.created_at < expiry:
+                self._ack(record.batch_id, "expired_batches")
+                continue
+
+            body = self._read_body(segment, record)
+            if body is None:
+                continue
+
+            try:
+                status_code = send(body, record.content_encoding)
+            except Exception as e:
+                safe_log(
+                    self.tracer_instance,
+                    "debug",
+                    f"OTLP spool replay failed: {e}",
+                    honeyhive_data={"error_type": type(e).__name__},
+                )
+                status_code = None
+
+            if status_code is not None and 200 <= status_code < 300:
+                self._ack(record.batch_id, "replayed_batches")
+                with self._lock:
+                    self._stats["replayed_bytes"] += record.length
+            elif status_code is None or is_retryable_status(status_code):
+                with self._lock:
+                    self._stats["replay_failures"] += 1
+                drained = False
+                break
+            else:
+                safe_log(
+                    self.tracer_instance,
+                    "warning",
+                    f"Discarding spooled batch rejected with status {status_code}",
+                    honeyhive_data={"batch_id": record.batch_id},
+                )
+                self._ack(record.batch_id, "rejected_batches")
+
+        self._delete_acked_segments()
+        return drained
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get spool counters and current on-disk usage."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats.update(
+                {
+                    "directory": self.directory,
+                    "enabled": self._is_open,
+                    "pending_batches": len(self._pending),
+                    "disk_bytes": sum(s.size for s in self._segments),
+                    "max_bytes": self.max_bytes,
+                    "max_age_seconds": self.max_age_seconds,
+                }
+            )
+            return stats
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _acquire_directory_lock(self) -> bool:
+        """Take an exclusive advisory lock on the directory (POSIX only)."""
+        # pylint: disable=consider-using-with
+        self._lock_file = open(os.path.join(self.directory, _LOCK_FILE), "ab")
+        if fcntl is None:
+            return True
+        try:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            self._lock_file.close()
+            self._lock_file = None
+            return False
+        return True
+
+    def _release_directory_lock(self) -> None:
+        """Release the directory lock if held."""
+        if self._lock_file is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+            self._lock_file.close()
+        except OSError:
+            pass
+        self._lock_file = None
+
+    def _segment_path(self, seq: int) -> str:
+        """Path of the segment file with sequence number ``seq``."""
+        return os.path.join(
+            self.directory, f"{_SEGMENT_PREFIX}{seq:010d}{_SEGMENT_SUFFIX}"
+        )
+
+    def _load_acks(self) -> None:
+        """Read delivered batch ids, ignoring a torn final line."""
+        path = os.path.join(self.directory, _ACK_FILE)
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as handle:
+            for line in handle:
+                batch_key = line.strip().decode("ascii", "ignore")
+                if len(batch_key) == 32:
+                    self._acked.add(batch_key)
+
+    def _load_segments(self) -> None:
+        """Index every valid record in existing segment files."""
+        seqs = []
+        for name in os.listdir(self.directory):
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX):
+                try:
+                    seqs.append(int(name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+
+        for seq in sorted(seqs):
+            segment = _Segment(seq=seq, path=self._segment_path(seq))
+            self._scan_segment(segment)
+            self._segments.append(segment)
+            for record in segment.records:
+                if record.batch_id not in self._acked:
+                    self._pending.setdefault(record.batch_id, segment)
+            self._next_seq = seq + 1
+
+        self._delete_acked_segments()
+
+    def _scan_segment(self, segment: _Segment) -> None:
+        """Read record headers, stopping at the first torn or corrupt record."""
+        with open(segment.path, "rb") as handle:
+            data = handle.read()
+        offset = 0
+        while offset + _HEADER.size <= len(data):
+            magic, created_at, crc, length, batch_id, encoding = _HEADER.unpack_from(
+                data, offset
+            )
+            end = offset + _HEADER.size + length
+            if magic != _MAGIC or end > len(data):
+                break
+            if zlib.crc32(data[offset + _HEADER.size : end]) != crc:
+                break
+            segment.records.append(
+                _SpoolRecord(
+                    batch_id=batch_id.hex(),
+                    created_at=created_at,
+                    offset=offset,
+                    length=length,
+                    content_encoding=encoding.rstrip(b"\0").decode("ascii") or None,
+                )
+            )
+            offset = end
+        if offset < len(data):
+            self._stats["corrupt_records"] += 1
+        segment.size = len(data)
+
+    def _writable_segment(self, record_size: int) -> _Segment:
+        """Get the active segment, starting a new one when it is full."""
+        active = self._active
+        if (
+            active is not None
+            and active.size
+            and active.size + record_size > self.segment_max_bytes
+        ):
+            self._seal_active_segment()
+            active = None
+        if active is None:
+            active = _Segment(
+                seq=self._next_seq, path=self._segment_path(self._next_seq)
+            )
+            self._next_seq += 1
+            # pylint: disable=consider-using-with
+            self._active_file = open(active.path, "ab")
+            self._active = active
+            self._segments.append(active)
+        return active
+
+    def _seal_active_segment(self) -> None:
+        """Close the active segment; the next append starts a new one."""
+        if self._active_file is not None:
+            try:
+                self._active_file.close()
+            except OSError:
+                pass
+        self._active_file = None
+        self._active = None
+
+    def _make_room(self, record_size: int) -> None:
+        """Evict the oldest segments until the new record fits the size cap."""
+        total = sum(s.size for s in self._segments)
+        evicted = 0
+        while self._segments and total + record_size > self.max_bytes:
+            oldest = self._segments[0]
+            if oldest is self._active:
+                self._seal_active_segment()
+            evicted += sum(1 for r in oldest.records if r.batch_id in self._pending)
+            total -= oldest.size
+            self._remove_segment(oldest)
+        if evicted:
+            self._stats["evicted_batches"] += evicted
+            safe_log(
+                self.tracer_instance,
+                "warning",
+                "OTLP spool size cap reached, evicted %d oldest batches",
+                evicted,
+                honeyhive_data={"max_bytes": self.max_bytes},
+            )
+
+    def _read_body(self, segment: _Segment, record: _SpoolRecord) -> Optional[bytes]:
+        """Read and verify a record body; None if it is gone or corrupt."""
+        try:
+            with open(segment.path, "rb") as handle:
+                handle.seek(record.offset)
+                data = handle.read(_HEADER.size + record.length)
+        except FileNotFoundError:
+            # Evicted by the size cap while replay was in progress
+            return None
+        except OSError as e:
+            safe_log(
+                self.tracer_instance,
+                "warning",
+                f"Failed to read spooled batch: {e}",
+                honeyhive_data={"error_type": type(e).__name__},
+            )
+            return None
+
+        body = data[_HEADER.size :]
+        crc = _HEADER.unpack_from(data)[2] if len(data) >= _HEADER.size else None
+        if len(body) != record.length or zlib.crc32(body) != crc:
+            self._ack(record.batch_id, "corrupt_records")
+            return None
+        return body
+
+    def _ack(self, batch_key: str, counter: Optional[str]) -> None:
+        """Durably mark a batch as done so it is never replayed again."""
+        with self._lock:
+            if batch_key in self._acked:
+                return
+            if self._ack_file is not None:
+                try:
+                    self._ack_file.write(batch_key.encode("ascii") + b"\n")
+                    self._ack_file.flush()
+                    os.fsync(self._ack_file.fileno())
+                except OSError as e:
+                    safe_log(
+                        self.tracer_instance,
+                        "warning",
+                        f"Failed to record OTLP spool acknowledgement: {e}",
+                        honeyhive_data={"error_type": type(e).__name__},
+                    )
+            self._acked.add(batch_key)
+            self._pending.pop(batch_key, None)
+            if counter:
+                self._stats[counter] += 1
+
+    def _delete_acked_segments(self) -> None:
+        """Delete sealed segments whose records have all been acknowledged."""
+        with self._lock:
+            removed = False
+            for segment in list(self._segments):
+                if segment is self._active:
+                    continue
+                if all(r.batch_id not in self._pending for r in segment.records):
+                    self._remove_segment(segment)
+                    removed = True
+            if removed:
+                self._compact_acks()
+
+    def _remove_segment(self, segment: _Segment) -> None:
+        """Forget a segment and delete its file."""
+        self._segments.remove(segment)
+        for record in segment.records:
+            if self._pending.get(record.batch_id) is segment:
+                del self._pending[record.batch_id]
+        try:
+            os.remove(segment.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            safe_log(
+                self.tracer_instance,
+                "debug",
+                f"Failed to delete OTLP spool segment: {e}",
+                honeyhive_data={"segment": segment.path},
+            )
+
+    def _compact_acks(self) -> None:
+        """Rewrite the ack log with only ids of records still on disk."""
+        live = {r.batch_id for s in self._segments for r in s.records}
+        self._acked &= live
+        path = os.path.join(self.directory, _ACK_FILE)
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as handle:
+                handle.write(
+                    b"".join(key.encode("ascii") + b"\n" for key in self._acked)
+                )
+                handle.flush()
+                os.fsync(handle.fileno())
+            if self._ack_file is not None:
+                self._ack_file.close()
+            os.replace(tmp_path, path)
+            if self._ack_file is not None:
+                # pylint: disable=consider-using-with
+                self._ack_file = open(path, "ab")
+        except OSError as e:
+            safe_log(
+                self.tracer_instance,
+                "debug",
+                f"Failed to compact OTLP spool acknowledgements: {e}",
+                honeyhive_data={"error_type": type(e).__name__},
+            )
+
+
+class SpoolReplayer:
+    """Background thread that drains an :class:`ExportSpool` with backoff.
+
+    The replayer retries with jittered exponential backoff while the endpoint
+    keeps failing; :meth:`notify` (called after a successful live export)
+    wakes it immediately so the spool drains as soon as the backend recovers.
+    """
+
+    def __init__(
+        self,
+        spool: ExportSpool,
+        send: SpoolSender,
+        *,
+        initial_backoff: float = DEFAULT_REPLAY_INITIAL_BACKOFF,
+        max_backoff: float = DEFAULT_REPLAY_MAX_BACKOFF,
+        tracer_instance: Any = None,
+    ) -> None:
+        """Initialize the replayer.
+
+        Args:
+            spool: Spool to drain
+            send: Callable that posts a body and returns the HTTP status code
+            initial_backoff: First retry delay in seconds
+            max_backoff: Maximum retry delay (also the idle poll interval)
+            tracer_instance: Optional tracer instance for logging context
+        """
+        self.spool = spool
+        self._send = send
+        self.initial_backoff = max(0.0, float(initial_backoff))
+        self.max_backoff = max(self.initial_backoff, float(max_backoff))
+        self.tracer_instance = tracer_instance
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the replay thread (idempotent)."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="honeyhive-otlp-spool-replay", daemon=True
+        )
+        self._thread.start()
+
+    def notify(self) -> None:
+        """Wake the replayer if batches are waiting (exports work again)."""
+        if self.spool.has_pending():
+            self._wake.set()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the replay thread, waiting up to ``timeout`` seconds."""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Replay loop: back off while failing, idle-poll while empty."""
+        backoff = self.initial_backoff
+        delay = self.initial_backoff
+        while not self._stopped.is_set():
+            self._wake.wait(delay)
+            self._wake.clear()
+            if self._stopped.is_set():
+                return
+            if not self.spool.has_pending():
+                backoff = self.initial_backoff
+                delay = self.max_backoff
+                continue
+
+            try:
+                drained = self.spool.replay(self._send)
+            except Exception as e:
+                safe_log(
+                    self.tracer_instance,
+                    "debug",
+                    f"OTLP spool replay error: {e}",
+                    honeyhive_data={"error_type": type(e).__name__},
+                )
+                drained = False
+
+            if drained:
+                backoff = self.initial_backoff
+                delay = self.max_backoff
+            else:
+                # Jitter keeps many processes from retrying in lockstep
+                delay = random.uniform(backoff / 2, backoff)
+                backoff = min(backoff * 2, self.max_backoff)
@@ -0,0 +1,350 @@
+"""In-process metrics for the span export pipeline.
+
+Each tracer owns one :class:`PipelineMetrics` registry (``tracer._pipeline_metrics``)
+shared by its span processor, batch processor and exporter:
+
+- :class:`Counter` and :class:`Histogram` record into per-thread cells, so the
+  hot path takes no lock: a thread only ever writes its own cell and readers
+  sum all cells. Cells of threads that have exited are folded into a retired
+  total when a snapshot is taken.
+- Histograms use fixed bucket bounds. Percentiles are estimated from the
+  bucket counts by linear interpolation within the bucket.
+- Gauges are callbacks evaluated when a snapshot is taken (for example queue
+  depth or the exporter's connection pool statistics).
+
+Snapshots are read without stopping writers, so counts recorded while a
+snapshot is taken may appear in one value and not yet in another.
+``tracer.get_pipeline_stats()`` returns a snapshot, and
+:meth:`PipelineMetrics.register_otel_instruments` reports the registry
+through OpenTelemetry observable instruments.
+"""
+
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Bucket upper bounds (the last bucket is unbounded)
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+BYTE_BUCKETS: Tuple[float, ...] = tuple(float(1024 * 4**i) for i in range(8))
+SPAN_COUNT_BUCKETS: Tuple[float, ...] = (
+    1,
+    2,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    512,
+    1000,
+    2500,
+)
+
+PERCENTILES = (0.5, 0.9, 0.99)
+
+
+class _PerThreadCells:
+    """Per-thread list cells with folding of exited threads."""
+
+    def __init__(self, width: int) -> None:
+        self._width = width
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._cells: List[Tuple["weakref.ReferenceType[threading.Thread]", list]] = []
+        self.retired: List[float] = [0] * width
+
+    def cell(self) -> list:
+        """Get the calling thread's cell, creating it on first use."""
+        try:
+            return self._local.cell  # type: ignore[no-any-return]
+        except AttributeError:
+            cell = [0] * self._width
+            self._local.cell = cell
+            with self._lock:
+                self._cells.append((weakref.ref(threading.current_thread()), cell))
+            return cell
+
+    def collect(self, fold: Callable[[List[float], list], None]) -> List[float]:
+        """Combine all cells with ``fold``, retiring cells of exited threads."""
+        with self._lock:
+            live = []
+            for thread_ref, cell in self._cells:
+                thread = thread_ref()
+                if thread is None or not thread.is_alive():
+                    fold(self.retired, cell)
+                else:
+                    live.append((thread_ref, cell))
+            self._cells = live
+            total = list(self.retired)
+            for _, cell in live:
+                fold(total, cell)
+            return total
+
+
+def _add(total: List[float], cell: list) -> None:
+    for index, value in enumerate(cell):
+        total[index] += value
+
+
+class Counter:
+    """Monotonic counter without locking on the write path."""
+
+    def __init__(self) -> None:
+        """Initialize a zero counter."""
+        self._cells = _PerThreadCells(1)
+
+    def add(self, amount: int = 1) -> None:
+        """Increase the counter."""
+        self._cells.cell()[0] += amount
+
+    @property
+    def value(self) -> int:
+        """Current total."""
+        return int(self._cells.collect(_add)[0])
+
+
+class Histogram:
+    """Fixed-bucket histogram without locking on the write path."""
+
+    # Cell layout: count, sum, max, then one count per bucket
+    _COUNT, _SUM, _MAX, _BUCKETS = 0, 1, 2, 3
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            bounds: Increasing bucket upper bounds; values above the last
+                bound fall into an extra unbounded bucket
+        """
+        self.bounds = tuple(bounds)
+        self._cells = _PerThreadCells(self._BUCKETS + len(self.bounds) + 1)
+
+    def record(self, value: float) -> None:
+        """Record one observation."""
+        cell = self._cells.cell()
+        cell[0] += 1
+        cell[1] += value
+        if value > cell[2]:
+            cell[2] = value
+        cell[3 + bisect_left(self.bounds, value)] += 1
+
+    @staticmethod
+    def _fold(total: List[float], cell: list) -> None:
+        total[0] += cell[0]
+        total[1] += cell[1]
+        total[2] = max(total[2], cell[2])
+        for index in range(3, len(cell)):
+            total[index] += cell[index]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get count, sum, max, estimated percentiles and bucket counts."""
+        total = self._cells.collect(self._fold)
+        count = int(total[self._COUNT])
+        buckets = [int(c) for c in total[self._BUCKETS :]]
+        observed_max = total[self._MAX]
+        snapshot: Dict[str, Any] = {
+            "count": count,
+            "sum": total[self._SUM],
+            "max": observed_max,
+        }
+        for quantile in PERCENTILES:
+            snapshot[f"p{round(quantile * 100)}"] = self._percentile(
+                quantile, count, buckets, observed_max
+            )
+        snapshot["buckets"] = [
+            [bound, bucket] for bound, bucket in zip(self.bounds, buckets)
+        ] + [["+Inf", buckets[-1]]]
+        return snapshot
+
+    def _percentile(
+        self, quantile: float, count: int, buckets: List[int], observed_max: float
+    ) -> Optional[float]:
+        """Estimate a percentile by interpolating within its bucket."""
+        if not count:
+            return None
+        rank = quantile * count
+        seen = 0
+        for index, bucket in enumerate(buckets):
+            if bucket and seen + bucket >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else observed_max
+                upper = min(upper, observed_max)
+                lower = min(lower, upper)
+                return lower + (upper - lower) * (rank - seen) / bucket
+            seen += bucket
+        return observed_max
+
+
+class PipelineMetrics:
+    """Registry of named counters, histograms and gauges."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Counter] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._gauges: Dict[str, Callable[[], Any]] = {}
+
+    def counter(self, name: str) -> Counter:
+        """Get or create a counter."""
+        with self._lock:
+            counter = self._counters.get(name)
+            if counter is None:
+                counter = self._counters[name] = Counter()
+            return counter
+
+    def histogram(self, name: str, bounds: Sequence[float]) -> Histogram:
+        """Get or create a histogram (bounds apply on creation only)."""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram(bounds)
+            return histogram
+
+    def register_gauge(self, name: str, callback: Callable[[], Any]) -> None:
+        """Register a callback whose result is included in snapshots."""
+        with self._lock:
+            self._gauges[name] = callback
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the current value of every metric.
+
+        Returns:
+            Dictionary with ``counters``, ``histograms`` and ``gauges``
+            sections. A gauge whose callback fails reports ``{"error": ...}``.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = dict(self._histograms)
+            gauges = dict(self._gauges)
+        gauge_values: Dict[str, Any] = {}
+        for name, callback in gauges.items():
+            try:
+                gauge_values[name] = callback()
+            except Exception as e:
+                gauge_values[name] = {"error": str(e)}
+        return {
+            "counters": {name: c.value for name, c in counters.items()},
+            "histograms": {name: h.snapshot() for name, h in histograms.items()},
+            "gauges": gauge_values,
+        }
+
+    def register_otel_instruments(
+        self, meter: Any, prefix: str = "honeyhive.pipeline"
+    ) -> int:
+        """Report this registry through OpenTelemetry observable instruments.
+
+        Counters become observable counters, histograms an observable
+        counter (``.count``) plus an observable gauge with one point per
+        percentile, and numeric gauge values observable gauges. Only
+        metrics registered before this call are reported.
+
+        Args:
+            meter: OpenTelemetry ``Meter``
+            prefix: Instrument name prefix
+
+        Returns:
+            Number of instruments created
+        """
+        # pylint: disable=import-outside-toplevel
+        from opentelemetry.metrics import Observation
+
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = dict(self._histograms)
+            gauge_names = list(self._gauges)
+
+        created = 0
+        for name, counter in counters.items():
+            meter.create_observable_counter(
+                f"{prefix}.{name}",
+                callbacks=[lambda _options, c=counter: [Observation(c.value)]],
+            )
+            created += 1
+
+        for name, histogram in histograms.items():
+
+            def _percentiles(_options: Any, h: Histogram = histogram) -> List[Any]:
+                snapshot = h.snapshot()
+                return [
+                    Observation(snapshot[key], {"quantile": key})
+                    for key in (f"p{round(q * 100)}" for q in PERCENTILES)
+                    if snapshot[key] is not None
+                ]
+
+            meter.create_observable_counter(
+                f"{prefix}.{name}.count",
+                callbacks=[
+                    lambda _options, h=histogram: [Observation(h.snapshot()["count"])]
+                ],
+            )
+            meter.create_observable_gauge(f"{prefix}.{name}", callbacks=[_percentiles])
+            created += 2
+
+        for name in gauge_names:
+
+            def _gauge(_options: Any, gauge: str = name) -> List[Any]:
+                callback = self._gauges.get(gauge)
+                try:
+                    value = callback() if callback else None
+                except Exception:
+                    return []
+                return [
+                    Observation(number, {"key": key})
+                    for key, number in _numeric_items(value)
+                ]
+
+            meter.create_observable_gauge(f"{prefix}.{name}", callbacks=[_gauge])
+            created += 1
+        return created
+
+
+def _numeric_items(value: Any, key: str = "") -> List[Tuple[str, float]]:
+    """Flatten the numeric leaves of a gauge value into (key, number) pairs."""
+    if isinstance(value, bool):
+        return []
+    if isinstance(value, (int, float)):
+        return [(key or "value", value)]
+    if isinstance(value, dict):
+        items: List[Tuple[str, float]] = []
+        for child_key, child in value.items():
+            items.extend(
+                _numeric_items(child, f"{key}.{child_key}" if key else str(child_key))
+            )
+        return items
+    return []
+
+
+def pipeline_metrics_for(tracer_instance: Any) -> PipelineMetrics:
+    """Get a tracer's pipeline metrics registry.
+
+    Args:
+        tracer_instance: Tracer owning the registry (may be None)
+
+    Returns:
+        The tracer's registry, or a new private registry when the tracer has
+        none (standalone processors and exporters)
+    """
+    metrics = getattr(tracer_instance, "_pipeline_metrics", None)
+    if isinstance(metrics, PipelineMetrics):
+        return metrics
+    return PipelineMetrics()
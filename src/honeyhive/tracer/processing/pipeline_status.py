@@ -0,0 +1,272 @@
+"""Export pipeline status published for other processes.
+
+Circuit breaker state and pipeline metrics live in the memory of the traced
+process, so ``honeyhive monitor status`` and ``honeyhive monitor watch``
+(running in a separate process) cannot query them directly. Instead, every
+process with tracers runs one :class:`PipelineStatusPublisher`:
+
+- Every ``otlp_status_interval`` seconds it writes ``<pid>.json`` to the
+  status directory (``otlp_status_dir``, by default
+  ``<tempdir>/honeyhive-pipelines-<uid>``). The file lists each registered
+  tracer with its exporter type, circuit breaker state and
+  ``tracer.get_pipeline_stats()`` snapshot. Files are replaced atomically.
+- The file is removed when the process has no tracers left and at exit.
+- The first tracer of a process starts the publisher, and its settings apply
+  to the whole process. An interval of 0 disables publishing.
+
+:func:`read_pipeline_status` is the reading side. It skips (and removes)
+files of processes that no longer exist and marks files that have not been
+updated for several intervals as stale.
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from ...utils.logger import safe_log
+
+DEFAULT_STATUS_INTERVAL = 5.0
+
+# A file not rewritten for this many intervals is reported as stale
+_STALE_INTERVALS = 3
+
+_PUBLISHER: Optional["PipelineStatusPublisher"] = None
+_PUBLISHER_LOCK = threading.Lock()
+
+
+def default_status_directory() -> str:
+    """Get the per-user default status directory in the temp directory."""
+    suffix = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+    return os.path.join(tempfile.gettempdir(), f"honeyhive-pipelines{suffix}")
+
+
+def tracer_pipeline_status(tracer_instance: Any) -> Dict[str, Any]:
+    """Describe one tracer's export pipeline.
+
+    Args:
+        tracer_instance: Registered tracer
+
+    Returns:
+        Dictionary with the tracer id and project, the exporter type, the
+        circuit breaker state (None for exporters without one) and the
+        pipeline metrics snapshot
+    """
+    exporter = getattr(tracer_instance, "otlp_exporter", None)
+    get_circuit_stats = getattr(exporter, "get_circuit_stats", None)
+    get_pipeline_stats = getattr(tracer_instance, "get_pipeline_stats", None)
+    return {
+        "tracer_id": getattr(tracer_instance, "_tracer_id", None),
+        "project": getattr(tracer_instance, "project_name", None),
+        "exporter": type(exporter).__name__ if exporter is not None else None,
+        "circuit": get_circuit_stats() if callable(get_circuit_stats) else None,
+        "pipeline": get_pipeline_stats() if callable(get_pipeline_stats) else None,
+    }
+
+
+class PipelineStatusPublisher:
+    """Background thread writing this process's pipeline status file."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        interval: float = DEFAULT_STATUS_INTERVAL,
+        tracer_instance: Any = None,
+    ) -> None:
+        """Initialize the publisher (call :meth:`start` to begin writing).
+
+        Args:
+            directory: Status directory; the per-user temp directory when None
+            interval: Seconds between writes
+            tracer_instance: Tracer used for logging context
+        """
+        self.directory = directory or default_status_directory()
+        self.interval = interval
+        self.tracer_instance = tracer_instance
+        self.pid = os.getpid()
+        self.path = os.path.join(self.directory, f"{self.pid}.json")
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._failed = False
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the publishing thread is alive (False in forked children)."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the publishing thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="honeyhive-pipeline-status", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread and remove the status file."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        self._remove()
+
+    def publish(self) -> bool:
+        """Write the status of every registered tracer now.
+
+        Returns:
+            True if a status file was written; False when there are no
+            tracers (the file is removed) or the write failed
+        """
+        # pylint: disable=import-outside-toplevel
+        from ..registry import get_all_tracers
+
+        pipelines = []
+        for tracer in get_all_tracers():
+            try:
+                pipelines.append(tracer_pipeline_status(tracer))
+            except Exception as e:
+                pipelines.append({"error": str(e)})
+        if not pipelines:
+            self._remove()
+            return False
+
+        status = {
+            "pid": self.pid,
+            "updated_at": time.time(),
+            "interval": self.interval,
+            "pipelines": pipelines,
+        }
+        temp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as status_file:
+                json.dump(status, status_file, default=str)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            if not self._failed:
+                self._failed = True
+                safe_log(
+                    self.tracer_instance,
+                    "debug",
+                    f"Could not write pipeline status file: {e}",
+                    honeyhive_data={"path": self.path},
+                )
+            return False
+        return True
+
+    def _run(self) -> None:
+        """Publish until stopped."""
+        while True:
+            try:
+                self.publish()
+            except Exception as e:
+                safe_log(
+                    self.tracer_instance,
+                    "debug",
+                    f"Pipeline status publishing failed: {e}",
+                    honeyhive_data={"error_type": type(e).__name__},
+                )
+            if self._stop.wait(self.interval):
+                return
+
+    def _remove(self) -> None:
+        """Remove this process's status file if it exists."""
+        if os.getpid() != self.pid:
+            return
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def start_status_publisher(
+    directory: Optional[str] = None,
+    interval: float = DEFAULT_STATUS_INTERVAL,
+    tracer_instance: Any = None,
+) -> Optional[PipelineStatusPublisher]:
+    """Start the process's status publisher unless it is already running.
+
+    Args:
+        directory: Status directory; the per-user temp directory when None
+        interval: Seconds between writes; 0 disables publishing
+        tracer_instance: Tracer used for logging context
+
+    Returns:
+        The running publisher, or None when publishing is disabled
+    """
+    global _PUBLISHER  # pylint: disable=global-statement
+    if interval <= 0:
+        return None
+    with _PUBLISHER_LOCK:
+        if _PUBLISHER is not None and _PUBLISHER.is_running:
+            return _PUBLISHER
+        first_start = _PUBLISHER is None
+        _PUBLISHER = PipelineStatusPublisher(directory, interval, tracer_instance)
+        _PUBLISHER.start()
+    if first_start:
+        atexit.register(_stop_status_publisher)
+    return _PUBLISHER
+
+
+def _stop_status_publisher() -> None:
+    """Stop the process's publisher (atexit)."""
+    with _PUBLISHER_LOCK:
+        publisher = _PUBLISHER
+    if publisher is not None:
+        publisher.stop()
+
+
+def _process_exists(pid: int) -> bool:
+    """Check whether a process with this pid is running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+def read_pipeline_status(directory: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Read the status files published by running processes.
+
+    Args:
+        directory: Status directory; the per-user temp directory when None
+
+    Returns:
+        One status per process (``pid``, ``updated_at``, ``interval``,
+        ``pipelines`` and ``stale``), ordered by pid. Files of processes
+        that have exited are removed.
+    """
+    directory = directory or default_status_directory()
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+
+    statuses = []
+    now = time.time()
+    for name in names:
+        if not name.endswith(".json"):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            with open(path, encoding="utf-8") as status_file:
+                status = json.load(status_file)
+            pid = int(status["pid"])
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+        if not _process_exists(pid):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            continue
+        interval = float(status.get("interval") or DEFAULT_STATUS_INTERVAL)
+        age = now - float(status.get("updated_at") or 0)
+        status["stale"] = age > interval * _STALE_INTERVALS
+        statuses.append(status)
+    return sorted(statuses, key=lambda status: int(status["pid"]))
@@ -0,0 +1,282 @@
+"""Session-level head and tail sampling for HoneyHive spans.
+
+Sampling decisions are made per ``session_id`` so a session is either
+exported as a whole or not at all:
+
+- Head sampling keeps ``sampling_ratio`` of sessions. The decision is a hash
+  of the session id, so every span of a session (and every service that sees
+  it) agrees without coordination.
+- Tail sampling (``tail_sampling=True``) rescues sessions head sampling
+  would drop when they turn out to be interesting. Their spans are buffered
+  per session, across traces and turns. The first span that failed, took at
+  least ``tail_sampling_slow_span_ms`` or has one of
+  ``tail_sampling_event_types`` keeps the session: the buffer is exported and
+  later spans of the session are exported immediately. A session with nothing
+  interesting ``tail_sampling_decision_wait`` seconds after its first span, or
+  evicted when the buffer is full, is dropped, and later spans of the session
+  are dropped too.
+
+Each session is decided once, and the decision (keep or drop) is remembered
+for the most recent sessions. Sessions selected by head sampling are never
+buffered, so tail sampling only costs memory for sessions that would
+otherwise be dropped.
+"""
+
+# pylint: disable=too-many-instance-attributes
+# Justification: The sampler tracks configuration, buffers and counters
+
+import collections
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.trace import StatusCode
+
+from ...utils.logger import safe_log
+
+DEFAULT_SLOW_SPAN_MS = 5000.0
+DEFAULT_DECISION_WAIT = 30.0
+DEFAULT_MAX_BUFFERED_SPANS = 10000
+
+# Kept sessions remembered so their late spans skip the buffer
+_MAX_REMEMBERED_SESSIONS = 10000
+_HASH_SPACE = 1 << 64
+
+
+def session_sampled(session_id: str, ratio: float) -> bool:
+    """Deterministic head sampling decision for a session.
+
+    Args:
+        session_id: Session identifier
+        ratio: Fraction of sessions to keep (0.0 - 1.0)
+
+    Returns:
+        True if the session falls within the sampled fraction
+    """
+    if ratio >= 1.0:
+        return True
+    if ratio <= 0.0:
+        return False
+    digest = hashlib.blake2b(session_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") < ratio * _HASH_SPACE
+
+
+class _SessionBuffer:
+    """Spans of one session waiting for a tail sampling decision."""
+
+    __slots__ = ("spans", "started_at")
+
+    def __init__(self, started_at: float) -> None:
+        self.spans: List[ReadableSpan] = []
+        self.started_at = started_at
+
+
+class SpanSampler:
+    """Head and tail sampler applied to ended spans by the span processor.
+
+    :meth:`on_end` returns the spans that should be exported now: the span
+    itself when its session is sampled or kept, nothing while it is buffered
+    or its session is dropped, or the whole buffered session once it is kept.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 1.0,
+        *,
+        tail_sampling: bool = False,
+        slow_span_ms: float = DEFAULT_SLOW_SPAN_MS,
+        keep_event_types: Iterable[str] = (),
+        decision_wait: float = DEFAULT_DECISION_WAIT,
+        max_buffered_spans: int = DEFAULT_MAX_BUFFERED_SPANS,
+        tracer_instance: Any = None,
+    ) -> None:
+        """Initialize the sampler.
+
+        Args:
+            ratio: Fraction of sessions kept by head sampling (0.0 - 1.0)
+            tail_sampling: Buffer sessions head sampling drops and keep the
+                interesting ones
+            slow_span_ms: Spans at least this long make a session interesting
+            keep_event_types: Event types (``honeyhive_event_type``) that
+                make a session interesting
+            decision_wait: Seconds after its first span that a session with
+                nothing interesting is dropped
+            max_buffered_spans: Buffer capacity; the oldest sessions are
+                dropped early when it is exceeded
+            tracer_instance: Optional tracer instance for logging context
+        """
+        self.ratio = min(1.0, max(0.0, float(ratio)))
+        self.tail_sampling = tail_sampling
+        self.slow_span_ns = int(float(slow_span_ms) * 1_000_000)
+        self.keep_event_types = frozenset(name for name in keep_event_types if name)
+        self.decision_wait = max(0.0, float(decision_wait))
+        self.max_buffered_spans = max(1, int(max_buffered_spans))
+        self.tracer_instance = tracer_instance
+
+        self._lock = threading.Lock()
+        self._buffers: "collections.OrderedDict[str, _SessionBuffer]" = (
+            collections.OrderedDict()
+        )
+        # Remembered tail decisions: session_id -> True (kept) / False (dropped)
+        self._decisions: "collections.OrderedDict[str, bool]" = (
+            collections.OrderedDict()
+        )
+        self._buffered_spans = 0
+        self._stats = {
+            "kept_spans": 0,
+            "dropped_spans": 0,
+            "tail_kept_sessions": 0,
+            "tail_dropped_sessions": 0,
+        }
+
+    def on_end(self, span: ReadableSpan, session_id: str) -> List[ReadableSpan]:
+        """Apply sampling to an ended span.
+
+        Args:
+            span: Span that just ended
+            session_id: HoneyHive session the span belongs to
+
+        Returns:
+            Spans to export now: the span, or the buffered spans of its
+            session once the session is kept
+        """
+        if session_sampled(session_id, self.ratio):
+            with self._lock:
+                self._stats["kept_spans"] += 1
+            return [span]
+        if not self.tail_sampling:
+            with self._lock:
+                self._stats["dropped_spans"] += 1
+            return []
+
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            decision = self._decisions.get(session_id)
+            if decision is not None:
+                self._decisions.move_to_end(session_id)
+                self._stats["kept_spans" if decision else "dropped_spans"] += 1
+                return [span] if decision else []
+
+            buffer = self._buffers.get(session_id)
+            if buffer is None:
+                buffer = self._buffers[session_id] = _SessionBuffer(now)
+            buffer.spans.append(span)
+            self._buffered_spans += 1
+            if self._is_interesting(span):
+                return self._decide(session_id, keep=True)
+            self._expire(now)
+            return []
+
+    def expire(self) -> None:
+        """Drop buffered sessions past the decision wait."""
+        with self._lock:
+            self._expire(time.monotonic())
+
+    def close(self) -> None:
+        """Drop every undecided session, e.g. when the tracer shuts down."""
+        with self._lock:
+            for session_id in list(self._buffers):
+                self._decide(session_id, keep=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get kept/dropped counters and the current buffer depth."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats.update(
+                {
+                    "sampling_ratio": self.ratio,
+                    "tail_sampling": self.tail_sampling,
+                    "buffered_sessions": len(self._buffers),
+                    "buffered_spans": self._buffered_spans,
+                }
+            )
+            return stats
+
+    def _is_interesting(self, span: ReadableSpan) -> bool:
+        """Whether a span forces its session to be kept."""
+        if span.status.status_code == StatusCode.ERROR:
+            return True
+        attributes = span.attributes or {}
+        if attributes.get("honeyhive_error"):
+            return True
+        if (
+            span.end_time is not None
+            and span.start_time is not None
+            and span.end_time - span.start_time >= self.slow_span_ns
+        ):
+            return True
+        return attributes.get("honeyhive_event_type") in self.keep_event_types
+
+    def _decide(self, session_id: str, keep: bool) -> List[ReadableSpan]:
+        """Record the decision for a buffered session; must hold the lock."""
+        buffer = self._buffers.pop(session_id)
+        self._buffered_spans -= len(buffer.spans)
+        self._decisions[session_id] = keep
+        if len(self._decisions) > _MAX_REMEMBERED_SESSIONS:
+            self._decisions.popitem(last=False)
+        if keep:
+            self._stats["tail_kept_sessions"] += 1
+            self._stats["kept_spans"] += len(buffer.spans)
+            return buffer.spans
+        self._stats["tail_dropped_sessions"] += 1
+        self._stats["dropped_spans"] += len(buffer.spans)
+        return []
+
+    def _expire(self, now: float) -> None:
+        """Drop sessions past the decision wait or over capacity."""
+        while self._buffers:
+            session_id, buffer = next(iter(self._buffers.items()))
+            if (
+                now - buffer.started_at < self.decision_wait
+                and self._buffered_spans <= self.max_buffered_spans
+            ):
+                break
+            self._decide(session_id, keep=False)
+
+
+def create_span_sampler(tracer_instance: Any) -> Optional[SpanSampler]:
+    """Build a sampler from the tracer's config, or None when sampling is off.
+
+    Args:
+        tracer_instance: Tracer whose unified config to read (may be None)
+
+    Returns:
+        A :class:`SpanSampler` when ``sampling_ratio`` is below 1.0
+    """
+    config = getattr(tracer_instance, "config", None)
+    if not isinstance(config, dict):
+        return None
+    ratio = config.get("sampling_ratio")
+    if not isinstance(ratio, (int, float)) or ratio >= 1.0:
+        return None
+
+    def _setting(name: str, default: Any, kind: Any) -> Any:
+        value = config.get(name)
+        return value if isinstance(value, kind) else default
+
+    sampler = SpanSampler(
+        ratio,
+        tail_sampling=_setting("tail_sampling", False, bool),
+        slow_span_ms=_setting(
+            "tail_sampling_slow_span_ms", DEFAULT_SLOW_SPAN_MS, (int, float)
+        ),
+        keep_event_types=_setting("tail_sampling_event_types", "", str).split(","),
+        decision_wait=_setting(
+            "tail_sampling_decision_wait", DEFAULT_DECISION_WAIT, (int, float)
+        ),
+        tracer_instance=tracer_instance,
+    )
+    safe_log(
+        tracer_instance,
+        "debug",
+        "Span sampling enabled",
+        honeyhive_data={
+            "sampling_ratio": sampler.ratio,
+            "tail_sampling": sampler.tail_sampling,
+            "keep_event_types": sorted(sampler.keep_event_types),
+        },
+    )
+    return sampler
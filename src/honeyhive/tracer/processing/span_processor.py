@@ -7,22 +7,33 @@
 # protected-access: Accessing _config is the established pattern for tracer config
 # too-many-lines: Comprehensive span processor with debugging requires additional code
 # line-too-long: Complex OpenTelemetry attribute mappings exceed 88 char limit
-# invalid-name: OPENINFERENCE_TO_HONEYHIVE is a constant mapping dict (acceptable)
+# invalid-name: Historical constant naming in mapping tables (acceptable)
 # no-else-return: Early return pattern improves readability in complex conditionals
 
 import json
+import time
 import uuid
 import warnings
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from opentelemetry import baggage, context
 from opentelemetry.context import Context
 from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.trace import SpanKind
 
 from ..utils import convert_enum_to_string
 from ..utils.event_type import detect_event_type_from_patterns, extract_raw_attributes
+from .attribute_aliases import ALIAS_MODE_SPAN, compact_aliases, get_alias_mode
+from .batch_processor import HoneyHiveBatchSpanProcessor, get_batch_settings
+from .export_hub import SharedExportChannel
+from .otlp_async_exporter import AsyncBatchSpanProcessor, AsyncOTLPExporter
+from .pipeline_metrics import LATENCY_BUCKETS, pipeline_metrics_for
+from .sampling import create_span_sampler
+from .span_size import (
+    DEFAULT_MAX_SPAN_SIZE,
+    SPAN_SIZE_POLICY_TRUNCATE,
+    SpanSizeLimiter,
+)
 
 # No module-level logger - use tracer instance logger
 
@@ -35,6 +46,71 @@ _GENAI_OP_TO_EVENT_TYPE = {
     "execute_tool": "tool",
 }
 
+# OpenInference span.kind → HoneyHive event type
+_OPENINFERENCE_TO_EVENT_TYPE = {
+    "LLM": "model",  # LLM invocations
+    "CHAIN": "chain",  # Multi-step workflows
+    "TOOL": "tool",  # Tool/function calls
+    "AGENT": "chain",  # Agent operations (map to chain)
+    "RETRIEVER": "tool",  # Retrieval operations
+    "EMBEDDING": "tool",  # Embedding generation (map to tool)
+    "RERANKER": "tool",  # Reranking operations
+    "GUARDRAIL": "tool",  # Guardrail checks
+}
+
+# Baggage keys mapped to dedicated attributes instead of "baggage.<key>"
+_RESERVED_BAGGAGE_KEYS = frozenset(
+    {
+        "session_id",
+        "project",
+        "source",
+        "parent_id",
+        "run_id",
+        "dataset_id",
+        "datapoint_id",
+        "honeyhive_tracer_id",  # Internal tracer discovery key
+    }
+)
+
+# Contexts whose baggage-derived attributes are memoized per processor
+_CONTEXT_CACHE_SIZE = 256
+
+
+class _ContextAttributes:
+    """Baggage-derived enrichment for one (immutable) OpenTelemetry Context."""
+
+    __slots__ = (
+        "session_id",
+        "project",
+        "source",
+        "session_name",
+        "association",
+        "session_scoped",
+        "custom",
+    )
+
+    def __init__(self, processor: "HoneyHiveSpanProcessor", ctx: Context) -> None:
+        self.session_id = baggage.get_baggage("session_id", ctx)
+        self.project = baggage.get_baggage("project", ctx)
+        self.source = baggage.get_baggage("source", ctx)
+        self.session_name = baggage.get_baggage("session_name", ctx)
+        # Legacy association_properties, applied to every span
+        self.association = processor._process_association_properties(ctx)
+        # parent_id, traceloop compatibility and evaluation metadata, applied
+        # to spans that belong to a session
+        self.session_scoped: Dict[str, Any] = {}
+        parent_id = baggage.get_baggage("parent_id", ctx)
+        if parent_id:
+            self.session_scoped["honeyhive.parent_id"] = parent_id
+        self.session_scoped.update(
+            processor._get_traceloop_compatibility_attributes(ctx)
+        )
+        self.session_scoped.update(
+            processor._get_evaluation_attributes_from_baggage(ctx)
+        )
+        # Custom "baggage.*" attributes, applied to every span
+        self.custom = processor._get_all_baggage_attributes(ctx)
+
 
 # Removed _get_config_value_dynamically_from_tracer - replaced by unified config
 # Use tracer.config.get(key) instead
@@ -74,7 +150,17 @@ class HoneyHiveSpanProcessor(SpanProcessor):
         self.disable_batch = disable_batch
         self.otlp_exporter = otlp_exporter
         self.tracer_instance = tracer_instance
-        self._batch_processor: Optional[BatchSpanProcessor] = None
+        self._batch_processor: Optional[
+            Union[
+                HoneyHiveBatchSpanProcessor,
+                AsyncBatchSpanProcessor,
+                SharedExportChannel,
+            ]
+        ] = None
+        self._metrics = pipeline_metrics_for(tracer_instance)
+        self._on_end_seconds = self._metrics.histogram(
+            "processor.on_end_seconds", LATENCY_BUCKETS
+        )
 
         # Multi-instance logging architecture uses safe_log utility
         # No need to store logger reference directly
@@ -93,16 +179,45 @@ class HoneyHiveSpanProcessor(SpanProcessor):
         self.mode = "otlp"
         batch_mode = "immediate" if disable_batch else "batched"
 
-        # When batching is enabled and we have an OTLP exporter, wrap it in
-        # OTel's BatchSpanProcessor for async background export.
-        # Uses OTel's upstream defaults (queue=2048, delay=5000ms, batch=512, timeout=30s).
+        # The async exporter keeps its own counters instead of recording into
+        # the registry; report them like the other exporters' session stats
+        if isinstance(otlp_exporter, AsyncOTLPExporter):
+            self._metrics.register_gauge("exporter", otlp_exporter.get_session_stats)
+
+        # When batching is enabled and we have an OTLP exporter, wrap it in a
+        # batch processor configured from the tracer's OTLP settings
+        # (batch_size, flush_interval, max_export_batch_size, export_timeout,
+        # max_queue_size, export_workers, queue_drop_policy). The async
+        # exporter gets its own processor, which dispatches batches
+        # concurrently on the exporter's event loop. A shared export channel
+        # queues on its hub's processor instead.
         if not disable_batch and otlp_exporter is not None:
-            self._batch_processor = BatchSpanProcessor(
-                span_exporter=otlp_exporter,
-            )
+            batch_settings = get_batch_settings(tracer_instance)
+            if isinstance(otlp_exporter, SharedExportChannel):
+                self._batch_processor = otlp_exporter
+            elif isinstance(otlp_exporter, AsyncOTLPExporter):
+                self._batch_processor = AsyncBatchSpanProcessor(
+                    otlp_exporter,
+                    max_queue_size=batch_settings["max_queue_size"],
+                    schedule_delay_millis=batch_settings["schedule_delay_millis"],
+                    max_export_batch_size=batch_settings["max_export_batch_size"],
+                    export_timeout_millis=batch_settings["export_timeout_millis"],
+                    drop_policy=batch_settings["drop_policy"],
+                    max_export_batch_bytes=batch_settings["max_export_batch_bytes"],
+                )
+            else:
+                self._batch_processor = HoneyHiveBatchSpanProcessor(
+                    otlp_exporter,
+                    tracer_instance=tracer_instance,
+                    metrics=self._metrics,
+                    **batch_settings,
+                )
+            self._metrics.register_gauge("queue", self._batch_processor.get_stats)
             self._safe_log(
                 "debug",
-                "🔧 BatchSpanProcessor created with OTel defaults",
+                "🔧 %s created from tracer config",
+                type(self._batch_processor).__name__,
+                honeyhive_data=batch_settings,
             )
 
         self._safe_log(
@@ -123,6 +238,55 @@ class HoneyHiveSpanProcessor(SpanProcessor):
         self._span_name_exclude_prefixes: List[str] = []
         self._parse_span_name_filters()
 
+        # Enforce max_span_size before spans reach the export queue
+        self._span_size_limiter = self._create_span_size_limiter()
+
+        # Session-level head/tail sampling (None when sampling_ratio is 1.0)
+        self._sampler = create_span_sampler(tracer_instance)
+
+        # Leave traceloop.* aliases off spans when the exporter restores them
+        self._compact_aliases = get_alias_mode(tracer_instance) != ALIAS_MODE_SPAN
+
+        # on_start enrichment caches: experiment attributes keyed by the
+        # tracer config object, baggage-derived attributes keyed by Context
+        self._experiment_attributes_cache: Optional[Tuple[Any, Dict[str, Any]]] = None
+        self._context_attributes_cache: Dict[
+            int, Tuple[Context, _ContextAttributes]
+        ] = {}
+
+    def _create_span_size_limiter(self) -> SpanSizeLimiter:
+        """Build the span size limiter from the tracer's max_span_size config."""
+        config = getattr(self.tracer_instance, "config", None)
+        if not isinstance(config, dict):
+            config = {}
+        max_span_size = getattr(self.tracer_instance, "_max_span_size", None)
+        if not isinstance(max_span_size, int):
+            max_span_size = config.get("max_span_size")
+        if not isinstance(max_span_size, int):
+            max_span_size = DEFAULT_MAX_SPAN_SIZE
+        policy = config.get("span_size_policy")
+        if not isinstance(policy, str):
+            policy = SPAN_SIZE_POLICY_TRUNCATE
+        return SpanSizeLimiter(
+            max_span_size, policy, tracer_instance=self.tracer_instance
+        )
+
+    def get_span_size_stats(self) -> Dict[str, int]:
+        """Get counters for spans truncated or dropped by max_span_size.
+
+        :return: truncated_spans, dropped_spans and trimmed_bytes counters
+        :rtype: Dict[str, int]
+        """
+        return self._span_size_limiter.get_stats()
+
+    def get_sampling_stats(self) -> Optional[Dict[str, Any]]:
+        """Get kept/dropped span and session counters from the sampler.
+
+        :return: Sampler counters, or None when sampling is disabled
+        :rtype: Optional[Dict[str, Any]]
+        """
+        return self._sampler.get_stats() if self._sampler is not None else None
+
     def _parse_span_name_filters(self) -> None:
         """Parse and cache span_name_filters from tracer config.
 
@@ -237,6 +401,14 @@ class HoneyHiveSpanProcessor(SpanProcessor):
             formatted_message = message
         safe_log(self.tracer_instance, level, formatted_message, **kwargs)
 
+    def _is_debug_enabled(self) -> bool:
+        """Check whether debug diagnostics would be logged for this tracer."""
+        # pylint: disable=import-outside-toplevel  # Avoids circular
+        # import: processor -> logger
+        from ...utils.logger import is_log_enabled
+
+        return is_log_enabled(self.tracer_instance, "debug")
+
     def _dump_raw_span_data(self, span: ReadableSpan) -> str:
         """Dump all raw span data for debugging.
 
@@ -639,21 +811,9 @@ class HoneyHiveSpanProcessor(SpanProcessor):
             if not all_baggage:
                 return attributes
 
-            # Keys that are already processed by other methods
-            excluded_keys = {
-                "session_id",
-                "project",
-                "source",
-                "parent_id",
-                "run_id",
-                "dataset_id",
-                "datapoint_id",
-                "honeyhive_tracer_id",  # Internal tracer discovery key
-            }
-
-            # Extract all other baggage items
+            # Extract all baggage items not already processed by other methods
             for key, value in all_baggage.items():
-                if key not in excluded_keys and value is not None:
+                if key not in _RESERVED_BAGGAGE_KEYS and value is not None:
                     # Add baggage items with "baggage." prefix for clarity
                     attributes[f"baggage.{key}"] = str(value)
 
@@ -677,9 +837,63 @@ class HoneyHiveSpanProcessor(SpanProcessor):
 
         return attributes
 
+    def invalidate_enrichment_cache(self) -> None:
+        """Drop cached on_start enrichment.
+
+        Call after mutating the tracer's experiment config in place; replacing
+        ``tracer.config`` is detected automatically.
+        """
+        self._experiment_attributes_cache = None
+        self._context_attributes_cache.clear()
+
+    def _get_cached_experiment_attributes(self) -> Dict[str, Any]:
+        """Experiment attributes, rebuilt only when the tracer config changes.
+
+        :return: Dictionary of experiment attributes (shared, do not mutate)
+        :rtype: Dict[str, Any]
+        """
+        config = getattr(self.tracer_instance, "config", None)
+        cached = self._experiment_attributes_cache
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        attributes = self._get_experiment_attributes()
+        self._experiment_attributes_cache = (config, attributes)
+        return attributes
+
+    def _get_context_attributes(self, ctx: Context) -> _ContextAttributes:
+        """Baggage-derived attributes for a context, memoized per Context.
+
+        Contexts are immutable (setting baggage creates a new one), so spans
+        started under the same context share one baggage lookup.
+
+        :param ctx: OpenTelemetry context to extract baggage from
+        :type ctx: Context
+        :return: Baggage values and attribute groups for the context
+        :rtype: _ContextAttributes
+        """
+        cached = self._context_attributes_cache.get(id(ctx))
+        if cached is not None and cached[0] is ctx:
+            return cached[1]
+        attributes = _ContextAttributes(self, ctx)
+        if len(self._context_attributes_cache) >= _CONTEXT_CACHE_SIZE:
+            self._context_attributes_cache.clear()
+        # Keep a reference to ctx so its id cannot be reused while cached
+        self._context_attributes_cache[id(ctx)] = (ctx, attributes)
+        return attributes
+
+    def _get_tracer_value(self, name: str) -> Any:
+        """Tracer instance fallback for a value missing from baggage."""
+        if self.tracer_instance and hasattr(self.tracer_instance, name):
+            return getattr(self.tracer_instance, name)
+        return None
+
     def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
         """Called when a span starts - enriches spans with HoneyHive attributes.
 
+        Experiment attributes are cached per tracer config and baggage-derived
+        attributes per Context, and everything is applied with a single
+        ``set_attributes`` call.
+
         :param span: The span that is starting
         :type span: Span
         :param parent_context: Parent context for baggage operations
@@ -688,7 +902,7 @@ class HoneyHiveSpanProcessor(SpanProcessor):
         self._safe_log(
             "debug",
             "🚀 SPAN PROCESSOR on_start called",
-            honeyhive_data={
+            honeyhive_data=lambda: {
                 "span_name": span.name,
                 "span_id": span.get_span_context().span_id,
                 "trace_id": span.get_span_context().trace_id,
@@ -726,13 +940,18 @@ class HoneyHiveSpanProcessor(SpanProcessor):
                 )
                 return
 
+            # Resolve the logger once; per-span diagnostics below are skipped
+            # entirely when debug logging is off
+            debug_enabled = self._is_debug_enabled()
+            ctx_attributes = self._get_context_attributes(ctx)
+
             # Get session_id to determine if this span should be enriched
             # Priority: baggage session_id (distributed tracing), then
             # tracer instance. This ensures distributed traces use the
             # propagated session_id from the client
-            session_id = baggage.get_baggage("session_id", ctx)
+            session_id = ctx_attributes.session_id
 
-            if session_id:
+            if session_id and debug_enabled:
                 self._safe_log(
                     "debug",
                     "🔍 DEBUG: Using baggage session_id (distributed tracing)",
@@ -748,17 +967,19 @@ class HoneyHiveSpanProcessor(SpanProcessor):
             if not session_id:
                 if self.tracer_instance and hasattr(self.tracer_instance, "session_id"):
                     session_id = self.tracer_instance.session_id
-                    self._safe_log(
-                        "debug",
-                        "🔍 DEBUG: Using tracer instance session_id (local tracing)",
-                        honeyhive_data={
-                            "span_name": span.name,
-                            "session_id": session_id,
-                            "tracer_instance_id": id(self.tracer_instance),
-                            "source": "tracer_instance",
-                        },
-                    )
-                else:
+                    if debug_enabled:
+                        self._safe_log(
+                            "debug",
+                            "🔍 DEBUG: Using tracer instance session_id "
+                            "(local tracing)",
+                            honeyhive_data={
+                                "span_name": span.name,
+                                "session_id": session_id,
+                                "tracer_instance_id": id(self.tracer_instance),
+                                "source": "tracer_instance",
+                            },
+                        )
+                elif debug_enabled:
                     self._safe_log(
                         "debug",
                         ("⚠️ DEBUG: No session_id found in tracer instance or baggage"),
@@ -785,9 +1006,12 @@ class HoneyHiveSpanProcessor(SpanProcessor):
             # starts, so its session_id would differ from the one assigned here.
             # Use a raw ASGI middleware or call create_session() inside the route
             # handler if per-request session metadata is needed.
+            session_auto_create = getattr(
+                self.tracer_instance, "_session_auto_create", False
+            )
             if (
                 not session_id
-                and getattr(self.tracer_instance, "_session_auto_create", False)
+                and session_auto_create
                 and span.kind is SpanKind.SERVER
                 and span.parent is None
             ):
@@ -801,14 +1025,13 @@ class HoneyHiveSpanProcessor(SpanProcessor):
                     session_id,
                 )
 
-            # Collect all attributes to set
-            attributes_to_set = {}
+            # Collect all attributes to set; later groups take precedence
 
             # Always process association_properties for legacy support
-            attributes_to_set.update(self._process_association_properties(ctx))
+            attributes_to_set = dict(ctx_attributes.association)
 
             # Always add experiment attributes (they don't require session_id)
-            attributes_to_set.update(self._get_experiment_attributes())
+            attributes_to_set.update(self._get_cached_experiment_attributes())
 
             if session_id:
                 # Set session_id attributes directly (multi-instance isolation)
@@ -820,12 +1043,12 @@ class HoneyHiveSpanProcessor(SpanProcessor):
                 # Signal ingestion to auto-create the Session row if it doesn't
                 # exist yet. Stamped on every span; ingestion is idempotent on
                 # session_id.
-                if getattr(self.tracer_instance, "_session_auto_create", False):
+                if session_auto_create:
                     attributes_to_set["honeyhive.session_auto_create"] = True
                     # Prefer session_name from baggage (per-request) over the
                     # tracer-instance value (init-time), matching how
                     # session_id is resolved.
-                    session_name = baggage.get_baggage("session_name", ctx)
+                    session_name = ctx_attributes.session_name
                     if not session_name:
                         session_name = getattr(
                             self.tracer_instance, "session_name", None
@@ -833,57 +1056,68 @@ class HoneyHiveSpanProcessor(SpanProcessor):
                     if session_name:
                         attributes_to_set["honeyhive.session_name"] = session_name
 
-                # Get other baggage attributes (project, source, etc.)
-                other_baggage_attrs = self._get_basic_baggage_attributes(ctx)
-                # Remove session_id from baggage attrs since we're setting it directly
-                other_baggage_attrs.pop("honeyhive.session_id", None)
-                other_baggage_attrs.pop(
-                    "traceloop.association.properties.session_id", None
+                # Project and source: baggage first, then tracer instance
+                project = ctx_attributes.project or self._get_tracer_value(
+                    "project_name"
                 )
-                attributes_to_set.update(other_baggage_attrs)
-
-                # Add traceloop compatibility attributes for backend
-                attributes_to_set.update(
-                    self._get_traceloop_compatibility_attributes(ctx)
+                if project:
+                    attributes_to_set["honeyhive.project"] = project
+                    attributes_to_set["traceloop.association.properties.project"] = (
+                        project
+                    )
+                source = ctx_attributes.source or self._get_tracer_value(
+                    "source_environment"
                 )
+                if source:
+                    attributes_to_set["honeyhive.source"] = source
+                    attributes_to_set["traceloop.association.properties.source"] = (
+                        source
+                    )
 
-                # Add evaluation metadata from baggage (run_id, dataset_id,
-                # datapoint_id)
-                attributes_to_set.update(
-                    self._get_evaluation_attributes_from_baggage(ctx)
-                )
+                # parent_id, traceloop compatibility attributes and evaluation
+                # metadata (run_id, dataset_id, datapoint_id) from baggage
+                attributes_to_set.update(ctx_attributes.session_scoped)
 
             # Add all custom baggage attributes (generalized baggage extraction)
             # This extracts ALL baggage items not already processed above
-            attributes_to_set.update(self._get_all_baggage_attributes(ctx))
-
-            # Apply all attributes to the span
-            for key, value in attributes_to_set.items():
-                if value is not None:
-                    span.set_attribute(key, value)
+            attributes_to_set.update(ctx_attributes.custom)
+
+            if self._compact_aliases:
+                # The exporter writes the traceloop.* aliases at encode time
+                compact_aliases(attributes_to_set)
+
+            # Apply all attributes to the span in one call
+            span.set_attributes(
+                {
+                    key: value
+                    for key, value in attributes_to_set.items()
+                    if value is not None
+                }
+            )
 
             # Process all honeyhive attributes and map them to backend format
-            self._process_honeyhive_attributes(span)
+            self._process_honeyhive_attributes(span, debug_enabled)
 
             # Detect and set event type using priority-based logic
-            detected_event_type = self._detect_event_type(span)
+            detected_event_type = self._detect_event_type(span, debug_enabled)
             if detected_event_type:
                 span.set_attribute("honeyhive_event_type", detected_event_type)
-                span_context = span.get_span_context()
-                self._safe_log(
-                    "debug",
-                    "🎯 Event type set on span: %s",
-                    detected_event_type,
-                    honeyhive_data={
-                        "span_name": span.name,
-                        "detected_event_type": detected_event_type,
-                        "span_id": (
-                            span_context.span_id
-                            if span_context is not None
-                            else "unknown"
-                        ),
-                    },
-                )
+                if debug_enabled:
+                    span_context = span.get_span_context()
+                    self._safe_log(
+                        "debug",
+                        "🎯 Event type set on span: %s",
+                        detected_event_type,
+                        honeyhive_data={
+                            "span_name": span.name,
+                            "detected_event_type": detected_event_type,
+                            "span_id": (
+                                span_context.span_id
+                                if span_context is not None
+                                else "unknown"
+                            ),
+                        },
+                    )
 
         except Exception as e:
             # Graceful degradation - never crash host
@@ -899,8 +1133,9 @@ class HoneyHiveSpanProcessor(SpanProcessor):
         :param span: The span that is ending
         :type span: ReadableSpan
         """
+        start = time.perf_counter()
         try:
-            self._safe_log("debug", f"🟦 ON_END CALLED for span: {span.name}")
+            self._safe_log("debug", "🟦 ON_END CALLED for span: %s", span.name)
 
             # Check span name filters — skip export for excluded spans
             if self._is_span_excluded(span.name):
@@ -945,33 +1180,44 @@ class HoneyHiveSpanProcessor(SpanProcessor):
             # Convert session_id to string
             session_id = str(session_id_raw)
 
-            # Dump raw span data for debugging
-            raw_span_data = self._dump_raw_span_data(span)
-            instrumentation_scope = getattr(span, "instrumentation_scope", None)
-            instrumentation_scope_name = (
-                instrumentation_scope.name if instrumentation_scope else None
-            )
-            instrumentation_scope_version = (
-                instrumentation_scope.version if instrumentation_scope else None
-            )
-            self._safe_log(
-                "debug",
-                "🔎 ON_END instrumentation scope - span: %s, scope_name: %s, scope_version: %s",
-                span.name,
-                instrumentation_scope_name or "unknown",
-                instrumentation_scope_version or "unknown",
-            )
+            # Truncate (or drop) spans larger than max_span_size
+            limited_span = self._span_size_limiter.enforce(span)
+            if limited_span is None:
+                return
+            span = limited_span
 
-            self._safe_log(
-                "debug",
-                "🚀 SPAN PROCESSOR on_end - mode: %s, span: %s\n📊 RAW DATA:\n%s",
-                self.mode,
-                span.name,
-                raw_span_data,
-            )
+            # Span dumps are expensive; only build them when debug is enabled
+            if self._is_debug_enabled():
+                instrumentation_scope = getattr(span, "instrumentation_scope", None)
+                instrumentation_scope_name = (
+                    instrumentation_scope.name if instrumentation_scope else None
+                )
+                instrumentation_scope_version = (
+                    instrumentation_scope.version if instrumentation_scope else None
+                )
+                self._safe_log(
+                    "debug",
+                    "🔎 ON_END instrumentation scope - span: %s, scope_name: %s, scope_version: %s",
+                    span.name,
+                    instrumentation_scope_name or "unknown",
+                    instrumentation_scope_version or "unknown",
+                )
+
+                self._safe_log(
+                    "debug",
+                    "🚀 SPAN PROCESSOR on_end - mode: %s, span: %s\n📊 RAW DATA:\n%s",
+                    self.mode,
+                    span.name,
+                    self._dump_raw_span_data(span),
+                )
 
             if self.otlp_exporter:
-                self._send_via_otlp(span, attributes, session_id)
+                if self._sampler is None:
+                    self._send_via_otlp(span, attributes, session_id)
+                else:
+                    # A kept session releases its buffered spans at once
+                    for sampled_span in self._sampler.on_end(span, session_id):
+                        self._send_via_otlp(sampled_span, attributes, session_id)
             else:
                 self._safe_log(
                     "warning",
@@ -982,6 +1228,8 @@ class HoneyHiveSpanProcessor(SpanProcessor):
         except Exception as e:
             # Error processing span end - continue without disrupting application
             self._safe_log("debug", "❌ Error in span processor on_end: %s", e)
+        finally:
+            self._on_end_seconds.record(time.perf_counter() - start)
 
     def _send_via_client(
         self, span: ReadableSpan, attributes: dict, session_id: str
@@ -1029,12 +1277,20 @@ class HoneyHiveSpanProcessor(SpanProcessor):
             )
 
             if self._batch_processor is not None:
-                # Batched async mode: delegate to OTel BatchSpanProcessor
+                # Batched async mode: delegate to the internal batch processor
                 # which queues the span and exports in a background thread.
                 self._batch_processor.on_end(span)
                 self._safe_log(
                     "debug",
-                    "📦 Span enqueued to BatchSpanProcessor (async batch mode)",
+                    "📦 Span enqueued to batch processor (async batch mode)",
+                )
+            elif isinstance(self.otlp_exporter, AsyncOTLPExporter):
+                # Immediate mode with the async exporter: send now without
+                # blocking the caller on the request
+                self.otlp_exporter.submit([span])
+                self._safe_log(
+                    "debug",
+                    "✅ Span submitted to async OTLP exporter (immediate mode)",
                 )
             elif self.otlp_exporter:
                 # Immediate sync mode (disable_batch=True): export inline
@@ -1053,7 +1309,9 @@ class HoneyHiveSpanProcessor(SpanProcessor):
         except Exception as e:
             self._safe_log("error", "❌ Error sending via OTLP: %s", e)
 
-    def _process_honeyhive_attributes(self, span: Span) -> None:
+    def _process_honeyhive_attributes(
+        self, span: Span, debug_enabled: Optional[bool] = None
+    ) -> None:
         """Process all honeyhive_* attributes and map them to backend-expected format.
 
         This method handles:
@@ -1064,7 +1322,11 @@ class HoneyHiveSpanProcessor(SpanProcessor):
 
         :param span: The span to process attributes for
         :type span: Span
+        :param debug_enabled: Whether debug logging is on (resolved if None)
+        :type debug_enabled: Optional[bool]
         """
+        if debug_enabled is None:
+            debug_enabled = self._is_debug_enabled()
         try:
             # Get current span attributes
             attributes = (
@@ -1073,23 +1335,24 @@ class HoneyHiveSpanProcessor(SpanProcessor):
                 else {}
             )
 
-            self._safe_log(
-                "debug",
-                "🔧 Processing honeyhive attributes for span: %s",
-                span.name,
-                honeyhive_data={
-                    "span_name": span.name,
-                    "total_attributes": len(attributes),
-                    "honeyhive_attributes": [
-                        k for k in attributes.keys() if k.startswith("honeyhive")
-                    ],
-                    "attribute_types": {
-                        k: type(v).__name__
-                        for k, v in attributes.items()
-                        if k.startswith("honeyhive")
+            if debug_enabled:
+                self._safe_log(
+                    "debug",
+                    "🔧 Processing honeyhive attributes for span: %s",
+                    span.name,
+                    honeyhive_data={
+                        "span_name": span.name,
+                        "total_attributes": len(attributes),
+                        "honeyhive_attributes": [
+                            k for k in attributes.keys() if k.startswith("honeyhive")
+                        ],
+                        "attribute_types": {
+                            k: type(v).__name__
+                            for k, v in attributes.items()
+                            if k.startswith("honeyhive")
+                        },
                     },
-                },
-            )
+                )
 
             # Define all honeyhive attributes that need processing
             honeyhive_basic_attrs = [
@@ -1121,25 +1384,28 @@ class HoneyHiveSpanProcessor(SpanProcessor):
                     if processed_value is not None:
                         # Set the processed value back to the span
                         span.set_attribute(attr_name, processed_value)
-                        self._safe_log(
-                            "debug",
-                            "Processed basic attribute: %s = %s",
-                            attr_name,
-                            processed_value,
-                        )
+                        if debug_enabled:
+                            self._safe_log(
+                                "debug",
+                                "Processed basic attribute: %s = %s",
+                                attr_name,
+                                processed_value,
+                            )
 
             # Process complex attributes (these might have nested structures)
-            for attr_name in honeyhive_complex_attrs:
-                if attr_name in attributes:
-                    value = attributes[attr_name]
-                    # Complex attributes processed by _set_span_attributes
-                    # Just ensure they're properly formatted
-                    self._safe_log("debug", "Found complex attribute: %s", attr_name)
+            if debug_enabled:
+                for attr_name in honeyhive_complex_attrs:
+                    if attr_name in attributes:
+                        # Complex attributes processed by _set_span_attributes
+                        # Just ensure they're properly formatted
+                        self._safe_log(
+                            "debug", "Found complex attribute: %s", attr_name
+                        )
 
-            # Process attributes using centralized dynamic logic
-            self._safe_log(
-                "debug", "🔍 Processing attributes using dynamic extraction logic"
-            )
+                # Process attributes using centralized dynamic logic
+                self._safe_log(
+                    "debug", "🔍 Processing attributes using dynamic extraction logic"
+                )
 
             # Use the centralized dynamic logic from event_type utility
             processed_attributes = extract_raw_attributes(
@@ -1150,17 +1416,20 @@ class HoneyHiveSpanProcessor(SpanProcessor):
             for attr_name, attr_value in processed_attributes.items():
                 if attr_name not in attributes:  # Don't override existing attributes
                     span.set_attribute(attr_name, attr_value)
-                    self._safe_log(
-                        "debug",
-                        "Set processed attribute: %s = %s",
-                        attr_name,
-                        attr_value,
-                    )
+                    if debug_enabled:
+                        self._safe_log(
+                            "debug",
+                            "Set processed attribute: %s = %s",
+                            attr_name,
+                            attr_value,
+                        )
 
         except Exception as e:
             self._safe_log("debug", "Error processing honeyhive attributes: %s", e)
 
-    def _detect_event_type(self, span: Span) -> Optional[str]:
+    def _detect_event_type(
+        self, span: Span, debug_enabled: Optional[bool] = None
+    ) -> Optional[str]:
         """Dynamically detect event type using priority-based patterns.
 
         Priority Order:
@@ -1181,11 +1450,18 @@ class HoneyHiveSpanProcessor(SpanProcessor):
         - RERANKER → tool (reranking operations)
         - GUARDRAIL → tool (guardrail checks)
 
+        Span name inference uses the compiled, per-name cached matcher in
+        :mod:`honeyhive.tracer.utils.event_type`.
+
         :param span: The span to analyze for event type
         :type span: Span
+        :param debug_enabled: Whether debug logging is on (resolved if None)
+        :type debug_enabled: Optional[bool]
         :return: Detected event type or None if no detection possible
         :rtype: Optional[str]
         """
+        if debug_enabled is None:
+            debug_enabled = self._is_debug_enabled()
         try:
             attributes = (
                 dict(span.attributes)
@@ -1193,19 +1469,22 @@ class HoneyHiveSpanProcessor(SpanProcessor):
                 else {}
             )
 
-            span_context = span.get_span_context()
-            self._safe_log(
-                "debug",
-                "🔍 Starting event type detection for span: %s",
-                span.name,
-                honeyhive_data={
-                    "span_name": span.name,
-                    "available_attributes": list(attributes.keys()),
-                    "span_id": (
-                        span_context.span_id if span_context is not None else "unknown"
-                    ),
-                },
-            )
+            if debug_enabled:
+                span_context = span.get_span_context()
+                self._safe_log(
+                    "debug",
+                    "🔍 Starting event type detection for span: %s",
+                    span.name,
+                    honeyhive_data={
+                        "span_name": span.name,
+                        "available_attributes": list(attributes.keys()),
+                        "span_id": (
+                            span_context.span_id
+                            if span_context is not None
+                            else "unknown"
+                        ),
+                    },
+                )
 
             # Priority 1: Check if event type is already set
             existing_type = attributes.get("honeyhive_event_type")
@@ -1259,22 +1538,8 @@ class HoneyHiveSpanProcessor(SpanProcessor):
             span_kind = attributes.get("openinference.span.kind")
             if span_kind:
                 # Map OpenInference span kinds to HoneyHive event types
-                # Complete OpenInference span.kind mapping
                 span_kind_upper = str(span_kind).upper()
-
-                # Deterministic mapping table
-                OPENINFERENCE_TO_HONEYHIVE = {
-                    "LLM": "model",  # LLM invocations
-                    "CHAIN": "chain",  # Multi-step workflows
-                    "TOOL": "tool",  # Tool/function calls
-                    "AGENT": "chain",  # Agent operations (map to chain)
-                    "RETRIEVER": "tool",  # Retrieval operations
-                    "EMBEDDING": "tool",  # Embedding generation (map to tool)
-                    "RERANKER": "tool",  # Reranking operations
-                    "GUARDRAIL": "tool",  # Guardrail checks
-                }
-
-                event_type = OPENINFERENCE_TO_HONEYHIVE.get(span_kind_upper)
+                event_type = _OPENINFERENCE_TO_EVENT_TYPE.get(span_kind_upper)
                 if event_type:
                     self._safe_log(
                         "debug",
@@ -1296,9 +1561,12 @@ class HoneyHiveSpanProcessor(SpanProcessor):
                     return "tool"
 
             # Priority 5: Dynamic pattern matching using utility function
-            self._safe_log(
-                "debug", "🔍 Using dynamic pattern matching for span: '%s'", span.name
-            )
+            if debug_enabled:
+                self._safe_log(
+                    "debug",
+                    "🔍 Using dynamic pattern matching for span: '%s'",
+                    span.name,
+                )
 
             # Use the centralized dynamic logic from event_type utility
             detected_type = detect_event_type_from_patterns(
@@ -1306,12 +1574,13 @@ class HoneyHiveSpanProcessor(SpanProcessor):
             )
 
             if detected_type:
-                self._safe_log(
-                    "debug",
-                    "✅ Event type detected via dynamic patterns: '%s' for span '%s'",
-                    detected_type,
-                    span.name,
-                )
+                if debug_enabled:
+                    self._safe_log(
+                        "debug",
+                        "✅ Event type detected via dynamic patterns: '%s' for span '%s'",
+                        detected_type,
+                        span.name,
+                    )
                 return detected_type
 
             # Priority 6: Default fallback
@@ -1357,22 +1626,27 @@ class HoneyHiveSpanProcessor(SpanProcessor):
     def shutdown(self) -> None:
         """Shutdown the span processor.
 
-        Performs graceful shutdown of the internal BatchSpanProcessor (which
+        Performs graceful shutdown of the internal batch processor (which
         drains its queue and shuts down the exporter), or the OTLP exporter
         directly in immediate mode.
         """
         try:
+            # Sessions still waiting for a tail sampling decision are dropped;
+            # kept sessions were handed to the exporter when they were kept
+            if self._sampler is not None:
+                self._sampler.close()
+
             # Shutdown the internal batch processor first — this drains the
             # queue and calls exporter.shutdown() internally.
             if self._batch_processor is not None:
                 self._safe_log(
                     "debug",
-                    "🛑 Shutting down internal BatchSpanProcessor",
+                    "🛑 Shutting down internal batch processor",
                 )
                 self._batch_processor.shutdown()
                 self._safe_log(
                     "debug",
-                    "✅ Internal BatchSpanProcessor shutdown complete",
+                    "✅ Internal batch processor shutdown complete",
                 )
             elif hasattr(self, "otlp_exporter") and self.otlp_exporter:
                 # Immediate mode: shutdown exporter directly
@@ -1382,10 +1656,38 @@ class HoneyHiveSpanProcessor(SpanProcessor):
             self._safe_log("debug", "Error during shutdown: %s", e)
             # Graceful degradation - continue shutdown process
 
+    def spool_pending_spans(self) -> int:
+        """Move spans still queued for export to the exporter's on-disk spool.
+
+        Used when a serverless flush deadline passes: the spans are sent by a
+        later invocation instead of being lost when the process is frozen.
+
+        :return: Number of spans spooled
+        :rtype: int
+        """
+        exporter = self.otlp_exporter
+        if (
+            not isinstance(self._batch_processor, HoneyHiveBatchSpanProcessor)
+            or exporter is None
+            or not hasattr(exporter, "get_spool_stats")
+            or exporter.get_spool_stats() is None
+        ):
+            return 0
+        spans = self._batch_processor.drain()
+        if not spans:
+            return 0
+        if exporter.spool_spans(spans):
+            self._safe_log("debug", "Spooled %d queued spans", len(spans))
+            return len(spans)
+        # Spooling failed: keep the spans queued for a later export
+        for span in spans:
+            self._batch_processor.on_end(span)
+        return 0
+
     def force_flush(self, timeout_millis: float = 30000) -> bool:
         """Force flush any pending spans.
 
-        In batched mode, this drains the internal BatchSpanProcessor queue
+        In batched mode, this drains the internal batch processor queue
         and blocks until the current batch is exported (or timeout).
         In immediate mode, delegates to the OTLP exporter's force_flush.
 
@@ -1395,11 +1697,13 @@ class HoneyHiveSpanProcessor(SpanProcessor):
         :rtype: bool
         """
         try:
-            # Batched mode: flush the internal BatchSpanProcessor
+            # Undecided tail-sampling sessions stay buffered: a flush must not
+            # cut a session short. Kept sessions were already handed over.
+            # Batched mode: flush the internal batch processor
             if self._batch_processor is not None:
                 self._safe_log(
                     "debug",
-                    "🔄 Force flushing internal BatchSpanProcessor (timeout=%dms)",
+                    "🔄 Force flushing internal batch processor (timeout=%dms)",
                     int(timeout_millis),
                 )
                 result = self._batch_processor.force_flush(
@@ -1407,7 +1711,7 @@ class HoneyHiveSpanProcessor(SpanProcessor):
                 )
                 self._safe_log(
                     "debug",
-                    "✅ BatchSpanProcessor force_flush result: %s",
+                    "✅ Batch processor force_flush result: %s",
                     result,
                 )
                 return bool(result)
@@ -0,0 +1,274 @@
+"""Enforcement of the tracer's ``max_span_size`` limit.
+
+OpenTelemetry's ``SpanLimits`` bound attribute counts but not their size, so
+a single multi-megabyte tool output or completion is queued and exported in
+full. :class:`SpanSizeLimiter` checks every ended span against
+``max_span_size`` (estimated OTLP JSON size) and applies ``span_size_policy``:
+
+- ``truncate`` (default): shorten string values of span and event
+  attributes, including strings inside sequence attributes, largest first
+  and lowest priority tier first (see :mod:`honeyhive.tracer.core.priorities`),
+  until the span fits. Critical attributes are never truncated. Truncated
+  values end with :data:`TRUNCATION_MARKER` and their keys are listed in the
+  ``honeyhive.truncated_attributes`` attribute (event attributes as
+  ``events[<index>].<key>``). A span that still does not fit is dropped.
+- ``drop``: drop oversized spans entirely
+- ``off``: export spans unchanged
+
+Counters for truncated and dropped spans and trimmed bytes are available
+from :meth:`SpanSizeLimiter.get_stats`.
+"""
+
+import threading
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from opentelemetry.sdk.trace import Event, ReadableSpan
+
+from ...utils.logger import safe_log
+from ..core.priorities import (
+    HONEYHIVE_NAMESPACE,
+    AttributePriority,
+    get_attribute_priority,
+)
+from .batch_processor import estimate_span_size
+
+SPAN_SIZE_POLICY_TRUNCATE = "truncate"
+SPAN_SIZE_POLICY_DROP = "drop"
+SPAN_SIZE_POLICY_OFF = "off"
+SPAN_SIZE_POLICIES = (
+    SPAN_SIZE_POLICY_TRUNCATE,
+    SPAN_SIZE_POLICY_DROP,
+    SPAN_SIZE_POLICY_OFF,
+)
+
+DEFAULT_MAX_SPAN_SIZE = 10 * 1024 * 1024
+
+TRUNCATION_MARKER = "...[truncated]"
+TRUNCATED_ATTRIBUTES_KEY = f"{HONEYHIVE_NAMESPACE}truncated_attributes"
+
+# Characters kept from each truncated value so the span stays readable
+MIN_TRUNCATED_LENGTH = 256
+
+# Where a string value lives: (event index or None for the span itself,
+# attribute key, index within a sequence value or None)
+_ValueLocation = Tuple[Optional[int], str, Optional[int]]
+
+
+def _string_values(
+    attributes: Optional[Mapping[str, Any]], event_index: Optional[int]
+) -> Iterator[Tuple[_ValueLocation, str]]:
+    """Yield every string value of an attribute mapping with its location."""
+    for key, value in (attributes or {}).items():
+        if isinstance(value, str):
+            yield (event_index, key, None), value
+        elif isinstance(value, (list, tuple)):
+            for item_index, item in enumerate(value):
+                if isinstance(item, str):
+                    yield (event_index, key, item_index), item
+
+
+def _attribute_priority(key: str) -> AttributePriority:
+    """Priority of an attribute, including flattened ``honeyhive_*`` keys.
+
+    ``honeyhive_outputs.content`` takes the priority of ``honeyhive.outputs``
+    and ``honeyhive.metadata.user`` that of ``honeyhive.metadata``.
+    """
+    priority = get_attribute_priority(key)
+    if priority != AttributePriority.LOW:
+        return priority
+    root = key.split(".", 1)[0]
+    if root.startswith("honeyhive_"):
+        return get_attribute_priority(HONEYHIVE_NAMESPACE + root[len("honeyhive_") :])
+    if root == "honeyhive" and "." in key[len(HONEYHIVE_NAMESPACE) :]:
+        name = key[len(HONEYHIVE_NAMESPACE) :].split(".", 1)[0]
+        return get_attribute_priority(HONEYHIVE_NAMESPACE + name)
+    return priority
+
+
+class SpanSizeLimiter:
+    """Applies the ``max_span_size`` policy to ended spans.
+
+    Thread-safe; one limiter is shared by all spans of a span processor.
+    """
+
+    def __init__(
+        self,
+        max_span_size: int = DEFAULT_MAX_SPAN_SIZE,
+        policy: str = SPAN_SIZE_POLICY_TRUNCATE,
+        tracer_instance: Any = None,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_span_size: Maximum estimated encoded span size in bytes
+            policy: "truncate", "drop" or "off"
+            tracer_instance: Optional tracer instance for logging context
+        """
+        self.max_span_size = max(0, int(max_span_size))
+        if policy not in SPAN_SIZE_POLICIES:
+            safe_log(
+                tracer_instance,
+                "warning",
+                f"Unknown span size policy '{policy}', using "
+                f"'{SPAN_SIZE_POLICY_TRUNCATE}'",
+                honeyhive_data={"supported": list(SPAN_SIZE_POLICIES)},
+            )
+            policy = SPAN_SIZE_POLICY_TRUNCATE
+        self.policy = policy
+        self.tracer_instance = tracer_instance
+        self._lock = threading.Lock()
+        self._stats = {"truncated_spans": 0, "dropped_spans": 0, "trimmed_bytes": 0}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are checked at all."""
+        return self.policy != SPAN_SIZE_POLICY_OFF and self.max_span_size > 0
+
+    def enforce(self, span: ReadableSpan) -> Optional[ReadableSpan]:
+        """Apply the size policy to an ended span.
+
+        Args:
+            span: Span that just ended
+
+        Returns:
+            The span itself when it fits, a truncated copy, or None when the
+            span should be dropped
+        """
+        if not self.enabled:
+            return span
+        try:
+            size = estimate_span_size(span)
+        except Exception:
+            # Never block export because a span could not be measured
+            return span
+        if size <= self.max_span_size:
+            return span
+
+        if self.policy == SPAN_SIZE_POLICY_DROP:
+            self._drop(span, size)
+            return None
+
+        truncation = self._truncate(span, size - self.max_span_size)
+        if truncation is None:
+            # Only critical or non-string values are oversized
+            self._drop(span, size)
+            return None
+        attributes, events, truncated, trimmed = truncation
+        with self._lock:
+            self._stats["truncated_spans"] += 1
+            self._stats["trimmed_bytes"] += trimmed
+        safe_log(
+            self.tracer_instance,
+            "warning",
+            "Truncated %d attributes of span %s to fit max_span_size",
+            len(truncated),
+            span.name,
+            honeyhive_data={
+                "estimated_size": size,
+                "max_span_size": self.max_span_size,
+                "trimmed_bytes": trimmed,
+                "truncated_attributes": truncated,
+            },
+        )
+        return ReadableSpan(
+            name=span.name,
+            context=span.context,
+            parent=span.parent,
+            resource=span.resource,
+            attributes=attributes,
+            events=events,
+            links=span.links,
+            kind=span.kind,
+            status=span.status,
+            start_time=span.start_time,
+            end_time=span.end_time,
+            instrumentation_scope=span.instrumentation_scope,
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get counters for truncated and dropped spans and trimmed bytes."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _drop(self, span: ReadableSpan, size: int) -> None:
+        """Count and log a span dropped for exceeding ``max_span_size``."""
+        with self._lock:
+            self._stats["dropped_spans"] += 1
+        safe_log(
+            self.tracer_instance,
+            "warning",
+            "Dropping span %s: estimated size %d exceeds max_span_size %d",
+            span.name,
+            size,
+            self.max_span_size,
+        )
+
+    @staticmethod
+    def _truncate(
+        span: ReadableSpan, excess: int
+    ) -> Optional[Tuple[Dict[str, Any], Sequence[Event], List[str], int]]:
+        """Shorten string values until ``excess`` bytes have been removed.
+
+        Candidates are the string values of span and event attributes,
+        including strings inside sequences, ordered lowest priority first,
+        then largest first, so bulky optional payloads go before inputs and
+        outputs.
+
+        Returns:
+            The new span attributes and events, the truncated keys and the
+            trimmed byte count, or None when the span cannot be made to fit
+        """
+        events = list(span.events or ())
+        values = list(_string_values(span.attributes, None))
+        for index, event in enumerate(events):
+            values.extend(_string_values(event.attributes, index))
+        candidates = sorted(
+            (
+                (location, value)
+                for location, value in values
+                if len(value) > MIN_TRUNCATED_LENGTH + len(TRUNCATION_MARKER)
+                and _attribute_priority(location[1]) != AttributePriority.CRITICAL
+            ),
+            key=lambda item: (-_attribute_priority(item[0][1]), -len(item[1])),
+        )
+        span_attributes: Dict[str, Any] = dict(span.attributes or {})
+        event_attributes: Dict[int, Dict[str, Any]] = {}
+        truncated: List[str] = []
+        trimmed = 0
+        # The truncated_attributes marker itself adds to the span size
+        excess += len(TRUNCATED_ATTRIBUTES_KEY) + 32
+        for (event_index, key, item_index), value in candidates:
+            if trimmed >= excess:
+                break
+            label = key if event_index is None else f"events[{event_index}].{key}"
+            if label not in truncated:
+                truncated.append(label)
+                excess += len(label) + 8
+            keep = max(
+                MIN_TRUNCATED_LENGTH,
+                len(value) - (excess - trimmed) - len(TRUNCATION_MARKER),
+            )
+            short = value[:keep] + TRUNCATION_MARKER
+            target: Dict[str, Any]
+            if event_index is None:
+                target = span_attributes
+            else:
+                target = event_attributes.setdefault(
+                    event_index, dict(events[event_index].attributes or {})
+                )
+            if item_index is None:
+                target[key] = short
+            else:
+                items = list(target[key])
+                items[item_index] = short
+                target[key] = tuple(items)
+            trimmed += len(value) - len(short)
+        if trimmed < excess:
+            return None
+        span_attributes[TRUNCATED_ATTRIBUTES_KEY] = tuple(truncated)
+        for event_index, attributes in event_attributes.items():
+            event = events[event_index]
+            events[event_index] = Event(
+                event.name, attributes=attributes, timestamp=event.timestamp
+            )
+        return span_attributes, events, truncated, trimmed
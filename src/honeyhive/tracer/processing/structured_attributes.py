@@ -0,0 +1,208 @@
+"""Structured encoding of dict and list span attributes.
+
+By default ``_set_span_attributes`` flattens nested values into one attribute
+per leaf (``honeyhive_outputs.result.0.choices.3.message.content``). With
+``attribute_encoding="structured"`` (``HH_ATTRIBUTE_ENCODING``) a dict or list
+is stored as a single attribute instead:
+
+- The value is walked once with depth and item bounds (:func:`bound_structure`)
+  and stored on the span as a compact JSON string, because OpenTelemetry span
+  attributes cannot hold mappings.
+- The attribute key is recorded in ``honeyhive.structured_attributes``.
+- At export time the listed values are decoded again and written as OTLP
+  ``kvlistValue`` / ``arrayValue``. The marker attribute itself is not
+  exported.
+
+A large list therefore costs one attribute instead of one per element, and
+it no longer pushes other attributes out under ``max_attributes``. A value
+that no longer parses (for example one shortened by ``span_size_policy``) is
+exported as the original string.
+"""
+
+import json
+import math
+from typing import Any, Dict, Mapping
+
+from opentelemetry.sdk.trace import ReadableSpan
+
+ATTRIBUTE_ENCODING_FLATTEN = "flatten"
+ATTRIBUTE_ENCODING_STRUCTURED = "structured"
+ATTRIBUTE_ENCODINGS = (ATTRIBUTE_ENCODING_FLATTEN, ATTRIBUTE_ENCODING_STRUCTURED)
+
+# Span attribute listing the keys whose values are encoded structures
+STRUCTURED_ATTRIBUTES_KEY = "honeyhive.structured_attributes"
+
+# Walker bounds: nesting depth and total number of values per attribute
+MAX_STRUCTURE_DEPTH = 16
+MAX_STRUCTURE_ITEMS = 10_000
+TRUNCATION_MARKER = "...[truncated]"
+
+
+def uses_structured_attributes(tracer_instance: Any) -> bool:
+    """Check whether a tracer is configured for structured attributes.
+
+    Args:
+        tracer_instance: Tracer whose config to read (may be None)
+
+    Returns:
+        True if ``attribute_encoding`` is ``structured``
+    """
+    config = getattr(tracer_instance, "config", None)
+    if not isinstance(config, dict):
+        return False
+    return config.get("attribute_encoding") == ATTRIBUTE_ENCODING_STRUCTURED
+
+
+def bound_structure(
+    value: Any,
+    max_depth: int = MAX_STRUCTURE_DEPTH,
+    max_items: int = MAX_STRUCTURE_ITEMS,
+) -> Any:
+    """Convert a value into a bounded JSON-compatible structure.
+
+    None values are skipped (as flattening does), keys become strings,
+    tuples become lists, non-finite floats and other objects are
+    stringified. Containers nested deeper than ``max_depth`` are replaced by
+    :data:`TRUNCATION_MARKER`. Once ``max_items`` values have been visited,
+    the remaining entries of each container are replaced by a single marker.
+
+    Args:
+        value: Value to convert
+        max_depth: Maximum container nesting depth
+        max_items: Maximum number of values visited
+
+    Returns:
+        The bounded structure
+    """
+    budget = [max_items]
+
+    def walk(item: Any, depth: int) -> Any:
+        budget[0] -= 1
+        if isinstance(item, (str, bool, int)):
+            return item
+        if isinstance(item, float):
+            return item if math.isfinite(item) else str(item)
+        if isinstance(item, dict):
+            if depth >= max_depth:
+                return TRUNCATION_MARKER
+            mapping: Dict[str, Any] = {}
+            for key, child in item.items():
+                if child is None:
+                    continue
+                if budget[0] <= 0:
+                    mapping["..."] = TRUNCATION_MARKER
+                    break
+                mapping[str(key)] = walk(child, depth + 1)
+            return mapping
+        if isinstance(item, (list, tuple)):
+            if depth >= max_depth:
+                return TRUNCATION_MARKER
+            sequence = []
+            for child in item:
+                if child is None:
+                    continue
+                if budget[0] <= 0:
+                    sequence.append(TRUNCATION_MARKER)
+                    break
+                sequence.append(walk(child, depth + 1))
+            return sequence
+        return str(item)
+
+    return walk(value, 0)
+
+
+def _merge(previous: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep-merge ``update`` into ``previous`` (leaf values of update win)."""
+    for key, value in update.items():
+        existing = previous.get(key)
+        if isinstance(existing, dict) and isinstance(value, dict):
+            _merge(existing, value)
+        else:
+            previous[key] = value
+    return previous
+
+
+def set_structured_attribute(span: Any, key: str, value: Any) -> None:
+    """Store a dict or list on a span as one structured attribute.
+
+    Setting a dict on a key that already holds a structured dict merges the
+    two, matching the per-leaf overwrite semantics of flattening.
+
+    Args:
+        span: Span to set the attribute on
+        key: Attribute key
+        value: Dict or list to store
+    """
+    structure = bound_structure(value)
+    attributes = getattr(span, "attributes", None)
+    if not isinstance(attributes, Mapping):
+        attributes = {}
+    structured_keys = tuple(attributes.get(STRUCTURED_ATTRIBUTES_KEY) or ())
+
+    if key in structured_keys and isinstance(structure, dict):
+        try:
+            previous = json.loads(attributes.get(key) or "null")
+        except (TypeError, ValueError):
+            previous = None
+        if isinstance(previous, dict):
+            structure = _merge(previous, structure)
+
+    span.set_attribute(
+        key, json.dumps(structure, separators=(",", ":"), ensure_ascii=False)
+    )
+    if key not in structured_keys:
+        span.set_attribute(STRUCTURED_ATTRIBUTES_KEY, structured_keys + (key,))
+
+
+def expand_structured_attributes(attributes: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Decode the structured values listed in a span's attributes.
+
+    Args:
+        attributes: Span attributes
+
+    Returns:
+        ``attributes`` itself when nothing is structured, otherwise a new
+        dict with decoded values and without the marker attribute
+    """
+    structured_keys = attributes.get(STRUCTURED_ATTRIBUTES_KEY)
+    if not structured_keys:
+        return attributes
+
+    expanded = dict(attributes)
+    del expanded[STRUCTURED_ATTRIBUTES_KEY]
+    for key in structured_keys:
+        encoded = expanded.get(key)
+        if not isinstance(encoded, str):
+            continue
+        try:
+            expanded[key] = json.loads(encoded)
+        except ValueError:
+            # Shortened by span size enforcement: keep the string
+            continue
+    return expanded
+
+
+def with_structured_values(span: ReadableSpan) -> ReadableSpan:
+    """Return the span with structured attribute values decoded.
+
+    Used by encoders that map Python mappings and sequences themselves
+    (Protobuf). Returns the span itself when nothing is structured.
+    """
+    attributes = span.attributes or {}
+    expanded = expand_structured_attributes(attributes)
+    if expanded is attributes:
+        return span
+    return ReadableSpan(
+        name=span.name,
+        context=span.context,
+        parent=span.parent,
+        resource=span.resource,
+        attributes=expanded,  # type: ignore[arg-type]
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
@@ -6,6 +6,9 @@ All utilities follow the multi-instance architecture and provide graceful
 degradation for error conditions.
 """
 
+# Tracer configuration lookup
+from .config import get_otlp_setting
+
 # Event type detection and processing utilities
 from .event_type import (
     detect_event_type_from_patterns,
@@ -36,6 +39,8 @@ from .session import (
 )
 
 __all__ = [
+    # Configuration utilities
+    "get_otlp_setting",
     # Event type utilities
     "detect_event_type_from_patterns",
     "extract_raw_attributes",
@@ -0,0 +1,35 @@
+"""Tracer configuration lookup utilities.
+
+OTLPConfig fields live under ``config.otlp`` in the unified tracer config
+rather than at the root, so they cannot be read with a plain ``getattr``.
+Components that read export settings from a tracer use
+:func:`get_otlp_setting`.
+"""
+
+from typing import Any
+
+
+def get_otlp_setting(tracer_instance: Any, name: str, default: Any) -> Any:
+    """Read a setting from a tracer's ``config.otlp`` section.
+
+    Args:
+        tracer_instance: Tracer whose unified config to read (may be None)
+        name: OTLPConfig field name
+        default: Value returned when the setting is missing or None
+
+    Returns:
+        Configured value or ``default``
+
+    Example:
+        >>> get_otlp_setting(tracer, "otlp_compression", "gzip")
+        'zstd'
+        >>> get_otlp_setting(None, "otlp_compression", "gzip")
+        'gzip'
+    """
+    config = getattr(tracer_instance, "config", None)
+    otlp_section = config.get("otlp") if isinstance(config, dict) else None
+    if isinstance(otlp_section, dict):
+        value = otlp_section.get(name)
+        if value is not None:
+            return value
+    return default
@@ -10,12 +10,94 @@ static hardcoded values and provide flexible, extensible detection logic.
 # Duplicate code represents common LLM attribute lists and model patterns
 # shared across utility and processing modules for consistent event detection.
 
+import functools
+import re
 from typing import Any, Dict, List, Optional
 
 # Import shared logging utility
 from ...utils.logger import safe_log
 from .general import convert_enum_to_string
 
+# Core LLM provider patterns
+_PROVIDER_PATTERNS = (
+    "openai.chat.completions",
+    "openai.completions",
+    "anthropic.messages",
+    "bedrock.invoke_model",
+    "google.generativeai",
+)
+
+# Generic LLM operation patterns
+_OPERATION_PATTERNS = (
+    "llm.",
+    "model.",
+    "chat",
+    "completion",
+    "generate",
+    "inference",
+)
+
+# Popular model name patterns
+_MODEL_NAME_PATTERNS = (
+    "gpt",
+    "claude",
+    "llama",
+    "gemini",
+    "mistral",
+    "palm",
+)
+
+# Attribute names that indicate LLM operations: OpenTelemetry semantic
+# conventions, provider-specific and generic model attributes
+_LLM_ATTRIBUTES = (
+    "llm.request.model",
+    "llm.response.model",
+    "llm.model.name",
+    "gen_ai.request.model",
+    "gen_ai.response.model",
+    "openai.model",
+    "anthropic.model",
+    "bedrock.model_id",
+    "google.model",
+    "model_name",
+    "model_id",
+    "model_type",
+    "ai_model",
+)
+
+# Substrings of a lower-cased span name that mark it as a model/LLM operation,
+# including the compound ai_/ml_/nlp_ prefixes
+_SPAN_NAME_MODEL_INDICATORS = (
+    "llm",
+    "model",
+    "gpt",
+    "claude",
+    "llama",
+    "gemini",
+    "mistral",
+    "palm",
+    "chat",
+    "completion",
+    "generate",
+    "inference",
+    "openai",
+    "anthropic",
+    "bedrock",
+    "google",
+    "generativeai",
+    "ai_",
+    "ml_",
+    "nlp_",
+)
+
+# All indicators compiled into one alternation, matched in a single pass
+_SPAN_NAME_MODEL_REGEX = re.compile(
+    "|".join(re.escape(indicator) for indicator in _SPAN_NAME_MODEL_INDICATORS)
+)
+
+# Span names repeat heavily, so classification results are cached
+SPAN_NAME_CACHE_SIZE = 4096
+
 
 def get_model_patterns() -> List[str]:
     """Dynamically generate patterns that indicate model/LLM operations.
@@ -26,42 +108,7 @@ def get_model_patterns() -> List[str]:
     Returns:
         List of string patterns for model detection
     """
-    # Core LLM provider patterns - dynamically extensible
-    provider_patterns = [
-        "openai.chat.completions",
-        "openai.completions",
-        "anthropic.messages",
-        "bedrock.invoke_model",
-        "google.generativeai",
-    ]
-
-    # Generic LLM operation patterns - dynamic detection
-    operation_patterns = [
-        "llm.",
-        "model.",
-        "chat",
-        "completion",
-        "generate",
-        "inference",
-    ]
-
-    # Popular model name patterns - dynamically updated
-    model_name_patterns = [
-        "gpt",
-        "claude",
-        "llama",
-        "gemini",
-        "mistral",
-        "palm",
-    ]
-
-    # Combine all patterns dynamically
-    all_patterns = []
-    all_patterns.extend(provider_patterns)
-    all_patterns.extend(operation_patterns)
-    all_patterns.extend(model_name_patterns)
-
-    return all_patterns
+    return [*_PROVIDER_PATTERNS, *_OPERATION_PATTERNS, *_MODEL_NAME_PATTERNS]
 
 
 def get_llm_attributes() -> List[str]:
@@ -73,38 +120,21 @@ def get_llm_attributes() -> List[str]:
     Returns:
         List of attribute names for LLM detection
     """
-    # OpenTelemetry semantic convention attributes - dynamic
-    otel_attributes = [
-        "llm.request.model",
-        "llm.response.model",
-        "llm.model.name",
-        "gen_ai.request.model",
-        "gen_ai.response.model",
-    ]
+    return list(_LLM_ATTRIBUTES)
 
-    # Provider-specific attributes - dynamically extensible
-    provider_attributes = [
-        "openai.model",
-        "anthropic.model",
-        "bedrock.model_id",
-        "google.model",
-    ]
 
-    # Generic model attributes - dynamic detection
-    generic_attributes = [
-        "model_name",
-        "model_id",
-        "model_type",
-        "ai_model",
-    ]
+@functools.lru_cache(maxsize=SPAN_NAME_CACHE_SIZE)
+def _match_span_name_indicator(span_name: str) -> Optional[str]:
+    """Find the model indicator in a span name, cached per span name.
 
-    # Combine all attributes dynamically
-    all_attributes = []
-    all_attributes.extend(otel_attributes)
-    all_attributes.extend(provider_attributes)
-    all_attributes.extend(generic_attributes)
+    Args:
+        span_name: Name of the span
 
-    return all_attributes
+    Returns:
+        The matched indicator, or None if the name has none
+    """
+    match = _SPAN_NAME_MODEL_REGEX.search(span_name.lower())
+    return match.group(0) if match else None
 
 
 def extract_raw_attributes(
@@ -406,48 +436,20 @@ def _detect_from_span_name_dynamically(
     if not span_name:
         return None
 
-    span_name_lower = span_name.lower()
-
-    # Dynamic LLM/Model detection patterns - more flexible matching
-    llm_indicators = [
-        "llm",
-        "model",
-        "gpt",
-        "claude",
-        "llama",
-        "gemini",
-        "mistral",
-        "palm",
-        "chat",
-        "completion",
-        "generate",
-        "inference",
-        "openai",
-        "anthropic",
-        "bedrock",
-        "google",
-        "generativeai",
-    ]
-
-    # Dynamic pattern matching - check if any LLM indicator is present
-    for indicator in llm_indicators:
-        if indicator in span_name_lower:
-            safe_log(
-                tracer_instance,
-                "debug",
-                "Event type inferred as 'model' from span name pattern",
-                honeyhive_data={
-                    "indicator": indicator,
-                    "span_name": span_name,
-                },
-            )
-            return "model"
-
-    # Additional dynamic checks for compound patterns
-    if any(term in span_name_lower for term in ["ai_", "ml_", "nlp_"]):
-        return "model"
+    indicator = _match_span_name_indicator(span_name)
+    if indicator is None:
+        return None
 
-    return None
+    safe_log(
+        tracer_instance,
+        "debug",
+        "Event type inferred as 'model' from span name pattern",
+        honeyhive_data={
+            "indicator": indicator,
+            "span_name": span_name,
+        },
+    )
+    return "model"
 
 
 def _detect_from_attributes_dynamically(
@@ -464,11 +466,8 @@ def _detect_from_attributes_dynamically(
     if not attributes:
         return None
 
-    # Get dynamic LLM attributes
-    llm_attributes = get_llm_attributes()
-
     # Dynamic attribute matching
-    for attr in llm_attributes:
+    for attr in _LLM_ATTRIBUTES:
         if attr in attributes:
             safe_log(
                 tracer_instance,
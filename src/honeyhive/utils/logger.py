@@ -5,7 +5,7 @@ import logging
 import sys
 import threading
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 # No lifecycle imports - logger should be independent
 # Shutdown detection implemented directly in logger module
@@ -16,6 +16,11 @@ from typing import Any, Dict, Optional, Union
 # Internal shutdown state tracking - managed automatically by safe_log
 _shutdown_detected = threading.Event()
 
+# Structured log data: either a dict or a zero-argument provider returning one.
+# Providers are only called when the log level is enabled, so expensive
+# diagnostics (pretty-printed payloads, span dumps) cost nothing otherwise.
+HoneyHiveData = Union[Dict[str, Any], Callable[[], Dict[str, Any]]]
+
 
 def _detect_shutdown_conditions() -> bool:
     """Dynamically detect shutdown conditions without external signaling.
@@ -162,7 +167,10 @@ class HoneyHiveLogger:
 
         # Dynamic level determination with verbose parameter priority
         effective_level = self._determine_log_level_dynamically(level, verbose)
-        self.logger.setLevel(effective_level)
+        # setLevel clears the logging cache of every logger, and safe_log
+        # builds fallback loggers per call, so only touch a changed level
+        if self.logger.level != effective_level:
+            self.logger.setLevel(effective_level)
 
         # Add handler if not already present
         if not self.logger.handlers:
@@ -412,12 +420,81 @@ def get_tracer_logger(
 # Simple approach: Use tracer logger directly, no module-level loggers needed
 
 
+def _resolve_target_logger(tracer_instance: Any) -> Any:
+    """Select the logger that safe_log writes to for a tracer instance.
+
+    Args:
+        tracer_instance: Optional tracer instance (can be None or partially
+            initialized)
+
+    Returns:
+        HoneyHiveLogger for the tracer, its delegate, or a fallback logger
+    """
+    # Use tracer instance logger if fully initialized
+    if (
+        tracer_instance
+        and hasattr(tracer_instance, "logger")
+        and tracer_instance.logger
+    ):
+        return tracer_instance.logger
+
+    # API client pattern - delegate to the actual tracer
+    if (
+        tracer_instance
+        and hasattr(tracer_instance, "tracer_instance")
+        and tracer_instance.tracer_instance
+    ):
+        return _resolve_target_logger(tracer_instance.tracer_instance)
+
+    # Tracer exists but logger not ready - create temporary logger with
+    # tracer's verbose setting
+    if tracer_instance and hasattr(tracer_instance, "verbose"):
+        verbose_setting = getattr(tracer_instance, "verbose", False)
+        return get_logger("honeyhive.early_init", verbose=verbose_setting)
+
+    # Complete fallback for early initialization or None tracer_instance
+    return get_logger("honeyhive.fallback")
+
+
+def _is_level_enabled(target_logger: Any, level: str) -> bool:
+    """Check whether a HoneyHiveLogger would emit records at ``level``."""
+    levelno = getattr(logging, level.upper(), None)
+    if not isinstance(levelno, int):
+        return True  # Unknown level names are left to the logger itself
+    return bool(target_logger.logger.isEnabledFor(levelno))
+
+
+def is_log_enabled(tracer_instance: Any, level: str) -> bool:
+    """Check whether safe_log would emit a message at the given level.
+
+    Use this to guard diagnostics that are expensive to build (span dumps,
+    pretty-printed payloads) in hot paths.
+
+    Args:
+        tracer_instance: Optional tracer instance for per-instance logging
+        level: Log level name (debug, info, warning, error, critical)
+
+    Returns:
+        True if the message would be logged, False otherwise
+
+    Example:
+        >>> if is_log_enabled(tracer_instance, "debug"):
+        ...     safe_log(tracer_instance, "debug", "Span: %s", dump_span(span))
+    """
+    if _detect_shutdown_conditions():
+        return False
+    try:
+        return _is_level_enabled(_resolve_target_logger(tracer_instance), level)
+    except Exception:
+        return False
+
+
 def safe_log(
     tracer_instance: Any,
     level: str,
     message: str,
     *args: Any,
-    honeyhive_data: Optional[Dict[str, Any]] = None,
+    honeyhive_data: Optional[HoneyHiveData] = None,
     **kwargs: Any,
 ) -> None:
     """Safely log a message with enhanced early initialization and
@@ -448,7 +525,9 @@ def safe_log(
         level: Log level (debug, info, warning, error)
         message: Log message format string (supports % formatting for lazy evaluation)
         *args: Arguments for lazy string formatting (deferred until log level check)
-        honeyhive_data: Optional structured data for HoneyHive logger
+        honeyhive_data: Optional structured data for HoneyHive logger, or a
+            zero-argument callable returning it. Callables are only invoked
+            when the level is enabled, keeping expensive diagnostics lazy.
         **kwargs: Additional keyword arguments for logger
 
     Performance Note:
@@ -463,6 +542,9 @@ def safe_log(
         >>> safe_log(tracer_instance, "warning",
         ...           "Failed to process %s after %d tries",
         ...          item_name, retry_count)
+        >>> # ✅ CORRECT - Lazy structured data (built only when debug is on)
+        >>> safe_log(tracer_instance, "debug", "Exporting batch",
+        ...          honeyhive_data=lambda: {"payload": json.dumps(p, indent=2)})
         >>> # ✅ CORRECT - Static messages
         >>> safe_log(None, "info", "Static message")  # Works without tracer
         >>> safe_log(partial_tracer, "debug", "Early init message")
@@ -504,28 +586,10 @@ def safe_log(
                 **kwargs,
             )
 
-        # Strategy 3: Use tracer_instance's own logger if it has one
-        # (API client independent mode)
-        elif (
-            tracer_instance
-            and hasattr(tracer_instance, "logger")
-            and tracer_instance.logger
-        ):
-            target_logger = tracer_instance.logger
-
-        # Strategy 4: Use tracer instance for logger creation if partially
-        # initialized
-        elif tracer_instance and hasattr(tracer_instance, "verbose"):
-            # Tracer exists but logger not ready - create temporary logger with
-            # tracer's verbose setting
-            verbose_setting = getattr(tracer_instance, "verbose", False)
-            target_logger = get_logger("honeyhive.early_init", verbose=verbose_setting)
-
-        # Strategy 5: Fallback to default logger for None tracer_instance or
-        # no verbose setting
+        # Strategies 3-5: tracer's own logger, temporary logger with the
+        # tracer's verbose setting, or the default fallback logger
         else:
-            # Complete fallback for early initialization or None tracer_instance
-            target_logger = get_logger("honeyhive.fallback")
+            target_logger = _resolve_target_logger(tracer_instance)
 
         # Check if the logger and its handlers are still available
         if not hasattr(target_logger, "logger") or not target_logger.logger.handlers:
@@ -543,6 +607,11 @@ def safe_log(
                     return None  # Stream is closed, fail silently
 
         log_func = getattr(target_logger, level)
+        if callable(honeyhive_data):
+            # Lazy provider: skip rendering entirely when the level is off
+            if not _is_level_enabled(target_logger, level):
+                return None
+            honeyhive_data = honeyhive_data()
         if honeyhive_data:
             log_func(message, *args, honeyhive_data=honeyhive_data, **kwargs)
         else:
@@ -0,0 +1,69 @@
+"""Measure end-of-invocation flush and shutdown cost per lifecycle mode."""
+
+import json
+import os
+import sys
+import time
+from typing import Any, Dict
+
+sys.path.insert(0, "/var/task")
+
+from honeyhive.tracer import HoneyHiveTracer
+from honeyhive.tracer.lifecycle import flush_at_handler_end, is_serverless_mode
+
+# HH_OTLP_LIFECYCLE_MODE selects "standard" or "serverless"; HH_API_URL
+# points at an unreachable endpoint so the export cost is the timeout path
+tracer = HoneyHiveTracer.init(
+    api_key=os.getenv("HH_API_KEY", "test-key"),
+    project="lambda-serverless-flush-test",
+    source="aws-lambda",
+    session_name="serverless-flush-benchmark",
+    disable_http_tracing=True,
+)
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """Create spans, then time the flush and a short-lived tracer's shutdown."""
+    serverless = is_serverless_mode(tracer)
+
+    for index in range(event.get("span_count", 10)):
+        with tracer.start_span(f"serverless_flush_{index}") as span:
+            span.set_attribute("lambda.iteration", index)
+
+    flush_start = time.perf_counter()
+    if serverless:
+        flush_success = flush_at_handler_end(tracer, context)["success"]
+    else:
+        flush_success = tracer.force_flush(timeout_millis=1000)
+    flush_time = time.perf_counter() - flush_start
+
+    shutdown_time = None
+    if event.get("measure_shutdown", False):
+        short_lived = HoneyHiveTracer.init(
+            api_key=os.getenv("HH_API_KEY", "test-key"),
+            project="lambda-serverless-flush-test",
+            source="aws-lambda",
+            session_name="serverless-shutdown-benchmark",
+            disable_http_tracing=True,
+        )
+        with short_lived.start_span("serverless_shutdown") as span:
+            span.set_attribute("lambda.shutdown", True)
+        shutdown_start = time.perf_counter()
+        short_lived.shutdown()
+        shutdown_time = time.perf_counter() - shutdown_start
+
+    return {
+        "statusCode": 200,
+        "body": json.dumps(
+            {
+                "serverless": serverless,
+                "flush_success": flush_success,
+                "timings": {
+                    "flush_ms": flush_time * 1000,
+                    "shutdown_ms": (
+                        shutdown_time * 1000 if shutdown_time is not None else None
+                    ),
+                },
+            }
+        ),
+    }
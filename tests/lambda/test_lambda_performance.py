@@ -575,6 +575,68 @@ class TestLambdaPerformance:
             baseline_container.stop()
             sdk_container.stop()
 
+    @pytest.mark.benchmark
+    def test_serverless_flush_performance(self):
+        """Compare end-of-invocation flush and shutdown per lifecycle mode."""
+        client = docker.from_env()
+        results = {}
+
+        for mode, port in (("standard", 9110), ("serverless", 9111)):
+            container = client.containers.run(
+                "honeyhive-lambda:bundle-native",
+                command="serverless_flush_test.lambda_handler",
+                ports={"8080/tcp": port},
+                environment={
+                    "AWS_LAMBDA_FUNCTION_NAME": f"serverless-flush-{mode}",
+                    "HH_API_KEY": "test-key",
+                    "HH_PROJECT": "lambda-serverless-flush-test",
+                    # Unreachable backend: exports hit their timeouts
+                    "HH_API_URL": "http://10.255.255.1",
+                    "HH_OTLP_LIFECYCLE_MODE": mode,
+                    "HH_OTLP_SERVERLESS_FLUSH_BUDGET": "0.5",
+                },
+                detach=True,
+                remove=True,
+            )
+            try:
+                self._wait_for_performance_container_ready(port=port, timeout=30)
+                url = (
+                    f"http://localhost:{port}/2015-03-31/functions/function/invocations"
+                )
+                flush_times = []
+                shutdown_times = []
+                for iteration in range(5):
+                    response = requests.post(
+                        url,
+                        json={"span_count": 10, "measure_shutdown": iteration == 0},
+                        headers={"Content-Type": "application/json"},
+                        timeout=60,
+                    )
+                    body = json.loads(response.json()["body"])
+                    flush_times.append(body["timings"]["flush_ms"])
+                    if body["timings"]["shutdown_ms"] is not None:
+                        shutdown_times.append(body["timings"]["shutdown_ms"])
+                results[mode] = {
+                    "flush_p50_ms": statistics.median(flush_times),
+                    "flush_max_ms": max(flush_times),
+                    "shutdown_ms": shutdown_times[0],
+                }
+            finally:
+                try:
+                    container.stop()
+                except:
+                    pass
+
+        print(f"📊 Lifecycle mode comparison: {json.dumps(results, indent=2)}")
+
+        # Serverless flushes stay within the 0.5 s budget (plus overhead)
+        assert results["serverless"]["flush_max_ms"] < 1000
+        # No grace sleep or 5 s + 10 s retry flush on shutdown
+        assert results["serverless"]["shutdown_ms"] < 1000
+        assert results["serverless"]["shutdown_ms"] < results["standard"]["shutdown_ms"]
+
+        return results
+
     def _wait_for_optimal_containers_ready(
         self, baseline_port: str, sdk_port: str, timeout: int = 30
     ):
@@ -3,6 +3,7 @@ Performance benchmarks for HoneyHive non-instrumentor integration.
 
 This module provides comprehensive benchmarks for:
 - Span processing overhead
+- Span processor on_start overhead
 - Provider detection speed
 - Memory usage patterns
 - Concurrent operation performance
@@ -20,6 +21,8 @@ from typing import Any, Optional
 
 import psutil
 import pytest
+from opentelemetry import baggage, context
+from opentelemetry.sdk.trace import TracerProvider
 
 from honeyhive import HoneyHiveTracer
 from honeyhive.tracer.integration.detection import IntegrationStrategy, ProviderDetector
@@ -35,6 +38,7 @@ class PerformanceBenchmarks:
         self.test_project: Optional[str] = None
         self.test_source: Optional[str] = None
         self.max_span_processing_time: Optional[float] = None
+        self.max_on_start_time: Optional[float] = None
         self.max_provider_detection_time: Optional[float] = None
         self.max_memory_overhead_percent: Optional[float] = None
         self.benchmark_iterations: Optional[int] = None
@@ -54,6 +58,9 @@ class PerformanceBenchmarks:
 
         # Performance thresholds (from spec requirements)
         self.max_span_processing_time = 0.001  # 1ms per span
+        # on_start took ~190us per span before the single-pass rework;
+        # the target is to halve it
+        self.max_on_start_time = 0.000095  # 95us per span
         self.max_provider_detection_time = 0.010  # 10ms
         self.max_memory_overhead_percent = 5.0  # 5% increase
 
@@ -114,6 +121,52 @@ class PerformanceBenchmarks:
         print(f"✅ Span processing benchmark: {per_span_time:.4f}s per span")
         return per_span_time
 
+    @pytest.mark.benchmark
+    def test_benchmark_on_start_overhead(self, benchmark: Any) -> float:
+        """Benchmark HoneyHiveSpanProcessor.on_start with full baggage."""
+        tracer = HoneyHiveTracer.init(
+            api_key=self.test_api_key,
+            project=self.test_project,
+            source=self.test_source,
+            test_mode=True,
+            session_name="benchmark-session",
+        )
+        processor = tracer.span_processor
+        assert processor is not None
+        ctx = _evaluation_baggage_context(tracer)
+
+        # Spans come from a separate provider so only on_start is measured
+        otel_tracer = TracerProvider().get_tracer("benchmark")
+        spans = [
+            otel_tracer.start_span(f"llm_call_{i % 10}", context=ctx)
+            for i in range(100)
+        ]
+
+        def run_on_start() -> int:
+            """Run on_start for a batch of spans."""
+            for span in spans:
+                processor.on_start(span, ctx)
+            return len(spans)
+
+        # Benchmark on_start
+        result = benchmark(run_on_start)
+
+        # Verify results
+        assert result == 100
+        assert spans[0].attributes.get("honeyhive.session_id") == tracer.session_id
+
+        # Calculate per-span on_start time
+        per_span_time: float = benchmark.stats.mean / 100
+
+        # Verify performance requirement: on_start cost halved (<95us per span)
+        assert per_span_time < (self.max_on_start_time or 0.000095), (
+            f"on_start too slow: {per_span_time * 1e6:.1f}us per span "
+            f"(max: {(self.max_on_start_time or 0.000095) * 1e6:.0f}us)"
+        )
+
+        print(f"✅ on_start benchmark: {per_span_time * 1e6:.1f}us per span")
+        return per_span_time
+
     @pytest.mark.benchmark
     def test_benchmark_provider_detection_speed(self, benchmark: Any) -> float:
         """Benchmark provider detection speed."""
@@ -487,6 +540,21 @@ class ConcurrentBenchmark:  # pylint: disable=too-few-public-methods
         }
 
 
+def _evaluation_baggage_context(tracer: HoneyHiveTracer) -> Any:
+    """Build a context carrying the baggage of an evaluation run."""
+    ctx = context.get_current()
+    for key, value in {
+        "session_id": tracer.session_id,
+        "project": "benchmark-project",
+        "source": "benchmark-test",
+        "run_id": "benchmark-run",
+        "dataset_id": "benchmark-dataset",
+        "datapoint_id": "benchmark-datapoint",
+    }.items():
+        ctx = baggage.set_baggage(key, value, ctx)
+    return ctx
+
+
 # Standalone benchmark functions for manual testing
 def benchmark_span_processing(iterations: int = 1000) -> float:
     """Standalone span processing benchmark."""
@@ -518,6 +586,44 @@ def benchmark_span_processing(iterations: int = 1000) -> float:
     return per_span_time
 
 
+def benchmark_on_start(iterations: int = 5000) -> float:
+    """Standalone span processor on_start benchmark."""
+    tracer = HoneyHiveTracer.init(
+        api_key="benchmark-key",
+        project="benchmark-project",
+        source="benchmark-test",
+        test_mode=True,
+        session_name="benchmark-session",
+    )
+    processor = tracer.span_processor
+    assert processor is not None
+    ctx = _evaluation_baggage_context(tracer)
+
+    otel_tracer = TracerProvider().get_tracer("benchmark")
+    spans = [
+        otel_tracer.start_span(f"llm_call_{i % 10}", context=ctx)
+        for i in range(iterations)
+    ]
+
+    start_time = time.perf_counter()
+
+    for span in spans:
+        processor.on_start(span, ctx)
+
+    end_time = time.perf_counter()
+
+    total_time = end_time - start_time
+    per_span_time = total_time / iterations
+
+    print("on_start Benchmark:")
+    print(f"  Total spans: {iterations}")
+    print(f"  Total time: {total_time:.4f}s")
+    print(f"  Time per span: {per_span_time:.6f}s")
+    print(f"  Spans per second: {iterations / total_time:.1f}")
+
+    return per_span_time
+
+
 def benchmark_provider_detection(iterations: int = 100) -> float:
     """Standalone provider detection benchmark."""
     detector = ProviderDetector()
@@ -552,16 +658,23 @@ if __name__ == "__main__":
 
     print()
 
+    # Run on_start benchmark
+    on_start_time = benchmark_on_start(5000)
+
+    print()
+
     # Run provider detection benchmark
     detection_time = benchmark_provider_detection(100)
 
     print()
     print("✅ Benchmark Summary:")
     print(f"  Span processing: {span_time:.6f}s per span")
+    print(f"  on_start: {on_start_time:.6f}s per span")
     print(f"  Provider detection: {detection_time:.6f}s per detection")
 
     # Performance requirements check
     MAX_SPAN_TIME = 0.001  # 1ms
+    MAX_ON_START_TIME = 0.000095  # 95us, half the pre-rework cost
     MAX_DETECTION_TIME = 0.010  # 10ms
 
     if span_time < MAX_SPAN_TIME:
@@ -569,6 +682,11 @@ if __name__ == "__main__":
     else:
         print(f"  ❌ Span processing exceeds requirement (>{MAX_SPAN_TIME}s)")
 
+    if on_start_time < MAX_ON_START_TIME:
+        print(f"  ✅ on_start meets requirement (<{MAX_ON_START_TIME}s)")
+    else:
+        print(f"  ❌ on_start exceeds requirement (>{MAX_ON_START_TIME}s)")
+
     if detection_time < MAX_DETECTION_TIME:
         print(f"  ✅ Provider detection meets requirement (<{MAX_DETECTION_TIME}s)")
     else:
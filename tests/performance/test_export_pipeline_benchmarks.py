@@ -0,0 +1,294 @@
+"""Performance benchmarks for the span export pipeline.
+
+Measures the per-batch and per-span cost of:
+- OTLPJSONExporter.export (serialization, compression, debug diagnostics)
+- OTLPJSONSerializer vs. the dict-based payload builder + json.dumps
+- HoneyHiveSpanProcessor.on_end (filtering, debug diagnostics, hand-off)
+- Structured (kvlistValue) vs. flattened encoding of large dict/list values
+
+Debug diagnostics (pretty-printed payloads, raw span dumps) must cost
+nothing when verbose logging is off.
+"""
+
+# pylint: disable=protected-access
+# Justification: Benchmarks time internal serialization helpers directly
+
+import gc
+import json
+import time
+from typing import Any, Callable, List, Tuple
+from unittest.mock import Mock, patch
+
+import pytest
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, SpanLimits, TracerProvider
+
+from honeyhive import HoneyHiveTracer
+from honeyhive.tracer.instrumentation.span_utils import _set_span_attributes
+from honeyhive.tracer.processing import otlp_exporter as otlp_exporter_module
+from honeyhive.tracer.processing.otlp_compression import compress_payload
+from honeyhive.tracer.processing.otlp_exporter import OTLPJSONExporter
+from honeyhive.tracer.processing.otlp_json_serializer import (
+    ORJSON_AVAILABLE,
+    OTLPJSONSerializer,
+)
+from honeyhive.tracer.processing.span_processor import HoneyHiveSpanProcessor
+
+BATCH_SIZE = 500
+SERIALIZER_BATCH_SIZE = 512
+TEST_OTLP_ENDPOINT = "https://test.example.com/opentelemetry/v1/traces"
+
+
+def best_of(func: Callable[[], Any], repeats: int = 5) -> float:
+    """Run func several times and return the fastest run in milliseconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def interleaved_best_of(
+    first: Callable[[], Any], second: Callable[[], Any], repeats: int = 30
+) -> Tuple[float, float]:
+    """Time two functions alternately and return each one's fastest run (ms).
+
+    Alternating runs and disabling GC keeps machine noise from favouring
+    whichever function happens to run during a quiet period.
+    """
+    first_timings, second_timings = [], []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            for func, timings in ((first, first_timings), (second, second_timings)):
+                start = time.perf_counter()
+                func()
+                timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return min(first_timings), min(second_timings)
+
+
+def make_spans(count: int = BATCH_SIZE) -> List[ReadableSpan]:
+    """Create finished SDK spans carrying typical LLM attributes."""
+    tracer = TracerProvider().get_tracer("benchmark.export")
+    spans: List[ReadableSpan] = []
+    for i in range(count):
+        span = tracer.start_span(f"llm_call_{i % 10}")
+        span.set_attribute("honeyhive.session_id", "benchmark-session")
+        span.set_attribute("honeyhive_event_type", "model")
+        span.set_attribute("gen_ai.request.model", "gpt-4o")
+        span.set_attribute("gen_ai.usage.prompt_tokens", 512)
+        span.set_attribute("honeyhive_inputs.prompt", "Summarize this text. " * 40)
+        span.set_attribute("honeyhive_outputs.completion", "The summary is... " * 20)
+        span.end()
+        spans.append(span)
+    return spans
+
+
+def make_traced_llm_spans(count: int = SERIALIZER_BATCH_SIZE) -> List[ReadableSpan]:
+    """Create spans shaped like instrumented LLM calls traced by HoneyHive.
+
+    Besides the prompt/completion, real spans carry a dozen or more short
+    session, model and metadata attributes plus span events.
+    """
+    provider = TracerProvider(
+        resource=Resource.create(
+            {"service.name": "benchmark", "honeyhive.project": "benchmark"}
+        )
+    )
+    tracer = provider.get_tracer("openinference.instrumentation.openai", "1.0.0")
+    spans: List[ReadableSpan] = []
+    for i in range(count):
+        span = tracer.start_span(f"llm_call_{i % 10}")
+        span.set_attribute("honeyhive.session_id", "benchmark-session")
+        span.set_attribute("honeyhive_event_type", "model")
+        span.set_attribute("gen_ai.request.model", "gpt-4o")
+        span.set_attribute("gen_ai.usage.prompt_tokens", 512)
+        span.set_attribute("gen_ai.request.temperature", 0.7)
+        span.set_attribute("llm.is_streaming", False)
+        span.set_attribute("honeyhive.tags", ["benchmark", "export"])
+        span.set_attribute("honeyhive_inputs.prompt", "Summarize this text. " * 40)
+        span.set_attribute("honeyhive_outputs.completion", "The summary is... " * 20)
+        for key in range(10):
+            span.set_attribute(f"honeyhive_metadata.field_{key}", f"value_{key}")
+        span.add_event("gen_ai.content.completion", {"choice": 0})
+        span.end()
+        spans.append(span)
+    return spans
+
+
+@pytest.fixture
+def quiet_tracer() -> HoneyHiveTracer:
+    """Tracer with verbose logging off (the production default)."""
+    return HoneyHiveTracer.init(
+        api_key="test-key", project="test-project", test_mode=True, verbose=False
+    )
+
+
+class TestExportDebugRenderingOverhead:
+    """Debug payload rendering must be free when verbose is off."""
+
+    def test_export_skips_pretty_print_when_verbose_off(
+        self, quiet_tracer: HoneyHiveTracer
+    ) -> None:
+        """export() never pretty-prints the payload with debug logging off."""
+        session = Mock()
+        session.post.return_value = Mock(status_code=200)
+        exporter = OTLPJSONExporter(
+            TEST_OTLP_ENDPOINT, session=session, tracer_instance=quiet_tracer
+        )
+        spans = make_spans()
+
+        with patch.object(
+            otlp_exporter_module.json, "dumps", wraps=json.dumps
+        ) as dumps_spy:
+            exporter.export(spans)
+
+        assert all("indent" not in c.kwargs for c in dumps_spy.call_args_list)
+
+    def test_export_cost_matches_essential_work(
+        self, quiet_tracer: HoneyHiveTracer
+    ) -> None:
+        """export() costs no more than serialize + compress + post."""
+        session = Mock()
+        session.post.return_value = Mock(status_code=200)
+        exporter = OTLPJSONExporter(
+            TEST_OTLP_ENDPOINT, session=session, tracer_instance=quiet_tracer
+        )
+        spans = make_spans()
+
+        def essential_work() -> None:
+            body = exporter._serializer.serialize(spans)
+            compress_payload(body, exporter.compression, exporter.compression_min_bytes)
+
+        essential_ms = best_of(essential_work)
+        export_ms = best_of(lambda: exporter.export(spans))
+
+        print(
+            f"\nexport({BATCH_SIZE} spans): {export_ms:.2f}ms "
+            f"(essential work: {essential_ms:.2f}ms)"
+        )
+
+        # Pretty-printing the payload used to roughly double this cost
+        assert export_ms < essential_ms * 1.3 + 1.0, (
+            f"export() overhead too high: {export_ms:.2f}ms vs "
+            f"{essential_ms:.2f}ms essential"
+        )
+
+    def test_on_end_skips_span_dump_when_verbose_off(
+        self, quiet_tracer: HoneyHiveTracer
+    ) -> None:
+        """on_end() never builds the raw span dump with debug logging off."""
+        processor = HoneyHiveSpanProcessor(
+            otlp_exporter=Mock(), disable_batch=True, tracer_instance=quiet_tracer
+        )
+        spans = make_spans()
+
+        with patch.object(
+            processor, "_dump_raw_span_data", wraps=processor._dump_raw_span_data
+        ) as dump_spy:
+
+            def end_all() -> None:
+                for span in spans:
+                    processor.on_end(span)
+
+            on_end_ms = best_of(end_all)
+
+        dump_ms = best_of(lambda: [processor._dump_raw_span_data(s) for s in spans])
+
+        print(
+            f"\non_end x{BATCH_SIZE}: {on_end_ms:.2f}ms "
+            f"(raw span dumps alone: {dump_ms:.2f}ms)"
+        )
+
+        dump_spy.assert_not_called()
+        assert on_end_ms / BATCH_SIZE < 1.0, "on_end too slow"
+
+
+class TestOTLPJSONSerializerThroughput:
+    """The streaming serializer beats building dicts and calling json.dumps."""
+
+    @pytest.mark.parametrize(
+        "use_orjson",
+        [
+            False,
+            pytest.param(
+                True,
+                marks=pytest.mark.skipif(
+                    not ORJSON_AVAILABLE, reason="orjson not installed"
+                ),
+            ),
+        ],
+        ids=["stdlib", "orjson"],
+    )
+    def test_serializer_speedup(self, use_orjson: bool) -> None:
+        """Serializing a 512-span batch is at least 3x faster."""
+        exporter = OTLPJSONExporter(TEST_OTLP_ENDPOINT, session=Mock())
+        serializer = OTLPJSONSerializer(use_orjson=use_orjson)
+        spans = make_traced_llm_spans()
+
+        def dict_path() -> bytes:
+            payload = exporter._spans_to_otlp_json_payload(spans)
+            return json.dumps(payload).encode("utf-8")
+
+        assert json.loads(serializer.serialize(spans)) == json.loads(dict_path())
+
+        dict_ms, serializer_ms = interleaved_best_of(
+            dict_path, lambda: serializer.serialize(spans)
+        )
+        speedup = dict_ms / serializer_ms
+
+        print(
+            f"\nserialize({SERIALIZER_BATCH_SIZE} spans): {serializer_ms:.2f}ms "
+            f"vs dict + json.dumps {dict_ms:.2f}ms ({speedup:.1f}x)"
+        )
+
+        assert speedup >= 3.0, f"serializer only {speedup:.1f}x faster"
+
+
+class TestStructuredAttributeEncoding:
+    """Large structured outputs cost one attribute instead of one per leaf."""
+
+    def test_structured_beats_flattening(self) -> None:
+        """Setting + serializing a 1,000-choice result is at least 2x faster."""
+        tracer = TracerProvider(span_limits=SpanLimits(max_attributes=1024)).get_tracer(
+            "benchmark.structured"
+        )
+        serializer = OTLPJSONSerializer()
+        result = {
+            "choices": [
+                {"index": i, "message": {"role": "assistant", "content": "ok " * 5}}
+                for i in range(1000)
+            ]
+        }
+
+        def record(structured: bool) -> ReadableSpan:
+            span = tracer.start_span("llm_call")
+            _set_span_attributes(
+                span, "honeyhive_outputs.result", result, structured=structured
+            )
+            span.end()
+            serializer.serialize([span])  # type: ignore[list-item]
+            return span  # type: ignore[return-value]
+
+        flattened, structured = record(False), record(True)
+        # Flattening 3,000 leaves overflows max_attributes and evicts data
+        assert flattened.dropped_attributes > 0
+        assert structured.dropped_attributes == 0
+        assert len(structured.attributes or {}) == 2
+
+        flatten_ms, structured_ms = interleaved_best_of(
+            lambda: record(False), lambda: record(True), repeats=10
+        )
+        speedup = flatten_ms / structured_ms
+
+        print(
+            f"\n1,000-choice result: structured {structured_ms:.2f}ms vs "
+            f"flattened {flatten_ms:.2f}ms ({speedup:.1f}x)"
+        )
+
+        assert speedup >= 2.0, f"structured only {speedup:.1f}x faster"
@@ -177,13 +177,11 @@ class TestProjectDeprecationWarning:
 
         events_api = EventsAPI(mock_config)
 
-        with patch("httpx.Client") as mock_client:
+        with patch.object(mock_config, "get_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"events": [], "totalEvents": 0}
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request.return_value = mock_response
 
             with warnings.catch_warnings(record=True) as w:
                 warnings.simplefilter("always")
@@ -203,13 +201,11 @@ class TestProjectDeprecationWarning:
 
         events_api = EventsAPI(mock_config)
 
-        with patch("httpx.Client") as mock_client:
+        with patch.object(mock_config, "get_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"events": [], "totalEvents": 0}
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request.return_value = mock_response
 
             with warnings.catch_warnings(record=True) as w:
                 warnings.simplefilter("always")
@@ -232,13 +228,11 @@ class TestProjectDeprecationWarning:
 
         events_api = EventsAPI(mock_config)
 
-        with patch("httpx.Client") as mock_client:
+        with patch.object(mock_config, "get_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"events": [], "totalEvents": 0}
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request.return_value = mock_response
 
             with warnings.catch_warnings(record=True) as w:
                 warnings.simplefilter("always")
@@ -389,13 +383,11 @@ class TestConfigurationsDeprecationWarning:
 
         events_api = EventsAPI(mock_config)
 
-        with patch("httpx.Client") as mock_client:
+        with patch.object(mock_config, "get_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"events": [], "totalEvents": 0}
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request.return_value = mock_response
 
             with warnings.catch_warnings(record=True) as w:
                 warnings.simplefilter("always")
@@ -426,11 +418,11 @@ class TestExportRequestBody:
 
         events_api = EventsAPI(mock_config)
 
-        with patch("httpx.Client") as mock_client:
+        with patch.object(mock_config, "get_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"events": [], "totalEvents": 0}
-            mock_request = mock_client.return_value.__enter__.return_value.request
+            mock_request = mock_client.return_value.request
             mock_request.return_value = mock_response
 
             with warnings.catch_warnings():
@@ -451,11 +443,11 @@ class TestExportRequestBody:
 
         events_api = EventsAPI(mock_config)
 
-        with patch("httpx.Client") as mock_client:
+        with patch.object(mock_config, "get_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"events": [], "totalEvents": 0}
-            mock_request = mock_client.return_value.__enter__.return_value.request
+            mock_request = mock_client.return_value.request
             mock_request.return_value = mock_response
 
             with warnings.catch_warnings():
@@ -487,16 +479,14 @@ class TestGetBySessionIdSorting:
             {"event_name": "event2", "start_time": 2000.0},
         ]
 
-        with patch("httpx.Client") as mock_client:
+        with patch.object(mock_config, "get_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
                 "events": unsorted_events,
                 "totalEvents": 3,
             }
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request.return_value = mock_response
 
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
@@ -1,7 +1,7 @@
-"""Unit tests for batched async export via OTel BatchSpanProcessor integration.
+"""Unit tests for batched async export via HoneyHiveBatchSpanProcessor.
 
-Tests the HoneyHiveSpanProcessor's internal BatchSpanProcessor wiring:
-- Batch mode creates an internal BatchSpanProcessor
+Tests the HoneyHiveSpanProcessor's internal batch processor wiring:
+- Batch mode creates an internal HoneyHiveBatchSpanProcessor from tracer config
 - Immediate mode (disable_batch=True) does not
 - Spans are enqueued (not exported inline) in batch mode
 - force_flush drains the batch queue
@@ -13,9 +13,11 @@ from unittest.mock import Mock
 
 import pytest
 from opentelemetry.sdk.trace import ReadableSpan
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExportResult
+from opentelemetry.sdk.trace.export import SpanExportResult
 
+from honeyhive.tracer.processing.batch_processor import HoneyHiveBatchSpanProcessor
 from honeyhive.tracer.processing.span_processor import HoneyHiveSpanProcessor
+from honeyhive.utils.dotdict import DotDict
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -73,23 +75,22 @@ def _make_batch_processor(
     schedule_delay_millis: float = 60000.0,
     max_export_batch_size: int = 512,
 ) -> HoneyHiveSpanProcessor:
-    """Create a HoneyHiveSpanProcessor with a custom BatchSpanProcessor.
-
-    Since HoneyHiveSpanProcessor defers to OTel's defaults, tests that need
-    specific batch timing construct the BatchSpanProcessor directly.
-    """
-    processor = HoneyHiveSpanProcessor(
+    """Create a HoneyHiveSpanProcessor whose batch timing comes from tracer config."""
+    tracer = Mock()
+    tracer.config = DotDict(
+        {
+            "otlp": {
+                "flush_interval": schedule_delay_millis / 1000,
+                "batch_size": max_export_batch_size,
+                "max_export_batch_size": max_export_batch_size,
+            }
+        }
+    )
+    return HoneyHiveSpanProcessor(
         otlp_exporter=exporter,
         disable_batch=False,
+        tracer_instance=tracer,
     )
-    # Replace the default BatchSpanProcessor with one using test-specific config
-    processor._batch_processor.shutdown()
-    processor._batch_processor = BatchSpanProcessor(
-        span_exporter=exporter,
-        schedule_delay_millis=schedule_delay_millis,
-        max_export_batch_size=max_export_batch_size,
-    )
-    return processor
 
 
 # ---------------------------------------------------------------------------
@@ -98,7 +99,7 @@ def _make_batch_processor(
 
 
 class TestBatchProcessorInitialization:
-    """Test that the internal BatchSpanProcessor is created/skipped correctly."""
+    """Test that the internal batch processor is created/skipped correctly."""
 
     def test_batch_mode_creates_internal_batch_processor(self) -> None:
         """When disable_batch=False and exporter provided, _batch_processor is created."""
@@ -108,7 +109,7 @@ class TestBatchProcessorInitialization:
             disable_batch=False,
         )
         assert processor._batch_processor is not None
-        assert isinstance(processor._batch_processor, BatchSpanProcessor)
+        assert isinstance(processor._batch_processor, HoneyHiveBatchSpanProcessor)
         processor.shutdown()
 
     def test_immediate_mode_skips_batch_processor(self) -> None:
@@ -129,15 +130,32 @@ class TestBatchProcessorInitialization:
         )
         assert processor._batch_processor is None
 
-    def test_uses_otel_defaults(self) -> None:
-        """BatchSpanProcessor is created with OTel upstream defaults (no custom config)."""
+    def test_uses_tracer_config(self) -> None:
+        """Batch settings are read from the tracer's OTLP config section."""
+        exporter = _make_mock_exporter()
+        processor = _make_batch_processor(
+            exporter, schedule_delay_millis=2000.0, max_export_batch_size=64
+        )
+
+        batch_processor = processor._batch_processor
+        assert isinstance(batch_processor, HoneyHiveBatchSpanProcessor)
+        assert batch_processor.schedule_delay == 2.0
+        assert batch_processor.batch_size == 64
+        assert batch_processor.max_export_batch_size == 64
+        processor.shutdown()
+
+    def test_uses_defaults_without_tracer(self) -> None:
+        """Without a tracer the HoneyHive defaults apply."""
         exporter = _make_mock_exporter()
         processor = HoneyHiveSpanProcessor(
             otlp_exporter=exporter,
             disable_batch=False,
         )
-        # Verify processor was created without error — OTel defaults are used internally
-        assert processor._batch_processor is not None
+
+        batch_processor = processor._batch_processor
+        assert isinstance(batch_processor, HoneyHiveBatchSpanProcessor)
+        assert batch_processor.max_queue_size == 8192
+        assert batch_processor.export_workers == 1
         processor.shutdown()
 
 
@@ -311,7 +329,7 @@ class TestShutdown:
     """Test shutdown behavior in both modes."""
 
     def test_shutdown_batch_mode_shuts_down_batch_processor(self) -> None:
-        """In batch mode, shutdown() shuts down the internal BatchSpanProcessor."""
+        """In batch mode, shutdown() shuts down the internal batch processor."""
         exporter = _make_mock_exporter()
         processor = HoneyHiveSpanProcessor(
             otlp_exporter=exporter,
@@ -322,7 +340,7 @@ class TestShutdown:
         processor.shutdown()
 
         # After shutdown, the exporter should have been shut down
-        # (BatchSpanProcessor calls exporter.shutdown() internally)
+        # (the batch processor calls exporter.shutdown() internally)
         exporter.shutdown.assert_called()
 
     def test_shutdown_immediate_mode_shuts_down_exporter(self) -> None:
@@ -353,7 +371,7 @@ class TestErrorHandling:
     """Test graceful degradation on errors."""
 
     def test_send_via_otlp_handles_batch_enqueue_error(self) -> None:
-        """If BatchSpanProcessor.on_end raises, error is caught gracefully."""
+        """If the batch processor's on_end raises, error is caught gracefully."""
         exporter = _make_mock_exporter()
         processor = HoneyHiveSpanProcessor(
             otlp_exporter=exporter,
@@ -368,7 +386,7 @@ class TestErrorHandling:
         processor.shutdown()
 
     def test_force_flush_handles_batch_processor_error(self) -> None:
-        """If BatchSpanProcessor.force_flush raises, returns False."""
+        """If the batch processor's force_flush raises, returns False."""
         exporter = _make_mock_exporter()
         processor = HoneyHiveSpanProcessor(
             otlp_exporter=exporter,
@@ -383,7 +401,7 @@ class TestErrorHandling:
         processor.shutdown()
 
     def test_shutdown_handles_batch_processor_error(self) -> None:
-        """If BatchSpanProcessor.shutdown raises, error is caught."""
+        """If the batch processor's shutdown raises, error is caught."""
         exporter = _make_mock_exporter()
         processor = HoneyHiveSpanProcessor(
             otlp_exporter=exporter,
@@ -7,6 +7,8 @@ nothing is configured.
 
 from unittest.mock import patch
 
+import httpx
+
 from honeyhive.api.client import HoneyHive, _resolve_api_timeout
 
 
@@ -98,3 +100,21 @@ class TestResolveApiTimeout:
             with patch("honeyhive.api.client.logger") as mock_logger:
                 assert _resolve_api_timeout(None) is None
                 mock_logger.warning.assert_called_once()
+
+
+class TestClientPoolSettings:
+    """HoneyHive() threads HTTPClientConfig pool settings into APIConfig."""
+
+    def test_pool_defaults(self) -> None:
+        with patch.dict("os.environ", {}, clear=True):
+            client = HoneyHive(api_key="k")
+        assert client.api_config.max_connections == 100
+        assert client.api_config.pool_timeout == 10.0
+
+    def test_pool_timeout_reaches_httpx(self) -> None:
+        with patch.dict("os.environ", {"HH_POOL_TIMEOUT": "2.5"}, clear=True):
+            client = HoneyHive(api_key="k")
+        timeout = client.api_config.get_timeout()
+        assert isinstance(timeout, httpx.Timeout)
+        assert timeout.pool == 2.5
+        assert timeout.read == 5.0
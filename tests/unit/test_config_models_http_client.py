@@ -19,7 +19,7 @@ class TestHTTPClientConfig:
         with patch.dict(os.environ, {}, clear=True):
             config = HTTPClientConfig()
             assert config.timeout == 30.0
-            assert config.max_connections == 10
+            assert config.max_connections == 100
             assert config.max_keepalive_connections == 20
             assert config.keepalive_expiry == 30.0
             assert config.pool_timeout == 10.0
@@ -90,7 +90,7 @@ class TestHTTPClientConfig:
 
         with patch.dict(os.environ, {"HH_MAX_CONNECTIONS": "invalid"}, clear=True):
             config = HTTPClientConfig()
-            assert config.max_connections == 10  # Should fall back to default
+            assert config.max_connections == 100  # Should fall back to default
 
     def test_env_float_invalid_values(self) -> None:
         """Test environment float parsing for invalid values (lines 43-44)."""
@@ -520,6 +520,322 @@ class TestOTLPHeadersValidation:
         assert mock_logger.warning.call_count == 3
 
 
+class TestOTLPCompressionValidation:
+    """Test OTLP compression settings validation."""
+
+    def test_default_compression_settings(self) -> None:
+        """Compression defaults to gzip with a 1 KiB threshold."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = OTLPConfig()
+
+            assert config.otlp_compression == "gzip"
+            assert config.otlp_compression_min_bytes == 1024
+
+    def test_compression_from_environment_variables(self) -> None:
+        """HH_ and OTEL_ environment variables are honored."""
+        with patch.dict(
+            os.environ,
+            {
+                "OTEL_EXPORTER_OTLP_COMPRESSION": "none",
+                "HH_OTLP_COMPRESSION_MIN_BYTES": "4096",
+            },
+            clear=True,
+        ):
+            config = OTLPConfig()
+
+            assert config.otlp_compression == "none"
+            assert config.otlp_compression_min_bytes == 4096
+
+        with patch.dict(os.environ, {"HH_OTLP_COMPRESSION": "ZSTD"}, clear=True):
+            assert OTLPConfig().otlp_compression == "zstd"
+
+    @patch("logging.getLogger")
+    def test_validate_otlp_compression_invalid_value(
+        self, mock_get_logger: Mock
+    ) -> None:
+        """Unknown encodings fall back to gzip with a warning."""
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
+
+        assert OTLPConfig.validate_otlp_compression("brotli") == "gzip"
+        assert OTLPConfig.validate_otlp_compression("identity") == "none"
+        assert OTLPConfig.validate_otlp_compression(None) == "gzip"
+        assert mock_logger.warning.call_count == 1
+
+    @patch("logging.getLogger")
+    def test_validate_otlp_compression_min_bytes(self, mock_get_logger: Mock) -> None:
+        """Threshold is coerced to a non-negative integer."""
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
+
+        assert OTLPConfig.validate_otlp_compression_min_bytes("2048") == 2048
+        assert OTLPConfig.validate_otlp_compression_min_bytes(-5) == 0
+        assert OTLPConfig.validate_otlp_compression_min_bytes("abc") == 1024
+        assert mock_logger.warning.call_count == 2
+
+
+class TestOTLPSpoolValidation:
+    """Test OTLP export spool settings validation."""
+
+    def test_spool_disabled_by_default(self) -> None:
+        """No spool directory is configured unless requested."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = OTLPConfig()
+
+            assert config.otlp_spool_dir is None
+            assert config.otlp_spool_max_bytes == 64 * 1024 * 1024
+            assert config.otlp_spool_max_age == 86400.0
+
+    def test_spool_from_environment_variables(self) -> None:
+        """HH_OTLP_SPOOL_* environment variables are honored."""
+        with patch.dict(
+            os.environ,
+            {
+                "HH_OTLP_SPOOL_DIR": "/var/tmp/hh-spool",
+                "HH_OTLP_SPOOL_MAX_BYTES": "1048576",
+                "HH_OTLP_SPOOL_MAX_AGE": "3600",
+            },
+            clear=True,
+        ):
+            config = OTLPConfig()
+
+            assert config.otlp_spool_dir == "/var/tmp/hh-spool"
+            assert config.otlp_spool_max_bytes == 1048576
+            assert config.otlp_spool_max_age == 3600.0
+
+    @patch("logging.getLogger")
+    def test_validate_spool_settings(self, mock_get_logger: Mock) -> None:
+        """Blank directories disable the spool; bad caps fall back to defaults."""
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
+
+        assert OTLPConfig.validate_otlp_spool_dir("  ") is None
+        assert OTLPConfig.validate_otlp_spool_dir("~/spool") == os.path.expanduser(
+            "~/spool"
+        )
+        assert OTLPConfig.validate_otlp_spool_max_bytes("0") == 64 * 1024 * 1024
+        assert OTLPConfig.validate_otlp_spool_max_bytes("abc") == 64 * 1024 * 1024
+        assert OTLPConfig.validate_otlp_spool_max_age(-1) == 86400.0
+        assert OTLPConfig.validate_otlp_spool_max_age("60") == 60.0
+        assert mock_logger.warning.call_count == 3
+
+
+class TestOTLPAsyncExportValidation:
+    """Test async OTLP export settings validation."""
+
+    def test_async_export_disabled_by_default(self) -> None:
+        """The blocking exporter stays the default."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = OTLPConfig()
+
+            assert config.otlp_async_export is False
+            assert config.otlp_http2 is True
+            assert config.otlp_max_in_flight == 16
+
+    def test_async_export_from_environment_variables(self) -> None:
+        """HH_OTLP_ASYNC_EXPORT, HH_OTLP_HTTP2 and HH_OTLP_MAX_IN_FLIGHT apply."""
+        with patch.dict(
+            os.environ,
+            {
+                "HH_OTLP_ASYNC_EXPORT": "true",
+                "HH_OTLP_HTTP2": "false",
+                "HH_OTLP_MAX_IN_FLIGHT": "64",
+            },
+            clear=True,
+        ):
+            config = OTLPConfig()
+
+            assert config.otlp_async_export is True
+            assert config.otlp_http2 is False
+            assert config.otlp_max_in_flight == 64
+
+    @patch("logging.getLogger")
+    def test_validate_max_in_flight(self, mock_get_logger: Mock) -> None:
+        """Non-positive or invalid limits fall back to the default."""
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
+
+        assert OTLPConfig.validate_otlp_max_in_flight("8") == 8
+        assert OTLPConfig.validate_otlp_max_in_flight(0) == 16
+        assert OTLPConfig.validate_otlp_max_in_flight("abc") == 16
+        assert mock_logger.warning.call_count == 2
+
+
+class TestOTLPQueueValidation:
+    """Test span queue and export worker settings validation."""
+
+    def test_queue_defaults(self) -> None:
+        """The queue is larger than OTel's default and drops the oldest spans."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = OTLPConfig()
+
+            assert config.max_queue_size == 8192
+            assert config.export_workers == 1
+            assert config.queue_drop_policy == "drop_oldest"
+
+    def test_queue_from_environment_variables(self) -> None:
+        """HH_MAX_QUEUE_SIZE, HH_EXPORT_WORKERS and HH_QUEUE_DROP_POLICY apply."""
+        with patch.dict(
+            os.environ,
+            {
+                "HH_MAX_QUEUE_SIZE": "32768",
+                "HH_EXPORT_WORKERS": "4",
+                "HH_QUEUE_DROP_POLICY": "DROP_NEWEST",
+            },
+            clear=True,
+        ):
+            config = OTLPConfig()
+
+            assert config.max_queue_size == 32768
+            assert config.export_workers == 4
+            assert config.queue_drop_policy == "drop_newest"
+
+    @patch("logging.getLogger")
+    def test_validate_queue_settings(self, mock_get_logger: Mock) -> None:
+        """Invalid values fall back to the defaults."""
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
+
+        assert OTLPConfig.validate_max_queue_size("0") == 8192
+        assert OTLPConfig.validate_export_workers("abc") == 1
+        assert OTLPConfig.validate_queue_drop_policy("random") == "drop_oldest"
+        assert mock_logger.warning.call_count == 3
+
+
+class TestOTLPBatchBytesValidation:
+    """Test the byte ceiling used to cut export batches."""
+
+    def test_default_and_environment(self) -> None:
+        """HH_MAX_EXPORT_BATCH_BYTES overrides the 4 MiB default; 0 disables."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert OTLPConfig().max_export_batch_bytes == 4 * 1024 * 1024
+
+        with patch.dict(os.environ, {"HH_MAX_EXPORT_BATCH_BYTES": "0"}, clear=True):
+            assert OTLPConfig().max_export_batch_bytes == 0
+
+    @patch("logging.getLogger")
+    def test_invalid_values_use_default(self, mock_get_logger: Mock) -> None:
+        """Negative or non-numeric values fall back to the default."""
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
+
+        assert OTLPConfig.validate_max_export_batch_bytes(-1) == 4 * 1024 * 1024
+        assert OTLPConfig.validate_max_export_batch_bytes("big") == 4 * 1024 * 1024
+        assert mock_logger.warning.call_count == 2
+
+
+class TestOTLPAttributeAliasesValidation:
+    """Test the traceloop.* attribute alias mode."""
+
+    def test_default_and_environment(self) -> None:
+        """HH_OTLP_ATTRIBUTE_ALIASES overrides the 'span' default."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert OTLPConfig().otlp_attribute_aliases == "span"
+
+        with patch.dict(
+            os.environ, {"HH_OTLP_ATTRIBUTE_ALIASES": "Resource"}, clear=True
+        ):
+            assert OTLPConfig().otlp_attribute_aliases == "resource"
+
+    @patch("logging.getLogger")
+    def test_invalid_value_uses_default(self, mock_get_logger: Mock) -> None:
+        """Unknown modes fall back to 'span'."""
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
+
+        assert OTLPConfig.validate_otlp_attribute_aliases("scope") == "span"
+        assert mock_logger.warning.call_count == 1
+
+
+class TestOTLPRetryValidation:
+    """Test export retry settings."""
+
+    def test_defaults_and_environment(self) -> None:
+        """Retry settings default sensibly and load from HH_OTLP_RETRY_*."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = OTLPConfig()
+            assert config.otlp_retry_max_attempts == 5
+            assert config.otlp_retry_base_delay == 0.1
+            assert config.otlp_retry_max_delay == 5.0
+            assert config.otlp_retry_budget_ratio == 0.1
+
+        with patch.dict(
+            os.environ,
+            {
+                "HH_OTLP_RETRY_MAX_ATTEMPTS": "3",
+                "HH_OTLP_RETRY_MAX_DELAY": "2.5",
+                "HH_OTLP_RETRY_BUDGET_RATIO": "0.2",
+            },
+            clear=True,
+        ):
+            config = OTLPConfig()
+            assert config.otlp_retry_max_attempts == 3
+            assert config.otlp_retry_max_delay == 2.5
+            assert config.otlp_retry_budget_ratio == 0.2
+
+    @patch("logging.getLogger")
+    def test_invalid_values_use_defaults(self, mock_get_logger: Mock) -> None:
+        """Invalid attempts and delays fall back; the ratio is clamped."""
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
+
+        with patch.dict(os.environ, {}, clear=True):
+            config = OTLPConfig(
+                otlp_retry_max_attempts=0,
+                otlp_retry_base_delay=-1,
+                otlp_retry_budget_ratio=3,
+            )
+
+        assert config.otlp_retry_max_attempts == 5
+        assert config.otlp_retry_base_delay == 0.1
+        assert config.otlp_retry_budget_ratio == 1.0
+        assert mock_logger.warning.call_count == 2
+
+
+class TestOTLPCircuitValidation:
+    """Test export circuit breaker settings."""
+
+    def test_defaults_and_environment(self) -> None:
+        """Circuit settings default sensibly and load from HH_OTLP_CIRCUIT_*."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = OTLPConfig()
+            assert config.otlp_circuit_failure_threshold == 5
+            assert config.otlp_circuit_reset_timeout == 30.0
+            assert config.otlp_circuit_open_policy == "spool"
+
+        with patch.dict(
+            os.environ,
+            {
+                "HH_OTLP_CIRCUIT_FAILURE_THRESHOLD": "0",
+                "HH_OTLP_CIRCUIT_RESET_TIMEOUT": "5",
+                "HH_OTLP_CIRCUIT_OPEN_POLICY": "DROP",
+            },
+            clear=True,
+        ):
+            config = OTLPConfig()
+            assert config.otlp_circuit_failure_threshold == 0
+            assert config.otlp_circuit_reset_timeout == 5.0
+            assert config.otlp_circuit_open_policy == "drop"
+
+    @patch("logging.getLogger")
+    def test_invalid_values_use_defaults(self, mock_get_logger: Mock) -> None:
+        """Invalid circuit settings fall back to their defaults."""
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
+
+        with patch.dict(os.environ, {}, clear=True):
+            config = OTLPConfig(
+                otlp_circuit_failure_threshold=-1,
+                otlp_circuit_reset_timeout=0,
+                otlp_circuit_open_policy="block",
+            )
+
+        assert config.otlp_circuit_failure_threshold == 5
+        assert config.otlp_circuit_reset_timeout == 30.0
+        assert config.otlp_circuit_open_policy == "spool"
+        assert mock_logger.warning.call_count == 3
+
+
 class TestOTLPConfigIntegration:
     """Test OTLPConfig integration scenarios."""
 
@@ -707,3 +1023,81 @@ class TestOTLPConfigEdgeCases:
         with patch.dict(os.environ, {"HH_OTLP_PROTOCOL": "http/json"}):
             config = OTLPConfig(otlp_protocol="http/protobuf")
             assert config.otlp_protocol == "http/protobuf"
+
+
+class TestOTLPSharedExport:
+    """Test the shared export pipeline setting."""
+
+    def test_defaults_and_environment(self) -> None:
+        """Shared export is off by default and loads from HH_OTLP_SHARED_EXPORT."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert OTLPConfig().otlp_shared_export is False
+
+        with patch.dict(os.environ, {"HH_OTLP_SHARED_EXPORT": "true"}, clear=True):
+            assert OTLPConfig().otlp_shared_export is True
+
+
+class TestOTLPLifecycleMode:
+    """Test the serverless lifecycle settings."""
+
+    def test_defaults_and_environment(self) -> None:
+        """Lifecycle settings default to auto and load from HH_OTLP_* variables."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = OTLPConfig()
+            assert config.otlp_lifecycle_mode == "auto"
+            assert config.otlp_serverless_flush_budget == 2.0
+
+        with patch.dict(
+            os.environ,
+            {
+                "HH_OTLP_LIFECYCLE_MODE": "Serverless",
+                "HH_OTLP_SERVERLESS_FLUSH_BUDGET": "0.5",
+            },
+            clear=True,
+        ):
+            config = OTLPConfig()
+            assert config.otlp_lifecycle_mode == "serverless"
+            assert config.otlp_serverless_flush_budget == 0.5
+
+    @patch("logging.getLogger")
+    def test_invalid_values_use_defaults(self, mock_get_logger: Mock) -> None:
+        """Invalid lifecycle settings fall back to their defaults."""
+        mock_get_logger.return_value = Mock()
+
+        with patch.dict(os.environ, {}, clear=True):
+            config = OTLPConfig(
+                otlp_lifecycle_mode="lambda", otlp_serverless_flush_budget=0
+            )
+
+        assert config.otlp_lifecycle_mode == "auto"
+        assert config.otlp_serverless_flush_budget == 2.0
+
+
+class TestOTLPPipelineStatus:
+    """Test the pipeline status publishing settings."""
+
+    def test_defaults_and_environment(self) -> None:
+        """Status settings default to the temp directory every 5 seconds."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = OTLPConfig()
+            assert config.otlp_status_dir is None
+            assert config.otlp_status_interval == 5.0
+
+        with patch.dict(
+            os.environ,
+            {"HH_OTLP_STATUS_DIR": " /var/run/hh ", "HH_OTLP_STATUS_INTERVAL": "0"},
+            clear=True,
+        ):
+            config = OTLPConfig()
+            assert config.otlp_status_dir == "/var/run/hh"
+            assert config.otlp_status_interval == 0.0
+
+    @patch("logging.getLogger")
+    def test_invalid_interval_uses_default(self, mock_get_logger: Mock) -> None:
+        """A negative status interval falls back to the default."""
+        mock_get_logger.return_value = Mock()
+
+        with patch.dict(os.environ, {}, clear=True):
+            config = OTLPConfig(otlp_status_interval=-1)
+
+        assert config.otlp_status_interval == 5.0
@@ -345,6 +345,47 @@ class TestTracerConfig:
             assert config.max_span_size == 52428800  # 50MB
             assert config.preserve_core_attributes is False  # Disabled via env var
 
+    def test_span_size_policy(self) -> None:
+        """HH_SPAN_SIZE_POLICY is normalized; invalid values use 'truncate'."""
+        with patch.dict("os.environ", {"HH_SPAN_SIZE_POLICY": "DROP"}, clear=True):
+            assert TracerConfig().span_size_policy == "drop"
+
+        assert TracerConfig().span_size_policy == "truncate"
+        assert TracerConfig(span_size_policy="shrink").span_size_policy == "truncate"
+
+    def test_attribute_encoding(self) -> None:
+        """HH_ATTRIBUTE_ENCODING is normalized; invalid values use 'flatten'."""
+        with patch.dict(
+            "os.environ", {"HH_ATTRIBUTE_ENCODING": "Structured"}, clear=True
+        ):
+            assert TracerConfig().attribute_encoding == "structured"
+
+        assert TracerConfig().attribute_encoding == "flatten"
+        assert TracerConfig(attribute_encoding="json").attribute_encoding == "flatten"
+
+    def test_sampling_settings(self) -> None:
+        """Sampling settings are read from env and normalized."""
+        with patch.dict(
+            "os.environ",
+            {
+                "HH_SAMPLING_RATIO": "0.25",
+                "HH_TAIL_SAMPLING": "true",
+                "HH_TAIL_SAMPLING_EVENT_TYPES": "model, chain",
+            },
+            clear=True,
+        ):
+            config = TracerConfig()
+
+            assert config.sampling_ratio == 0.25
+            assert config.tail_sampling is True
+            assert config.tail_sampling_event_types == "model,chain"
+            assert config.tail_sampling_slow_span_ms == 5000.0
+
+        assert TracerConfig(sampling_ratio=3).sampling_ratio == 1.0
+        assert TracerConfig(sampling_ratio="bad").sampling_ratio == 1.0
+        config = TracerConfig(tail_sampling_event_types=["model", "tool"])
+        assert config.tail_sampling_event_types == "model,tool"
+
     def test_extra_fields_forbidden(self) -> None:
         """Test that extra fields are forbidden in configuration."""
         with pytest.raises(ValidationError) as exc_info:
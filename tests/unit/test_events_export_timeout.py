@@ -14,6 +14,7 @@ the default read timeout.
 # pylint: disable=protected-access
 # Justification: Unit tests need to verify private method behavior
 
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import httpx
@@ -43,6 +44,11 @@ def events_api(api_config: APIConfig) -> EventsAPI:
     return EventsAPI(api_config)
 
 
+async def _run_request_async(fn: Any, operation: str) -> Any:
+    """Stand-in for RetryConfig.execute_async that runs the request once."""
+    return await fn()
+
+
 class TestExportTimeoutConstant:
     """Test the EXPORT_TIMEOUT constant."""
 
@@ -123,49 +129,42 @@ class TestBuildExportTimeout:
 class TestExportSyncTimeout:
     """Test that sync export() uses the correct timeout."""
 
-    @patch("honeyhive.api.client.httpx.Client")
+    @patch.object(APIConfig, "get_client")
     @patch("honeyhive.api.client.RetryConfig")
-    def test_export_creates_client_with_timeout(
+    def test_export_uses_shared_client_with_timeout(
         self,
         mock_retry_cls: Mock,
-        mock_client_cls: Mock,
+        mock_get_client: Mock,
         events_api: EventsAPI,
     ) -> None:
-        """export() should create httpx.Client with EXPORT_TIMEOUT."""
-        # Set up the mock client context manager
+        """export() should send through the pooled client with EXPORT_TIMEOUT."""
         mock_client = MagicMock()
-        mock_client_cls.return_value.__enter__ = Mock(return_value=mock_client)
-        mock_client_cls.return_value.__exit__ = Mock(return_value=False)
+        mock_get_client.return_value = mock_client
 
-        # Set up retry to return a successful response
+        # Run the request lambda so the call on the shared client is recorded
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
         mock_response.json.return_value = {"events": [], "totalEvents": 0}
+        mock_client.request.return_value = mock_response
         mock_retry = Mock()
-        mock_retry.execute.return_value = mock_response
+        mock_retry.execute.side_effect = lambda fn, operation: fn()
         mock_retry_cls.default.return_value = mock_retry
 
         events_api.export(filters=[])
 
-        # Verify httpx.Client was called with EXPORT_TIMEOUT
-        mock_client_cls.assert_called_once_with(
-            base_url="https://api.test.honeyhive.ai",
-            verify=True,
-            timeout=EXPORT_TIMEOUT,
-        )
+        mock_get_client.assert_called_once_with()
+        assert mock_client.request.call_args.kwargs["timeout"] == EXPORT_TIMEOUT
 
-    @patch("honeyhive.api.client.httpx.Client")
+    @patch.object(APIConfig, "get_client")
     @patch("honeyhive.api.client.RetryConfig")
     def test_export_returns_events(
         self,
         mock_retry_cls: Mock,
-        mock_client_cls: Mock,
+        mock_get_client: Mock,
         events_api: EventsAPI,
     ) -> None:
         """export() should return events from the response."""
-        mock_client = MagicMock()
-        mock_client_cls.return_value.__enter__ = Mock(return_value=mock_client)
-        mock_client_cls.return_value.__exit__ = Mock(return_value=False)
+        mock_get_client.return_value = MagicMock()
 
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
@@ -186,55 +185,43 @@ class TestExportSyncTimeout:
 class TestExportAsyncTimeout:
     """Test that async export_async() uses the correct timeout."""
 
-    @patch("honeyhive.api.client.httpx.AsyncClient")
+    @patch.object(APIConfig, "get_async_client")
     @patch("honeyhive.api.client.RetryConfig")
     @pytest.mark.asyncio
-    async def test_export_async_creates_client_with_timeout(
+    async def test_export_async_uses_shared_client_with_timeout(
         self,
         mock_retry_cls: Mock,
-        mock_async_client_cls: Mock,
+        mock_get_async_client: Mock,
         events_api: EventsAPI,
     ) -> None:
-        """export_async() should create httpx.AsyncClient with EXPORT_TIMEOUT."""
-        # Set up the mock async client context manager
+        """export_async() should send through the pooled client with EXPORT_TIMEOUT."""
         mock_client = AsyncMock()
-        mock_async_client_cls.return_value.__aenter__ = AsyncMock(
-            return_value=mock_client
-        )
-        mock_async_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_async_client.return_value = mock_client
 
-        # Set up retry to return a successful response
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
         mock_response.json.return_value = {"events": [], "totalEvents": 0}
+        mock_client.request.return_value = mock_response
         mock_retry = Mock()
-        mock_retry.execute_async = AsyncMock(return_value=mock_response)
+        mock_retry.execute_async = _run_request_async
         mock_retry_cls.default.return_value = mock_retry
 
         await events_api.export_async(filters=[])
 
-        # Verify httpx.AsyncClient was called with EXPORT_TIMEOUT
-        mock_async_client_cls.assert_called_once_with(
-            base_url="https://api.test.honeyhive.ai",
-            verify=True,
-            timeout=EXPORT_TIMEOUT,
-        )
+        mock_get_async_client.assert_called_once_with()
+        assert mock_client.request.call_args.kwargs["timeout"] == EXPORT_TIMEOUT
 
-    @patch("honeyhive.api.client.httpx.AsyncClient")
+    @patch.object(APIConfig, "get_async_client")
     @patch("honeyhive.api.client.RetryConfig")
     @pytest.mark.asyncio
     async def test_export_async_returns_events(
         self,
         mock_retry_cls: Mock,
-        mock_async_client_cls: Mock,
+        mock_get_async_client: Mock,
         events_api: EventsAPI,
     ) -> None:
         """export_async() should return events from the response."""
-        mock_client = AsyncMock()
-        mock_async_client_cls.return_value.__aenter__ = AsyncMock(
-            return_value=mock_client
-        )
-        mock_async_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_async_client.return_value = AsyncMock()
 
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
@@ -251,21 +238,18 @@ class TestExportAsyncTimeout:
         assert len(result.events) == 2
         assert result.total_events == 2
 
-    @patch("honeyhive.api.client.httpx.AsyncClient")
+    @patch.object(APIConfig, "get_async_client")
     @patch("honeyhive.api.client.RetryConfig")
     @pytest.mark.asyncio
     async def test_get_by_session_id_async_uses_export_timeout(
         self,
         mock_retry_cls: Mock,
-        mock_async_client_cls: Mock,
+        mock_get_async_client: Mock,
         events_api: EventsAPI,
     ) -> None:
         """get_by_session_id_async() delegates to export_async() which uses EXPORT_TIMEOUT."""
         mock_client = AsyncMock()
-        mock_async_client_cls.return_value.__aenter__ = AsyncMock(
-            return_value=mock_client
-        )
-        mock_async_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_async_client.return_value = mock_client
 
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
@@ -273,15 +257,12 @@ class TestExportAsyncTimeout:
             "events": [{"event_id": "e1", "session_id": "sess-123"}],
             "totalEvents": 1,
         }
+        mock_client.request.return_value = mock_response
         mock_retry = Mock()
-        mock_retry.execute_async = AsyncMock(return_value=mock_response)
+        mock_retry.execute_async = _run_request_async
         mock_retry_cls.default.return_value = mock_retry
 
         await events_api.get_by_session_id_async("sess-123")
 
-        # Verify the timeout was passed through to AsyncClient
-        mock_async_client_cls.assert_called_once_with(
-            base_url="https://api.test.honeyhive.ai",
-            verify=True,
-            timeout=EXPORT_TIMEOUT,
-        )
+        # Verify the timeout was passed through to the shared AsyncClient
+        assert mock_client.request.call_args.kwargs["timeout"] == EXPORT_TIMEOUT
@@ -16,16 +16,23 @@ TestRunEvaluatorsForDatapoint, TestApplyInlineEvaluators).
 """
 
 import threading
-from typing import Any, Collection, Dict
+from typing import Any, Collection, Dict, Iterator
 from unittest.mock import Mock, patch
 
 import httpx
 import pytest
+from opentelemetry import baggage
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 
 from honeyhive._generated.api_config import HTTPException
-from honeyhive.experiments.core import ExperimentContext, evaluate, run_experiment
+from honeyhive.experiments.core import (
+    ExperimentContext,
+    evaluate,
+    iter_experiment_results,
+    run_experiment,
+)
 from honeyhive.experiments.results import compare_runs, get_run_metrics, get_run_result
+from honeyhive.experiments.utils import generate_external_datapoint_id
 
 # Tests updated to match current implementation (base_url instead of server_url)
 
@@ -1697,6 +1704,298 @@ class TestInstrumentorsSupport:
         assert results[0]["status"] == "success"
 
 
+class TestPooledTracers:
+    """Test suite for run_experiment with pooled_tracers=True."""
+
+    @pytest.fixture
+    def tracer_factory(self) -> Any:
+        """Create a fresh mock tracer per HoneyHiveTracer() call."""
+
+        def make_tracer(**_kwargs: Any) -> Mock:
+            tracer = Mock()
+            tracer.test_mode = False
+            tracer.session_id = None
+            tracer.client.sessions.start.side_effect = lambda data: Mock(
+                session_id=data["session_id"]
+            )
+            mock_span = Mock()
+            tracer.start_span.return_value.__enter__ = Mock(return_value=mock_span)
+            tracer.start_span.return_value.__exit__ = Mock(return_value=False)
+            return tracer
+
+        return make_tracer
+
+    @pytest.fixture
+    def experiment_context(self) -> ExperimentContext:
+        """Create a test experiment context."""
+        return ExperimentContext(
+            run_id="run-123", dataset_id="ds-456", run_name="pooled-run"
+        )
+
+    @patch("honeyhive.experiments.core.force_flush_tracer")
+    @patch("honeyhive.experiments.core.HoneyHiveTracer")
+    def test_one_tracer_per_worker(
+        self,
+        mock_tracer_class: Mock,
+        mock_flush: Mock,
+        tracer_factory: Any,
+        experiment_context: ExperimentContext,
+    ) -> None:
+        """Tracers are created per worker and flushed once each."""
+        mock_tracer_class.side_effect = tracer_factory
+        seen: Dict[str, Dict[str, Any]] = {}
+
+        def func(datapoint: Dict[str, Any]) -> Dict[str, Any]:
+            seen[datapoint["inputs"]["id"]] = dict(baggage.get_all())
+            return {"ok": True}
+
+        dataset = [{"inputs": {"id": f"dp-{i}"}} for i in range(6)]
+        datapoint_ids = [f"dp-{i}" for i in range(6)]
+
+        results = run_experiment(
+            function=func,
+            dataset=dataset,
+            datapoint_ids=datapoint_ids,
+            experiment_context=experiment_context,
+            api_key="test-key",
+            max_workers=2,
+            pooled_tracers=True,
+        )
+
+        assert 1 <= mock_tracer_class.call_count <= 2
+        for call in mock_tracer_class.call_args_list:
+            assert call.kwargs["skip_backend_session_creation"] is True
+            assert call.kwargs["session_name"] == "pooled-run"
+            assert "datapoint_id" not in call.kwargs
+        assert mock_flush.call_count == mock_tracer_class.call_count
+
+        # Each datapoint ran under its own session and datapoint baggage
+        assert all(r["status"] == "success" for r in results)
+        session_ids = {r["session_id"] for r in results}
+        assert len(session_ids) == 6
+        for result in results:
+            bound = seen[result["datapoint_id"]]
+            assert bound["datapoint_id"] == result["datapoint_id"]
+            assert bound["session_id"] == result["session_id"]
+            assert bound["run_id"] == "run-123"
+            assert bound["dataset_id"] == "ds-456"
+
+    @patch("honeyhive.experiments.core.force_flush_tracer")
+    @patch("honeyhive.experiments.core.HoneyHiveTracer")
+    def test_session_created_per_datapoint(
+        self,
+        mock_tracer_class: Mock,
+        mock_flush: Mock,
+        tracer_factory: Any,
+        experiment_context: ExperimentContext,
+    ) -> None:
+        """Each datapoint's session carries its inputs and metadata."""
+        tracer = tracer_factory()
+        mock_tracer_class.return_value = tracer
+
+        results = run_experiment(
+            function=lambda datapoint: {"ok": True},
+            dataset=[{"inputs": {"q": "a"}}, {"inputs": {"q": "b"}}],
+            datapoint_ids=["dp-a", "dp-b"],
+            experiment_context=experiment_context,
+            api_key="test-key",
+            max_workers=1,
+            pooled_tracers=True,
+        )
+
+        sessions = [
+            call.kwargs["data"] for call in tracer.client.sessions.start.call_args_list
+        ]
+        assert [s["inputs"] for s in sessions] == [{"q": "a"}, {"q": "b"}]
+        assert sessions[0]["session_name"] == "pooled-run"
+        assert sessions[0]["source"] == "evaluation"
+        assert sessions[1]["metadata"] == {
+            "run_id": "run-123",
+            "dataset_id": "ds-456",
+            "datapoint_id": "dp-b",
+        }
+        assert {r["session_id"] for r in results} == {s["session_id"] for s in sessions}
+        mock_flush.assert_called_once_with(tracer)
+        # The datapoint baggage does not leak into the caller's context
+        assert baggage.get_baggage("datapoint_id") is None
+
+    @patch("honeyhive.experiments.core.force_flush_tracer")
+    @patch("honeyhive.experiments.core.HoneyHiveTracer")
+    def test_failed_session_request_keeps_generated_id(
+        self,
+        mock_tracer_class: Mock,
+        mock_flush: Mock,
+        tracer_factory: Any,
+        experiment_context: ExperimentContext,
+    ) -> None:
+        """A failed session request still binds a session ID."""
+        tracer = tracer_factory()
+        tracer.client.sessions.start.side_effect = httpx.ConnectError("down")
+        mock_tracer_class.return_value = tracer
+
+        def func(datapoint: Dict[str, Any]) -> Dict[str, Any]:
+            return {"session": baggage.get_baggage("session_id")}
+
+        results = run_experiment(
+            function=func,
+            dataset=[{"inputs": {}}],
+            datapoint_ids=["dp-1"],
+            experiment_context=experiment_context,
+            api_key="test-key",
+            max_workers=1,
+            pooled_tracers=True,
+        )
+
+        assert results[0]["status"] == "success"
+        assert results[0]["session_id"]
+        assert results[0]["outputs"] == {"session": results[0]["session_id"]}
+
+
+class TestStreamingExecution:
+    """Test suite for iterable datasets and bounded in-flight submission."""
+
+    @pytest.fixture
+    def mock_tracer(self) -> Mock:
+        """Create a mock HoneyHiveTracer."""
+        tracer = Mock()
+        mock_span = Mock()
+        tracer.start_span.return_value.__enter__ = Mock(return_value=mock_span)
+        tracer.start_span.return_value.__exit__ = Mock(return_value=False)
+        return tracer
+
+    @pytest.fixture
+    def experiment_context(self) -> ExperimentContext:
+        """Create a test experiment context."""
+        return ExperimentContext(run_id="run-123", dataset_id="EXT-stream-run-123")
+
+    @patch("honeyhive.experiments.core.force_flush_tracer")
+    @patch("honeyhive.experiments.core.HoneyHiveTracer")
+    def test_dataset_read_through_bounded_window(
+        self,
+        mock_tracer_class: Mock,
+        mock_flush: Mock,
+        mock_tracer: Mock,
+        experiment_context: ExperimentContext,
+    ) -> None:
+        """Datapoints are read as results are consumed, not up front."""
+        mock_tracer_class.return_value = mock_tracer
+        pulled = []
+
+        def read_dataset() -> Iterator[Dict[str, Any]]:
+            for index in range(50):
+                pulled.append(index)
+                yield {"inputs": {"i": index}}
+
+        results = iter_experiment_results(
+            lambda datapoint: datapoint["inputs"]["i"],
+            read_dataset(),
+            None,
+            experiment_context=experiment_context,
+            api_key="test-key",
+            max_workers=1,
+            max_in_flight=2,
+        )
+
+        first = next(results)
+        assert first["status"] == "success"
+        assert len(pulled) <= 3
+
+        rest = list(results)
+        assert len(pulled) == 50
+        assert sorted(r["outputs"] for r in [first, *rest]) == list(range(50))
+
+    @patch("honeyhive.experiments.core.force_flush_tracer")
+    @patch("honeyhive.experiments.core.HoneyHiveTracer")
+    def test_generated_datapoint_ids(
+        self,
+        mock_tracer_class: Mock,
+        mock_flush: Mock,
+        mock_tracer: Mock,
+        experiment_context: ExperimentContext,
+    ) -> None:
+        """Without datapoint_ids, EXT- IDs are generated per datapoint."""
+        mock_tracer_class.return_value = mock_tracer
+        dataset = [{"inputs": {"q": "a"}}, {"id": "mine", "inputs": {"q": "b"}}]
+
+        results = run_experiment(
+            function=lambda datapoint: {"ok": True},
+            dataset=iter(dataset),
+            datapoint_ids=None,
+            experiment_context=experiment_context,
+            api_key="test-key",
+            max_workers=1,
+        )
+
+        assert {r["datapoint_id"] for r in results} == {
+            generate_external_datapoint_id(dataset[0], 0),
+            "EXT-mine",
+        }
+
+    @patch("honeyhive.experiments.core.force_flush_tracer")
+    @patch("honeyhive.experiments.core.HoneyHiveTracer")
+    def test_length_mismatch_detected_while_streaming(
+        self,
+        mock_tracer_class: Mock,
+        mock_flush: Mock,
+        mock_tracer: Mock,
+        experiment_context: ExperimentContext,
+    ) -> None:
+        """Iterables of different lengths raise once one runs out."""
+        mock_tracer_class.return_value = mock_tracer
+
+        with pytest.raises(ValueError, match="does not match"):
+            run_experiment(
+                function=lambda datapoint: {"ok": True},
+                dataset=iter([{"inputs": {}}, {"inputs": {}}]),
+                datapoint_ids=iter(["dp-1"]),
+                experiment_context=experiment_context,
+                api_key="test-key",
+                max_workers=1,
+            )
+
+    @patch("honeyhive.experiments.core.get_run_result")
+    @patch("honeyhive.experiments.core.iter_experiment_results")
+    @patch("honeyhive.experiments.core.HoneyHive")
+    def test_evaluate_streams_generator_dataset(
+        self,
+        mock_honeyhive_class: Mock,
+        mock_iter_results: Mock,
+        mock_get_result: Mock,
+    ) -> None:
+        """evaluate() streams a generator and records datapoints at the end."""
+        mock_client = Mock()
+        mock_client.experiments.create_run.return_value = Mock(run_id="run-xyz")
+        mock_honeyhive_class.return_value = mock_client
+        mock_iter_results.return_value = iter(
+            [
+                {
+                    "datapoint_id": "EXT-a",
+                    "session_id": "11111111-1111-1111-1111-111111111111",
+                    "outputs": {"r": 1},
+                },
+                {"datapoint_id": "EXT-b", "session_id": None, "outputs": None},
+            ]
+        )
+
+        evaluate(
+            function=lambda datapoint: {"r": 1},
+            dataset=({"inputs": {"i": i}} for i in range(2)),
+            api_key="test-key",
+            run_id="client-run",
+            print_results=False,
+        )
+
+        run_request = mock_client.experiments.create_run.call_args[0][0]
+        assert run_request.datapoint_ids == []
+        assert run_request.metadata["offline_dataset_id"] == "EXT-stream-client-run"
+        assert mock_iter_results.call_args[0][2] is None
+
+        update_request = mock_client.experiments.update_run.call_args[0][1]
+        assert update_request.datapoint_ids == ["EXT-a", "EXT-b"]
+        assert update_request.event_ids == ["11111111-1111-1111-1111-111111111111"]
+        mock_client.events.update.assert_called_once()
+
+
 class TestResultsBackwardCompatibility:
     """Positional project_id must remain at its original index."""
 
@@ -19,6 +19,8 @@ Tests cover:
 # Justification: Complete test class coverage for all utility functions
 # Justification: Some variables extracted for clarity, explicit empty checks in tests
 
+import hashlib
+import json
 from typing import Any, Dict, List
 
 from honeyhive.experiments.utils import (
@@ -54,6 +56,26 @@ class TestGenerateExternalDatasetId:
 
         assert id1 == id2
 
+    def test_matches_hash_of_whole_dataset(self) -> None:
+        """Test that incremental hashing matches hashing the whole dataset JSON."""
+        datapoints = [
+            {"inputs": {"text": "héllo", "n": 1}, "ground_truth": [1, 2]},
+            {"inputs": {"text": "bye"}},
+        ]
+        for dataset in (datapoints, []):
+            content = json.dumps(dataset, sort_keys=True)
+            expected = hashlib.sha256(content.encode()).hexdigest()[:16]
+
+            assert generate_external_dataset_id(dataset) == f"EXT-{expected}"
+
+    def test_accepts_generator(self) -> None:
+        """Test that any iterable of datapoints gives the list's ID."""
+        datapoints = [{"inputs": {"text": "hello"}}, {"inputs": {"text": "bye"}}]
+
+        assert generate_external_dataset_id(
+            dp for dp in datapoints
+        ) == generate_external_dataset_id(datapoints)
+
     def test_different_inputs_generate_different_ids(self) -> None:
         """Test that different inputs generate different IDs."""
         datapoints1 = [{"inputs": {"text": "hello"}}]
@@ -201,6 +223,21 @@ class TestPrepareExternalDataset:
         assert isinstance(datapoint_ids, list)
         assert all(isinstance(dp_id, str) for dp_id in datapoint_ids)
 
+    def test_single_pass_matches_separate_generators(self) -> None:
+        """Test that IDs match the standalone generators, for any iterable."""
+        datapoints = [
+            {"inputs": {"text": "hello"}},
+            {"id": "custom", "inputs": {"text": "bye"}},
+        ]
+
+        dataset_id, datapoint_ids = prepare_external_dataset(iter(datapoints))
+
+        assert dataset_id == generate_external_dataset_id(datapoints)
+        assert datapoint_ids == [
+            generate_external_datapoint_id(datapoints[0], 0),
+            "EXT-custom",
+        ]
+
     def test_generates_ids_for_all_datapoints(self) -> None:
         """Test that IDs are generated for all datapoints."""
         datapoints = [
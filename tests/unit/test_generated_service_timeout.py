@@ -1,16 +1,25 @@
-"""Unit tests verifying the generated services pass APIConfig.timeout to httpx.
-
-The generated service functions create an httpx client per request. These tests
-confirm the configured ``timeout`` (5.0s by default) is forwarded to both the
-sync ``httpx.Client`` and async ``httpx.AsyncClient`` constructors. getDatasets
-is used as the representative operation (the customer's reported use case).
+"""Unit tests verifying the generated services use APIConfig's pooled clients.
+
+The generated service functions send every request through the keep-alive
+client owned by ``APIConfig`` (``get_client()`` / ``get_async_client()``).
+These tests confirm the configured ``timeout`` (5.0s by default) and pool
+limits reach the sync ``httpx.Client`` and async ``httpx.AsyncClient``
+constructors, and that the client is reused across calls. getDatasets is used
+as the representative operation (the customer's reported use case).
 """
 
+# pylint: disable=protected-access
+# Justification: Unit tests inspect the cached client on APIConfig
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import httpx
 import pytest
 
-from honeyhive._generated.api_config import APIConfig
+from honeyhive._generated.api_config import APIConfig, get_default_api_config
 from honeyhive._generated.services import Datasets_service as datasets_svc
 from honeyhive._generated.services import async_Datasets_service as datasets_svc_async
 
@@ -26,21 +35,17 @@ def _mock_response() -> Mock:
 class TestSyncServiceTimeout:
     """Sync generated services forward api_config.timeout to httpx.Client."""
 
-    @patch("honeyhive._generated.services.Datasets_service.httpx.Client")
+    @patch("honeyhive._generated.api_config.httpx.Client")
     def test_explicit_timeout_is_passed(self, mock_client_cls: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_client.request.return_value = _mock_response()
-        mock_client_cls.return_value.__enter__.return_value = mock_client
+        mock_client_cls.return_value.request.return_value = _mock_response()
 
         datasets_svc.getDatasets(api_config_override=APIConfig(timeout=2.5))
 
         assert mock_client_cls.call_args.kwargs["timeout"] == 2.5
 
-    @patch("honeyhive._generated.services.Datasets_service.httpx.Client")
+    @patch("honeyhive._generated.api_config.httpx.Client")
     def test_default_timeout_is_passed(self, mock_client_cls: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_client.request.return_value = _mock_response()
-        mock_client_cls.return_value.__enter__.return_value = mock_client
+        mock_client_cls.return_value.request.return_value = _mock_response()
 
         datasets_svc.getDatasets(api_config_override=APIConfig())
 
@@ -51,25 +56,194 @@ class TestAsyncServiceTimeout:
     """Async generated services forward api_config.timeout to httpx.AsyncClient."""
 
     @pytest.mark.asyncio
-    @patch("honeyhive._generated.services.async_Datasets_service.httpx.AsyncClient")
+    @patch("honeyhive._generated.api_config.httpx.AsyncClient")
     async def test_explicit_timeout_is_passed(self, mock_client_cls: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_client.request = AsyncMock(return_value=_mock_response())
-        mock_client_cls.return_value.__aenter__.return_value = mock_client
-        mock_client_cls.return_value.__aexit__.return_value = None
+        mock_client_cls.return_value.request = AsyncMock(return_value=_mock_response())
 
         await datasets_svc_async.getDatasets(api_config_override=APIConfig(timeout=2.5))
 
         assert mock_client_cls.call_args.kwargs["timeout"] == 2.5
 
     @pytest.mark.asyncio
-    @patch("honeyhive._generated.services.async_Datasets_service.httpx.AsyncClient")
+    @patch("honeyhive._generated.api_config.httpx.AsyncClient")
     async def test_default_timeout_is_passed(self, mock_client_cls: MagicMock) -> None:
-        mock_client = MagicMock()
-        mock_client.request = AsyncMock(return_value=_mock_response())
-        mock_client_cls.return_value.__aenter__.return_value = mock_client
-        mock_client_cls.return_value.__aexit__.return_value = None
+        mock_client_cls.return_value.request = AsyncMock(return_value=_mock_response())
 
         await datasets_svc_async.getDatasets(api_config_override=APIConfig())
 
         assert mock_client_cls.call_args.kwargs["timeout"] == 5.0
+
+
+class TestPooledClient:
+    """APIConfig owns one keep-alive client that is reused across calls."""
+
+    @patch("honeyhive._generated.api_config.httpx.Client")
+    def test_client_is_reused_across_calls(self, mock_client_cls: MagicMock) -> None:
+        mock_client_cls.return_value.request.return_value = _mock_response()
+        mock_client_cls.return_value.is_closed = False
+        config = APIConfig()
+
+        datasets_svc.getDatasets(api_config_override=config)
+        datasets_svc.getDatasets(api_config_override=config)
+
+        mock_client_cls.assert_called_once()
+        assert mock_client_cls.return_value.request.call_count == 2
+
+    @patch("honeyhive._generated.api_config.httpx.Client")
+    def test_pool_limits_are_passed(self, mock_client_cls: MagicMock) -> None:
+        config = APIConfig(
+            max_connections=7, max_keepalive_connections=3, keepalive_expiry=12.0
+        )
+
+        config.get_client()
+
+        limits = mock_client_cls.call_args.kwargs["limits"]
+        assert limits.max_connections == 7
+        assert limits.max_keepalive_connections == 3
+        assert limits.keepalive_expiry == 12.0
+
+    def test_client_rebuilt_when_base_path_changes(self) -> None:
+        config = APIConfig(base_path="https://a.example.com")
+        first = config.get_client()
+
+        config.base_path = "https://b.example.com"
+        second = config.get_client()
+
+        assert first is not second
+        assert first.is_closed
+        assert str(second.base_url).startswith("https://b.example.com")
+        config.close()
+
+    def test_close_releases_client(self) -> None:
+        config = APIConfig()
+        client = config.get_client()
+
+        config.close()
+
+        assert client.is_closed
+        assert config._client is None
+        assert config.get_client() is not client
+        config.close()
+
+    def test_async_client_is_per_event_loop(self) -> None:
+        config = APIConfig()
+
+        async def _get() -> httpx.AsyncClient:
+            first = config.get_async_client()
+            assert config.get_async_client() is first
+            return first
+
+        first = asyncio.run(_get())
+        second = asyncio.run(_get())
+
+        assert first is not second
+        # Each client is closed while its own loop shuts down
+        assert first.is_closed
+        assert second.is_closed
+
+    def test_sync_close_closes_async_client_on_its_loop(self) -> None:
+        config = APIConfig()
+
+        async def _use_then_close() -> httpx.AsyncClient:
+            client = config.get_async_client()
+            config.close()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            assert client.is_closed
+            return client
+
+        client = asyncio.run(_use_then_close())
+
+        assert not config._async_clients
+        assert client.is_closed
+
+    def test_concurrent_loops_keep_their_own_clients(self) -> None:
+        received = threading.Event()
+        release = threading.Event()
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                if self.path == "/slow":
+                    received.set()
+                    release.wait(5)
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        config = APIConfig(base_path=f"http://127.0.0.1:{server.server_port}")
+        results: dict = {}
+
+        def _request(name: str, path: str) -> None:
+            async def _run() -> None:
+                client = config.get_async_client()
+                results[name] = (client, (await client.get(path)).status_code)
+
+            try:
+                asyncio.run(_run())
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                results[name] = (None, exc)
+
+        slow = threading.Thread(target=_request, args=("slow", "/slow"))
+        slow.start()
+        try:
+            assert received.wait(5)
+            # A second loop asking for a client must not close the first one
+            fast = threading.Thread(target=_request, args=("fast", "/fast"))
+            fast.start()
+            fast.join(5)
+        finally:
+            release.set()
+            slow.join(5)
+            server.shutdown()
+            server.server_close()
+
+        assert results["fast"][1] == 200
+        assert results["slow"][1] == 200
+        assert results["slow"][0] is not results["fast"][0]
+        # Both clients were closed when their own loop shut down
+        assert results["slow"][0].is_closed
+        assert results["fast"][0].is_closed
+
+    def test_aclose_closes_async_client(self) -> None:
+        config = APIConfig()
+
+        async def _use_then_aclose() -> httpx.AsyncClient:
+            client = config.get_async_client()
+            await config.aclose()
+            assert client.is_closed
+            return client
+
+        asyncio.run(_use_then_aclose())
+
+    def test_pool_timeout_is_passed(self) -> None:
+        config = APIConfig(timeout=4.0, pool_timeout=1.5)
+
+        with patch("honeyhive._generated.api_config.httpx.Client") as client_cls:
+            config.get_client()
+
+        timeout = client_cls.call_args.kwargs["timeout"]
+        assert timeout == httpx.Timeout(4.0, pool=1.5)
+
+
+class TestDefaultAPIConfig:
+    """Calls without api_config_override share one default APIConfig."""
+
+    @patch("honeyhive._generated.api_config._default_config", None)
+    @patch("honeyhive._generated.api_config.httpx.Client")
+    def test_calls_without_override_share_one_client(
+        self, mock_client_cls: MagicMock
+    ) -> None:
+        mock_client_cls.return_value.request.return_value = _mock_response()
+        mock_client_cls.return_value.is_closed = False
+
+        datasets_svc.getDatasets()
+        datasets_svc.getDatasets()
+
+        mock_client_cls.assert_called_once()
+        assert get_default_api_config() is get_default_api_config()
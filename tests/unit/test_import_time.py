@@ -0,0 +1,127 @@
+"""Import-time regression tests for the lazy package layout.
+
+``import honeyhive`` must not load the API client, the generated models, the
+OpenTelemetry SDK or the experiments framework; they are imported on first
+use. Each check runs in a fresh interpreter so modules imported by other
+tests do not hide a regression.
+"""
+
+import json
+import subprocess
+import sys
+from typing import Dict, List
+
+import pytest
+
+import honeyhive
+
+# Cumulative ``-X importtime`` budget for ``import honeyhive`` in microseconds.
+# The lazy package imports in about 1 ms; the eager layout took over 500 ms.
+IMPORT_BUDGET_US = 150_000
+
+HEAVY_MODULES = [
+    "honeyhive.api.client",
+    "honeyhive._generated.models",
+    "honeyhive.experiments",
+    "honeyhive.tracer",
+    "opentelemetry.sdk",
+    "httpx",
+]
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+
+
+def _cumulative_import_times(stderr: str) -> Dict[str, int]:
+    """Parse ``-X importtime`` output into module -> cumulative microseconds."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    """``import honeyhive`` stays cheap."""
+
+    def test_heavy_modules_not_loaded(self) -> None:
+        result = _run(
+            "import json, sys, honeyhive; print(json.dumps(sorted(sys.modules)))"
+        )
+        loaded: List[str] = json.loads(result.stdout)
+
+        for heavy in HEAVY_MODULES:
+            assert not [
+                name for name in loaded if name == heavy or name.startswith(heavy + ".")
+            ], f"import honeyhive loaded {heavy}"
+
+    def test_import_within_budget(self) -> None:
+        # Warm up so the measured run reads compiled bytecode
+        _run("import honeyhive")
+        result = _run("import honeyhive", "-X", "importtime")
+
+        times = _cumulative_import_times(result.stderr)
+
+        assert times["honeyhive"] < IMPORT_BUDGET_US, (
+            f"import honeyhive took {times['honeyhive']} us, "
+            f"budget is {IMPORT_BUDGET_US} us"
+        )
+
+    def test_generated_model_loads_alone(self) -> None:
+        result = _run(
+            "import sys\n"
+            "from honeyhive._generated.models import QueryFilter\n"
+            "prefix = 'honeyhive._generated.models.'\n"
+            "print(QueryFilter.__name__)\n"
+            "print(sum(name.startswith(prefix) for name in sys.modules))"
+        )
+        name, loaded_models = result.stdout.split()
+
+        assert name == "QueryFilter"
+        assert int(loaded_models) < 5
+
+
+class TestLazyExports:
+    """Lazy attributes behave like the eager ones did."""
+
+    def test_exports_resolve(self) -> None:
+        from honeyhive.tracer import HoneyHiveTracer
+
+        assert honeyhive.HoneyHiveTracer is HoneyHiveTracer
+        for name in honeyhive.__all__:
+            assert getattr(honeyhive, name) is not None
+
+    def test_subpackages_resolve(self) -> None:
+        import honeyhive.tracer
+
+        assert honeyhive.tracer.__name__ == "honeyhive.tracer"
+        assert honeyhive.utils.__name__ == "honeyhive.utils"
+
+    def test_dir_lists_exports(self) -> None:
+        listing = dir(honeyhive)
+
+        assert set(honeyhive.__all__) <= set(listing)
+        assert "tracer" in listing
+
+    def test_unknown_attribute(self) -> None:
+        with pytest.raises(AttributeError, match="no_such_name"):
+            _ = honeyhive.no_such_name  # type: ignore[attr-defined]
+
+    def test_generated_models_keep_classes(self) -> None:
+        from honeyhive._generated import models
+        from honeyhive._generated.models.QueryFilter import QueryFilter
+
+        # Importing the submodule must not replace the class with the module
+        assert models.QueryFilter is QueryFilter
+        assert "QueryFilter" in dir(models)
+        with pytest.raises(AttributeError):
+            _ = models.NoSuchModel
@@ -23,9 +23,11 @@ from honeyhive.tracer.infra.environment import (
     EnvironmentDetector,
     clear_environment_cache,
     get_comprehensive_environment_analysis,
+    get_environment_snapshot,
     get_environment_type,
     get_performance_characteristics,
     get_resource_constraints,
+    reset_environment_snapshot,
 )
 
 
@@ -1387,6 +1389,14 @@ class TestEnvironmentDetectorCacheManagement:
 class TestModuleLevelFunctions:
     """Test module-level convenience functions."""
 
+    def setup_method(self) -> None:
+        """Start every test without a process-wide snapshot."""
+        reset_environment_snapshot()
+
+    def teardown_method(self) -> None:
+        """Drop snapshots built from mocked detection results."""
+        reset_environment_snapshot()
+
     @patch.object(EnvironmentDetector, "detect_primary_environment_type")
     def test_get_environment_type_with_tracer(self, mock_detect: Mock) -> None:
         """Test get_environment_type function with tracer instance."""
@@ -1448,32 +1458,42 @@ class TestModuleLevelFunctions:
 
         assert result == {"latency_sensitivity": "high"}
 
-    def test_get_comprehensive_environment_analysis_with_tracer(self) -> None:
-        """Test get_comprehensive_environment_analysis with tracer instance."""
-        mock_tracer = Mock()
-        mock_detector = Mock()
-        mock_detector.get_comprehensive_analysis.return_value = {"complete": "analysis"}
-        mock_tracer._environment_detector = mock_detector
+    @patch.object(EnvironmentDetector, "get_comprehensive_analysis")
+    def test_get_comprehensive_environment_analysis_shared_by_tracers(
+        self, mock_analysis: Mock
+    ) -> None:
+        """Test that all tracers share one detection per process."""
+        mock_analysis.return_value = {"shared": {"analysis": True}}
 
-        with patch("builtins.hasattr", return_value=True):
-            result = get_comprehensive_environment_analysis(mock_tracer)
+        first = get_comprehensive_environment_analysis(Mock())
+        first["shared"]["analysis"] = False
+        second = get_comprehensive_environment_analysis(Mock())
 
-        assert result == {"complete": "analysis"}
-        mock_detector.get_comprehensive_analysis.assert_called_once_with()
+        assert second == {"shared": {"analysis": True}}
+        mock_analysis.assert_called_once_with()
 
     @patch.object(EnvironmentDetector, "get_comprehensive_analysis")
-    def test_get_comprehensive_environment_analysis_create_detector(
+    def test_snapshot_refreshed_when_detection_inputs_change(
         self, mock_analysis: Mock
     ) -> None:
-        """Test get_comprehensive_environment_analysis creating new detector."""
-        mock_analysis.return_value = {"new": "analysis"}
-        mock_tracer = Mock()
-
-        with patch("builtins.hasattr", return_value=False):
-            result = get_comprehensive_environment_analysis(mock_tracer)
-
-        assert result == {"new": "analysis"}
-        assert hasattr(mock_tracer, "_environment_detector")
+        """Test that a changed environment variable or PID invalidates the snapshot."""
+        mock_analysis.side_effect = [
+            {"environment_type": "standard"},
+            {"environment_type": "aws_lambda"},
+            {"environment_type": "forked"},
+        ]
+
+        with patch.dict(os.environ, {}, clear=True):
+            assert get_environment_type() == "standard"
+            assert get_environment_type() == "standard"
+            with patch.dict(os.environ, {"AWS_LAMBDA_FUNCTION_NAME": "fn"}):
+                assert get_environment_type() == "aws_lambda"
+                with patch(
+                    "honeyhive.tracer.infra.environment.os.getpid", return_value=-1
+                ):
+                    assert get_environment_snapshot() == {"environment_type": "forked"}
+
+        assert mock_analysis.call_count == 3
 
     @patch.object(EnvironmentDetector, "get_comprehensive_analysis")
     def test_get_comprehensive_environment_analysis_without_tracer(
@@ -32,7 +32,7 @@ from honeyhive.tracer.infra.resources import (
 class TestBuildOtelResources:
     """Test suite for build_otel_resources function."""
 
-    @patch("honeyhive.tracer.infra.resources.EnvironmentDetector")
+    @patch("honeyhive.tracer.infra.resources.get_environment_snapshot")
     @patch("honeyhive.tracer.infra.resources.safe_log")
     @patch("honeyhive.tracer.infra.resources.os.getpid")
     @patch("honeyhive.tracer.infra.resources._get_python_version")
@@ -45,7 +45,7 @@ class TestBuildOtelResources:
         mock_get_python_version: Mock,
         mock_getpid: Mock,
         mock_safe_log: Mock,
-        mock_environment_detector: Mock,
+        mock_get_snapshot: Mock,
     ) -> None:
         """Test successful resource building with tracer instance.
 
@@ -62,19 +62,11 @@ class TestBuildOtelResources:
         mock_detect_service_name.return_value = "test-service"
         mock_detect_service_version.return_value = "1.0.0"
 
-        # Mock EnvironmentDetector
-        mock_detector_instance: Mock = Mock()
-        mock_environment_detector.return_value = mock_detector_instance
-
-        mock_detector_instance.detect_system_info.return_value = {
-            "os.type": "Linux",
-            "host.name": "test-host",
-        }
-        mock_detector_instance.detect_container_environment.return_value = {
-            "container.runtime": "docker"
-        }
-        mock_detector_instance.detect_cloud_environment.return_value = {
-            "cloud.provider": "aws"
+        # Mock the environment snapshot
+        mock_get_snapshot.return_value = {
+            "system_info": {"os.type": "Linux", "host.name": "test-host"},
+            "container_info": {"container.runtime": "docker"},
+            "cloud_info": {"cloud.provider": "aws"},
         }
 
         # Mock id() function for tracer instance
@@ -109,11 +101,8 @@ class TestBuildOtelResources:
         assert result["container.runtime"] == "docker"
         assert result["cloud.provider"] == "aws"
 
-        # Verify EnvironmentDetector was called correctly
-        mock_environment_detector.assert_called_once_with(mock_tracer)
-        mock_detector_instance.detect_system_info.assert_called_once()
-        mock_detector_instance.detect_container_environment.assert_called_once()
-        mock_detector_instance.detect_cloud_environment.assert_called_once()
+        # Verify the environment snapshot was read once
+        mock_get_snapshot.assert_called_once_with(mock_tracer)
 
         # Verify helper functions were called
         mock_detect_service_name.assert_called_once_with(mock_tracer)
@@ -128,7 +117,7 @@ class TestBuildOtelResources:
             f"Built {len(result)} OpenTelemetry resource attributes",
         )
 
-    @patch("honeyhive.tracer.infra.resources.EnvironmentDetector")
+    @patch("honeyhive.tracer.infra.resources.get_environment_snapshot")
     @patch("honeyhive.tracer.infra.resources.safe_log")
     @patch("honeyhive.tracer.infra.resources.os.getpid")
     @patch("honeyhive.tracer.infra.resources._get_python_version")
@@ -141,7 +130,7 @@ class TestBuildOtelResources:
         mock_get_python_version: Mock,
         mock_getpid: Mock,
         mock_safe_log: Mock,
-        mock_environment_detector: Mock,
+        mock_get_snapshot: Mock,
     ) -> None:
         """Test successful resource building without tracer instance.
 
@@ -154,13 +143,12 @@ class TestBuildOtelResources:
         mock_detect_service_name.return_value = "unknown-service"
         mock_detect_service_version.return_value = "unknown"
 
-        # Mock EnvironmentDetector
-        mock_detector_instance: Mock = Mock()
-        mock_environment_detector.return_value = mock_detector_instance
-
-        mock_detector_instance.detect_system_info.return_value = {}
-        mock_detector_instance.detect_container_environment.return_value = {}
-        mock_detector_instance.detect_cloud_environment.return_value = {}
+        # Mock the environment snapshot
+        mock_get_snapshot.return_value = {
+            "system_info": {},
+            "container_info": {},
+            "cloud_info": {},
+        }
 
         # Act
         result: Dict[str, Any] = build_otel_resources(None)
@@ -173,8 +161,8 @@ class TestBuildOtelResources:
         assert result["service.version"] == "unknown"
         assert result["service.instance.id"] == "unknown"
 
-        # Verify EnvironmentDetector was called with None
-        mock_environment_detector.assert_called_once_with(None)
+        # Verify the environment snapshot was read without a tracer
+        mock_get_snapshot.assert_called_once_with(None)
 
         # Verify helper functions were called
         mock_detect_service_name.assert_called_once_with(None)
@@ -183,14 +171,14 @@ class TestBuildOtelResources:
         # Verify no logging occurred (tracer_instance is None)
         mock_safe_log.assert_not_called()
 
-    @patch("honeyhive.tracer.infra.resources.EnvironmentDetector")
+    @patch("honeyhive.tracer.infra.resources.get_environment_snapshot")
     @patch("honeyhive.tracer.infra.resources.safe_log")
     @patch("honeyhive.tracer.infra.resources.os.getpid")
     def test_build_otel_resources_exception_with_tracer(
         self,
         mock_getpid: Mock,
         mock_safe_log: Mock,
-        mock_environment_detector: Mock,
+        mock_get_snapshot: Mock,
     ) -> None:
         """Test exception handling with tracer instance.
 
@@ -202,8 +190,8 @@ class TestBuildOtelResources:
         mock_tracer_id: int = 67890
         test_exception = RuntimeError("Environment detection failed")
 
-        # Mock EnvironmentDetector to raise exception
-        mock_environment_detector.side_effect = test_exception
+        # Mock the environment snapshot to raise exception
+        mock_get_snapshot.side_effect = test_exception
         mock_getpid.return_value = 1111
 
         # Mock id() function for tracer instance
@@ -224,14 +212,14 @@ class TestBuildOtelResources:
             mock_tracer, "warning", f"Error during resource detection: {test_exception}"
         )
 
-    @patch("honeyhive.tracer.infra.resources.EnvironmentDetector")
+    @patch("honeyhive.tracer.infra.resources.get_environment_snapshot")
     @patch("honeyhive.tracer.infra.resources.safe_log")
     @patch("honeyhive.tracer.infra.resources.os.getpid")
     def test_build_otel_resources_exception_without_tracer(
         self,
         mock_getpid: Mock,
         mock_safe_log: Mock,
-        mock_environment_detector: Mock,
+        mock_get_snapshot: Mock,
     ) -> None:
         """Test exception handling without tracer instance.
 
@@ -241,8 +229,8 @@ class TestBuildOtelResources:
         # Arrange
         test_exception = ValueError("Mock environment error")
 
-        # Mock EnvironmentDetector to raise exception
-        mock_environment_detector.side_effect = test_exception
+        # Mock the environment snapshot to raise exception
+        mock_get_snapshot.side_effect = test_exception
         mock_getpid.return_value = 2222
 
         # Act
@@ -21,6 +21,7 @@ Generated test framework:
 # and many test methods. Generated test code follows V3 framework patterns.
 
 import os
+import threading
 import uuid
 from typing import Any, Dict, Optional, cast
 from unittest.mock import MagicMock, Mock, call, mock_open, patch
@@ -32,6 +33,7 @@ from honeyhive.tracer.core import HoneyHiveTracer
 
 # Import the module under test - REAL code execution for coverage
 from honeyhive.tracer.instrumentation import initialization
+from honeyhive.utils.dotdict import DotDict
 
 
 class MockHoneyHiveTracer:
@@ -983,6 +985,113 @@ class TestTracerInitialization:
         mock_exporter.assert_called_once()
         assert mock_exporter.call_args[1]["session"] is custom_session
 
+    @patch("honeyhive.tracer.instrumentation.initialization.HoneyHiveOTLPExporter")
+    @patch(
+        "honeyhive.tracer.instrumentation.initialization._get_optimal_session_config"
+    )
+    @patch("honeyhive.tracer.instrumentation.initialization.safe_log")
+    @patch.dict("os.environ", {"HH_OTLP_ENABLED": "true"})
+    def test__create_otlp_exporter_passes_compression_settings(
+        self, mock_log: Any, mock_session_config: Any, mock_exporter: Any
+    ) -> None:
+        """Compression settings are read from the nested OTLP config section."""
+        # Arrange
+        mock_session_config.return_value = Mock()
+        self.mock_tracer.config = DotDict(
+            {
+                "api_key": "test-key",
+                "otlp_enabled": True,
+                "otlp": {"otlp_compression": "none", "otlp_compression_min_bytes": 0},
+            }
+        )
+        self.mock_tracer.test_mode = False
+
+        # Act
+        initialization._create_otlp_exporter(self.mock_tracer)
+
+        # Assert
+        call_kwargs = mock_exporter.call_args[1]
+        assert call_kwargs["compression"] == "none"
+        assert call_kwargs["compression_min_bytes"] == 0
+
+    @patch("honeyhive.tracer.instrumentation.initialization.HoneyHiveOTLPExporter")
+    @patch(
+        "honeyhive.tracer.instrumentation.initialization._get_optimal_session_config"
+    )
+    @patch("honeyhive.tracer.instrumentation.initialization.safe_log")
+    @patch.dict("os.environ", {"HH_OTLP_ENABLED": "true"})
+    def test__create_otlp_exporter_passes_spool_settings(
+        self, mock_log: Any, mock_session_config: Any, mock_exporter: Any
+    ) -> None:
+        """Spool settings are read from the nested OTLP config section."""
+        # Arrange
+        mock_session_config.return_value = Mock()
+        self.mock_tracer.config = DotDict(
+            {
+                "api_key": "test-key",
+                "otlp_enabled": True,
+                "otlp": {
+                    "otlp_spool_dir": "/tmp/hh-spool",
+                    "otlp_spool_max_bytes": 1024,
+                    "otlp_spool_max_age": 60.0,
+                },
+            }
+        )
+        self.mock_tracer.test_mode = False
+
+        # Act
+        initialization._create_otlp_exporter(self.mock_tracer)
+
+        # Assert
+        call_kwargs = mock_exporter.call_args[1]
+        assert call_kwargs["spool_dir"] == "/tmp/hh-spool"
+        assert call_kwargs["spool_max_bytes"] == 1024
+        assert call_kwargs["spool_max_age_seconds"] == 60.0
+
+    @patch("honeyhive.tracer.instrumentation.initialization.HoneyHiveOTLPExporter")
+    @patch("honeyhive.tracer.instrumentation.initialization.AsyncOTLPExporter")
+    @patch(
+        "honeyhive.tracer.instrumentation.initialization._get_optimal_session_config"
+    )
+    @patch("honeyhive.tracer.instrumentation.initialization.safe_log")
+    @patch.dict("os.environ", {"HH_OTLP_ENABLED": "true"})
+    def test__create_otlp_exporter_uses_async_exporter(
+        self,
+        mock_log: Any,
+        mock_session_config: Any,
+        mock_async_exporter: Any,
+        mock_exporter: Any,
+    ) -> None:
+        """otlp_async_export selects the asyncio exporter with the same settings."""
+        # Arrange
+        mock_session_config.return_value = Mock()
+        self.mock_tracer.config = DotDict(
+            {
+                "api_key": "test-key",
+                "otlp_enabled": True,
+                "otlp": {
+                    "otlp_async_export": True,
+                    "otlp_http2": False,
+                    "otlp_max_in_flight": 4,
+                    "otlp_compression": "zstd",
+                },
+            }
+        )
+        self.mock_tracer.test_mode = False
+
+        # Act
+        result = initialization._create_otlp_exporter(self.mock_tracer)
+
+        # Assert
+        assert result is mock_async_exporter.return_value
+        mock_exporter.assert_not_called()
+        call_kwargs = mock_async_exporter.call_args[1]
+        assert call_kwargs["http2"] is False
+        assert call_kwargs["max_in_flight"] == 4
+        assert call_kwargs["compression"] == "zstd"
+        assert "session" not in call_kwargs
+        assert "use_optimized_session" not in call_kwargs
+
     @patch("honeyhive.tracer.instrumentation.initialization.safe_log")
     def test__create_otlp_exporter_disabled(self, mock_log: Any) -> None:
         """Test OTLP exporter creation when disabled."""
@@ -1911,3 +2020,74 @@ class TestTracerInitialization:
         initialization._register_tracer_instance(self.mock_tracer)
 
         assert self.mock_tracer._tracer_id is None
+
+
+class TestAsyncSessionCreation:
+    """Session creation deferred to a background worker."""
+
+    def setup_method(self) -> None:
+        self.mock_tracer = MockHoneyHiveTracer()
+        self.mock_tracer.session_id = None
+        self.mock_tracer.run_id = None
+        self.mock_tracer.dataset_id = None
+        self.mock_tracer.datapoint_id = None
+        self.mock_tracer._session_auto_create = False
+        self.mock_tracer.client = MagicMock()
+        self.mock_tracer.config.get.side_effect = lambda key, default=None: {
+            "async_session_creation": True
+        }.get(key, default)
+
+    def test_session_id_assigned_before_backend_call(self) -> None:
+        """The constructor path returns while sessions.start is still running."""
+        release = threading.Event()
+
+        def start(data: Dict[str, Any]) -> Any:
+            release.wait(5)
+            return MagicMock(session_id=data["session_id"])
+
+        self.mock_tracer.client.sessions.start.side_effect = start
+
+        initialization._create_new_session(self.mock_tracer)
+
+        session_id = self.mock_tracer.session_id
+        assert uuid.UUID(session_id)
+        assert self.mock_tracer._session_id == session_id
+        assert self.mock_tracer._session_auto_create is True
+        assert initialization.wait_for_session_start(self.mock_tracer, 0.01) is False
+
+        release.set()
+        assert initialization.wait_for_session_start(self.mock_tracer) is True
+        sent = self.mock_tracer.client.sessions.start.call_args.kwargs["data"]
+        assert sent["session_id"] == session_id
+        assert sent["session_name"] == "test-session"
+        assert self.mock_tracer._session_auto_create is False
+
+    def test_provided_session_id_is_kept(self) -> None:
+        provided = "550E8400-E29B-41D4-A716-446655440000"
+        self.mock_tracer.session_id = provided
+        self.mock_tracer.client.sessions.start.return_value = {
+            "session_id": provided.lower()
+        }
+
+        initialization._create_new_session(self.mock_tracer)
+
+        assert initialization.wait_for_session_start(self.mock_tracer) is True
+        assert self.mock_tracer.session_id == provided.lower()
+
+    @patch("honeyhive.tracer.instrumentation.initialization.safe_log")
+    def test_failure_falls_back_to_ingestion_auto_create(self, mock_log: Any) -> None:
+        self.mock_tracer.client.sessions.start.side_effect = requests.Timeout("slow")
+
+        initialization._create_new_session(self.mock_tracer)
+
+        assert initialization.wait_for_session_start(self.mock_tracer) is False
+        # The client-side session_id is kept and spans ask ingestion to create it
+        assert uuid.UUID(self.mock_tracer.session_id)
+        assert self.mock_tracer._session_auto_create is True
+        assert any(
+            "Background session creation failed" in str(c)
+            for c in mock_log.call_args_list
+        )
+
+    def test_wait_without_deferred_creation(self) -> None:
+        assert initialization.wait_for_session_start(Mock(spec=[])) is None
@@ -14,19 +14,20 @@ Based on thorough inspection of the actual implementation in:
 # requires protected access, pytest fixtures redefine outer names by design, comprehensive test
 # classes need many test methods, and mock patch decorators create unavoidable long lines.
 
+import threading
+import time
 from contextlib import contextmanager
-from typing import Any, Iterator, List
+from types import SimpleNamespace
+from typing import Any, Iterator
 from unittest.mock import Mock, patch
 
 import pytest
 
 from honeyhive.tracer.lifecycle.flush import (
-    _flush_batch_processors,
-    _flush_single_processor,
-    _flush_span_processor,
-    _flush_tracer_provider,
-    _get_batch_processors,
+    _flush_component,
+    _get_flush_targets,
     _log_flush_results,
+    flush_tracer_components,
     force_flush_tracer,
 )
 
@@ -63,16 +64,10 @@ class TestForceFlushTracer:
 
     @patch("honeyhive.tracer.lifecycle.flush.safe_log")
     @patch("honeyhive.tracer.lifecycle.flush.acquire_lifecycle_lock_optimized")
-    @patch("honeyhive.tracer.lifecycle.flush._flush_tracer_provider")
-    @patch("honeyhive.tracer.lifecycle.flush._flush_span_processor")
-    @patch("honeyhive.tracer.lifecycle.flush._flush_batch_processors")
     @patch("honeyhive.tracer.lifecycle.flush._log_flush_results")
     def test_force_flush_success_all_components(
         self,
         mock_log_results: Mock,
-        mock_flush_batch: Mock,
-        mock_flush_span: Mock,
-        mock_flush_provider: Mock,
         mock_acquire_lock: Mock,
         _mock_safe_log: Mock,
         mock_tracer: Mock,
@@ -81,26 +76,8 @@ class TestForceFlushTracer:
         """Test successful force flush of all components."""
         # Setup
         mock_acquire_lock.return_value = mock_context_manager()
-
-        # Mock flush results to simulate successful flushes
-        def setup_flush_results(
-            _tracer: Any, _timeout: Any, results: List[tuple[str, bool]]
-        ) -> None:
-            results.extend(
-                [
-                    ("provider", True),
-                    ("span_processor", True),
-                    ("batch_processors", True),
-                ]
-            )
-
-        mock_flush_provider.side_effect = setup_flush_results
-        mock_flush_span.side_effect = lambda t, tm, r: r.append(
-            ("span_processor", True)
-        )
-        mock_flush_batch.side_effect = lambda t, tm, r: r.append(
-            ("batch_processors", True)
-        )
+        mock_tracer.span_processor.force_flush.return_value = True
+        mock_tracer.provider.force_flush.return_value = True
 
         # Execute
         result = force_flush_tracer(mock_tracer, timeout_millis=5000)
@@ -108,10 +85,11 @@ class TestForceFlushTracer:
         # Verify
         assert result is True
         mock_acquire_lock.assert_called_once_with("flush", custom_timeout=5.0)
-        mock_flush_provider.assert_called_once()
-        mock_flush_span.assert_called_once()
-        mock_flush_batch.assert_called_once()
-        mock_log_results.assert_called_once()
+        mock_tracer.span_processor.force_flush.assert_called_once()
+        mock_tracer.provider.force_flush.assert_called_once()
+        mock_log_results.assert_called_once_with(
+            mock_tracer, True, [("span_processor", True), ("provider", True)]
+        )
 
     @patch("honeyhive.tracer.lifecycle.flush.safe_log")
     @patch("honeyhive.tracer.lifecycle.flush.acquire_lifecycle_lock_optimized")
@@ -192,401 +170,146 @@ class TestForceFlushTracer:
         )
 
 
-class TestFlushTracerProvider:
-    """Test suite for _flush_tracer_provider function."""
+def _processor(delay: float = 0.0, result: bool = True) -> Mock:
+    """Processor whose force_flush takes ``delay`` seconds."""
 
-    @patch("honeyhive.tracer.lifecycle.flush.safe_log")
-    def test_flush_provider_success(
-        self, mock_safe_log: Mock, mock_tracer: Mock
-    ) -> None:
-        """Test successful provider flush."""
-        # Setup
-        mock_tracer.provider.force_flush.return_value = True
-        flush_results: List[tuple[str, bool]] = []
+    def force_flush(timeout_millis: int = 30000) -> bool:
+        time.sleep(min(delay, timeout_millis / 1000))
+        return result if delay <= timeout_millis / 1000 else False
 
-        # Execute
-        _flush_tracer_provider(mock_tracer, 5000, flush_results)
+    processor = Mock()
+    processor.force_flush.side_effect = force_flush
+    return processor
 
-        # Verify
-        assert flush_results == [("provider", True)]
-        mock_tracer.provider.force_flush.assert_called_once_with(timeout_millis=5000)
-        mock_safe_log.assert_any_call(
-            mock_tracer,
-            "debug",
-            "Provider force_flush completed",
-            honeyhive_data={"success": True, "operation": "provider_flush"},
-        )
 
-    @patch("honeyhive.tracer.lifecycle.flush.safe_log")
-    def test_flush_provider_exception(
-        self, mock_safe_log: Mock, mock_tracer: Mock
-    ) -> None:
-        """Test provider flush exception handling."""
-        # Setup
-        mock_tracer.provider.force_flush.side_effect = Exception("Provider error")
-        flush_results: List[tuple[str, bool]] = []
+def _tracer(span_processor: Any, *processors: Any) -> SimpleNamespace:
+    """Tracer whose SDK-style provider holds ``processors``."""
+    provider = SimpleNamespace(
+        _active_span_processor=SimpleNamespace(_span_processors=tuple(processors)),
+        force_flush=Mock(),
+    )
+    return SimpleNamespace(
+        test_mode=True, span_processor=span_processor, provider=provider
+    )
 
-        # Execute
-        _flush_tracer_provider(mock_tracer, 5000, flush_results)
 
-        # Verify - this tests lines 128-135
-        assert flush_results == [("provider", False)]
-        mock_safe_log.assert_any_call(
-            mock_tracer,
-            "error",
-            "Provider force_flush error",
-            honeyhive_data={
-                "error": "Provider error",
-                "error_type": "Exception",
-                "operation": "provider_flush",
-            },
-        )
+class TestFlushTargets:
+    """Test suite for _get_flush_targets function."""
 
-    @patch("honeyhive.tracer.lifecycle.flush.safe_log")
-    def test_flush_provider_exception_test_mode(
-        self, mock_safe_log: Mock, mock_tracer: Mock
-    ) -> None:
-        """Test provider flush exception handling in test mode."""
-        # Setup
-        mock_tracer.test_mode = True
-        mock_tracer.provider.force_flush.side_effect = Exception("Provider error")
-        flush_results: List[tuple[str, bool]] = []
+    def test_processors_are_deduplicated(self) -> None:
+        """The span processor registered on the provider is flushed once."""
+        span_processor = Mock()
+        batch_processor = Mock()
+        tracer = _tracer(span_processor, span_processor, batch_processor)
 
-        # Execute
-        _flush_tracer_provider(mock_tracer, 5000, flush_results)
+        targets = _get_flush_targets(tracer)
 
-        # Verify - this tests the test_mode branch in lines 130-134
-        assert flush_results == [("provider", False)]
-        # Should not log error in test mode
-        error_calls = [
-            call for call in mock_safe_log.call_args_list if call[0][0] == "error"
+        assert targets == [
+            ("span_processor", span_processor),
+            ("processor_2", batch_processor),
         ]
-        assert len(error_calls) == 0
 
-    @patch("honeyhive.tracer.lifecycle.flush.safe_log")
-    def test_flush_provider_no_force_flush_method(
-        self, mock_safe_log: Mock, mock_tracer: Mock
-    ) -> None:
-        """Test provider without force_flush method."""
-        # Setup - provider exists but no force_flush method
-        del mock_tracer.provider.force_flush
-        flush_results: List[tuple[str, bool]] = []
+    def test_opaque_provider_is_flushed_whole(self, mock_tracer: Mock) -> None:
+        """A provider that does not list its processors is flushed itself."""
+        targets = _get_flush_targets(mock_tracer)
 
-        # Execute
-        _flush_tracer_provider(mock_tracer, 5000, flush_results)
-
-        # Verify - this tests lines 136-139
-        assert flush_results == [("provider", True)]
-        mock_safe_log.assert_any_call(
-            mock_tracer,
-            "debug",
-            "Provider does not support force_flush",
-            honeyhive_data={"operation": "provider_flush"},
-        )
-
-    @patch("honeyhive.tracer.lifecycle.flush.safe_log")
-    def test_flush_provider_no_force_flush_method_test_mode(
-        self, mock_safe_log: Mock, mock_tracer: Mock
-    ) -> None:
-        """Test provider without force_flush method in test mode."""
-        # Setup
-        mock_tracer.test_mode = True
-        del mock_tracer.provider.force_flush
-        flush_results: List[tuple[str, bool]] = []
-
-        # Execute
-        _flush_tracer_provider(mock_tracer, 5000, flush_results)
-
-        # Verify - this tests the test_mode branch in lines 137-138
-        assert flush_results == [("provider", True)]
-        # Should not log debug in test mode
-        debug_calls = [
-            call for call in mock_safe_log.call_args_list if call[0][0] == "debug"
+        assert targets == [
+            ("span_processor", mock_tracer.span_processor),
+            ("provider", mock_tracer.provider),
         ]
-        assert len(debug_calls) == 0
-
-
-class TestFlushSpanProcessor:
-    """Test suite for _flush_span_processor function."""
-
-    @patch("honeyhive.tracer.lifecycle.flush.safe_log")
-    def test_flush_span_processor_success(
-        self, _mock_safe_log: Mock, mock_tracer: Mock
-    ) -> None:
-        """Test successful span processor flush."""
-        # Setup
-        mock_tracer.span_processor.force_flush.return_value = True
-        flush_results: List[tuple[str, bool]] = []
-
-        # Execute
-        _flush_span_processor(mock_tracer, 5000, flush_results)
-
-        # Verify
-        assert flush_results == [("span_processor", True)]
-        mock_tracer.span_processor.force_flush.assert_called_once_with(
-            timeout_millis=5000
-        )
-
-    @patch("honeyhive.tracer.lifecycle.flush.safe_log")
-    def test_flush_span_processor_exception(
-        self, mock_safe_log: Mock, mock_tracer: Mock
-    ) -> None:
-        """Test span processor flush exception handling."""
-        # Setup
-        mock_tracer.span_processor.force_flush.side_effect = Exception(
-            "Processor error"
-        )
-        flush_results: List[tuple[str, bool]] = []
-
-        # Execute
-        _flush_span_processor(mock_tracer, 5000, flush_results)
-
-        # Verify - this tests lines 168-175
-        assert flush_results == [("span_processor", False)]
-        mock_safe_log.assert_any_call(
-            mock_tracer,
-            "error",
-            "Span processor force_flush error",
-            honeyhive_data={
-                "error": "Processor error",
-                "error_type": "Exception",
-                "operation": "span_processor_flush",
-            },
-        )
 
-    @patch("honeyhive.tracer.lifecycle.flush.safe_log")
-    def test_flush_span_processor_exception_test_mode(
-        self, mock_safe_log: Mock, mock_tracer: Mock
-    ) -> None:
-        """Test span processor flush exception handling in test mode."""
-        # Setup
-        mock_tracer.test_mode = True
-        mock_tracer.span_processor.force_flush.side_effect = Exception(
-            "Processor error"
+    def test_components_without_force_flush_are_skipped(self) -> None:
+        """Missing span processor and unflushable processors are skipped."""
+        tracer = _tracer(None, object())
+
+        assert not _get_flush_targets(tracer)
+
+
+class TestFlushTracerComponents:
+    """Test suite for flush_tracer_components function."""
+
+    def test_components_flush_concurrently(self) -> None:
+        """Independent processors flush in parallel under one deadline."""
+        tracer = _tracer(_processor(0.3), _processor(0.3), _processor(0.3))
+
+        started = time.monotonic()
+        report = flush_tracer_components(tracer, timeout_millis=5000)
+        elapsed = time.monotonic() - started
+
+        assert report["success"] is True
+        assert set(report["components"]) == {
+            "span_processor",
+            "processor_1",
+            "processor_2",
+        }
+        assert elapsed < 0.8
+        tracer.provider.force_flush.assert_not_called()
+
+    def test_deadline_bounds_total_wait(self) -> None:
+        """A hanging processor is reported as timed out at the deadline."""
+        release = threading.Event()
+        hanging = Mock()
+        hanging.force_flush.side_effect = lambda timeout_millis: release.wait(5)
+        fast = _processor()
+        tracer = _tracer(fast, hanging)
+        try:
+            started = time.monotonic()
+            report = flush_tracer_components(tracer, timeout_millis=200)
+            elapsed = time.monotonic() - started
+        finally:
+            release.set()
+
+        assert report["success"] is False
+        assert report["components"]["span_processor"]["success"] is True
+        assert report["components"]["processor_1"]["timed_out"] is True
+        assert elapsed < 1.0
+        assert fast.force_flush.call_args.kwargs["timeout_millis"] <= 200
+
+    def test_single_component_timing_out_is_reported(self) -> None:
+        """A component that gives up at the deadline on the caller's thread."""
+        expiring = Mock()
+        expiring.force_flush.side_effect = lambda timeout_millis: time.sleep(
+            timeout_millis / 1000 + 0.01
         )
-        flush_results: List[tuple[str, bool]] = []
+        tracer = _tracer(expiring)
 
-        # Execute
-        _flush_span_processor(mock_tracer, 5000, flush_results)
+        report = flush_tracer_components(tracer, timeout_millis=100)
 
-        # Verify - this tests the test_mode branch in lines 170-174
-        assert flush_results == [("span_processor", False)]
-        # Should not log error in test mode
-        error_calls = [
-            call for call in mock_safe_log.call_args_list if call[0][0] == "error"
-        ]
-        assert len(error_calls) == 0
+        assert report["success"] is False
+        assert list(report["components"]) == ["span_processor"]
+        assert report["components"]["span_processor"]["timed_out"] is True
 
-    def test_flush_span_processor_no_processor(self, mock_tracer: Mock) -> None:
-        """Test when span processor is None."""
-        # Setup
-        mock_tracer.span_processor = None
-        flush_results: List[tuple[str, bool]] = []
+    def test_failing_component_is_reported(self) -> None:
+        """Errors are reported per component without stopping the others."""
+        broken = Mock()
+        broken.force_flush.side_effect = RuntimeError("boom")
+        tracer = _tracer(_processor(), broken)
 
-        # Execute
-        _flush_span_processor(mock_tracer, 5000, flush_results)
+        report = flush_tracer_components(tracer, timeout_millis=1000)
 
-        # Verify - this tests lines 176-179
-        assert flush_results == [("span_processor", True)]
-
-
-class TestGetBatchProcessors:
-    """Test suite for _get_batch_processors function."""
-
-    def test_get_batch_processors_success(self, mock_tracer: Mock) -> None:
-        """Test successful batch processor extraction."""
-        # Setup
-        mock_processor1 = Mock()
-        mock_processor1.force_flush = Mock()
-        mock_processor2 = Mock()  # No force_flush method
-        # Remove force_flush attribute to ensure it's not detected
-        if hasattr(mock_processor2, "force_flush"):
-            delattr(mock_processor2, "force_flush")
-        mock_processor3 = Mock()
-        mock_processor3.force_flush = Mock()
-
-        mock_tracer.provider._span_processors = [
-            mock_processor1,
-            mock_processor2,
-            mock_processor3,
-        ]
-
-        # Execute
-        result = _get_batch_processors(mock_tracer)
-
-        # Verify
-        assert len(result) == 2
-        assert mock_processor1 in result
-        assert mock_processor3 in result
-        assert mock_processor2 not in result
-
-    def test_get_batch_processors_no_provider(self, mock_tracer: Mock) -> None:
-        """Test when provider is None."""
-        # Setup
-        mock_tracer.provider = None
-
-        # Execute
-        result = _get_batch_processors(mock_tracer)
-
-        # Verify - this tests line 188
-        assert not result
-
-    def test_get_batch_processors_no_span_processors_attr(
-        self, mock_tracer: Mock
-    ) -> None:
-        """Test when provider has no _span_processors attribute."""
-        # Setup
-        del mock_tracer.provider._span_processors
-
-        # Execute
-        result = _get_batch_processors(mock_tracer)
-
-        # Verify - this tests lines 192-194
-        assert not result
-
-
-class TestFlushSingleProcessor:
-    """Test suite for _flush_single_processor function."""
+        assert report["success"] is False
+        assert report["components"]["span_processor"]["success"] is True
+        assert report["components"]["processor_1"] == {
+            "success": False,
+            "timed_out": False,
+            "elapsed_ms": report["components"]["processor_1"]["elapsed_ms"],
+            "error": "boom",
+        }
 
     @patch("honeyhive.tracer.lifecycle.flush.safe_log")
-    def test_flush_single_processor_success(
-        self, mock_safe_log: Mock, mock_tracer: Mock
-    ) -> None:
-        """Test successful single processor flush."""
-        # Setup
-        mock_processor = Mock()
-        mock_processor.force_flush.return_value = True
-
-        # Execute
-        result = _flush_single_processor(mock_processor, 5000, 1, mock_tracer)
-
-        # Verify
-        assert result is True
-        mock_processor.force_flush.assert_called_once_with(timeout_millis=5000)
-        mock_safe_log.assert_any_call(
-            mock_tracer,
-            "debug",
-            "Batch processor force_flush completed",
-            honeyhive_data={
-                "processor_index": 1,
-                "success": True,
-                "operation": "batch_processor_flush",
-            },
-        )
-
-    @patch("honeyhive.tracer.lifecycle.flush.safe_log")
-    def test_flush_single_processor_exception(
-        self, mock_safe_log: Mock, mock_tracer: Mock
+    def test_flush_component_passes_remaining_time(
+        self, _mock_safe_log: Mock, mock_tracer: Mock
     ) -> None:
-        """Test single processor flush exception handling."""
-        # Setup
-        mock_processor = Mock()
-        mock_processor.force_flush.side_effect = Exception("Single processor error")
-
-        # Execute
-        result = _flush_single_processor(mock_processor, 5000, 2, mock_tracer)
+        """The component gets the time left until the deadline."""
+        processor = Mock()
+        processor.force_flush.return_value = True
 
-        # Verify - this tests lines 213-223
-        assert result is False
-        mock_safe_log.assert_any_call(
-            mock_tracer,
-            "error",
-            "Batch processor force_flush error",
-            honeyhive_data={
-                "processor_index": 2,
-                "error": "Single processor error",
-                "error_type": "Exception",
-                "operation": "batch_processor_flush",
-            },
+        result = _flush_component(
+            mock_tracer, "processor_1", processor, time.monotonic() + 2.0
         )
 
-    @patch("honeyhive.tracer.lifecycle.flush.safe_log")
-    def test_flush_single_processor_exception_test_mode(
-        self, mock_safe_log: Mock, mock_tracer: Mock
-    ) -> None:
-        """Test single processor flush exception handling in test mode."""
-        # Setup
-        mock_tracer.test_mode = True
-        mock_processor = Mock()
-        mock_processor.force_flush.side_effect = Exception("Single processor error")
-
-        # Execute
-        result = _flush_single_processor(mock_processor, 5000, 2, mock_tracer)
-
-        # Verify - this tests the test_mode branch in lines 214-222
-        assert result is False
-        # Should not log error in test mode
-        error_calls = [
-            call for call in mock_safe_log.call_args_list if call[0][0] == "error"
-        ]
-        assert len(error_calls) == 0
-
-
-class TestFlushBatchProcessors:
-    """Test suite for _flush_batch_processors function."""
-
-    @patch("honeyhive.tracer.lifecycle.flush._get_batch_processors")
-    @patch("honeyhive.tracer.lifecycle.flush._flush_single_processor")
-    def test_flush_batch_processors_success(
-        self, mock_flush_single: Mock, mock_get_processors: Mock, mock_tracer: Mock
-    ) -> None:
-        """Test successful batch processors flush."""
-        # Setup
-        mock_processor1 = Mock()
-        mock_processor2 = Mock()
-        mock_get_processors.return_value = [mock_processor1, mock_processor2]
-        mock_flush_single.side_effect = [True, True]
-        flush_results: List[tuple[str, bool]] = []
-
-        # Execute
-        _flush_batch_processors(mock_tracer, 5000, flush_results)
-
-        # Verify - this tests lines 245-252
-        assert flush_results == [("batch_processors", True)]
-        assert mock_flush_single.call_count == 2
-        mock_flush_single.assert_any_call(mock_processor1, 5000, 1, mock_tracer)
-        mock_flush_single.assert_any_call(mock_processor2, 5000, 2, mock_tracer)
-
-    @patch("honeyhive.tracer.lifecycle.flush._get_batch_processors")
-    def test_flush_batch_processors_no_processors(
-        self, mock_get_processors: Mock, mock_tracer: Mock
-    ) -> None:
-        """Test when no batch processors are found."""
-        # Setup
-        mock_get_processors.return_value = []
-        flush_results: List[tuple[str, bool]] = []
-
-        # Execute
-        _flush_batch_processors(mock_tracer, 5000, flush_results)
-
-        # Verify - this tests lines 241-243
-        assert flush_results == [("batch_processors", True)]
-
-    @patch("honeyhive.tracer.lifecycle.flush.safe_log")
-    @patch("honeyhive.tracer.lifecycle.flush._get_batch_processors")
-    def test_flush_batch_processors_exception(
-        self, mock_get_processors: Mock, mock_safe_log: Mock, mock_tracer: Mock
-    ) -> None:
-        """Test batch processors flush exception handling."""
-        # Setup
-        mock_get_processors.side_effect = Exception("Batch error")
-        flush_results: List[tuple[str, bool]] = []
-
-        # Execute
-        _flush_batch_processors(mock_tracer, 5000, flush_results)
-
-        # Verify
-        assert flush_results == [("batch_processors", False)]
-        mock_safe_log.assert_any_call(
-            mock_tracer,
-            "error",
-            "Batch processors flush error",
-            honeyhive_data={
-                "error": "Batch error",
-                "error_type": "Exception",
-                "operation": "batch_processors_flush",
-            },
-        )
+        assert result["success"] is True
+        assert 1500 < processor.force_flush.call_args.kwargs["timeout_millis"] <= 2000
 
 
 class TestLogFlushResults:
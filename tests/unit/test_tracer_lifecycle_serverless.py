@@ -0,0 +1,187 @@
+"""Unit tests for the serverless lifecycle mode."""
+
+# pylint: disable=protected-access
+# Justification: Unit tests enqueue directly on the internal batch processor
+
+import os
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+import pytest
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+
+from honeyhive.tracer.lifecycle.serverless import (
+    flush_at_handler_end,
+    get_flush_budget_millis,
+    is_serverless_mode,
+    serverless_handler,
+)
+from honeyhive.tracer.lifecycle.shutdown import shutdown_tracer
+from honeyhive.tracer.processing.otlp_exporter import HoneyHiveOTLPExporter
+from honeyhive.tracer.processing.otlp_spool import ExportSpool
+from honeyhive.tracer.processing.span_processor import HoneyHiveSpanProcessor
+
+TEST_ENDPOINT = "https://test.example.com/opentelemetry/v1/traces"
+
+
+def _tracer(**otlp: Any) -> SimpleNamespace:
+    return SimpleNamespace(
+        config={"otlp": otlp},
+        test_mode=True,
+        provider=None,
+        span_processor=None,
+        otlp_exporter=None,
+    )
+
+
+def _spans(count: int) -> List[ReadableSpan]:
+    tracer = TracerProvider().get_tracer("test")
+    spans = []
+    for index in range(count):
+        span = tracer.start_span(f"step-{index}")
+        span.end()
+        spans.append(span)  # type: ignore[arg-type]
+    return spans
+
+
+class TestServerlessSettings:
+    """Mode detection and the flush budget."""
+
+    def test_auto_mode_follows_lambda_environment(self) -> None:
+        with patch.dict(os.environ, {"AWS_LAMBDA_FUNCTION_NAME": "fn"}):
+            assert is_serverless_mode(_tracer())
+            assert not is_serverless_mode(_tracer(otlp_lifecycle_mode="standard"))
+        with patch.dict(os.environ, {}, clear=True):
+            assert not is_serverless_mode(_tracer())
+            assert is_serverless_mode(_tracer(otlp_lifecycle_mode="serverless"))
+
+    def test_budget_is_capped_by_remaining_time(self) -> None:
+        tracer = _tracer(otlp_serverless_flush_budget=2.0)
+        context = Mock()
+
+        context.get_remaining_time_in_millis.return_value = 900
+        assert get_flush_budget_millis(tracer, context) == 700
+        context.get_remaining_time_in_millis.return_value = 60000
+        assert get_flush_budget_millis(tracer, context) == 2000
+        context.get_remaining_time_in_millis.return_value = 50
+        assert get_flush_budget_millis(tracer, context) == 0
+        assert get_flush_budget_millis(tracer) == 2000
+
+
+class TestFlushAtHandlerEnd:
+    """Leftovers are spooled and sent by the next invocation."""
+
+    def test_leftovers_spooled_then_replayed(self, tmp_path: Path) -> None:
+        release = threading.Event()
+        session = Mock()
+
+        def post(*_args: Any, **_kwargs: Any) -> Mock:
+            release.wait(5)
+            return Mock(status_code=200, text="", headers={})
+
+        session.post.side_effect = post
+        exporter = HoneyHiveOTLPExporter(
+            session=session,
+            endpoint=TEST_ENDPOINT,
+            retry_max_attempts=1,
+            spool_dir=str(tmp_path),
+        )
+        tracer = _tracer(
+            otlp_serverless_flush_budget=0.2,
+            batch_size=1,
+            max_export_batch_size=1,
+            export_workers=1,
+        )
+        tracer.span_processor = HoneyHiveSpanProcessor(
+            otlp_exporter=exporter, tracer_instance=tracer
+        )
+        tracer.otlp_exporter = exporter
+        # A frozen runtime never runs the background replayer
+        exporter._otlp_exporter._spool_replayer.notify = Mock()
+        try:
+            for span in _spans(3):
+                tracer.span_processor._batch_processor.on_end(span)
+
+            started = time.monotonic()
+            report = flush_at_handler_end(tracer)
+
+            assert time.monotonic() - started < 1.0
+            assert report["success"] is False
+            assert report["spooled_spans"] == 2
+            assert exporter.get_spool_stats()["pending_batches"] == 1  # type: ignore[index]
+
+            # Next invocation: the backend answers, the spool is drained
+            release.set()
+            report = flush_at_handler_end(tracer)
+
+            assert report["success"] is True
+            assert report["spool_drained"] is True
+            assert exporter.get_spool_stats()["pending_batches"] == 0  # type: ignore[index]
+        finally:
+            release.set()
+            tracer.span_processor.shutdown()
+
+    def test_handler_decorator_flushes_on_error(self) -> None:
+        tracer = _tracer()
+        context = Mock()
+
+        @serverless_handler(tracer)
+        def handler(event: Dict[str, Any], _context: Any) -> Dict[str, Any]:
+            raise RuntimeError(event["message"])
+
+        with patch(
+            "honeyhive.tracer.lifecycle.serverless.flush_at_handler_end"
+        ) as mock_flush:
+            with pytest.raises(RuntimeError, match="boom"):
+                handler({"message": "boom"}, context)
+
+        mock_flush.assert_called_once_with(tracer, context)
+
+    def test_spool_replay_stops_at_deadline(self, tmp_path: Path) -> None:
+        spool = ExportSpool(str(tmp_path))
+        assert spool.open()
+        try:
+            spool.append(b"{}", None)
+            send = Mock(return_value=200)
+
+            assert not spool.replay(send, deadline=time.monotonic() - 1)
+            send.assert_not_called()
+            assert spool.replay(send)
+        finally:
+            spool.close()
+
+
+class TestServerlessShutdown:
+    """shutdown_tracer skips the grace sleep and retry flush."""
+
+    @patch("honeyhive.tracer.lifecycle.shutdown.acquire_lifecycle_lock_optimized")
+    @patch("honeyhive.tracer.lifecycle.shutdown._cleanup_tracer_state")
+    @patch("honeyhive.tracer.lifecycle.shutdown._cleanup_secondary_provider")
+    @patch("honeyhive.tracer.lifecycle.shutdown.force_flush_tracer")
+    @patch("honeyhive.tracer.lifecycle.shutdown.flush_at_handler_end")
+    @patch("honeyhive.tracer.lifecycle.shutdown.time.sleep")
+    def test_shutdown_flushes_once_without_sleep(
+        self,
+        mock_sleep: Mock,
+        mock_flush_at_end: Mock,
+        mock_force_flush: Mock,
+        _mock_cleanup_secondary: Mock,
+        _mock_cleanup_state: Mock,
+        mock_acquire_lock: Mock,
+    ) -> None:
+        mock_acquire_lock.return_value.__enter__.return_value = True
+        mock_flush_at_end.return_value = {"success": False}
+        tracer = Mock()
+        tracer.test_mode = False
+        tracer.is_main_provider = False
+        tracer.config = {"otlp": {"otlp_lifecycle_mode": "serverless"}}
+
+        shutdown_tracer(tracer)
+
+        mock_flush_at_end.assert_called_once_with(tracer)
+        mock_force_flush.assert_not_called()
+        mock_sleep.assert_not_called()
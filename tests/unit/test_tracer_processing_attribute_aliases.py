@@ -0,0 +1,179 @@
+"""Unit tests for compacting and restoring traceloop.* attribute aliases."""
+
+import json
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, Span, TracerProvider
+
+from honeyhive.tracer.processing.attribute_aliases import (
+    ALIAS_MODE_EXPORT,
+    ALIAS_MODE_RESOURCE,
+    ALIAS_MODE_SPAN,
+    compact_aliases,
+    get_alias_mode,
+    missing_aliases,
+    with_aliases,
+)
+from honeyhive.tracer.processing.otlp_json_serializer import OTLPJSONSerializer
+from honeyhive.tracer.processing.span_processor import HoneyHiveSpanProcessor
+from honeyhive.utils.dotdict import DotDict
+
+SESSION_ALIAS = "traceloop.association.properties.session_id"
+PROJECT_ALIAS = "traceloop.association.properties.project"
+
+_provider = TracerProvider(resource=Resource.create({"service.name": "svc"}))
+_tracer = _provider.get_tracer("test.scope", "1.0.0")
+
+
+def _full_attributes(session_id: str) -> Dict[str, Any]:
+    return {
+        "honeyhive.session_id": session_id,
+        SESSION_ALIAS: session_id,
+        "honeyhive.project": "proj",
+        PROJECT_ALIAS: "proj",
+        "tool.name": "search",
+    }
+
+
+def _spans(attributes: List[Dict[str, Any]]) -> List[ReadableSpan]:
+    spans = []
+    for attrs in attributes:
+        span = _tracer.start_span("step", attributes=attrs)
+        span.end()
+        spans.append(span)
+    return spans  # type: ignore[return-value]
+
+
+def _compacted(session_id: str) -> Dict[str, Any]:
+    attributes = _full_attributes(session_id)
+    compact_aliases(attributes)
+    return attributes
+
+
+def _span_attributes(span_json: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        item["key"]: item["value"].get("stringValue")
+        for item in span_json["attributes"]
+    }
+
+
+class TestAliasHelpers:
+    """Compaction and restoration of the alias map."""
+
+    def test_compact_removes_only_duplicates(self) -> None:
+        attributes = _full_attributes("s1")
+        attributes[PROJECT_ALIAS] = "other"
+
+        compact_aliases(attributes)
+
+        assert SESSION_ALIAS not in attributes
+        assert attributes[PROJECT_ALIAS] == "other"
+
+    def test_missing_aliases_restores_compacted_keys(self) -> None:
+        assert missing_aliases(_compacted("s1")) == {
+            SESSION_ALIAS: "s1",
+            PROJECT_ALIAS: "proj",
+        }
+        assert missing_aliases(_full_attributes("s1")) == {}
+
+    def test_with_aliases_copies_span(self) -> None:
+        span = _spans([_compacted("s1")])[0]
+
+        restored = with_aliases(span)
+
+        assert restored is not span
+        assert (restored.attributes or {})[SESSION_ALIAS] == "s1"
+        assert restored.context == span.context
+        full = _spans([_full_attributes("s1")])[0]
+        assert with_aliases(full) is full
+
+    def test_mode_from_tracer_config(self) -> None:
+        tracer = Mock()
+        tracer.config = DotDict({"otlp": {"otlp_attribute_aliases": "export"}})
+
+        assert get_alias_mode(tracer) == ALIAS_MODE_EXPORT
+        assert get_alias_mode(None) == ALIAS_MODE_SPAN
+
+
+class TestSerializerAliasModes:
+    """The serializer writes the aliases spans no longer carry."""
+
+    def test_export_mode_matches_uncompacted_payload(self) -> None:
+        compact = _spans([_compacted("s1")])
+        full = _spans([_full_attributes("s1")])
+
+        exported = json.loads(
+            OTLPJSONSerializer(alias_mode=ALIAS_MODE_EXPORT).serialize(compact)
+        )
+        baseline = json.loads(OTLPJSONSerializer().serialize(full))
+
+        exported_span = exported["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        baseline_span = baseline["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert _span_attributes(exported_span) == _span_attributes(baseline_span)
+
+    def test_resource_mode_emits_aliases_once_per_group(self) -> None:
+        spans = _spans([_compacted("s1"), _compacted("s2"), _compacted("s1")])
+
+        payload = json.loads(
+            OTLPJSONSerializer(alias_mode=ALIAS_MODE_RESOURCE).serialize(spans)
+        )
+
+        resource_spans = payload["resourceSpans"]
+        assert len(resource_spans) == 2
+        first = resource_spans[0]
+        resource_attrs = _span_attributes(first["resource"])
+        assert resource_attrs["service.name"] == "svc"
+        assert resource_attrs[SESSION_ALIAS] == "s1"
+        assert resource_attrs[PROJECT_ALIAS] == "proj"
+        grouped = first["scopeSpans"][0]["spans"]
+        assert len(grouped) == 2
+        assert SESSION_ALIAS not in _span_attributes(grouped[0])
+        assert _span_attributes(resource_spans[1]["resource"])[SESSION_ALIAS] == "s2"
+
+    def test_resource_mode_is_smaller(self) -> None:
+        compact = _spans([_compacted("s1")] * 20)
+        full = _spans([_full_attributes("s1")] * 20)
+
+        compacted = OTLPJSONSerializer(alias_mode=ALIAS_MODE_RESOURCE).serialize(
+            compact
+        )
+
+        assert len(compacted) < len(OTLPJSONSerializer().serialize(full))
+
+
+class TestSpanProcessorCompaction:
+    """on_start leaves duplicated aliases off spans outside 'span' mode."""
+
+    @staticmethod
+    def _applied(mode: str) -> Dict[str, Any]:
+        tracer = Mock()
+        tracer.session_id = "s1"
+        tracer.project_name = "proj"
+        tracer.source_environment = "dev"
+        tracer._session_auto_create = False
+        tracer.config = DotDict({"otlp": {"otlp_attribute_aliases": mode}})
+        processor = HoneyHiveSpanProcessor(tracer_instance=tracer)
+        span = Mock(spec=Span)
+        span.name = "step"
+        span.attributes = {}
+
+        processor.on_start(span, Context())
+
+        return dict(span.set_attributes.call_args.args[0])
+
+    def test_span_mode_keeps_aliases(self) -> None:
+        applied = self._applied(ALIAS_MODE_SPAN)
+
+        assert applied[SESSION_ALIAS] == "s1"
+        assert applied[PROJECT_ALIAS] == "proj"
+
+    def test_export_mode_keeps_canonical_keys_only(self) -> None:
+        applied = self._applied(ALIAS_MODE_EXPORT)
+
+        assert applied["honeyhive.session_id"] == "s1"
+        assert applied["honeyhive.project"] == "proj"
+        assert SESSION_ALIAS not in applied
+        assert PROJECT_ALIAS not in applied
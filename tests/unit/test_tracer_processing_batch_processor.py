@@ -0,0 +1,325 @@
+"""Unit tests for the HoneyHive batch span processor."""
+
+# pylint: disable=protected-access
+# Justification: Unit tests inspect queue state and counters
+
+import threading
+import time
+from typing import Any, List, Sequence
+from unittest.mock import Mock
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExportResult
+
+from honeyhive.tracer.processing.batch_processor import (
+    DROP_NEWEST,
+    DROP_OLDEST,
+    HoneyHiveBatchSpanProcessor,
+    estimate_span_size,
+    get_batch_settings,
+    split_batches,
+)
+from honeyhive.utils.dotdict import DotDict
+
+
+class RecordingExporter:
+    """Exporter that records batches and can block until released."""
+
+    def __init__(self, result: SpanExportResult = SpanExportResult.SUCCESS) -> None:
+        self.result = result
+        self.batches: List[List[Any]] = []
+        self.release = threading.Event()
+        self.release.set()
+        self.shutdown_called = False
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        self.release.wait(5)
+        with self._lock:
+            self.batches.append(list(spans))
+        return self.result
+
+    def shutdown(self) -> None:
+        self.shutdown_called = True
+
+    @property
+    def exported(self) -> List[Any]:
+        return [span for batch in self.batches for span in batch]
+
+
+def _span(name: str = "span", payload: str = "") -> Mock:
+    span = Mock(spec=ReadableSpan)
+    span.name = name
+    span.context = Mock()
+    span.context.trace_flags.sampled = True
+    span.attributes = {"honeyhive_outputs.content": payload} if payload else {}
+    span.events = ()
+    span.links = ()
+    return span
+
+
+def _processor(
+    exporter: RecordingExporter, **kwargs: Any
+) -> HoneyHiveBatchSpanProcessor:
+    kwargs.setdefault("schedule_delay_millis", 60000)
+    return HoneyHiveBatchSpanProcessor(exporter, **kwargs)  # type: ignore[arg-type]
+
+
+def _hold_workers(processor: HoneyHiveBatchSpanProcessor) -> None:
+    """Keep workers asleep so spans stay queued until flush or shutdown."""
+    processor.batch_size = processor.max_queue_size + 1
+
+
+class TestGetBatchSettings:
+    """Settings are read from the tracer's OTLP config section."""
+
+    def test_reads_otlp_section(self) -> None:
+        tracer = Mock()
+        tracer.config = DotDict(
+            {
+                "otlp": {
+                    "batch_size": 50,
+                    "flush_interval": 0.5,
+                    "max_export_batch_size": 256,
+                    "max_export_batch_bytes": 65536,
+                    "export_timeout": 10.0,
+                    "max_queue_size": 4096,
+                    "export_workers": 4,
+                    "queue_drop_policy": "drop_newest",
+                }
+            }
+        )
+
+        settings = get_batch_settings(tracer)
+
+        assert settings == {
+            "max_queue_size": 4096,
+            "batch_size": 50,
+            "max_export_batch_size": 256,
+            "max_export_batch_bytes": 65536,
+            "schedule_delay_millis": 500.0,
+            "export_timeout_millis": 10000.0,
+            "export_workers": 4,
+            "drop_policy": "drop_newest",
+        }
+
+    def test_defaults_without_tracer(self) -> None:
+        settings = get_batch_settings(None)
+
+        assert settings["max_queue_size"] == 8192
+        assert settings["schedule_delay_millis"] == 5000.0
+        assert settings["drop_policy"] == DROP_OLDEST
+
+
+class TestSpanSizing:
+    """Estimated span sizes and byte-bounded batch splitting."""
+
+    def test_estimate_grows_with_attribute_payload(self) -> None:
+        small = estimate_span_size(_span(payload="x"))
+        large = estimate_span_size(_span(payload="x" * 10000))
+
+        assert large - small == 9999
+
+    def test_estimate_counts_events_and_sequences(self) -> None:
+        span = _span()
+        base = estimate_span_size(span)
+        event = Mock()
+        event.name = "exception"
+        event.attributes = {"exception.stacktrace": "t" * 500}
+        span.events = (event,)
+        span.attributes = {"tags": ["a", "b"]}
+
+        assert estimate_span_size(span) > base + 500
+
+    def test_split_by_count_without_byte_limit(self) -> None:
+        spans = [_span(f"s{i}") for i in range(5)]
+
+        batches = split_batches(spans, max_spans=2)
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    def test_split_by_bytes(self) -> None:
+        spans = [_span(f"s{i}") for i in range(4)]
+
+        batches = split_batches(spans, 10, max_bytes=250, sizes=[100, 100, 100, 400])
+
+        assert batches == [spans[:2], [spans[2]], [spans[3]]]
+
+
+class TestHoneyHiveBatchSpanProcessor:
+    """Queueing, batching and drop behaviour."""
+
+    def test_batch_size_triggers_export(self) -> None:
+        exporter = RecordingExporter()
+        processor = _processor(exporter, batch_size=3, max_export_batch_size=10)
+
+        for i in range(3):
+            processor.on_end(_span(f"s{i}"))
+
+        deadline = time.monotonic() + 5
+        while not exporter.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(exporter.exported) == 3
+        processor.shutdown()
+
+    def test_force_flush_splits_by_max_export_batch_size(self) -> None:
+        exporter = RecordingExporter()
+        processor = _processor(
+            exporter, batch_size=100, max_export_batch_size=2, export_workers=1
+        )
+
+        for i in range(5):
+            processor.on_end(_span(f"s{i}"))
+
+        assert processor.force_flush(5000) is True
+        assert sorted(len(batch) for batch in exporter.batches) == [1, 2, 2]
+        assert processor.get_stats()["exported_spans"] == 5
+        processor.shutdown()
+
+    def test_drop_oldest_keeps_newest_spans(self) -> None:
+        processor = _processor(
+            RecordingExporter(), max_queue_size=2, drop_policy=DROP_OLDEST
+        )
+        _hold_workers(processor)
+        spans = [_span(f"s{i}") for i in range(3)]
+
+        for span in spans:
+            processor.on_end(span)
+
+        assert list(processor._queue) == spans[1:]
+        assert processor.get_stats()["dropped_spans"] == 1
+        processor.shutdown()
+
+    def test_drop_newest_rejects_incoming_span(self) -> None:
+        processor = _processor(
+            RecordingExporter(), max_queue_size=2, drop_policy=DROP_NEWEST
+        )
+        _hold_workers(processor)
+        spans = [_span(f"s{i}") for i in range(3)]
+
+        for span in spans:
+            processor.on_end(span)
+
+        assert list(processor._queue) == spans[:2]
+        assert processor.get_stats()["dropped_spans"] == 1
+        processor.shutdown()
+
+    def test_batches_cut_at_byte_limit(self) -> None:
+        exporter = RecordingExporter()
+        processor = _processor(
+            exporter,
+            batch_size=100,
+            export_workers=1,
+            max_export_batch_bytes=3 * estimate_span_size(_span(payload="x" * 1000)),
+        )
+
+        for i in range(7):
+            processor.on_end(_span(f"s{i}", payload="x" * 1000))
+
+        assert processor.force_flush(5000) is True
+        assert [len(batch) for batch in exporter.batches] == [3, 3, 1]
+        assert processor.get_stats()["queued_bytes"] == 0
+        processor.shutdown()
+
+    def test_byte_limit_triggers_export(self) -> None:
+        exporter = RecordingExporter()
+        processor = _processor(exporter, batch_size=100, max_export_batch_bytes=1000)
+
+        processor.on_end(_span(payload="x" * 2000))
+
+        deadline = time.monotonic() + 5
+        while not exporter.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(exporter.exported) == 1
+        processor.shutdown()
+
+    def test_unknown_drop_policy_falls_back(self) -> None:
+        processor = _processor(RecordingExporter(), drop_policy="random")
+
+        assert processor.drop_policy == DROP_OLDEST
+        processor.shutdown()
+
+    def test_workers_export_concurrently(self) -> None:
+        exporter = RecordingExporter()
+        exporter.supports_concurrent_export = True  # type: ignore[attr-defined]
+        exporter.release.clear()
+        processor = _processor(
+            exporter, batch_size=1, max_export_batch_size=1, export_workers=3
+        )
+
+        for i in range(3):
+            processor.on_end(_span(f"s{i}"))
+
+        deadline = time.monotonic() + 5
+        while (
+            processor.get_stats()["exports_in_flight"] < 3
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        assert processor.get_stats()["exports_in_flight"] == 3
+        exporter.release.set()
+        assert processor.force_flush(5000) is True
+        processor.shutdown()
+
+    def test_exports_are_serialized_by_default(self) -> None:
+        active = 0
+        overlaps: List[int] = []
+        lock = threading.Lock()
+
+        class SlowExporter(RecordingExporter):
+            def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+                nonlocal active
+                with lock:
+                    active += 1
+                    overlaps.append(active)
+                time.sleep(0.02)
+                with lock:
+                    active -= 1
+                return super().export(spans)
+
+        exporter = SlowExporter()
+        processor = _processor(
+            exporter, batch_size=1, max_export_batch_size=1, export_workers=3
+        )
+
+        for i in range(6):
+            processor.on_end(_span(f"s{i}"))
+        assert processor.force_flush(5000) is True
+
+        assert max(overlaps) == 1
+        assert len(exporter.batches) == 6
+        assert processor.get_stats()["concurrent_export"] is False
+        processor.shutdown()
+
+    def test_failed_exports_are_counted(self) -> None:
+        exporter = RecordingExporter(result=SpanExportResult.FAILURE)
+        processor = _processor(exporter)
+
+        processor.on_end(_span())
+        processor.force_flush(5000)
+
+        assert processor.get_stats()["failed_spans"] == 1
+        processor.shutdown()
+
+    def test_unsampled_spans_are_ignored(self) -> None:
+        processor = _processor(RecordingExporter())
+        span = _span()
+        span.context.trace_flags.sampled = False
+
+        processor.on_end(span)
+
+        assert processor.get_stats()["queued_spans"] == 0
+        processor.shutdown()
+
+    def test_shutdown_drains_queue_and_stops_exporter(self) -> None:
+        exporter = RecordingExporter()
+        processor = _processor(exporter)
+        processor.on_end(_span())
+
+        processor.shutdown()
+
+        assert len(exporter.exported) == 1
+        assert exporter.shutdown_called is True
+        assert processor.force_flush(100) is True
+        processor.on_end(_span())
+        assert processor.get_stats()["queued_spans"] == 1
@@ -0,0 +1,198 @@
+"""Unit tests for the export pipeline shared between tracers."""
+
+# pylint: disable=protected-access
+# Justification: Unit tests inspect the hub registry
+
+import json
+import threading
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SpanExportResult
+
+from honeyhive.tracer.processing import export_hub
+from honeyhive.tracer.processing.batch_processor import HoneyHiveBatchSpanProcessor
+from honeyhive.tracer.processing.export_hub import (
+    SharedExportChannel,
+    acquire_channel,
+    get_hub_stats,
+    hub_key,
+)
+from honeyhive.tracer.processing.otlp_json_serializer import group_by_resource
+from honeyhive.tracer.processing.otlp_session import OTLPSessionConfig
+from honeyhive.tracer.processing.span_processor import HoneyHiveSpanProcessor
+
+TEST_ENDPOINT = "https://test.example.com/opentelemetry/v1/traces"
+
+BATCH_SETTINGS: Dict[str, Any] = {
+    "batch_size": 100,
+    "schedule_delay_millis": 60000,
+    "export_workers": 1,
+}
+
+
+def _export_kwargs(api_key: str = "key-a") -> Dict[str, Any]:
+    return {
+        "tracer_instance": Mock(),
+        "endpoint": TEST_ENDPOINT,
+        "headers": {"Authorization": f"Bearer {api_key}"},
+        "compression": "none",
+        "retry_max_attempts": 1,
+    }
+
+
+def _spans(project: str, count: int = 1) -> List[ReadableSpan]:
+    provider = TracerProvider(resource=Resource.create({"project": project}))
+    tracer = provider.get_tracer("test")
+    spans = []
+    for index in range(count):
+        span = tracer.start_span(f"{project}-{index}")
+        span.end()
+        spans.append(span)  # type: ignore[arg-type]
+    return spans
+
+
+def _session() -> Mock:
+    session = Mock()
+    session.post.return_value = Mock(status_code=200, text="", headers={})
+    return session
+
+
+class TestHubRegistry:
+    """Tracers with the same settings share one hub."""
+
+    def test_hub_key(self) -> None:
+        first = _export_kwargs()
+        second = _export_kwargs()
+        second["tracer_instance"] = Mock()
+
+        assert hub_key(first, BATCH_SETTINGS) == hub_key(second, BATCH_SETTINGS)
+        assert hub_key(first, BATCH_SETTINGS) != hub_key(
+            _export_kwargs("key-b"), BATCH_SETTINGS
+        )
+        assert hub_key(first, BATCH_SETTINGS) != hub_key(
+            first, {**BATCH_SETTINGS, "export_workers": 2}
+        )
+
+    def test_hub_key_includes_session_settings(self) -> None:
+        first = {**_export_kwargs(), "session_config": OTLPSessionConfig()}
+        same = {**_export_kwargs(), "session_config": OTLPSessionConfig()}
+        larger_pool = {
+            **_export_kwargs(),
+            "session_config": OTLPSessionConfig(pool_connections=50, pool_maxsize=50),
+        }
+
+        assert hub_key(first, BATCH_SETTINGS) == hub_key(same, BATCH_SETTINGS)
+        assert hub_key(first, BATCH_SETTINGS) != hub_key(larger_pool, BATCH_SETTINGS)
+
+    @patch("honeyhive.tracer.processing.otlp_exporter.create_optimized_otlp_session")
+    def test_channels_share_hub_until_last_shutdown(self, mock_session: Mock) -> None:
+        mock_session.return_value = _session()
+        first = acquire_channel(_export_kwargs(), BATCH_SETTINGS)
+        second = acquire_channel(_export_kwargs(), BATCH_SETTINGS)
+        other = acquire_channel(_export_kwargs("key-b"), BATCH_SETTINGS)
+
+        assert first.hub is second.hub
+        assert other.hub is not first.hub
+        assert first.get_stats()["shared_tracers"] == 2
+        assert mock_session.call_count == 2
+
+        first.shutdown()
+        first.shutdown()
+        assert second.hub.tracer_count == 1
+        assert second.hub.key in export_hub._HUBS
+
+        second.shutdown()
+        other.shutdown()
+        assert not export_hub._HUBS
+        assert get_hub_stats() == {"hubs": []}
+
+
+class TestSharedExport:
+    """Spans of several tracers go through one queue and connection pool."""
+
+    @patch("honeyhive.tracer.processing.otlp_exporter.create_optimized_otlp_session")
+    def test_batch_keeps_resources_apart(self, mock_session: Mock) -> None:
+        session = mock_session.return_value = _session()
+        first = acquire_channel(_export_kwargs(), BATCH_SETTINGS)
+        second = acquire_channel(_export_kwargs(), BATCH_SETTINGS)
+        try:
+            for span in _spans("alpha", 2):
+                first.on_end(span)
+            for span in _spans("beta", 1):
+                second.on_end(span)
+
+            assert first.force_flush(5000)
+            assert first.get_stats()["pending_spans"] == 0
+        finally:
+            first.shutdown()
+            second.shutdown()
+
+        body = json.loads(session.post.call_args_list[0].kwargs["data"])
+        projects = [
+            {
+                attribute["value"]["stringValue"]
+                for attribute in resource_spans["resource"]["attributes"]
+                if attribute["key"] == "project"
+            }
+            for resource_spans in body["resourceSpans"]
+        ]
+        assert projects == [{"alpha"}, {"beta"}]
+        assert session.post.call_count == 1
+
+    @patch("honeyhive.tracer.processing.otlp_exporter.create_optimized_otlp_session")
+    def test_span_processor_queues_on_hub(self, mock_session: Mock) -> None:
+        mock_session.return_value = _session()
+        channel = acquire_channel(_export_kwargs(), BATCH_SETTINGS)
+        processor = HoneyHiveSpanProcessor(otlp_exporter=channel)
+
+        assert processor._batch_processor is channel
+        assert isinstance(channel, SharedExportChannel)
+        processor.shutdown()
+        assert not export_hub._HUBS
+
+
+class TestOwnerFlush:
+    """force_flush with an owner waits only for that owner's spans."""
+
+    def test_owner_flush_does_not_wait_for_others(self) -> None:
+        release = threading.Event()
+
+        def export(batch: List[ReadableSpan]) -> SpanExportResult:
+            if any(span.name.startswith("slow") for span in batch):
+                release.wait(5)
+            return SpanExportResult.SUCCESS
+
+        exporter = Mock()
+        exporter.export.side_effect = export
+        exporter.supports_concurrent_export = True
+        processor = HoneyHiveBatchSpanProcessor(
+            exporter, batch_size=1, max_export_batch_size=1, export_workers=2
+        )
+        try:
+            processor.on_end(_spans("slow")[0], owner="a")
+            processor.on_end(_spans("fast")[0], owner="b")
+
+            assert processor.force_flush(5000, owner="b")
+            assert processor.pending_spans("b") == 0
+            assert not processor.force_flush(50, owner="a")
+            assert processor.pending_spans("a") == 1
+        finally:
+            release.set()
+            processor.shutdown()
+        assert processor.pending_spans("a") == 0
+
+
+class TestGroupByResource:
+    """Serialization groups mixed batches by resource."""
+
+    def test_equal_resources_share_group(self) -> None:
+        alpha = _spans("alpha", 2) + _spans("alpha", 1)
+        beta = _spans("beta", 1)
+
+        groups = group_by_resource([alpha[0], beta[0], alpha[1], alpha[2]])
+
+        assert [len(group) for group in groups] == [3, 1]
+        assert groups[1] == beta
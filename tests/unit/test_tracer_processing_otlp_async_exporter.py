@@ -0,0 +1,277 @@
+"""Unit tests for the asyncio OTLP exporter and batch span processor."""
+
+# pylint: disable=protected-access
+# Justification: Unit tests inspect exporter counters and internal state
+
+import asyncio
+import gzip
+import json
+import threading
+from pathlib import Path
+from typing import Any, List
+
+import httpx
+import pytest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTraceServiceRequest,
+)
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SpanExportResult
+
+from honeyhive.tracer.processing.otlp_async_exporter import (
+    AsyncBatchSpanProcessor,
+    AsyncOTLPExporter,
+)
+from honeyhive.tracer.processing.span_processor import HoneyHiveSpanProcessor
+
+TEST_ENDPOINT = "https://api.test.honeyhive.ai/opentelemetry/v1/traces"
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Async transport that records requests and answers with a fixed status."""
+
+    def __init__(self, status_code: int = 200, delay: float = 0.0) -> None:
+        self.status_code = status_code
+        self.delay = delay
+        self.requests: List[httpx.Request] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return httpx.Response(self.status_code, text="")
+
+
+def _make_spans(count: int = 1, name: str = "llm_call") -> List[ReadableSpan]:
+    tracer = TracerProvider().get_tracer("honeyhive-test")
+    spans = []
+    for _ in range(count):
+        span = tracer.start_span(name, attributes={"honeyhive_event_type": "model"})
+        span.end()
+        spans.append(span)  # type: ignore[arg-type]
+    return spans
+
+
+def _exporter(transport: RecordingTransport, **kwargs: Any) -> AsyncOTLPExporter:
+    exporter = AsyncOTLPExporter(endpoint=TEST_ENDPOINT, **kwargs)
+    exporter._client = httpx.AsyncClient(transport=transport)
+    return exporter
+
+
+class TestAsyncOTLPExporter:
+    """Export behaviour of AsyncOTLPExporter."""
+
+    def test_requires_endpoint(self) -> None:
+        with pytest.raises(ValueError, match="endpoint is required"):
+            AsyncOTLPExporter()
+
+    def test_json_export(self) -> None:
+        transport = RecordingTransport()
+        exporter = _exporter(transport, compression="none", headers={"X-Test": "1"})
+
+        assert exporter.export(_make_spans()) == SpanExportResult.SUCCESS
+
+        request = transport.requests[0]
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.headers["X-Test"] == "1"
+        payload = json.loads(request.content)
+        spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert spans[0]["name"] == "llm_call"
+        assert exporter.get_session_stats()["exported_batches"] == 1
+        exporter.shutdown()
+
+    def test_protobuf_export_is_gzipped(self) -> None:
+        transport = RecordingTransport()
+        exporter = _exporter(transport, protocol="http/protobuf", compression="zstd")
+
+        assert exporter.export(_make_spans()) == SpanExportResult.SUCCESS
+
+        request = transport.requests[0]
+        assert request.headers["Content-Type"] == "application/x-protobuf"
+        assert request.headers["Content-Encoding"] == "gzip"
+        message = ExportTraceServiceRequest()
+        message.ParseFromString(gzip.decompress(request.content))
+        assert message.resource_spans[0].scope_spans[0].spans[0].name == "llm_call"
+        exporter.shutdown()
+
+    def test_requests_run_concurrently_up_to_limit(self) -> None:
+        transport = RecordingTransport(delay=0.05)
+        exporter = _exporter(transport, max_in_flight=2)
+
+        futures = [exporter.submit(_make_spans()) for _ in range(6)]
+
+        assert exporter.force_flush(5000) is True
+        assert all(f.result() == SpanExportResult.SUCCESS for f in futures)
+        stats = exporter.get_session_stats()
+        assert stats["max_observed_in_flight"] == 2
+        assert stats["in_flight"] == 0
+        exporter.shutdown()
+
+    def test_failed_status_returns_failure(self) -> None:
+        exporter = _exporter(RecordingTransport(status_code=400))
+
+        assert exporter.export(_make_spans()) == SpanExportResult.FAILURE
+        assert exporter.get_session_stats()["failed_batches"] == 1
+        exporter.shutdown()
+
+    def test_retryable_failure_is_spooled(self, tmp_path: Path) -> None:
+        transport = RecordingTransport(status_code=503)
+        exporter = _exporter(transport, compression="none", spool_dir=str(tmp_path))
+
+        assert exporter.export(_make_spans()) == SpanExportResult.FAILURE
+
+        assert exporter.get_session_stats()["spool"]["pending_batches"] == 1
+        transport.status_code = 200
+        assert exporter._spool.replay(exporter._post_body_blocking)  # type: ignore
+        assert transport.requests[-1].content == transport.requests[0].content
+        exporter.shutdown()
+
+    def test_payload_too_large_splits_batch(self) -> None:
+        transport = RecordingTransport()
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            await request.aread()
+            transport.requests.append(request)
+            payload = json.loads(request.content)
+            spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+            return httpx.Response(413 if len(spans) > 1 else 200, text="")
+
+        transport.handle_async_request = handle  # type: ignore[method-assign]
+        exporter = _exporter(transport, compression="none", max_in_flight=1)
+
+        assert exporter.export(_make_spans(3)) == SpanExportResult.SUCCESS
+
+        stats = exporter.get_session_stats()
+        assert stats["exported_spans"] == 3
+        assert stats["failed_batches"] == 0
+        exporter.shutdown()
+
+    def test_export_after_shutdown_fails(self) -> None:
+        exporter = _exporter(RecordingTransport())
+        exporter.shutdown()
+
+        assert exporter.export(_make_spans()) == SpanExportResult.FAILURE
+        assert exporter._loop_thread is not None
+        assert exporter._loop_thread.loop.is_closed()
+
+    @pytest.mark.asyncio
+    async def test_export_async_on_caller_loop(self) -> None:
+        transport = RecordingTransport()
+        exporter = AsyncOTLPExporter(
+            endpoint=TEST_ENDPOINT,
+            loop=asyncio.get_running_loop(),
+            client=httpx.AsyncClient(transport=transport),
+        )
+
+        results = await asyncio.gather(
+            *(exporter.export_async(_make_spans()) for _ in range(3))
+        )
+
+        assert results == [SpanExportResult.SUCCESS] * 3
+        assert len(transport.requests) == 3
+        assert exporter._loop_thread is None
+
+
+class TestAsyncBatchSpanProcessor:
+    """Batching behaviour of AsyncBatchSpanProcessor."""
+
+    def test_force_flush_exports_in_batches(self) -> None:
+        transport = RecordingTransport()
+        exporter = _exporter(transport, compression="none")
+        processor = AsyncBatchSpanProcessor(
+            exporter, schedule_delay_millis=60000, max_export_batch_size=2
+        )
+
+        for span in _make_spans(5):
+            processor.on_end(span)
+
+        assert processor.force_flush() is True
+        sizes = sorted(
+            len(json.loads(r.content)["resourceSpans"][0]["scopeSpans"][0]["spans"])
+            for r in transport.requests
+        )
+        assert sizes == [1, 2, 2]
+        processor.shutdown()
+
+    def test_full_batch_dispatches_without_flush(self) -> None:
+        transport = RecordingTransport()
+        exporter = _exporter(transport)
+        processor = AsyncBatchSpanProcessor(
+            exporter, schedule_delay_millis=60000, max_export_batch_size=2
+        )
+        sent = threading.Event()
+        original = exporter.export_async
+
+        async def export_async(spans: Any) -> SpanExportResult:
+            result = await original(spans)
+            sent.set()
+            return result
+
+        exporter.export_async = export_async  # type: ignore[method-assign]
+
+        for span in _make_spans(2):
+            processor.on_end(span)
+
+        assert sent.wait(5)
+        processor.shutdown()
+
+    def test_batches_respect_byte_limit(self) -> None:
+        exporter = _exporter(RecordingTransport())
+        processor = AsyncBatchSpanProcessor(
+            exporter, schedule_delay_millis=60000, max_export_batch_bytes=1
+        )
+        processor._wake_dispatcher = lambda: None  # type: ignore[method-assign]
+
+        for span in _make_spans(3):
+            processor.on_end(span)
+
+        assert [len(batch) for batch in processor._take_batches()] == [1, 1, 1]
+        processor.shutdown()
+
+    def test_queue_overflow_drops_spans(self) -> None:
+        exporter = _exporter(RecordingTransport())
+        processor = AsyncBatchSpanProcessor(
+            exporter, max_queue_size=2, schedule_delay_millis=60000
+        )
+        processor._wake_dispatcher = lambda: None  # type: ignore[method-assign]
+
+        for span in _make_spans(3):
+            processor.on_end(span)
+
+        assert processor.get_stats()["dropped_spans"] == 1
+        processor.shutdown()
+
+    def test_shutdown_flushes_and_stops_exporter(self) -> None:
+        transport = RecordingTransport()
+        exporter = _exporter(transport)
+        processor = AsyncBatchSpanProcessor(exporter, schedule_delay_millis=60000)
+        processor.on_end(_make_spans()[0])
+
+        processor.shutdown()
+
+        assert len(transport.requests) == 1
+        assert exporter._is_shutdown is True
+
+
+class TestSpanProcessorIntegration:
+    """HoneyHiveSpanProcessor picks the async pipeline for the async exporter."""
+
+    def test_batched_mode_uses_async_batch_processor(self) -> None:
+        exporter = _exporter(RecordingTransport())
+
+        processor = HoneyHiveSpanProcessor(otlp_exporter=exporter)
+
+        assert isinstance(processor._batch_processor, AsyncBatchSpanProcessor)
+        processor.shutdown()
+
+    def test_immediate_mode_submits_without_blocking(self) -> None:
+        transport = RecordingTransport()
+        exporter = _exporter(transport)
+        processor = HoneyHiveSpanProcessor(otlp_exporter=exporter, disable_batch=True)
+
+        processor._send_via_otlp(_make_spans()[0], {}, "session")
+
+        assert processor.force_flush() is True
+        assert len(transport.requests) == 1
+        processor.shutdown()
@@ -0,0 +1,193 @@
+"""Unit tests for the OTLP export circuit breaker."""
+
+# pylint: disable=protected-access
+# Justification: Unit tests rewind the breaker's open timestamp
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from click.testing import CliRunner
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SpanExportResult
+
+from honeyhive.cli.main import status
+from honeyhive.tracer.processing.otlp_circuit import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    ExportCircuitBreaker,
+)
+from honeyhive.tracer.processing.otlp_exporter import HoneyHiveOTLPExporter
+from honeyhive.tracer.processing.pipeline_status import PipelineStatusPublisher
+
+TEST_ENDPOINT = "https://test.example.com/opentelemetry/v1/traces"
+
+
+def _span() -> ReadableSpan:
+    span = TracerProvider().get_tracer("test").start_span("step")
+    span.end()
+    return span  # type: ignore[return-value]
+
+
+def _expire(breaker: ExportCircuitBreaker) -> None:
+    """Pretend the reset timeout has passed."""
+    breaker._opened_at -= breaker.reset_timeout + 1
+
+
+class TestExportCircuitBreaker:
+    """State transitions of the breaker."""
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        breaker = ExportCircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_OPEN
+        assert not breaker.allow_request()
+
+    def test_half_open_allows_single_probe(self) -> None:
+        breaker = ExportCircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        _expire(breaker)
+
+        assert breaker.allow_request()
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == CIRCUIT_CLOSED
+        assert breaker.allow_request()
+
+    def test_failed_probe_reopens(self) -> None:
+        breaker = ExportCircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        _expire(breaker)
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CIRCUIT_OPEN
+        assert not breaker.allow_request()
+        stats = breaker.get_stats()
+        assert stats["probes"] == 1
+        assert stats["transition_counts"] == {
+            CIRCUIT_OPEN: 2,
+            CIRCUIT_HALF_OPEN: 1,
+            CIRCUIT_CLOSED: 0,
+        }
+        assert [t["to"] for t in stats["recent_transitions"]] == [
+            CIRCUIT_OPEN,
+            CIRCUIT_HALF_OPEN,
+            CIRCUIT_OPEN,
+        ]
+        assert 0 < stats["probe_in"] <= 60
+
+    def test_zero_threshold_disables_breaker(self) -> None:
+        breaker = ExportCircuitBreaker(failure_threshold=0)
+
+        for _ in range(100):
+            breaker.record_failure()
+
+        assert breaker.allow_request()
+        assert breaker.get_stats()["enabled"] is False
+
+
+class TestExporterCircuit:
+    """HoneyHiveOTLPExporter short-circuits exports while open."""
+
+    def test_open_circuit_skips_network(self) -> None:
+        session = Mock()
+        session.post.return_value = Mock(status_code=400, text="bad")
+        exporter = HoneyHiveOTLPExporter(
+            session=session,
+            endpoint=TEST_ENDPOINT,
+            retry_max_attempts=1,
+            circuit_failure_threshold=2,
+            circuit_open_policy="drop",
+        )
+
+        for _ in range(5):
+            assert exporter.export([_span()]) == SpanExportResult.FAILURE
+
+        assert session.post.call_count == 2
+        circuit = exporter.get_session_stats()["circuit"]
+        assert circuit["state"] == CIRCUIT_OPEN
+        assert circuit["short_circuited_batches"] == 3
+        assert circuit["short_circuited_spans"] == 3
+
+    def test_probe_success_closes_circuit(self) -> None:
+        session = Mock()
+        session.post.side_effect = [
+            Mock(status_code=503, text=""),
+            Mock(status_code=200, text=""),
+        ]
+        exporter = HoneyHiveOTLPExporter(
+            session=session,
+            endpoint=TEST_ENDPOINT,
+            retry_max_attempts=1,
+            circuit_failure_threshold=1,
+        )
+        assert exporter.export([_span()]) == SpanExportResult.FAILURE
+        _expire(exporter._circuit)
+
+        assert exporter.export([_span()]) == SpanExportResult.SUCCESS
+        assert exporter.get_circuit_stats()["state"] == CIRCUIT_CLOSED
+
+    def test_open_circuit_spools_batches(self, tmp_path: Path) -> None:
+        session = Mock()
+        session.post.return_value = Mock(status_code=400, text="bad")
+        exporter = HoneyHiveOTLPExporter(
+            session=session,
+            endpoint=TEST_ENDPOINT,
+            retry_max_attempts=1,
+            circuit_failure_threshold=1,
+            spool_dir=str(tmp_path),
+        )
+        try:
+            exporter.export([_span()])
+            exporter.export([_span(), _span()])
+
+            assert session.post.call_count == 1
+            spool = exporter.get_session_stats()["spool"]
+            assert spool["pending_batches"] == 1
+        finally:
+            exporter.shutdown()
+
+
+class TestMonitorStatusCircuit:
+    """`honeyhive monitor status` shows the circuit published by other processes."""
+
+    @patch("honeyhive.tracer.registry.get_all_tracers")
+    def test_status_reports_circuit_state(
+        self, mock_get_all_tracers: Mock, tmp_path: Path
+    ) -> None:
+        exporter = HoneyHiveOTLPExporter(
+            session=Mock(), endpoint=TEST_ENDPOINT, circuit_failure_threshold=1
+        )
+        exporter._circuit.record_failure()
+        mock_get_all_tracers.return_value = [
+            SimpleNamespace(otlp_exporter=exporter, project_name="demo")
+        ]
+        assert PipelineStatusPublisher(str(tmp_path)).publish()
+
+        result = CliRunner().invoke(status, ["--status-dir", str(tmp_path)])
+
+        assert "=== Export Pipeline Status ===" in result.output
+        assert f"Process {os.getpid()}" in result.output
+        assert "(HoneyHiveOTLPExporter)" in result.output
+        assert "Circuit: open" in result.output
+        assert "Consecutive Failures: 1/1" in result.output
+        assert "Last Transition: closed -> open" in result.output
+
+    def test_status_without_published_pipelines(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(status, ["--status-dir", str(tmp_path)])
+
+        assert f"No pipeline status published in {tmp_path}" in result.output
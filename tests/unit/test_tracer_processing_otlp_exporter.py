@@ -10,11 +10,15 @@ NOTE: Tests temporarily skipped - test expectations don't match current implemen
 TODO: Update tests to match current OTLP exporter implementation.
 """
 
-from typing import List, Sequence
+import gzip
+import json
+from pathlib import Path
+from typing import Any, List, Sequence
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
+from opentelemetry.exporter.otlp.proto.http import Compression
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import SpanExportResult
 
@@ -23,6 +27,7 @@ from honeyhive.tracer.processing.otlp_exporter import (
     OTLPJSONExporter,
 )
 from honeyhive.tracer.processing.otlp_session import OTLPSessionConfig
+from honeyhive.tracer.processing.otlp_spool import ExportSpool
 
 # Tests updated to match current OTLP exporter implementation (endpoint required)
 
@@ -473,6 +478,9 @@ class TestHoneyHiveOTLPExporterSessionStats:
         expected_stats = {"pools": 2, "connections": 10}
         mock_get_session_stats.return_value = expected_stats
         mock_exporter_instance = Mock()
+        mock_exporter_instance.get_compression_stats.return_value = {"raw_bytes": 0}
+        mock_exporter_instance.get_spool_stats.return_value = None
+        mock_exporter_instance.get_retry_stats.return_value = None
         mock_json_exporter.return_value = mock_exporter_instance
 
         exporter = HoneyHiveOTLPExporter(
@@ -490,6 +498,7 @@ class TestHoneyHiveOTLPExporterSessionStats:
             **expected_stats,
             "session_type": "optimized",
             "session_config": mock_otlp_session_config.to_dict(),
+            "compression": {"raw_bytes": 0},
         }
         assert result == expected_result
         mock_get_session_stats.assert_called_once_with(mock_requests_session)
@@ -506,6 +515,9 @@ class TestHoneyHiveOTLPExporterSessionStats:
         """
         # Arrange
         mock_exporter_instance = Mock()
+        mock_exporter_instance.get_compression_stats.return_value = {"raw_bytes": 0}
+        mock_exporter_instance.get_spool_stats.return_value = None
+        mock_exporter_instance.get_retry_stats.return_value = None
         mock_json_exporter.return_value = mock_exporter_instance
 
         exporter = HoneyHiveOTLPExporter(
@@ -518,7 +530,12 @@ class TestHoneyHiveOTLPExporterSessionStats:
         result = exporter.get_session_stats()
 
         # Assert
-        expected_result = {"error": "No session available", "session_type": "default"}
+        expected_result = {
+            "error": "No session available",
+            "session_type": "default",
+            "compression": {"raw_bytes": 0},
+            "circuit": exporter.get_circuit_stats(),
+        }
         assert result == expected_result
 
     @patch("honeyhive.tracer.processing.otlp_exporter.OTLPJSONExporter")
@@ -542,6 +559,9 @@ class TestHoneyHiveOTLPExporterSessionStats:
         test_error = AttributeError("Session not configured")
         mock_get_session_stats.side_effect = test_error
         mock_exporter_instance = Mock()
+        mock_exporter_instance.get_compression_stats.return_value = {"raw_bytes": 0}
+        mock_exporter_instance.get_spool_stats.return_value = None
+        mock_exporter_instance.get_retry_stats.return_value = None
         mock_json_exporter.return_value = mock_exporter_instance
 
         exporter = HoneyHiveOTLPExporter(
@@ -557,6 +577,8 @@ class TestHoneyHiveOTLPExporterSessionStats:
         expected_result = {
             "error": f"Failed to get session stats: {test_error}",
             "session_type": "optimized",
+            "compression": {"raw_bytes": 0},
+            "circuit": exporter.get_circuit_stats(),
         }
         assert result == expected_result
 
@@ -1341,6 +1363,290 @@ class TestOTLPJSONExporterTimestamps:
         assert span_json["events"][0]["timeUnixNano"] == "1500000000"
 
 
+class TestOTLPJSONExporterCompression:
+    """Test request body compression in the OTLP JSON exporter."""
+
+    @staticmethod
+    def _make_span(payload: str) -> Mock:
+        """Create a span mock carrying a string attribute of the given size."""
+        span = Mock(spec=ReadableSpan)
+        span.name = "llm_call"
+        span.context = Mock()
+        span.context.trace_id = 0x1234567890ABCDEF1234567890ABCDEF
+        span.context.span_id = 0x1234567890ABCDEF
+        span.parent = None
+        span.kind = Mock()
+        span.kind.name = "INTERNAL"
+        span.start_time = 1000000000
+        span.end_time = 2000000000
+        span.status = Mock()
+        span.status.status_code = Mock()
+        span.status.status_code.name = "OK"
+        span.status.description = None
+        span.attributes = {"honeyhive_inputs.prompt": payload}
+        span.events = []
+        span.resource = Mock()
+        span.resource.attributes = {}
+        span.instrumentation_scope = None
+        return span
+
+    @staticmethod
+    def _exporter(session: Mock, **kwargs: Any) -> OTLPJSONExporter:
+        response = Mock()
+        response.status_code = 200
+        session.post.return_value = response
+        return OTLPJSONExporter(TEST_OTLP_ENDPOINT, session=session, **kwargs)
+
+    def test_default_compression_is_gzip(self, mock_requests_session: Mock) -> None:
+        """Large payloads are gzip-encoded by default."""
+        exporter = self._exporter(mock_requests_session)
+
+        result = exporter.export([self._make_span("hello world " * 500)])
+
+        assert result == SpanExportResult.SUCCESS
+        call_kwargs = mock_requests_session.post.call_args[1]
+        assert call_kwargs["headers"]["Content-Encoding"] == "gzip"
+        payload = json.loads(gzip.decompress(call_kwargs["data"]))
+        assert payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] == (
+            "llm_call"
+        )
+        assert "Content-Encoding" not in exporter.headers
+
+    def test_small_payload_sent_uncompressed(self, mock_requests_session: Mock) -> None:
+        """Bodies below the threshold skip compression."""
+        exporter = self._exporter(mock_requests_session, compression_min_bytes=10**6)
+
+        exporter.export([self._make_span("short")])
+
+        call_kwargs = mock_requests_session.post.call_args[1]
+        assert "Content-Encoding" not in call_kwargs["headers"]
+        assert json.loads(call_kwargs["data"])["resourceSpans"]
+
+    def test_compression_none_disables_encoding(
+        self, mock_requests_session: Mock
+    ) -> None:
+        """compression='none' always sends the raw JSON body."""
+        exporter = self._exporter(mock_requests_session, compression="none")
+
+        exporter.export([self._make_span("hello world " * 500)])
+
+        call_kwargs = mock_requests_session.post.call_args[1]
+        assert "Content-Encoding" not in call_kwargs["headers"]
+        assert json.loads(call_kwargs["data"])["resourceSpans"]
+
+    def test_compression_stats_track_raw_and_sent_bytes(
+        self, mock_requests_session: Mock
+    ) -> None:
+        """Byte counters reflect both compressed and uncompressed requests."""
+        exporter = self._exporter(mock_requests_session, compression_min_bytes=2048)
+
+        exporter.export([self._make_span("hello world " * 500)])
+        exporter.export([self._make_span("short")])
+
+        stats = exporter.get_compression_stats()
+        assert stats["compression"] == "gzip"
+        assert stats["compressed_requests"] == 1
+        assert stats["uncompressed_requests"] == 1
+        assert stats["sent_bytes"] < stats["raw_bytes"]
+        assert 0 < stats["compression_ratio"] < 1
+
+    @patch("honeyhive.tracer.processing.otlp_compression.ZSTD_AVAILABLE", False)
+    def test_zstd_without_library_falls_back_to_gzip(
+        self, mock_requests_session: Mock
+    ) -> None:
+        """Requesting zstd without zstandard installed uses gzip."""
+        exporter = self._exporter(mock_requests_session, compression="zstd")
+
+        assert exporter.compression == "gzip"
+
+    def test_unknown_compression_falls_back_to_gzip(
+        self, mock_requests_session: Mock
+    ) -> None:
+        """Unsupported encodings degrade to gzip instead of failing."""
+        exporter = self._exporter(mock_requests_session, compression="brotli")
+
+        assert exporter.compression == "gzip"
+
+    @patch("honeyhive.tracer.processing.otlp_exporter.OTLPSpanExporter")
+    def test_protobuf_exporter_receives_otel_compression(
+        self, mock_span_exporter: Mock, mock_tracer: Mock
+    ) -> None:
+        """Protobuf protocol maps compression names to the OTel enum."""
+        HoneyHiveOTLPExporter(
+            tracer_instance=mock_tracer,
+            protocol="http/protobuf",
+            endpoint=TEST_OTLP_ENDPOINT,
+            compression="none",
+            compression_min_bytes=0,
+        )
+
+        call_kwargs = mock_span_exporter.call_args[1]
+        assert call_kwargs["compression"] == Compression.NoCompression
+        assert "compression_min_bytes" not in call_kwargs
+
+
+class TestOTLPJSONExporterSpool:
+    """Failed batches go to the on-disk spool and are replayed later."""
+
+    _make_span = staticmethod(TestOTLPJSONExporterCompression._make_span)
+
+    @staticmethod
+    def _exporter(session: Mock, spool_dir: Path) -> OTLPJSONExporter:
+        return OTLPJSONExporter(
+            TEST_OTLP_ENDPOINT,
+            session=session,
+            compression="none",
+            spool=ExportSpool(str(spool_dir)),
+        )
+
+    def test_retryable_status_spools_sent_body(
+        self, mock_requests_session: Mock, tmp_path: Path
+    ) -> None:
+        """A 503 stores the exact request body for replay."""
+        mock_requests_session.post.return_value = Mock(status_code=503, text="")
+        exporter = self._exporter(mock_requests_session, tmp_path)
+
+        result = exporter.export([self._make_span("hello")])
+
+        assert result == SpanExportResult.FAILURE
+        stats = exporter.get_spool_stats()
+        assert stats is not None and stats["pending_batches"] == 1
+
+        sent_body = mock_requests_session.post.call_args[1]["data"]
+        mock_requests_session.post.return_value = Mock(status_code=200)
+        assert exporter._spool.replay(exporter._post_body) is True  # type: ignore
+        assert mock_requests_session.post.call_args[1]["data"] == sent_body
+        exporter.shutdown()
+
+    def test_connection_error_spools_body(
+        self, mock_requests_session: Mock, tmp_path: Path
+    ) -> None:
+        """Network failures are spooled."""
+        mock_requests_session.post.side_effect = requests.ConnectionError("down")
+        exporter = self._exporter(mock_requests_session, tmp_path)
+
+        assert exporter.export([self._make_span("hello")]) == SpanExportResult.FAILURE
+
+        assert exporter.get_spool_stats()["pending_batches"] == 1  # type: ignore
+        exporter.shutdown()
+
+    def test_client_error_is_not_spooled(
+        self, mock_requests_session: Mock, tmp_path: Path
+    ) -> None:
+        """A 400 would fail the same way on replay, so it is not spooled."""
+        mock_requests_session.post.return_value = Mock(status_code=400, text="bad")
+        exporter = self._exporter(mock_requests_session, tmp_path)
+
+        exporter.export([self._make_span("hello")])
+
+        assert exporter.get_spool_stats()["pending_batches"] == 0  # type: ignore
+        exporter.shutdown()
+
+    def test_success_wakes_replayer(
+        self, mock_requests_session: Mock, tmp_path: Path
+    ) -> None:
+        """A successful live export triggers an immediate replay attempt."""
+        mock_requests_session.post.return_value = Mock(status_code=200)
+        exporter = self._exporter(mock_requests_session, tmp_path)
+
+        with patch.object(exporter._spool_replayer, "notify") as mock_notify:
+            exporter.export([self._make_span("hello")])
+
+        mock_notify.assert_called_once()
+        exporter.shutdown()
+
+    def test_shutdown_closes_spool(
+        self, mock_requests_session: Mock, tmp_path: Path
+    ) -> None:
+        """Shutdown stops the replayer and releases the spool directory."""
+        exporter = self._exporter(mock_requests_session, tmp_path)
+
+        exporter.shutdown()
+
+        assert exporter._spool is not None
+        assert exporter._spool.is_open is False
+
+    def test_no_spool_by_default(self, mock_requests_session: Mock) -> None:
+        """Without a spool, failed batches are only logged."""
+        exporter = OTLPJSONExporter(TEST_OTLP_ENDPOINT, session=mock_requests_session)
+
+        assert exporter.get_spool_stats() is None
+
+    def test_honeyhive_exporter_builds_spool_from_spool_dir(
+        self, mock_tracer: Mock, mock_requests_session: Mock, tmp_path: Path
+    ) -> None:
+        """spool_dir enables the spool and its stats show in session stats."""
+        exporter = HoneyHiveOTLPExporter(
+            tracer_instance=mock_tracer,
+            protocol="http/json",
+            endpoint=TEST_OTLP_ENDPOINT,
+            session=mock_requests_session,
+            spool_dir=str(tmp_path),
+            spool_max_bytes=4096,
+        )
+
+        stats = exporter.get_session_stats()
+
+        assert stats["spool"]["directory"] == str(tmp_path)
+        assert stats["spool"]["max_bytes"] == 4096
+        exporter.shutdown()
+
+
+class TestOTLPJSONExporterPayloadTooLarge:
+    """Batches rejected with HTTP 413 are bisected and retried."""
+
+    _make_span = staticmethod(TestOTLPJSONExporterCompression._make_span)
+
+    @staticmethod
+    def _post_with_limit(max_spans: int) -> Any:
+        """Fake POST that rejects bodies carrying more than max_spans spans."""
+
+        def post(*_args: Any, **kwargs: Any) -> Mock:
+            payload = json.loads(kwargs["data"])
+            spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+            status = 413 if len(spans) > max_spans else 200
+            return Mock(status_code=status, text="")
+
+        return post
+
+    def test_oversized_batch_is_split_until_accepted(
+        self, mock_requests_session: Mock
+    ) -> None:
+        """A 413 splits the batch in half until each request fits."""
+        mock_requests_session.post.side_effect = self._post_with_limit(2)
+        exporter = OTLPJSONExporter(
+            TEST_OTLP_ENDPOINT, session=mock_requests_session, compression="none"
+        )
+
+        result = exporter.export([self._make_span(f"p{i}") for i in range(5)])
+
+        assert result == SpanExportResult.SUCCESS
+        accepted = [
+            len(json.loads(c[1]["data"])["resourceSpans"][0]["scopeSpans"][0]["spans"])
+            for c in mock_requests_session.post.call_args_list
+        ]
+        assert sorted(n for n in accepted if n <= 2) == [1, 2, 2]
+
+    def test_single_span_too_large_fails_without_spooling(
+        self, mock_requests_session: Mock, tmp_path: Path
+    ) -> None:
+        """A lone span that is still too large fails and is not spooled."""
+        mock_requests_session.post.return_value = Mock(status_code=413, text="")
+        exporter = OTLPJSONExporter(
+            TEST_OTLP_ENDPOINT,
+            session=mock_requests_session,
+            compression="none",
+            spool=ExportSpool(str(tmp_path)),
+        )
+
+        result = exporter.export([self._make_span("x" * 100)])
+
+        assert result == SpanExportResult.FAILURE
+        assert mock_requests_session.post.call_count == 1
+        assert exporter.get_spool_stats()["pending_batches"] == 0  # type: ignore
+        exporter.shutdown()
+
+
 class TestHoneyHiveOTLPExporterProtocol:
     """Test HoneyHive OTLP exporter protocol selection."""
 
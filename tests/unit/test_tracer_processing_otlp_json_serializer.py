@@ -0,0 +1,259 @@
+"""Unit tests for the streaming OTLP JSON serializer.
+
+The serializer must produce the same JSON as the reference dict builder
+(``OTLPJSONExporter._spans_to_otlp_json_payload`` + ``json.dumps``) while
+reusing cached resource, scope and key encodings across batches.
+"""
+
+# pylint: disable=protected-access
+# Justification: Unit tests inspect the serializer's internal caches
+
+import json
+from typing import Any, Dict, List, Optional, Sequence
+from unittest.mock import Mock
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from honeyhive.tracer.processing import otlp_json_serializer
+from honeyhive.tracer.processing.otlp_exporter import OTLPJSONExporter
+from honeyhive.tracer.processing.otlp_json_serializer import OTLPJSONSerializer
+
+TEST_OTLP_ENDPOINT = "https://test.example.com/opentelemetry/v1/traces"
+
+ORJSON_MODES = [False]
+if otlp_json_serializer.ORJSON_AVAILABLE:
+    ORJSON_MODES.append(True)
+
+
+def _reference(spans: Sequence[ReadableSpan]) -> Dict[str, Any]:
+    """Build the payload with the dict-based reference implementation."""
+    exporter = OTLPJSONExporter(TEST_OTLP_ENDPOINT, session=Mock())
+    return json.loads(json.dumps(exporter._spans_to_otlp_json_payload(spans)))
+
+
+def _finished_spans(
+    provider: Optional[TracerProvider] = None,
+    scope: str = "test.scope",
+    version: Optional[str] = "1.0.0",
+    attributes: Optional[Dict[str, Any]] = None,
+    count: int = 1,
+) -> List[ReadableSpan]:
+    """Create finished SDK spans with the given attributes."""
+    provider = provider or TracerProvider(
+        resource=Resource.create({"service.name": "svc", "replicas": 3})
+    )
+    tracer = provider.get_tracer(scope, version)
+    spans: List[ReadableSpan] = []
+    for i in range(count):
+        span = tracer.start_span(f"span_{i}", attributes=attributes)
+        span.end()
+        spans.append(span)
+    return spans
+
+
+@pytest.fixture(params=ORJSON_MODES, ids=lambda mode: f"orjson={mode}")
+def serializer(request: pytest.FixtureRequest) -> OTLPJSONSerializer:
+    """Serializer with orjson forced on or off."""
+    return OTLPJSONSerializer(use_orjson=request.param)
+
+
+class TestOTLPJSONSerializerEquivalence:
+    """Output matches the reference dict builder."""
+
+    def test_empty_batch(self, serializer: OTLPJSONSerializer) -> None:
+        assert json.loads(serializer.serialize([])) == {"resourceSpans": []}
+
+    def test_attribute_types(self, serializer: OTLPJSONSerializer) -> None:
+        attributes = {
+            "str": "hello",
+            "long_str": "prompt " * 100,
+            "int": 42,
+            "big_int": 2**62 + 1,
+            "negative": -7,
+            "float": 3.14,
+            "bool_true": True,
+            "bool_false": False,
+            "one": 1,
+            "list_str": ["a", "b"],
+            "list_int": [1, 2, 3],
+            "list_float": [0.5, 1e300],
+            "unicode": 'héllo wörld ✓   "quoted" \\ \n\t',
+        }
+        spans = _finished_spans(attributes=attributes, count=3)
+
+        assert json.loads(serializer.serialize(spans)) == _reference(spans)
+
+    def test_non_finite_floats_become_strings(
+        self, serializer: OTLPJSONSerializer
+    ) -> None:
+        spans = _finished_spans(attributes={"nan": float("nan"), "inf": float("inf")})
+
+        body = serializer.serialize(spans)
+
+        assert b"NaN" not in body and b"Infinity" not in body
+        assert json.loads(body) == _reference(spans)
+
+    def test_events_parent_kind_and_status(
+        self, serializer: OTLPJSONSerializer
+    ) -> None:
+        provider = TracerProvider()
+        tracer = provider.get_tracer("test.scope")
+        parent = tracer.start_span("parent")
+        ctx = trace.set_span_in_context(parent)
+        child = tracer.start_span("child", context=ctx, kind=SpanKind.CLIENT)
+        child.add_event("retry", {"attempt": 2, "reason": "timeout"})
+        child.add_event("empty")
+        child.set_status(Status(StatusCode.ERROR, "boom"))
+        child.end()
+        parent.set_status(Status(StatusCode.OK))
+        parent.end()
+        spans = [child, parent]
+
+        payload = json.loads(serializer.serialize(spans))
+
+        assert payload == _reference(spans)
+        span_json = payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert span_json["parentSpanId"] == format(parent.context.span_id, "016x")
+        assert span_json["kind"] == "SPAN_KIND_CLIENT"
+        assert span_json["status"] == {"code": "STATUS_CODE_ERROR", "message": "boom"}
+        assert len(span_json["events"]) == 2
+
+    def test_groups_spans_by_scope(self, serializer: OTLPJSONSerializer) -> None:
+        provider = TracerProvider()
+        spans = (
+            _finished_spans(provider, scope="pydantic-ai", version="0.1")
+            + _finished_spans(provider, scope="httpx", version=None)
+            + _finished_spans(provider, scope="pydantic-ai", version="0.1")
+        )
+
+        payload = json.loads(serializer.serialize(spans))
+
+        assert payload == _reference(spans)
+        scope_spans = payload["resourceSpans"][0]["scopeSpans"]
+        assert [s["scope"] for s in scope_spans] == [
+            {"name": "pydantic-ai", "version": "0.1"},
+            {"name": "httpx"},
+        ]
+        assert [len(s["spans"]) for s in scope_spans] == [2, 1]
+
+    def test_mock_spans(self, serializer: OTLPJSONSerializer) -> None:
+        span = Mock(spec=ReadableSpan)
+        span.name = "mock_span"
+        span.context = Mock(trace_id=1, span_id=2)
+        span.parent = None
+        span.kind = Mock()
+        span.kind.name = "INTERNAL"
+        span.start_time = 1_000_000_000
+        span.end_time = 2_000_000_000
+        span.status = Mock(status_code=StatusCode.UNSET, description=None)
+        span.attributes = {"attr": "value", "count": 3}
+        span.events = []
+        span.resource = Mock()
+        span.resource.attributes = {}
+        span.instrumentation_scope = None
+
+        payload = json.loads(serializer.serialize([span]))
+
+        assert payload == _reference([span])
+        assert payload["resourceSpans"][0]["resource"] == {}
+        assert payload["resourceSpans"][0]["scopeSpans"][0]["scope"] == {
+            "name": "unknown"
+        }
+
+    def test_equal_scalars_of_different_types_do_not_collide(
+        self, serializer: OTLPJSONSerializer
+    ) -> None:
+        spans = [
+            span
+            for value in (True, 1, 1.0)
+            for span in _finished_spans(attributes={"flag": value})
+        ]
+
+        payload = json.loads(serializer.serialize(spans))
+
+        values = [
+            span["attributes"][0]["value"]
+            for span in payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        ]
+        assert values == [
+            {"boolValue": True},
+            {"intValue": "1"},
+            {"doubleValue": 1.0},
+        ]
+
+
+class TestOTLPJSONSerializerCaching:
+    """Resource, scope and key encodings are reused across batches."""
+
+    def test_resource_block_cached_per_resource(self) -> None:
+        serializer = OTLPJSONSerializer(use_orjson=False)
+        spans = _finished_spans(count=2)
+
+        serializer.serialize(spans)
+        cached = serializer._resource_cache[id(spans[0].resource)]
+        serializer.serialize(spans)
+
+        assert serializer._resource_cache[id(spans[0].resource)] is cached
+        assert len(serializer._resource_cache) == 1
+
+    def test_scope_headers_cached(self) -> None:
+        serializer = OTLPJSONSerializer(use_orjson=False)
+        spans = _finished_spans(scope="a", count=3) + _finished_spans(scope="b")
+
+        serializer.serialize(spans)
+
+        assert set(serializer._scope_cache) == {("a", "1.0.0"), ("b", "1.0.0")}
+
+    def test_caches_are_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(otlp_json_serializer, "_MAX_CACHED_KEYS", 4)
+        monkeypatch.setattr(otlp_json_serializer, "_MAX_CACHED_PAIRS", 4)
+        serializer = OTLPJSONSerializer(use_orjson=False)
+        spans = _finished_spans(attributes={f"key_{i}": i for i in range(10)})
+
+        payload = json.loads(serializer.serialize(spans))
+
+        assert payload == _reference(spans)
+        assert len(serializer._key_cache) <= 4
+        assert len(serializer._pair_cache) <= 4
+
+    def test_clear_caches(self) -> None:
+        serializer = OTLPJSONSerializer(use_orjson=False)
+        spans = _finished_spans(attributes={"k": "v"})
+        first = serializer.serialize(spans)
+
+        serializer.clear_caches()
+
+        assert not serializer._pair_cache
+        assert not serializer._resource_cache
+        assert serializer.serialize(spans) == first
+
+
+class TestOTLPJSONSerializerOrjson:
+    """orjson is optional and only used when installed."""
+
+    def test_disabled_when_not_installed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(otlp_json_serializer, "ORJSON_AVAILABLE", False)
+
+        assert OTLPJSONSerializer().uses_orjson is False
+        assert OTLPJSONSerializer(use_orjson=True).uses_orjson is False
+
+    def test_can_be_forced_off(self) -> None:
+        assert OTLPJSONSerializer(use_orjson=False).uses_orjson is False
+
+    @pytest.mark.skipif(
+        not otlp_json_serializer.ORJSON_AVAILABLE, reason="orjson not installed"
+    )
+    def test_lone_surrogates_fall_back_to_stdlib(self) -> None:
+        serializer = OTLPJSONSerializer(use_orjson=True)
+        spans = _finished_spans(attributes={"bad": "x\ud800y"})
+
+        payload = json.loads(serializer.serialize(spans))
+
+        value = payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["attributes"][
+            0
+        ]["value"]
+        assert value == {"stringValue": "x\ud800y"}
@@ -0,0 +1,192 @@
+"""Unit tests for OTLP export retries."""
+
+# pylint: disable=protected-access
+# Justification: Unit tests seed the policy's random generator
+
+import email.utils
+import time
+from typing import Any, List, Optional
+from unittest.mock import Mock
+
+import pytest
+import requests
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SpanExportResult
+
+from honeyhive.tracer.processing.otlp_exporter import (
+    HoneyHiveOTLPExporter,
+    OTLPJSONExporter,
+)
+from honeyhive.tracer.processing.otlp_retry import (
+    ExportRetryPolicy,
+    RetryBudget,
+    parse_retry_after,
+)
+
+TEST_ENDPOINT = "https://test.example.com/opentelemetry/v1/traces"
+
+
+def _response(status: int, retry_after: Optional[str] = None) -> Mock:
+    response = Mock(status_code=status, text="")
+    response.headers = {"Retry-After": retry_after} if retry_after else {}
+    return response
+
+
+class Sender:
+    """Answers attempts with canned responses or errors, recording timeouts."""
+
+    def __init__(self, *results: Any) -> None:
+        self.results = list(results)
+        self.timeouts: List[Optional[float]] = []
+
+    def __call__(self, timeout: Optional[float]) -> Any:
+        self.timeouts.append(timeout)
+        result = self.results.pop(0) if self.results else _response(200)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _policy(**kwargs: Any) -> ExportRetryPolicy:
+    kwargs.setdefault("base_delay", 0.001)
+    kwargs.setdefault("max_delay", 0.005)
+    policy = ExportRetryPolicy(**kwargs)
+    policy._random.seed(0)
+    return policy
+
+
+class TestParseRetryAfter:
+    """Retry-After accepts delta-seconds and HTTP dates."""
+
+    def test_seconds(self) -> None:
+        assert parse_retry_after("2") == 2.0
+        assert parse_retry_after(" 0.5 ") == 0.5
+
+    def test_http_date(self) -> None:
+        header = email.utils.formatdate(time.time() + 30, usegmt=True)
+
+        delay = parse_retry_after(header)
+
+        assert delay is not None and 25 < delay <= 30
+
+    @pytest.mark.parametrize("value", [None, "", "soon", Mock()])
+    def test_invalid(self, value: Any) -> None:
+        assert parse_retry_after(value) is None
+
+
+class TestExportRetryPolicy:
+    """Transient failures are retried within attempts, deadline and budget."""
+
+    def test_recovers_after_retryable_status_and_errors(self) -> None:
+        policy = _policy()
+        sender = Sender(_response(503), requests.ConnectionError("reset"))
+
+        response = policy.call(sender, 10.0)
+
+        assert response.status_code == 200
+        stats = policy.get_stats()
+        assert stats["attempts"] == 3
+        assert stats["retries"] == 2
+        assert stats["outcomes"]["recovered"] == 1
+
+    def test_non_retryable_status_is_returned(self) -> None:
+        policy = _policy()
+        sender = Sender(_response(413))
+
+        assert policy.call(sender, None).status_code == 413
+        assert policy.get_stats()["outcomes"]["non_retryable"] == 1
+        assert len(sender.timeouts) == 1
+
+    def test_exhausted_attempts_raise_last_error(self) -> None:
+        policy = _policy(max_attempts=2)
+        sender = Sender(requests.Timeout("t1"), requests.Timeout("t2"))
+
+        with pytest.raises(requests.Timeout, match="t2"):
+            policy.call(sender, None)
+        assert policy.get_stats()["outcomes"]["exhausted"] == 1
+
+    def test_other_errors_are_not_retried(self) -> None:
+        policy = _policy()
+
+        with pytest.raises(ValueError):
+            policy.call(Sender(ValueError("bad")), None)
+        assert policy.get_stats()["attempts"] == 1
+
+    def test_retry_after_past_deadline_stops(self) -> None:
+        policy = _policy(deadline=1.0)
+        sender = Sender(_response(429, retry_after="5"))
+
+        assert policy.call(sender, 30.0).status_code == 429
+        stats = policy.get_stats()
+        assert stats["outcomes"]["deadline_exceeded"] == 1
+        assert stats["retries"] == 0
+        # The request timeout is capped at the time left in the deadline
+        assert sender.timeouts[0] is not None and sender.timeouts[0] <= 1.0
+
+    def test_retry_after_is_honoured(self) -> None:
+        policy = _policy(deadline=5.0)
+        sender = Sender(_response(503, retry_after="0.05"))
+
+        start = time.monotonic()
+        policy.call(sender, None)
+
+        assert time.monotonic() - start >= 0.05
+        assert policy.get_stats()["retry_after_honoured"] == 1
+
+    def test_budget_limits_retries_during_outage(self) -> None:
+        policy = _policy(max_attempts=3, budget_ratio=0.1, budget_min_retries=2)
+
+        for _ in range(10):
+            policy.call(Sender(*[_response(503)] * 3), None)
+
+        stats = policy.get_stats()
+        # 2 burst tokens plus 10 x 0.1 earned: at most 3 retries
+        assert stats["retries"] <= 3
+        assert stats["outcomes"]["budget_exhausted"] >= 8
+
+    def test_cancel_interrupts_backoff(self) -> None:
+        policy = _policy(base_delay=10.0, max_delay=10.0, deadline=60.0)
+        policy.cancel()
+
+        assert policy.call(Sender(_response(502)), None).status_code == 502
+        assert policy.get_stats()["outcomes"]["cancelled"] == 1
+
+    def test_budget_refills_on_deposit(self) -> None:
+        budget = RetryBudget(ratio=0.5, min_retries=1)
+
+        assert budget.withdraw() is True
+        assert budget.withdraw() is False
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw() is True
+
+
+class TestExporterRetries:
+    """The JSON exporter retries POSTs through its policy."""
+
+    def test_json_exporter_retries_post(self) -> None:
+        session = Mock()
+        session.post.side_effect = [_response(503), _response(200)]
+        exporter = OTLPJSONExporter(
+            TEST_ENDPOINT, session=session, retry_policy=_policy()
+        )
+        span = TracerProvider().get_tracer("test").start_span("step")
+        span.end()
+
+        assert exporter.export([span]) == SpanExportResult.SUCCESS  # type: ignore[list-item]
+        assert session.post.call_count == 2
+        assert exporter.get_retry_stats()["outcomes"]["recovered"] == 1  # type: ignore[index]
+
+    def test_honeyhive_exporter_builds_policy(self) -> None:
+        exporter = HoneyHiveOTLPExporter(
+            session=Mock(),
+            endpoint=TEST_ENDPOINT,
+            retry_max_attempts=3,
+            retry_deadline=12.0,
+        )
+
+        stats = exporter.get_session_stats()
+
+        assert stats["retry"]["max_attempts"] == 3
+        policy = exporter._otlp_exporter._retry_policy  # type: ignore[union-attr]
+        assert policy.deadline == 12.0
@@ -0,0 +1,312 @@
+"""Unit tests for the on-disk OTLP export spool and its replayer."""
+
+# pylint: disable=protected-access
+# Justification: Unit tests inspect spool segments and counters
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from honeyhive.tracer.processing.otlp_spool import (
+    ExportSpool,
+    SpoolReplayer,
+    is_retryable_status,
+)
+
+
+class RecordingSender:
+    """Spool sender that records bodies and answers with canned statuses."""
+
+    def __init__(self, *statuses: int) -> None:
+        self.statuses = list(statuses)
+        self.sent: List[Tuple[bytes, Optional[str]]] = []
+
+    def __call__(self, body: bytes, content_encoding: Optional[str]) -> int:
+        self.sent.append((body, content_encoding))
+        return self.statuses.pop(0) if self.statuses else 200
+
+
+def _open_spool(directory: Path, **kwargs: object) -> ExportSpool:
+    spool = ExportSpool(str(directory), **kwargs)  # type: ignore[arg-type]
+    assert spool.open()
+    return spool
+
+
+def _segment_files(directory: Path) -> List[Path]:
+    return sorted(directory.glob("segment-*.log"))
+
+
+class TestIsRetryableStatus:
+    """Only throttling, timeouts and server errors are retried."""
+
+    @pytest.mark.parametrize("status", [408, 429, 500, 502, 503])
+    def test_retryable(self, status: int) -> None:
+        assert is_retryable_status(status)
+
+    @pytest.mark.parametrize("status", [400, 401, 403, 404, 413])
+    def test_not_retryable(self, status: int) -> None:
+        assert not is_retryable_status(status)
+
+
+class TestExportSpoolReplay:
+    """Spooled bodies are replayed in order, exactly as stored."""
+
+    def test_replays_bodies_in_order_and_deletes_segments(self, tmp_path: Path) -> None:
+        spool = _open_spool(tmp_path)
+        spool.append(b"first", "gzip")
+        spool.append(b"second", None)
+        sender = RecordingSender()
+
+        assert spool.replay(sender) is True
+
+        assert sender.sent == [(b"first", "gzip"), (b"second", None)]
+        assert not spool.has_pending()
+        assert _segment_files(tmp_path) == []
+        stats = spool.get_stats()
+        assert stats["replayed_batches"] == 2
+        assert stats["replayed_bytes"] == len(b"first") + len(b"second")
+        spool.close()
+
+    def test_duplicate_batches_are_stored_once(self, tmp_path: Path) -> None:
+        spool = _open_spool(tmp_path)
+
+        assert spool.append(b"payload")
+        assert spool.append(b"payload")
+
+        assert spool.get_stats()["pending_batches"] == 1
+        assert spool.get_stats()["deduplicated_batches"] == 1
+        spool.close()
+
+    def test_retryable_failure_stops_replay(self, tmp_path: Path) -> None:
+        spool = _open_spool(tmp_path)
+        spool.append(b"one")
+        spool.append(b"two")
+        sender = RecordingSender(503)
+
+        assert spool.replay(sender) is False
+
+        assert sender.sent == [(b"one", None)]
+        assert spool.get_stats()["pending_batches"] == 2
+        assert spool.get_stats()["replay_failures"] == 1
+        spool.close()
+
+    def test_send_exception_stops_replay(self, tmp_path: Path) -> None:
+        spool = _open_spool(tmp_path)
+        spool.append(b"one")
+
+        def failing_send(body: bytes, content_encoding: Optional[str]) -> int:
+            raise ConnectionError("unreachable")
+
+        assert spool.replay(failing_send) is False
+        assert spool.has_pending()
+        spool.close()
+
+    def test_non_retryable_rejection_discards_batch(self, tmp_path: Path) -> None:
+        spool = _open_spool(tmp_path)
+        spool.append(b"bad")
+        spool.append(b"good")
+        sender = RecordingSender(400, 200)
+
+        assert spool.replay(sender) is True
+
+        assert len(sender.sent) == 2
+        assert spool.get_stats()["rejected_batches"] == 1
+        assert spool.get_stats()["replayed_batches"] == 1
+        spool.close()
+
+    def test_expired_batches_are_not_sent(self, tmp_path: Path) -> None:
+        spool = _open_spool(tmp_path, max_age_seconds=60)
+        spool.append(b"old")
+        sender = RecordingSender()
+
+        with patch(
+            "honeyhive.tracer.processing.otlp_spool.time.time",
+            return_value=os.path.getmtime(_segment_files(tmp_path)[0]) + 3600,
+        ):
+            assert spool.replay(sender) is True
+
+        assert sender.sent == []
+        assert spool.get_stats()["expired_batches"] == 1
+        spool.close()
+
+    def test_concurrent_replays_send_each_batch_once(self, tmp_path: Path) -> None:
+        spool = _open_spool(tmp_path)
+        spool.append(b"one")
+        spool.append(b"two")
+        sending = threading.Event()
+        release = threading.Event()
+        sent: List[bytes] = []
+
+        def slow_send(body: bytes, content_encoding: Optional[str]) -> int:
+            sending.set()
+            release.wait(5)
+            sent.append(body)
+            return 200
+
+        background = threading.Thread(target=spool.replay, args=(slow_send,))
+        background.start()
+        assert sending.wait(5)
+        second = threading.Thread(target=spool.replay, args=(slow_send,))
+        second.start()
+        release.set()
+        background.join(5)
+        second.join(5)
+
+        assert sent == [b"one", b"two"]
+        assert not spool.has_pending()
+        spool.close()
+
+    def test_replay_with_deadline_gives_up_while_another_runs(
+        self, tmp_path: Path
+    ) -> None:
+        spool = _open_spool(tmp_path)
+        spool.append(b"queued")
+        sending = threading.Event()
+        release = threading.Event()
+
+        def blocking_send(body: bytes, content_encoding: Optional[str]) -> int:
+            sending.set()
+            release.wait(5)
+            return 200
+
+        background = threading.Thread(target=spool.replay, args=(blocking_send,))
+        background.start()
+        try:
+            assert sending.wait(5)
+            sender = RecordingSender()
+
+            assert spool.replay(sender, deadline=time.monotonic() + 0.05) is False
+            assert sender.sent == []
+        finally:
+            release.set()
+            background.join(5)
+        assert not spool.has_pending()
+        spool.close()
+
+
+class TestExportSpoolCaps:
+    """The spool stays within its size cap by evicting the oldest segments."""
+
+    def test_oldest_segments_evicted_at_size_cap(self, tmp_path: Path) -> None:
+        body_size = 1000
+        spool = _open_spool(tmp_path, max_bytes=3500, segment_max_bytes=1100)
+        for i in range(5):
+            assert spool.append(bytes([i]) * body_size)
+
+        sender = RecordingSender()
+        spool.replay(sender)
+
+        stats = spool.get_stats()
+        assert stats["evicted_batches"] == 2
+        assert [body[0] for body, _ in sender.sent] == [2, 3, 4]
+        spool.close()
+
+    def test_body_larger_than_cap_is_rejected(self, tmp_path: Path) -> None:
+        spool = _open_spool(tmp_path, max_bytes=100)
+
+        assert spool.append(b"x" * 200) is False
+        assert not spool.has_pending()
+        spool.close()
+
+
+class TestExportSpoolCrashSafety:
+    """Spooled batches survive restarts; delivered ones are not resent."""
+
+    def test_pending_batches_recovered_after_restart(self, tmp_path: Path) -> None:
+        spool = _open_spool(tmp_path)
+        spool.append(b"survivor", "zstd")
+        spool.close()
+
+        recovered = _open_spool(tmp_path)
+        sender = RecordingSender()
+
+        assert recovered.has_pending()
+        assert recovered.replay(sender) is True
+        assert sender.sent == [(b"survivor", "zstd")]
+        recovered.close()
+
+    def test_acknowledged_batches_not_replayed_after_restart(
+        self, tmp_path: Path
+    ) -> None:
+        spool = _open_spool(tmp_path)
+        spool.append(b"delivered")
+        spool.append(b"undelivered")
+        spool.replay(RecordingSender(200, 503))
+        spool.close()
+
+        recovered = _open_spool(tmp_path)
+        sender = RecordingSender()
+        recovered.replay(sender)
+
+        assert sender.sent == [(b"undelivered", None)]
+        recovered.close()
+
+    def test_torn_record_is_ignored(self, tmp_path: Path) -> None:
+        spool = _open_spool(tmp_path)
+        spool.append(b"complete")
+        spool.append(b"torn-by-crash")
+        spool.close()
+        segment = _segment_files(tmp_path)[0]
+        with open(segment, "r+b") as handle:
+            handle.truncate(segment.stat().st_size - 3)
+
+        recovered = _open_spool(tmp_path)
+        sender = RecordingSender()
+        recovered.replay(sender)
+
+        assert sender.sent == [(b"complete", None)]
+        assert recovered.get_stats()["corrupt_records"] == 1
+        recovered.close()
+
+    def test_directory_is_locked_to_one_process(self, tmp_path: Path) -> None:
+        pytest.importorskip("fcntl")
+        spool = _open_spool(tmp_path)
+
+        other = ExportSpool(str(tmp_path))
+
+        assert other.open() is False
+        assert other.append(b"data") is False
+        spool.close()
+        assert other.open() is True
+        other.close()
+
+
+class TestSpoolReplayer:
+    """The background replayer drains the spool when notified."""
+
+    def test_notify_drains_spool(self, tmp_path: Path) -> None:
+        spool = _open_spool(tmp_path)
+        spool.append(b"queued")
+        delivered = threading.Event()
+
+        def send(body: bytes, content_encoding: Optional[str]) -> int:
+            delivered.set()
+            return 200
+
+        replayer = SpoolReplayer(spool, send, initial_backoff=30, max_backoff=30)
+        replayer.start()
+        try:
+            replayer.notify()
+            assert delivered.wait(5)
+        finally:
+            replayer.stop()
+            spool.close()
+
+        assert not spool.has_pending()
+
+    def test_stop_is_prompt(self, tmp_path: Path) -> None:
+        spool = _open_spool(tmp_path)
+        replayer = SpoolReplayer(
+            spool, RecordingSender(), initial_backoff=60, max_backoff=60
+        )
+        replayer.start()
+
+        replayer.stop(timeout=5)
+
+        assert replayer._thread is None
+        spool.close()
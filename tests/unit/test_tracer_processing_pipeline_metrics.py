@@ -0,0 +1,260 @@
+"""Unit tests for export pipeline metrics."""
+
+import itertools
+import os
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List
+from unittest.mock import Mock, patch
+
+from click.testing import CliRunner
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SpanExportResult
+
+from honeyhive.cli.main import watch
+from honeyhive.tracer.core.context import TracerContextMixin
+from honeyhive.tracer.processing.batch_processor import HoneyHiveBatchSpanProcessor
+from honeyhive.tracer.processing.export_hub import SharedExportChannel
+from honeyhive.tracer.processing.otlp_exporter import OTLPJSONExporter
+from honeyhive.tracer.processing.pipeline_metrics import (
+    LATENCY_BUCKETS,
+    Counter,
+    Histogram,
+    PipelineMetrics,
+    pipeline_metrics_for,
+)
+from honeyhive.tracer.processing.pipeline_status import PipelineStatusPublisher
+
+TEST_ENDPOINT = "https://test.example.com/opentelemetry/v1/traces"
+
+
+def _spans(count: int) -> List[Any]:
+    tracer = TracerProvider().get_tracer("test")
+    spans = []
+    for index in range(count):
+        span = tracer.start_span(f"step-{index}")
+        span.end()
+        spans.append(span)
+    return spans
+
+
+class TestCounterAndHistogram:
+    """Per-thread recording and snapshots."""
+
+    def test_counter_sums_across_threads(self) -> None:
+        counter = Counter()
+
+        def work() -> None:
+            for _ in range(1000):
+                counter.add()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.add(5)
+
+        # Cells of the exited threads are retired and still counted
+        assert counter.value == 8005
+        assert counter.value == 8005
+
+    def test_histogram_percentiles(self) -> None:
+        histogram = Histogram((1, 2, 5, 10))
+        for value in [0.5] * 50 + [1.5] * 40 + [8] * 9 + [20]:
+            histogram.record(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot["count"] == 100
+        assert snapshot["max"] == 20
+        assert snapshot["sum"] == 25 + 60 + 72 + 20
+        assert 0 < snapshot["p50"] <= 1
+        assert 1 < snapshot["p90"] <= 2
+        assert 5 < snapshot["p99"] <= 10
+        assert snapshot["buckets"] == [[1, 50], [2, 40], [5, 0], [10, 9], ["+Inf", 1]]
+
+    def test_empty_histogram(self) -> None:
+        snapshot = Histogram(LATENCY_BUCKETS).snapshot()
+
+        assert snapshot["count"] == 0
+        assert snapshot["p50"] is None
+
+
+class TestPipelineMetrics:
+    """Registry lookups, gauges and OpenTelemetry export."""
+
+    def test_snapshot_includes_gauges(self) -> None:
+        metrics = PipelineMetrics()
+        metrics.counter("a").add(2)
+        metrics.histogram("h", (1,)).record(0.5)
+        metrics.register_gauge("queue", lambda: {"queue_size": 3})
+        metrics.register_gauge("broken", Mock(side_effect=RuntimeError("boom")))
+
+        snapshot = metrics.snapshot()
+
+        assert metrics.counter("a") is metrics.counter("a")
+        assert snapshot["counters"] == {"a": 2}
+        assert snapshot["histograms"]["h"]["count"] == 1
+        assert snapshot["gauges"]["queue"] == {"queue_size": 3}
+        assert snapshot["gauges"]["broken"] == {"error": "boom"}
+
+    def test_registry_is_taken_from_tracer(self) -> None:
+        metrics = PipelineMetrics()
+
+        assert pipeline_metrics_for(SimpleNamespace(_pipeline_metrics=metrics)) is (
+            metrics
+        )
+        assert isinstance(pipeline_metrics_for(Mock()), PipelineMetrics)
+
+    def test_register_otel_instruments(self) -> None:
+        metrics = PipelineMetrics()
+        metrics.counter("exporter.request_errors").add(3)
+        metrics.histogram("exporter.http_seconds", LATENCY_BUCKETS).record(0.02)
+        metrics.register_gauge("queue", lambda: {"queue_size": 7, "policy": "x"})
+        reader = InMemoryMetricReader()
+        provider = MeterProvider(metric_readers=[reader])
+
+        tracer = SimpleNamespace(_pipeline_metrics=metrics)
+        created = TracerContextMixin.export_pipeline_metrics(
+            tracer,
+            meter_provider=provider,  # type: ignore[arg-type]
+        )
+
+        points = {}
+        data = reader.get_metrics_data()
+        for resource_metrics in data.resource_metrics:  # type: ignore[union-attr]
+            for scope_metrics in resource_metrics.scope_metrics:
+                for metric in scope_metrics.metrics:
+                    for point in metric.data.data_points:
+                        key = (metric.name, tuple(sorted(point.attributes.items())))
+                        points[key] = point.value
+        assert created == 4
+        assert points[("honeyhive.pipeline.exporter.request_errors", ())] == 3
+        assert points[("honeyhive.pipeline.exporter.http_seconds.count", ())] == 1
+        assert points[("honeyhive.pipeline.queue", (("key", "queue_size"),))] == 7
+        assert (
+            "honeyhive.pipeline.exporter.http_seconds",
+            (("quantile", "p99"),),
+        ) in points
+
+
+class TestPipelineRecording:
+    """The batch processor and the exporter record into the registry."""
+
+    def test_batch_processor_records_batches(self) -> None:
+        metrics = PipelineMetrics()
+        exporter = Mock()
+        exporter.export.return_value = SpanExportResult.SUCCESS
+        processor = HoneyHiveBatchSpanProcessor(
+            exporter, batch_size=5, export_workers=1, metrics=metrics
+        )
+        for span in _spans(5):
+            processor.on_end(span)
+        assert processor.force_flush(5000)
+        processor.shutdown()
+
+        histograms = metrics.snapshot()["histograms"]
+        assert histograms["batch.spans"]["sum"] == 5
+        assert histograms["batch.export_seconds"]["count"] >= 1
+
+    def test_json_exporter_records_requests(self) -> None:
+        metrics = PipelineMetrics()
+        session = Mock()
+        session.post.side_effect = [Mock(status_code=200, text=""), OSError("down")]
+        exporter = OTLPJSONExporter(TEST_ENDPOINT, session=session, metrics=metrics)
+
+        exporter.export(_spans(2))
+        exporter.export(_spans(1))
+
+        snapshot = metrics.snapshot()
+        assert snapshot["counters"]["exporter.responses_2xx"] == 1
+        assert snapshot["counters"]["exporter.request_errors"] == 1
+        assert snapshot["histograms"]["exporter.http_seconds"]["count"] == 2
+        assert snapshot["histograms"]["exporter.serialize_seconds"]["count"] == 2
+        assert snapshot["histograms"]["exporter.request_bytes"]["count"] == 2
+
+    def test_tracer_without_registry(self) -> None:
+        assert TracerContextMixin.get_pipeline_stats(SimpleNamespace()) == {  # type: ignore[arg-type]
+            "counters": {},
+            "histograms": {},
+            "gauges": {},
+        }
+
+
+class TestSharedPipelineStats:
+    """`get_pipeline_stats()` of a tracer on a shared export hub."""
+
+    def test_hub_metrics_are_included(self) -> None:
+        own = PipelineMetrics()
+        own.counter("processor.spans").add(2)
+        own.register_gauge("queue", lambda: {"pending_spans": 1})
+        hub = SimpleNamespace(metrics=PipelineMetrics())
+        hub.metrics.histogram("exporter.http_seconds", LATENCY_BUCKETS).record(0.02)
+        hub.metrics.register_gauge("queue", lambda: {"queue_size": 3})
+        tracer = SimpleNamespace(
+            _pipeline_metrics=own,
+            otlp_exporter=SharedExportChannel(hub),  # type: ignore[arg-type]
+        )
+
+        stats = TracerContextMixin.get_pipeline_stats(tracer)  # type: ignore[arg-type]
+
+        assert stats["counters"] == {"processor.spans": 2}
+        assert stats["histograms"]["exporter.http_seconds"]["count"] == 1
+        assert stats["gauges"]["queue"] == {"pending_spans": 1}
+
+
+class TestMonitorWatchPipeline:
+    """`honeyhive monitor watch` shows pipeline metrics published by processes."""
+
+    @patch("honeyhive.tracer.registry.get_all_tracers")
+    @patch("honeyhive.cli.main.get_global_pool")
+    @patch("honeyhive.cli.main.get_global_cache")
+    @patch("honeyhive.cli.main.time.sleep")
+    def test_watch_shows_pipeline(
+        self,
+        _mock_sleep: Mock,
+        mock_get_cache: Mock,
+        mock_get_pool: Mock,
+        mock_get_all_tracers: Mock,
+        tmp_path: Path,
+    ) -> None:
+        mock_get_cache.return_value.get_stats.return_value = {
+            "size": 1,
+            "max_size": 10,
+            "hit_rate": 0.5,
+            "hits": 1,
+            "misses": 1,
+        }
+        mock_get_pool.return_value.get_stats.return_value = {
+            "total_requests": 1,
+            "pool_hits": 1,
+            "pool_misses": 0,
+            "active_connections": 1,
+        }
+        metrics = PipelineMetrics()
+        metrics.histogram("exporter.http_seconds", LATENCY_BUCKETS).record(0.02)
+        metrics.register_gauge(
+            "queue", lambda: {"queue_size": 4, "max_queue_size": 8, "dropped_spans": 2}
+        )
+        tracer = SimpleNamespace(project_name="demo", _pipeline_metrics=metrics)
+        tracer.get_pipeline_stats = lambda: TracerContextMixin.get_pipeline_stats(
+            tracer  # type: ignore[arg-type]
+        )
+        mock_get_all_tracers.return_value = [tracer]
+        assert PipelineStatusPublisher(str(tmp_path)).publish()
+
+        clock = itertools.chain([0, 0, 0], itertools.repeat(100))
+        with patch("honeyhive.cli.main.time.time", side_effect=clock):
+            result = CliRunner().invoke(
+                watch, ["--duration", "1", "--status-dir", str(tmp_path)]
+            )
+
+        assert "Export Pipeline:" in result.output
+        assert f"Process {os.getpid()}" in result.output
+        assert "Tracer: demo" in result.output
+        assert "Queue: 4/8, Dropped: 2" in result.output
+        assert "HTTP: 1 requests" in result.output
@@ -0,0 +1,125 @@
+"""Unit tests for the published export pipeline status."""
+
+import json
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from honeyhive.tracer.processing.export_hub import SharedExportChannel
+from honeyhive.tracer.processing.pipeline_status import (
+    PipelineStatusPublisher,
+    read_pipeline_status,
+    start_status_publisher,
+    tracer_pipeline_status,
+)
+
+CIRCUIT = {"state": "closed", "consecutive_failures": 0}
+
+
+class TestTracerPipelineStatus:
+    """What is published for one tracer."""
+
+    def test_shared_channel_reports_hub_circuit(self) -> None:
+        hub = Mock()
+        hub.exporter.get_circuit_stats.return_value = CIRCUIT
+        tracer = SimpleNamespace(
+            _tracer_id="t1",
+            project_name="demo",
+            otlp_exporter=SharedExportChannel(hub),
+            get_pipeline_stats=lambda: {"counters": {"spans": 1}},
+        )
+
+        status = tracer_pipeline_status(tracer)
+
+        assert status == {
+            "tracer_id": "t1",
+            "project": "demo",
+            "exporter": "SharedExportChannel",
+            "circuit": CIRCUIT,
+            "pipeline": {"counters": {"spans": 1}},
+        }
+
+    def test_exporter_without_circuit(self) -> None:
+        tracer = SimpleNamespace(otlp_exporter=Mock(spec=["get_session_stats"]))
+
+        status = tracer_pipeline_status(tracer)
+
+        assert status["circuit"] is None
+        assert status["pipeline"] is None
+
+
+class TestPipelineStatusPublisher:
+    """Writing and reading status files."""
+
+    @patch("honeyhive.tracer.registry.get_all_tracers")
+    def test_publish_and_read(self, mock_get_all_tracers: Mock, tmp_path: Path) -> None:
+        mock_get_all_tracers.return_value = [SimpleNamespace(project_name="demo")]
+        publisher = PipelineStatusPublisher(str(tmp_path), interval=5.0)
+
+        assert publisher.publish()
+        (status,) = read_pipeline_status(str(tmp_path))
+
+        assert status["pid"] == os.getpid()
+        assert status["stale"] is False
+        assert status["pipelines"][0]["project"] == "demo"
+        assert not list(tmp_path.glob("*.tmp"))
+
+    @patch("honeyhive.tracer.registry.get_all_tracers")
+    def test_file_removed_without_tracers(
+        self, mock_get_all_tracers: Mock, tmp_path: Path
+    ) -> None:
+        mock_get_all_tracers.return_value = [SimpleNamespace()]
+        publisher = PipelineStatusPublisher(str(tmp_path))
+        publisher.publish()
+
+        mock_get_all_tracers.return_value = []
+
+        assert not publisher.publish()
+        assert not os.path.exists(publisher.path)
+
+    def test_read_skips_exited_processes_and_marks_stale(self, tmp_path: Path) -> None:
+        exited = tmp_path / "999999999.json"
+        exited.write_text(json.dumps({"pid": 999999999, "pipelines": []}))
+        (tmp_path / f"{os.getpid()}.json").write_text(
+            json.dumps(
+                {
+                    "pid": os.getpid(),
+                    "updated_at": time.time() - 60,
+                    "interval": 5.0,
+                    "pipelines": [],
+                }
+            )
+        )
+        (tmp_path / "broken.json").write_text("{")
+
+        statuses = read_pipeline_status(str(tmp_path))
+
+        assert [status["pid"] for status in statuses] == [os.getpid()]
+        assert statuses[0]["stale"] is True
+        assert not exited.exists()
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        assert read_pipeline_status(str(tmp_path / "missing")) == []
+
+    @patch("honeyhive.tracer.registry.get_all_tracers")
+    def test_start_publishes_in_background(
+        self, mock_get_all_tracers: Mock, tmp_path: Path
+    ) -> None:
+        mock_get_all_tracers.return_value = [SimpleNamespace()]
+
+        with patch("honeyhive.tracer.processing.pipeline_status._PUBLISHER", None):
+            assert start_status_publisher(str(tmp_path), interval=0) is None
+            publisher = start_status_publisher(str(tmp_path), interval=0.05)
+            assert publisher is not None
+            try:
+                assert start_status_publisher(str(tmp_path / "other")) is publisher
+                deadline = time.monotonic() + 2.0
+                while not os.path.exists(publisher.path):
+                    assert time.monotonic() < deadline
+                    time.sleep(0.01)
+            finally:
+                publisher.stop()
+
+        assert not os.path.exists(publisher.path)
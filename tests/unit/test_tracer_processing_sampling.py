@@ -0,0 +1,204 @@
+"""Unit tests for session-level head and tail sampling."""
+
+# pylint: disable=protected-access
+# Justification: Unit tests age buffers to exercise the decision wait
+
+from typing import Any, Dict, Optional
+from unittest.mock import Mock
+
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.trace import Status, StatusCode, set_span_in_context
+
+from honeyhive.tracer.processing.sampling import (
+    SpanSampler,
+    create_span_sampler,
+    session_sampled,
+)
+from honeyhive.tracer.processing.span_processor import HoneyHiveSpanProcessor
+from honeyhive.utils.dotdict import DotDict
+
+_tracer = TracerProvider().get_tracer("honeyhive-test")
+
+
+def _span(
+    attributes: Optional[Dict[str, Any]] = None,
+    parent: Any = None,
+    error: bool = False,
+    duration_ns: int = 1_000_000,
+) -> ReadableSpan:
+    context = set_span_in_context(parent) if parent is not None else None
+    span = _tracer.start_span(
+        "step", context=context, attributes=attributes, start_time=1_000
+    )
+    if error:
+        span.set_status(Status(StatusCode.ERROR))
+    span.end(end_time=1_000 + duration_ns)
+    return span  # type: ignore[return-value]
+
+
+def _session_with(ratio: float, sampled: bool) -> str:
+    """Find a session id that head sampling keeps or drops."""
+    for i in range(1000):
+        session_id = f"session-{i}"
+        if session_sampled(session_id, ratio) is sampled:
+            return session_id
+    raise AssertionError("no matching session id")
+
+
+class TestHeadSampling:
+    """Ratio-based sampling keyed by session id."""
+
+    def test_decision_is_deterministic_per_session(self) -> None:
+        assert all(
+            session_sampled("abc", 0.5) == session_sampled("abc", 0.5)
+            for _ in range(10)
+        )
+        assert session_sampled("abc", 1.0) is True
+        assert session_sampled("abc", 0.0) is False
+
+    def test_ratio_is_respected(self) -> None:
+        kept = sum(session_sampled(f"s{i}", 0.25) for i in range(4000))
+
+        assert 800 < kept < 1200
+
+    def test_spans_of_dropped_session_are_counted(self) -> None:
+        sampler = SpanSampler(0.5)
+        kept_id = _session_with(0.5, True)
+        dropped_id = _session_with(0.5, False)
+
+        assert len(sampler.on_end(_span(), kept_id)) == 1
+        assert sampler.on_end(_span(), dropped_id) == []
+        stats = sampler.get_stats()
+        assert stats["kept_spans"] == 1
+        assert stats["dropped_spans"] == 1
+
+
+class TestTailSampling:
+    """Buffered sessions are kept whole when they turn out to be interesting."""
+
+    def test_error_in_later_turn_keeps_earlier_turns(self) -> None:
+        sampler = SpanSampler(0.0, tail_sampling=True)
+        turns = [_span(), _span()]
+
+        # Each clean turn is its own root trace; it stays buffered
+        assert all(sampler.on_end(turn, "s1") == [] for turn in turns)
+        failing = _span(error=True)
+        released = sampler.on_end(failing, "s1")
+
+        assert released == [*turns, failing]
+        stats = sampler.get_stats()
+        assert stats["tail_kept_sessions"] == 1
+        assert stats["tail_dropped_sessions"] == 0
+        # Later spans of a kept session skip the buffer
+        assert len(sampler.on_end(_span(), "s1")) == 1
+
+    def test_uninteresting_session_is_dropped_after_wait(self) -> None:
+        sampler = SpanSampler(0.0, tail_sampling=True, decision_wait=30)
+
+        assert sampler.on_end(_span(), "s1") == []
+        assert sampler.get_stats()["buffered_spans"] == 1
+        sampler._buffers["s1"].started_at -= 60
+        # The drop is remembered: a later error does not revive the session
+        assert sampler.on_end(_span(error=True), "s1") == []
+
+        stats = sampler.get_stats()
+        assert stats["tail_dropped_sessions"] == 1
+        assert stats["tail_kept_sessions"] == 0
+        assert stats["dropped_spans"] == 2
+        assert stats["buffered_spans"] == 0
+
+    def test_slow_span_and_event_type_keep_session(self) -> None:
+        sampler = SpanSampler(
+            0.0, tail_sampling=True, slow_span_ms=10, keep_event_types=["model"]
+        )
+
+        slow = sampler.on_end(_span(duration_ns=20_000_000), "slow")
+        model = sampler.on_end(_span({"honeyhive_event_type": "model"}), "model")
+
+        assert len(slow) == 1
+        assert len(model) == 1
+
+    def test_oldest_session_dropped_at_capacity(self) -> None:
+        sampler = SpanSampler(0.0, tail_sampling=True, max_buffered_spans=2)
+        sampler.on_end(_span(), "old")
+        sampler.on_end(_span(), "new")
+
+        sampler.on_end(_span(), "newest")
+
+        assert list(sampler._buffers) == ["new", "newest"]
+        assert sampler.get_stats()["tail_dropped_sessions"] == 1
+
+    def test_close_drops_undecided_sessions(self) -> None:
+        sampler = SpanSampler(0.0, tail_sampling=True)
+        sampler.on_end(_span(), "s1")
+        sampler.on_end(_span(), "s2")
+
+        sampler.close()
+
+        stats = sampler.get_stats()
+        assert stats["tail_dropped_sessions"] == 2
+        assert stats["buffered_spans"] == 0
+
+
+class TestSamplerConfig:
+    """Sampler construction from the tracer config."""
+
+    def test_disabled_at_full_ratio(self) -> None:
+        tracer = Mock()
+        tracer.config = DotDict({"sampling_ratio": 1.0})
+
+        assert create_span_sampler(tracer) is None
+
+    def test_reads_tail_settings(self) -> None:
+        tracer = Mock()
+        tracer.config = DotDict(
+            {
+                "sampling_ratio": 0.1,
+                "tail_sampling": True,
+                "tail_sampling_slow_span_ms": 250.0,
+                "tail_sampling_event_types": "model,chain",
+                "tail_sampling_decision_wait": 5.0,
+            }
+        )
+
+        sampler = create_span_sampler(tracer)
+
+        assert sampler is not None
+        assert sampler.ratio == 0.1
+        assert sampler.tail_sampling is True
+        assert sampler.slow_span_ns == 250_000_000
+        assert sampler.keep_event_types == {"model", "chain"}
+        assert sampler.decision_wait == 5.0
+
+    def test_span_processor_drops_unsampled_sessions(self) -> None:
+        tracer = Mock()
+        tracer.config = DotDict({"sampling_ratio": 0.5})
+        exporter = Mock()
+        processor = HoneyHiveSpanProcessor(
+            otlp_exporter=exporter, disable_batch=True, tracer_instance=tracer
+        )
+
+        for sampled in (True, False):
+            session_id = _session_with(0.5, sampled)
+            processor.on_end(_span({"honeyhive.session_id": session_id}))
+
+        assert exporter.export.call_count == 1
+        stats = processor.get_sampling_stats()
+        assert stats is not None and stats["dropped_spans"] == 1
+
+    def test_force_flush_keeps_undecided_sessions_buffered(self) -> None:
+        tracer = Mock()
+        tracer.config = DotDict({"sampling_ratio": 0.0, "tail_sampling": True})
+        exporter = Mock()
+        processor = HoneyHiveSpanProcessor(
+            otlp_exporter=exporter, disable_batch=True, tracer_instance=tracer
+        )
+
+        processor.on_end(_span({"honeyhive.session_id": "s1"}))
+        processor.force_flush()
+        processor.on_end(_span({"honeyhive.session_id": "s1"}, error=True))
+
+        exported = [call.args[0] for call in exporter.export.call_args_list]
+        assert sum(len(batch) for batch in exported) == 2
+        stats = processor.get_sampling_stats()
+        assert stats is not None and stats["tail_kept_sessions"] == 1
@@ -25,6 +25,7 @@ from opentelemetry.trace import Status, StatusCode
 
 from honeyhive.tracer.core.tracer import HoneyHiveTracer
 from honeyhive.tracer.processing.span_processor import HoneyHiveSpanProcessor
+from honeyhive.utils.dotdict import DotDict
 
 
 class TestHoneyHiveSpanProcessorInitialization:
@@ -674,6 +675,17 @@ class TestHoneyHiveSpanProcessorEventTypeDetection:
         mock_safe_log.assert_called()
 
 
+def _applied_attributes(mock_span: Mock) -> Dict[str, Any]:
+    """Attributes set on a mock span via set_attributes or set_attribute."""
+    applied: Dict[str, Any] = {}
+    for attributes_call in mock_span.set_attributes.call_args_list:
+        applied.update(attributes_call.args[0])
+    for attribute_call in mock_span.set_attribute.call_args_list:
+        if len(attribute_call.args) == 2:
+            applied[attribute_call.args[0]] = attribute_call.args[1]
+    return applied
+
+
 class TestHoneyHiveSpanProcessorOnStart:
     """Test on_start method functionality with all conditional branches."""
 
@@ -795,11 +807,7 @@ class TestHoneyHiveSpanProcessorOnStart:
 
         processor.on_start(mock_span, mock_context)
 
-        attribute_calls = {
-            call.args[0]: call.args[1]
-            for call in mock_span.set_attribute.call_args_list
-            if len(call.args) == 2
-        }
+        attribute_calls = _applied_attributes(mock_span)
         assert attribute_calls.get("honeyhive.session_auto_create") is True
         assert attribute_calls.get("honeyhive.session_name") == "my-session"
 
@@ -823,11 +831,7 @@ class TestHoneyHiveSpanProcessorOnStart:
 
         processor.on_start(mock_span, mock_context)
 
-        attribute_calls = {
-            call.args[0]: call.args[1]
-            for call in mock_span.set_attribute.call_args_list
-            if len(call.args) == 2
-        }
+        attribute_calls = _applied_attributes(mock_span)
         assert "honeyhive.session_auto_create" not in attribute_calls
 
     @patch("honeyhive.tracer.processing.span_processor.baggage.get_baggage")
@@ -855,11 +859,7 @@ class TestHoneyHiveSpanProcessorOnStart:
 
         processor.on_start(mock_span, mock_context)
 
-        attribute_calls = {
-            call.args[0]: call.args[1]
-            for call in mock_span.set_attribute.call_args_list
-            if len(call.args) == 2
-        }
+        attribute_calls = _applied_attributes(mock_span)
         assert attribute_calls.get("honeyhive.session_auto_create") is True
         assert attribute_calls.get("honeyhive.session_name") == "per-request-name"
 
@@ -882,15 +882,117 @@ class TestHoneyHiveSpanProcessorOnStart:
 
         processor.on_start(mock_span, mock_context)
 
-        attribute_calls = {
-            call.args[0]: call.args[1]
-            for call in mock_span.set_attribute.call_args_list
-            if len(call.args) == 2
-        }
+        attribute_calls = _applied_attributes(mock_span)
         assert attribute_calls.get("honeyhive.session_auto_create") is True
         assert "honeyhive.session_name" not in attribute_calls
 
 
+class TestHoneyHiveSpanProcessorEnrichmentCache:
+    """Cached experiment and baggage enrichment in on_start."""
+
+    @staticmethod
+    def _tracer(experiment_id: str = "exp-1") -> Mock:
+        mock_tracer = Mock(spec=HoneyHiveTracer)
+        mock_tracer.session_id = "tracer-session"
+        mock_tracer.project_name = "tracer-project"
+        mock_tracer.source_environment = "dev"
+        mock_tracer._session_auto_create = False
+        mock_tracer.config = DotDict({"experiment_id": experiment_id})
+        return mock_tracer
+
+    @staticmethod
+    def _span() -> Mock:
+        mock_span = Mock(spec=Span)
+        mock_span.name = "test_span"
+        mock_span.attributes = {}
+        mock_span.get_span_context.return_value = Mock(span_id=12345)
+        return mock_span
+
+    def test_attributes_applied_in_one_call(self) -> None:
+        processor = HoneyHiveSpanProcessor(tracer_instance=self._tracer())
+        mock_span = self._span()
+
+        processor.on_start(mock_span, Context())
+
+        mock_span.set_attributes.assert_called_once()
+        applied = mock_span.set_attributes.call_args.args[0]
+        assert applied["honeyhive.session_id"] == "tracer-session"
+        assert applied["honeyhive.project"] == "tracer-project"
+        assert applied["honeyhive.source"] == "dev"
+        assert applied["honeyhive.experiment_id"] == "exp-1"
+
+    def test_experiment_attributes_rebuilt_when_config_changes(self) -> None:
+        mock_tracer = self._tracer()
+        processor = HoneyHiveSpanProcessor(tracer_instance=mock_tracer)
+
+        with patch.object(
+            processor,
+            "_get_experiment_attributes",
+            wraps=processor._get_experiment_attributes,
+        ) as mock_experiment:
+            processor.on_start(self._span(), Context())
+            processor.on_start(self._span(), Context())
+            assert mock_experiment.call_count == 1
+
+            mock_tracer.config = DotDict({"experiment_id": "exp-2"})
+            mock_span = self._span()
+            processor.on_start(mock_span, Context())
+
+        assert mock_experiment.call_count == 2
+        applied = mock_span.set_attributes.call_args.args[0]
+        assert applied["honeyhive.experiment_id"] == "exp-2"
+
+    def test_invalidate_enrichment_cache(self) -> None:
+        mock_tracer = self._tracer()
+        processor = HoneyHiveSpanProcessor(tracer_instance=mock_tracer)
+        processor.on_start(self._span(), Context())
+
+        mock_tracer.config["experiment_id"] = "exp-2"
+        processor.invalidate_enrichment_cache()
+        mock_span = self._span()
+        processor.on_start(mock_span, Context())
+
+        applied = mock_span.set_attributes.call_args.args[0]
+        assert applied["honeyhive.experiment_id"] == "exp-2"
+
+    @patch("honeyhive.tracer.processing.span_processor.baggage.get_baggage")
+    def test_baggage_attributes_memoized_per_context(
+        self, mock_get_baggage: Mock
+    ) -> None:
+        mock_get_baggage.side_effect = lambda key, ctx: {
+            "session_id": "baggage-session",
+            "run_id": "run-1",
+        }.get(key)
+        processor = HoneyHiveSpanProcessor(tracer_instance=self._tracer())
+        ctx = Context()
+
+        processor.on_start(self._span(), ctx)
+        lookups = mock_get_baggage.call_count
+        mock_span = self._span()
+        processor.on_start(mock_span, ctx)
+
+        assert mock_get_baggage.call_count == lookups
+        applied = mock_span.set_attributes.call_args.args[0]
+        assert applied["honeyhive.session_id"] == "baggage-session"
+        assert applied["honeyhive_metadata.run_id"] == "run-1"
+
+        processor.on_start(self._span(), Context())
+        assert mock_get_baggage.call_count > lookups
+
+    def test_tracer_session_change_is_not_cached(self) -> None:
+        mock_tracer = self._tracer()
+        processor = HoneyHiveSpanProcessor(tracer_instance=mock_tracer)
+        ctx = Context()
+        processor.on_start(self._span(), ctx)
+
+        mock_tracer.session_id = "next-session"
+        mock_span = self._span()
+        processor.on_start(mock_span, ctx)
+
+        applied = mock_span.set_attributes.call_args.args[0]
+        assert applied["honeyhive.session_id"] == "next-session"
+
+
 class TestHoneyHiveSpanProcessorOnEnd:
     """Test on_end method functionality with all conditional branches."""
 
@@ -994,6 +1096,47 @@ class TestHoneyHiveSpanProcessorOnEnd:
 
         mock_safe_log.assert_called()
 
+    @patch("honeyhive.utils.logger.is_log_enabled", return_value=False)
+    @patch("honeyhive.utils.logger.safe_log")
+    def test_on_end_skips_span_dump_when_debug_disabled(
+        self, mock_safe_log: Mock, mock_is_log_enabled: Mock
+    ) -> None:
+        """The raw span dump is not rendered unless debug logging is on."""
+        mock_exporter = Mock()
+        processor = HoneyHiveSpanProcessor(
+            otlp_exporter=mock_exporter, disable_batch=True
+        )
+
+        mock_span = Mock(spec=ReadableSpan)
+        mock_span.name = "test_operation"
+        mock_span.attributes = {"honeyhive.session_id": "session-123"}
+
+        with patch.object(processor, "_dump_raw_span_data") as mock_dump:
+            processor.on_end(mock_span)
+
+        mock_dump.assert_not_called()
+        mock_exporter.export.assert_called_once_with([mock_span])
+
+    @patch("honeyhive.utils.logger.is_log_enabled", return_value=True)
+    @patch("honeyhive.utils.logger.safe_log")
+    def test_on_end_dumps_span_when_debug_enabled(
+        self, mock_safe_log: Mock, mock_is_log_enabled: Mock
+    ) -> None:
+        """With debug logging on, the raw span dump is logged."""
+        processor = HoneyHiveSpanProcessor(otlp_exporter=Mock(), disable_batch=True)
+
+        mock_span = Mock(spec=ReadableSpan)
+        mock_span.name = "test_operation"
+        mock_span.attributes = {"honeyhive.session_id": "session-123"}
+
+        with patch.object(
+            processor, "_dump_raw_span_data", return_value="{dump}"
+        ) as mock_dump:
+            processor.on_end(mock_span)
+
+        mock_dump.assert_called_once_with(mock_span)
+        assert any("{dump}" in str(c) for c in mock_safe_log.call_args_list)
+
 
 class TestHoneyHiveSpanProcessorSending:
     """Test span sending functionality with all conditional branches."""
@@ -1299,6 +1442,7 @@ class TestRootSpanAutoSession:
         span.set_attribute = Mock(
             side_effect=lambda k, v: span.attributes.update({k: v})
         )
+        span.set_attributes = Mock(side_effect=span.attributes.update)
         return span
 
     @patch("honeyhive.tracer.processing.span_processor.context.attach")
@@ -0,0 +1,174 @@
+"""Unit tests for max_span_size enforcement."""
+
+from typing import Any, Dict
+from unittest.mock import Mock
+
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+
+from honeyhive.tracer.processing.batch_processor import estimate_span_size
+from honeyhive.tracer.processing.span_processor import HoneyHiveSpanProcessor
+from honeyhive.tracer.processing.span_size import (
+    SPAN_SIZE_POLICY_DROP,
+    SPAN_SIZE_POLICY_OFF,
+    SPAN_SIZE_POLICY_TRUNCATE,
+    TRUNCATED_ATTRIBUTES_KEY,
+    TRUNCATION_MARKER,
+    SpanSizeLimiter,
+)
+from honeyhive.utils.dotdict import DotDict
+
+
+def _span(attributes: Dict[str, Any]) -> ReadableSpan:
+    tracer = TracerProvider().get_tracer("honeyhive-test")
+    span = tracer.start_span("tool_call", attributes=attributes)
+    span.end()
+    return span  # type: ignore[return-value]
+
+
+class TestSpanSizeLimiter:
+    """Truncation, drop and off policies."""
+
+    def test_small_span_is_unchanged(self) -> None:
+        span = _span({"honeyhive_outputs.result": "ok"})
+        limiter = SpanSizeLimiter(max_span_size=10000)
+
+        assert limiter.enforce(span) is span
+        assert limiter.get_stats()["truncated_spans"] == 0
+
+    def test_truncates_largest_low_priority_value_first(self) -> None:
+        span = _span(
+            {
+                "honeyhive.session_id": "s" * 2000,
+                "honeyhive_outputs.result": "o" * 3000,
+                "tool.raw_output": "r" * 20000,
+                "tool.log": "l" * 5000,
+            }
+        )
+        limiter = SpanSizeLimiter(max_span_size=estimate_span_size(span) - 15000)
+
+        result = limiter.enforce(span)
+
+        assert result is not None and result is not span
+        attributes = result.attributes or {}
+        assert attributes["tool.raw_output"].endswith(TRUNCATION_MARKER)
+        assert attributes["tool.log"] == "l" * 5000
+        assert attributes["honeyhive_outputs.result"] == "o" * 3000
+        assert attributes[TRUNCATED_ATTRIBUTES_KEY] == ("tool.raw_output",)
+        assert estimate_span_size(result) <= limiter.max_span_size
+        assert result.context == span.context
+        assert limiter.get_stats()["trimmed_bytes"] >= 15000
+
+    def test_higher_priority_values_truncated_last(self) -> None:
+        span = _span(
+            {
+                "honeyhive_outputs.result": "o" * 20000,
+                "tool.log": "l" * 5000,
+            }
+        )
+        limiter = SpanSizeLimiter(max_span_size=estimate_span_size(span) - 10000)
+
+        attributes = limiter.enforce(span).attributes  # type: ignore[union-attr]
+
+        assert attributes is not None
+        assert attributes[TRUNCATED_ATTRIBUTES_KEY] == (
+            "tool.log",
+            "honeyhive_outputs.result",
+        )
+        assert len(attributes["tool.log"]) < 5000
+
+    def test_critical_attributes_are_never_truncated(self) -> None:
+        span = _span({"honeyhive.event_name": "e" * 20000})
+        limiter = SpanSizeLimiter(max_span_size=1000)
+
+        # Nothing else can be shortened, so the span is dropped
+        assert limiter.enforce(span) is None
+        stats = limiter.get_stats()
+        assert stats["truncated_spans"] == 0
+        assert stats["dropped_spans"] == 1
+
+    def test_event_attributes_are_truncated(self) -> None:
+        tracer = TracerProvider().get_tracer("honeyhive-test")
+        span = tracer.start_span("tool_call", attributes={"tool.name": "search"})
+        span.add_event("exception", {"exception.stacktrace": "t" * 400_000})
+        span.end()
+        limiter = SpanSizeLimiter(max_span_size=10_000)
+
+        result = limiter.enforce(span)  # type: ignore[arg-type]
+
+        assert result is not None
+        event = result.events[0]
+        assert event.name == "exception"
+        assert event.attributes["exception.stacktrace"].endswith(TRUNCATION_MARKER)
+        assert (result.attributes or {})[TRUNCATED_ATTRIBUTES_KEY] == (
+            "events[0].exception.stacktrace",
+        )
+        assert estimate_span_size(result) <= limiter.max_span_size
+        assert limiter.get_stats()["truncated_spans"] == 1
+
+    def test_sequence_elements_are_truncated(self) -> None:
+        span = _span({"tool.documents": ("short", "d" * 200_000, "x" * 200_000)})
+        limiter = SpanSizeLimiter(max_span_size=10_000)
+
+        result = limiter.enforce(span)
+
+        assert result is not None
+        documents = (result.attributes or {})["tool.documents"]
+        assert documents[0] == "short"
+        assert all(item.endswith(TRUNCATION_MARKER) for item in documents[1:])
+        assert (result.attributes or {})[TRUNCATED_ATTRIBUTES_KEY] == (
+            "tool.documents",
+        )
+        assert estimate_span_size(result) <= limiter.max_span_size
+
+    def test_drop_policy(self) -> None:
+        limiter = SpanSizeLimiter(max_span_size=1000, policy=SPAN_SIZE_POLICY_DROP)
+
+        assert limiter.enforce(_span({"payload": "x" * 5000})) is None
+        assert limiter.get_stats()["dropped_spans"] == 1
+
+    def test_off_policy(self) -> None:
+        span = _span({"payload": "x" * 5000})
+        limiter = SpanSizeLimiter(max_span_size=1000, policy=SPAN_SIZE_POLICY_OFF)
+
+        assert limiter.enforce(span) is span
+
+    def test_unknown_policy_falls_back_to_truncate(self) -> None:
+        limiter = SpanSizeLimiter(policy="squash")
+
+        assert limiter.policy == SPAN_SIZE_POLICY_TRUNCATE
+
+
+class TestSpanProcessorEnforcement:
+    """HoneyHiveSpanProcessor applies the limit before export."""
+
+    @staticmethod
+    def _processor(max_span_size: int, policy: str = "truncate") -> Any:
+        tracer = Mock()
+        tracer._max_span_size = max_span_size
+        tracer.config = DotDict({"span_size_policy": policy})
+        exporter = Mock()
+        processor = HoneyHiveSpanProcessor(
+            otlp_exporter=exporter, disable_batch=True, tracer_instance=tracer
+        )
+        return processor, exporter
+
+    def test_oversized_span_is_exported_truncated(self) -> None:
+        processor, exporter = self._processor(2000)
+
+        processor.on_end(
+            _span({"honeyhive.session_id": "abc", "tool.output": "x" * 50000})
+        )
+
+        exported = exporter.export.call_args[0][0][0]
+        assert exported.attributes["tool.output"].endswith(TRUNCATION_MARKER)
+        assert processor.get_span_size_stats()["truncated_spans"] == 1
+
+    def test_drop_policy_skips_export(self) -> None:
+        processor, exporter = self._processor(2000, policy="drop")
+
+        processor.on_end(
+            _span({"honeyhive.session_id": "abc", "tool.output": "x" * 50000})
+        )
+
+        exporter.export.assert_not_called()
+        assert processor.get_span_size_stats()["dropped_spans"] == 1
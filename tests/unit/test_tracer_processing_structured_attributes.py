@@ -0,0 +1,174 @@
+"""Unit tests for structured (kvlistValue/arrayValue) span attributes."""
+
+import json
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+
+from honeyhive.tracer.instrumentation.enrichment import enrich_span_core
+from honeyhive.tracer.instrumentation.span_utils import _set_span_attributes
+from honeyhive.tracer.processing.otlp_exporter import OTLPJSONExporter
+from honeyhive.tracer.processing.otlp_json_serializer import OTLPJSONSerializer
+from honeyhive.tracer.processing.structured_attributes import (
+    STRUCTURED_ATTRIBUTES_KEY,
+    TRUNCATION_MARKER,
+    bound_structure,
+    uses_structured_attributes,
+    with_structured_values,
+)
+from honeyhive.utils.dotdict import DotDict
+
+_tracer = TracerProvider().get_tracer("honeyhive-test")
+
+RESULT = {"choices": [{"index": 0, "message": {"content": "hi"}}], "n": 1}
+
+
+def _structured_span(**values: Any) -> ReadableSpan:
+    span = _tracer.start_span("step")
+    for key, value in values.items():
+        _set_span_attributes(span, key, value, structured=True)
+    span.end()
+    return span  # type: ignore[return-value]
+
+
+def _exported_attributes(payload: bytes) -> List[Dict[str, Any]]:
+    body = json.loads(payload)
+    return body["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["attributes"]
+
+
+def _kvlist(values: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "kvlistValue": {
+            "values": [
+                {"key": key, "value": OTLPJSONExporter._to_otlp_any_value(value)}
+                for key, value in values.items()
+            ]
+        }
+    }
+
+
+class TestBoundStructure:
+    """The walker bounds depth and size and normalizes types."""
+
+    def test_normalizes_values(self) -> None:
+        value = {"a": None, 1: (1, None, float("nan")), "obj": object}
+
+        assert bound_structure(value) == {"1": [1, "nan"], "obj": str(object)}
+
+    def test_depth_limit(self) -> None:
+        nested: Dict[str, Any] = {"leaf": 1}
+        for _ in range(5):
+            nested = {"child": nested}
+
+        bounded = bound_structure(nested, max_depth=2)
+
+        assert bounded == {"child": {"child": TRUNCATION_MARKER}}
+
+    def test_item_limit(self) -> None:
+        bounded = bound_structure(list(range(100)), max_items=10)
+
+        assert len(bounded) == 10
+        assert bounded[-1] == TRUNCATION_MARKER
+
+
+class TestStructuredSpanAttributes:
+    """One attribute per value instead of one per leaf."""
+
+    def test_single_attribute_and_marker(self) -> None:
+        span = _structured_span(**{"honeyhive_outputs.result": RESULT})
+
+        assert span.attributes is not None
+        assert set(span.attributes) == {
+            "honeyhive_outputs.result",
+            STRUCTURED_ATTRIBUTES_KEY,
+        }
+        assert span.attributes[STRUCTURED_ATTRIBUTES_KEY] == (
+            "honeyhive_outputs.result",
+        )
+
+    def test_dicts_merge_on_same_key(self) -> None:
+        span = _tracer.start_span("step")
+        _set_span_attributes(span, "honeyhive_metadata", {"a": {"x": 1}}, True)
+        _set_span_attributes(span, "honeyhive_metadata", {"a": {"y": 2}}, True)
+
+        assert json.loads(span.attributes["honeyhive_metadata"]) == {  # type: ignore[index]
+            "a": {"x": 1, "y": 2}
+        }
+
+    def test_scalars_are_unchanged(self) -> None:
+        span = _structured_span(honeyhive_metrics=0.5)
+
+        assert dict(span.attributes or {}) == {"honeyhive_metrics": 0.5}
+
+    def test_mode_from_tracer_config(self) -> None:
+        tracer = Mock()
+        tracer.config = DotDict({"attribute_encoding": "structured"})
+
+        assert uses_structured_attributes(tracer) is True
+        assert uses_structured_attributes(None) is False
+
+    def test_enrich_span_uses_tracer_encoding(self) -> None:
+        tracer = Mock()
+        tracer.config = DotDict({"attribute_encoding": "structured"})
+        span = _tracer.start_span("step")
+
+        with trace.use_span(span, end_on_exit=True):
+            enrich_span_core(outputs={"result": RESULT}, tracer_instance=tracer)
+
+        assert json.loads(span.attributes["honeyhive_outputs"]) == {  # type: ignore[index]
+            "result": RESULT
+        }
+
+
+class TestStructuredExport:
+    """Exporters write structured values as kvlistValue/arrayValue."""
+
+    def test_serializer_writes_kvlist(self) -> None:
+        span = _structured_span(**{"honeyhive_outputs.result": RESULT})
+
+        attributes = _exported_attributes(OTLPJSONSerializer().serialize([span]))
+
+        assert attributes == [
+            {"key": "honeyhive_outputs.result", "value": _kvlist(RESULT)}
+        ]
+        choices = attributes[0]["value"]["kvlistValue"]["values"][0]["value"]
+        assert "arrayValue" in choices
+
+    def test_serializer_matches_dict_builder(self) -> None:
+        span = _structured_span(
+            honeyhive_inputs={"messages": [{"role": "user", "content": "hi"}]},
+            honeyhive_metadata={"tags": ["a", "b"], "empty": {}},
+        )
+        exporter = OTLPJSONExporter("https://example.com/v1/traces", session=Mock())
+
+        streamed = json.loads(OTLPJSONSerializer().serialize([span]))
+        built = exporter._spans_to_otlp_json_payload([span])
+
+        assert streamed == built
+
+    def test_unparseable_value_stays_string(self) -> None:
+        span = _tracer.start_span("step")
+        span.set_attribute("honeyhive_outputs", '{"cut": "abc...[truncated]')
+        span.set_attribute(STRUCTURED_ATTRIBUTES_KEY, ("honeyhive_outputs",))
+        span.end()
+
+        attributes = _exported_attributes(OTLPJSONSerializer().serialize([span]))
+
+        assert attributes == [
+            {
+                "key": "honeyhive_outputs",
+                "value": {"stringValue": '{"cut": "abc...[truncated]'},
+            }
+        ]
+
+    def test_protobuf_encodes_kvlist(self) -> None:
+        span = _structured_span(honeyhive_outputs=RESULT)
+
+        encoded = encode_spans([with_structured_values(span)])
+
+        proto_span = encoded.resource_spans[0].scope_spans[0].spans[0]
+        assert [kv.key for kv in proto_span.attributes] == ["honeyhive_outputs"]
+        assert proto_span.attributes[0].value.HasField("kvlist_value")
@@ -0,0 +1,34 @@
+"""Unit tests for HoneyHive tracer utils configuration lookup."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from honeyhive.tracer.utils.config import get_otlp_setting
+
+
+class TestGetOTLPSetting:
+    """Test reading settings from the ``config.otlp`` section."""
+
+    def test_reads_otlp_section(self) -> None:
+        """Configured values are returned from the nested section."""
+        tracer = SimpleNamespace(config={"otlp": {"otlp_compression": "zstd"}})
+
+        assert get_otlp_setting(tracer, "otlp_compression", "gzip") == "zstd"
+
+    def test_missing_or_none_values_use_default(self) -> None:
+        """Missing settings and None values fall back to the default."""
+        tracer = SimpleNamespace(config={"otlp": {"otlp_compression": None}})
+
+        assert get_otlp_setting(tracer, "otlp_compression", "gzip") == "gzip"
+        assert get_otlp_setting(tracer, "batch_size", 100) == 100
+
+    def test_without_otlp_section(self) -> None:
+        """Tracers without a dict config or OTLP section use the default."""
+        assert get_otlp_setting(None, "otlp_compression", "gzip") == "gzip"
+        assert get_otlp_setting(Mock(), "otlp_compression", "gzip") == "gzip"
+        assert (
+            get_otlp_setting(
+                SimpleNamespace(config={"otlp": "invalid"}), "otlp_compression", "gzip"
+            )
+            == "gzip"
+        )
@@ -18,6 +18,7 @@ from honeyhive.tracer.utils.event_type import (
     _identify_raw_attributes_dynamically,
     _is_raw_attribute_dynamically,
     _is_sensitive_attribute_dynamically,
+    _match_span_name_indicator,
     _process_raw_value_dynamically,
     _process_single_raw_attribute_dynamically,
     detect_event_type_from_patterns,
@@ -697,3 +698,73 @@ class TestEventTypeDetectionEdgeCases:
             "generic_span", {"llm.request.model": None}
         )
         assert result == "model"
+
+
+class TestSpanNameClassifier:
+    """Test the compiled, cached span name matcher."""
+
+    _LEGACY_INDICATORS = [
+        "llm",
+        "model",
+        "gpt",
+        "claude",
+        "llama",
+        "gemini",
+        "mistral",
+        "palm",
+        "chat",
+        "completion",
+        "generate",
+        "inference",
+        "openai",
+        "anthropic",
+        "bedrock",
+        "google",
+        "generativeai",
+    ]
+
+    def _legacy_detect(self, span_name: str) -> bool:
+        name = span_name.lower()
+        return any(indicator in name for indicator in self._LEGACY_INDICATORS) or any(
+            term in name for term in ["ai_", "ml_", "nlp_"]
+        )
+
+    @pytest.mark.parametrize(
+        "span_name",
+        [
+            "OpenAI.Chat",
+            "vector_search",
+            "RAG_pipeline",
+            "my_ai_step",
+            "HTML_render",
+            "tool.call",
+            "Generative step",
+            "nlp_parse",
+            "LLaMA-3",
+            "fetch_user",
+            "İstanbul_model",
+        ],
+    )
+    def test_matches_legacy_scan(self, span_name: str) -> None:
+        """The compiled matcher agrees with the original linear scan."""
+        detected = detect_event_type_from_patterns(span_name, {}) == "model"
+
+        assert detected == self._legacy_detect(span_name)
+
+    def test_results_are_cached_per_span_name(self) -> None:
+        """Repeated span names are served from the LRU cache."""
+        _match_span_name_indicator.cache_clear()
+
+        for _ in range(5):
+            detect_event_type_from_patterns("claude_call", {})
+
+        info = _match_span_name_indicator.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+
+    def test_get_llm_attributes_returns_fresh_list(self) -> None:
+        """Callers may mutate the returned list without affecting detection."""
+        get_llm_attributes().clear()
+
+        assert "llm.request.model" in get_llm_attributes()
+        assert detect_event_type_from_patterns("x", {"model_id": "m"}) == "model"
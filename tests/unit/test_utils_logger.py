@@ -30,6 +30,7 @@ from honeyhive.utils.logger import (
     default_logger,
     get_logger,
     get_tracer_logger,
+    is_log_enabled,
     is_shutdown_detected,
     reset_logging_state,
     safe_debug,
@@ -1191,6 +1192,61 @@ class TestSafeLogFunction:
         # safe_log should complete without raising exceptions
         # The function should not crash with valid logger setup
 
+    @patch("honeyhive.utils.logger._detect_shutdown_conditions")
+    def test_safe_log_lazy_honeyhive_data_skipped_when_level_disabled(
+        self, mock_detect_shutdown: Mock
+    ) -> None:
+        """Callable honeyhive_data is never invoked for filtered levels."""
+        mock_detect_shutdown.return_value = False
+        mock_tracer = Mock()
+        mock_tracer.logger = get_logger("honeyhive.test.lazy_off", verbose=False)
+        provider = Mock(return_value={"payload": "expensive"})
+
+        safe_log(mock_tracer, "debug", "Debug message", honeyhive_data=provider)
+
+        provider.assert_not_called()
+
+    @patch("honeyhive.utils.logger._detect_shutdown_conditions")
+    def test_safe_log_lazy_honeyhive_data_rendered_when_level_enabled(
+        self, mock_detect_shutdown: Mock
+    ) -> None:
+        """Callable honeyhive_data is resolved and passed to the logger."""
+        mock_detect_shutdown.return_value = False
+        mock_tracer = Mock()
+        mock_logger = Mock()
+        mock_logger.logger.handlers = [Mock(spec=[])]
+        mock_logger.logger.isEnabledFor.return_value = True
+        mock_tracer.logger = mock_logger
+
+        safe_log(
+            mock_tracer,
+            "debug",
+            "Debug message",
+            honeyhive_data=lambda: {"payload": "rendered"},
+        )
+
+        mock_logger.debug.assert_called_once_with(
+            "Debug message", honeyhive_data={"payload": "rendered"}
+        )
+
+    def test_is_log_enabled_follows_logger_level(self) -> None:
+        """is_log_enabled reflects the tracer logger's effective level."""
+        mock_tracer = Mock()
+        mock_tracer.logger = get_logger("honeyhive.test.enabled", verbose=False)
+
+        assert is_log_enabled(mock_tracer, "debug") is False
+        assert is_log_enabled(mock_tracer, "warning") is True
+
+        mock_tracer.logger.update_verbose_setting(True)
+        assert is_log_enabled(mock_tracer, "debug") is True
+
+    @patch("honeyhive.utils.logger._detect_shutdown_conditions")
+    def test_is_log_enabled_false_on_shutdown(self, mock_detect_shutdown: Mock) -> None:
+        """Nothing is logged once shutdown is detected."""
+        mock_detect_shutdown.return_value = True
+
+        assert is_log_enabled(Mock(), "error") is False
+
     @patch("honeyhive.utils.logger.safe_log")
     def test_safe_debug_convenience_function(self, mock_safe_log: Mock) -> None:
         """Test safe_debug convenience function."""